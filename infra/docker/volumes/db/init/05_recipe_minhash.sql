@@ -0,0 +1,9 @@
+-- Kitchen Database Schema: Recipe near-duplicate signatures 👯
+-- MinHash signature over title words + ingredient names, computed by the API
+-- when a recipe is created or re-parsed (see domain/recipes/similarity.py).
+-- Rows without one get it computed on the fly during plan generation.
+--
+-- Fun fact: 128 numbers are enough to estimate how alike two recipes are! 🔢
+
+ALTER TABLE public.recipes
+    ADD COLUMN IF NOT EXISTS minhash BIGINT[];
@@ -0,0 +1,94 @@
+-- Kitchen Database Schema: Atomic ingredient replacement 🔁
+-- Swaps the ingredient sets of one or more recipes in a single transaction:
+-- old rows out, new rows in, is_parsed (and minhash, if given) updated, and
+-- the resulting rows returned - one round trip instead of four or five.
+-- Called by RecipeRepository (see domain/recipes/repository.py).
+--
+-- p_recipes is a JSON array of:
+--   {
+--     "recipe_id": "<uuid>",
+--     "ingredients": [{"id", "raw_text", "quantity", "unit", "item_name",
+--                      "notes", "section", "sort_order", "confidence"}, ...],
+--     "append": false,       -- keep existing rows, add the new ones after them
+--     "is_parsed": true,     -- omit to leave the flag alone
+--     "minhash": [1, 2, ...] -- omit to leave the signature alone
+--   }
+--
+-- Fun fact: If anything fails half-way, Postgres rolls the whole call back -
+-- no recipe is ever left with half its ingredients! 🧯
+
+CREATE OR REPLACE FUNCTION public.replace_recipe_ingredients(p_recipes JSONB)
+RETURNS SETOF public.recipe_ingredients
+LANGUAGE plpgsql
+SECURITY INVOKER
+AS $$
+DECLARE
+    entry JSONB;
+    target UUID;
+    offset_by INTEGER;
+    touched UUID[] := '{}';
+BEGIN
+    FOR entry IN SELECT * FROM jsonb_array_elements(p_recipes)
+    LOOP
+        target := (entry ->> 'recipe_id')::UUID;
+        touched := touched || target;
+        offset_by := 0;
+
+        IF COALESCE((entry ->> 'append')::BOOLEAN, FALSE) THEN
+            SELECT COALESCE(MAX(sort_order) + 1, 0) INTO offset_by
+            FROM public.recipe_ingredients
+            WHERE recipe_id = target;
+        ELSE
+            DELETE FROM public.recipe_ingredients WHERE recipe_id = target;
+        END IF;
+
+        INSERT INTO public.recipe_ingredients (
+            id, recipe_id, raw_text, quantity, unit, item_name,
+            notes, section, sort_order, confidence
+        )
+        SELECT
+            COALESCE(item.id, extensions.uuid_generate_v4()),
+            target,
+            item.raw_text,
+            item.quantity,
+            item.unit,
+            item.item_name,
+            item.notes,
+            item.section,
+            COALESCE(item.sort_order, 0) + offset_by,
+            item.confidence
+        FROM jsonb_to_recordset(COALESCE(entry -> 'ingredients', '[]'::JSONB)) AS item(
+            id UUID,
+            raw_text TEXT,
+            quantity NUMERIC,
+            unit TEXT,
+            item_name TEXT,
+            notes TEXT,
+            section TEXT,
+            sort_order INTEGER,
+            confidence NUMERIC
+        );
+
+        UPDATE public.recipes
+        SET
+            is_parsed = COALESCE((entry ->> 'is_parsed')::BOOLEAN, is_parsed),
+            minhash = CASE
+                WHEN jsonb_typeof(entry -> 'minhash') = 'array' THEN ARRAY(
+                    SELECT value::BIGINT FROM jsonb_array_elements_text(entry -> 'minhash')
+                )
+                ELSE minhash
+            END
+        WHERE id = target;
+    END LOOP;
+
+    RETURN QUERY
+        SELECT *
+        FROM public.recipe_ingredients
+        WHERE recipe_id = ANY(touched)
+        ORDER BY recipe_id, sort_order;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.replace_recipe_ingredients(JSONB) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.replace_recipe_ingredients(JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION public.replace_recipe_ingredients(JSONB) TO anon;
@@ -0,0 +1,171 @@
+"""Background Tasks - Debounced per-household work. ⏳
+
+Some work is worth doing ahead of time - e.g. scoring recipes and
+generating plan options right after the pantry changes, before anyone
+opens the planner. Mutations tend to come in bursts (a grocery haul, a
+recipe import), so each household's task waits for a quiet period
+before running. A newer mutation cancels the waiting (or running) task
+and starts the wait again, since its result would already be stale.
+
+Fun fact: "Debouncing" comes from electronics - a mechanical switch
+bounces several times when pressed, and circuits wait for it to settle! 🔌
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import cast
+from uuid import UUID
+
+from src.api.app.core.config import get_settings
+from src.api.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+Work = Callable[[UUID], Awaitable[None]]
+
+
+@dataclass
+class RunnerStats:
+    """Snapshot of a runner's activity."""
+
+    queue_depth: int  # Households waiting to run
+    running: int  # Households currently running
+    completed: int
+    cancelled: int  # Tasks superseded by a newer mutation (or shutdown)
+    failed: int
+    last_run_ms: float | None  # Duration of the last completed task
+    last_latency_ms: float | None  # First pending mutation -> task done
+
+
+class DebouncedTaskRunner:
+    """In-process runner of debounced per-household tasks. ⏳
+
+    Must be started from a running event loop. Until then (and after
+    stopping), notifications are ignored.
+
+    Example:
+        >>> runner = DebouncedTaskRunner(debounce_seconds=2.0)
+        >>> runner.start(precompute_household)
+        >>> runner.notify(household_id)  # After a pantry write
+        >>> await runner.stop()
+    """
+
+    def __init__(self, *, debounce_seconds: float = 2.0) -> None:
+        """Initialize the runner.
+
+        Args:
+            debounce_seconds: Quiet period before a household's task runs.
+        """
+        self.debounce_seconds = debounce_seconds
+        self.completed = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.last_run_ms: float | None = None
+        self.last_latency_ms: float | None = None
+        self._work: Work | None = None
+        self._tasks: dict[UUID, asyncio.Task] = {}
+        self._pending_since: dict[UUID, float] = {}
+        self._running: set[asyncio.Task] = set()
+
+    @property
+    def started(self) -> bool:
+        """Whether the runner accepts notifications."""
+        return self._work is not None
+
+    def start(self, work: Work) -> None:
+        """Start accepting notifications.
+
+        Args:
+            work: Coroutine function run for a household after its
+                mutations settle.
+        """
+        self._work = work
+
+    async def stop(self) -> None:
+        """Cancel every waiting and running task and stop accepting new ones."""
+        self._work = None
+        tasks = [task for task in self._tasks.values() if not task.done()]
+        for task in tasks:
+            task.cancel()
+        self.cancelled += len(tasks)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._pending_since.clear()
+
+    def notify(self, household_id: UUID) -> bool:
+        """Record a mutation for a household.
+
+        Cancels the household's waiting or running task (if any) and
+        schedules a new one after the debounce period.
+
+        Args:
+            household_id: The household whose data changed.
+
+        Returns:
+            True if a task was scheduled.
+        """
+        if self._work is None:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False  # Called outside the event loop (e.g. a script)
+
+        previous = self._tasks.get(household_id)
+        if previous is not None and not previous.done():
+            previous.cancel()
+            self.cancelled += 1
+
+        self._pending_since.setdefault(household_id, time.perf_counter())
+        task = loop.create_task(self._run(household_id, self._work))
+        self._tasks[household_id] = task
+        return True
+
+    def stats(self) -> RunnerStats:
+        """Get a snapshot of the runner's activity."""
+        return RunnerStats(
+            queue_depth=len(set(self._tasks.values()) - self._running),
+            running=len(self._running),
+            completed=self.completed,
+            cancelled=self.cancelled,
+            failed=self.failed,
+            last_run_ms=self.last_run_ms,
+            last_latency_ms=self.last_latency_ms,
+        )
+
+    async def wait_idle(self) -> None:
+        """Wait until no task is waiting or running (useful in tests)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()), return_exceptions=True)
+
+    async def _run(self, household_id: UUID, work: Work) -> None:
+        """Wait out the debounce period, then run the work."""
+        task = cast(asyncio.Task, asyncio.current_task())
+        try:
+            await asyncio.sleep(self.debounce_seconds)
+            self._running.add(task)
+            started = time.perf_counter()
+            await work(household_id)
+        except Exception:
+            self.failed += 1
+            logger.exception("Background task failed", household_id=str(household_id))
+        else:
+            finished = time.perf_counter()
+            self.completed += 1
+            self.last_run_ms = (finished - started) * 1000
+            pending_since = self._pending_since.pop(household_id, started)
+            self.last_latency_ms = (finished - pending_since) * 1000
+        finally:
+            self._running.discard(task)
+            if self._tasks.get(household_id) is task:
+                del self._tasks[household_id]
+                self._pending_since.pop(household_id, None)
+
+
+@lru_cache
+def get_background_runner() -> DebouncedTaskRunner:
+    """Get the process-wide background task runner."""
+    return DebouncedTaskRunner(debounce_seconds=get_settings().precompute_debounce_seconds)
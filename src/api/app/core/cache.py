@@ -0,0 +1,307 @@
+"""Household Cache - Hot reads without the round trip. 🧊
+
+Whole-pantry snapshots, the recipe catalog and the active shopping list
+are read far more often than they change. HouseholdCache keeps those
+reads in memory, one namespace per household and kind of data:
+
+- every (household, namespace) has a version stamp; the write paths
+  (PantryService, RecipeService, ShoppingService, VoiceService) bump it,
+  which drops the namespace's entries at once
+- an entry remembers the version it was read at, so a read that raced
+  a write is never served afterwards
+- entries are stored pickled: callers always get their own copy (safe
+  to mutate), and the byte budget counts real bytes; the least recently
+  used entries are evicted once it's exceeded
+- a TTL bounds staleness from writes this process doesn't see (other
+  workers, scripts)
+
+`cached_read` puts the cache in front of a repository read method.
+
+Fun fact: Refrigerators only became common in homes in the 1930s -
+before that, the "cache" was an ice box restocked by the iceman! 🧊
+"""
+
+import functools
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, ParamSpec, TypeVar
+from uuid import UUID
+
+from src.api.app.core.config import get_settings
+
+# Namespaces bumped by the write paths
+PANTRY = "pantry"
+RECIPES = "recipes"
+SHOPPING = "shopping"
+NAMESPACES = (PANTRY, RECIPES, SHOPPING)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of a cache's activity."""
+
+    hits: int
+    misses: int
+    stale: int  # Misses on entries from an older version or past their TTL
+    evictions: int  # Entries dropped to stay within the byte budget
+    invalidations: int  # Version bumps
+    entries: int
+    bytes: int
+    max_bytes: int
+
+
+@dataclass
+class _Entry:
+    """A pickled value and the version it was read at."""
+
+    payload: bytes
+    version: int
+    expires_at: float
+
+
+class HouseholdCache:
+    """Byte-budgeted LRU cache with per-household version stamps. 🧊
+
+    Safe to share between threads.
+
+    Example:
+        >>> cache = HouseholdCache(max_bytes=32 * 1024 * 1024)
+        >>> version = cache.version(household_id, PANTRY)
+        >>> cache.put(household_id, PANTRY, "snapshot", items, version=version)
+        >>> cache.get(household_id, PANTRY, "snapshot") == items
+        True
+        >>> cache.bump(household_id, PANTRY)  # After a pantry write
+        >>> cache.get(household_id, PANTRY, "snapshot")  # -> None
+    """
+
+    def __init__(self, *, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: float = 300.0) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Budget for stored values (pickled size). Zero
+                disables caching.
+            ttl_seconds: How long an entry is served after it's stored.
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._bytes = 0
+        self._versions: dict[tuple[UUID, str], int] = {}
+        self._entries: OrderedDict[tuple[UUID, str, Hashable], _Entry] = OrderedDict()
+        self._keys: dict[tuple[UUID, str], set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether anything can be stored."""
+        return self.max_bytes > 0
+
+    def version(self, household_id: UUID, namespace: str) -> int:
+        """Get a namespace's current version.
+
+        Read it before loading a value, and pass it to `put`.
+        """
+        with self._lock:
+            return self._versions.get((household_id, namespace), 0)
+
+    def get(self, household_id: UUID, namespace: str, key: Hashable) -> Any:
+        """Get a copy of a cached value.
+
+        Args:
+            household_id: The household the value belongs to.
+            namespace: The kind of data (e.g. PANTRY).
+            key: The value's key within the namespace.
+
+        Returns:
+            The value, or None on a miss (use `lookup` to cache Nones).
+        """
+        value = self.lookup(household_id, namespace, key)
+        return None if value is _MISSING else value
+
+    def lookup(self, household_id: UUID, namespace: str, key: Hashable) -> Any:
+        """Like `get`, but returns a sentinel on a miss (see `is_miss`)."""
+        full_key = (household_id, namespace, key)
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+
+            current = self._versions.get((household_id, namespace), 0)
+            if entry.version != current or entry.expires_at <= time.monotonic():
+                self._remove(full_key)
+                self.stale += 1
+                self.misses += 1
+                return _MISSING
+
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            payload = entry.payload
+        return pickle.loads(payload)
+
+    @staticmethod
+    def is_miss(value: Any) -> bool:
+        """Check whether a `lookup` result is a miss."""
+        return value is _MISSING
+
+    def put(
+        self,
+        household_id: UUID,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        *,
+        version: int,
+    ) -> None:
+        """Store a value read at a given version.
+
+        Values read before the latest bump are dropped, as are values
+        bigger than the whole budget.
+
+        Args:
+            household_id: The household the value belongs to.
+            namespace: The kind of data (e.g. PANTRY).
+            key: The value's key within the namespace.
+            value: Anything picklable.
+            version: `version()` from before the value was read.
+        """
+        if not self.enabled:
+            return
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+
+        full_key = (household_id, namespace, key)
+        with self._lock:
+            if version != self._versions.get((household_id, namespace), 0):
+                return
+            if full_key in self._entries:
+                self._remove(full_key)
+            self._entries[full_key] = _Entry(
+                payload=payload,
+                version=version,
+                expires_at=time.monotonic() + self.ttl_seconds,
+            )
+            self._keys.setdefault((household_id, namespace), set()).add(key)
+            self._bytes += len(payload)
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def bump(self, household_id: UUID, *namespaces: str) -> None:
+        """Invalidate a household's namespaces (all of them if none given).
+
+        Call after every write to the underlying data.
+        """
+        with self._lock:
+            for namespace in namespaces or NAMESPACES:
+                scope = (household_id, namespace)
+                self._versions[scope] = self._versions.get(scope, 0) + 1
+                self.invalidations += 1
+                for key in list(self._keys.get(scope, ())):
+                    self._remove((household_id, namespace, key))
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache's activity."""
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                stale=self.stale,
+                evictions=self.evictions,
+                invalidations=self.invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry (versions are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._bytes = 0
+
+    def _remove(self, full_key: tuple[UUID, str, Hashable]) -> None:
+        """Drop one entry (lock must be held)."""
+        entry = self._entries.pop(full_key)
+        self._bytes -= len(entry.payload)
+        household_id, namespace, key = full_key
+        keys = self._keys.get((household_id, namespace))
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys[(household_id, namespace)]
+
+
+@lru_cache
+def get_household_cache() -> HouseholdCache:
+    """Get the process-wide household cache."""
+    settings = get_settings()
+    return HouseholdCache(
+        max_bytes=settings.household_cache_max_bytes,
+        ttl_seconds=settings.household_cache_ttl_seconds,
+    )
+
+
+def cached_read(
+    namespace: str,
+    *,
+    cache: HouseholdCache | None = None,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Cache an async repository read under the household's namespace.
+
+    The method's first argument after `self` must be the household ID;
+    the remaining arguments (which must be hashable) complete the key.
+    Results, including None, are cached until the namespace is bumped.
+
+    Example:
+        >>> class PantryRepository:
+        ...     @cached_read(PANTRY)
+        ...     async def get_snapshot(self, household_id: UUID) -> list[PantryItem]:
+        ...         ...
+
+    Args:
+        namespace: The namespace the result belongs to.
+        cache: Cache to use (the process-wide one if not provided).
+    """
+
+    def decorator(method: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(method)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            store = cache if cache is not None else get_household_cache()
+            if not store.enabled:
+                return await method(*args, **kwargs)
+
+            _, household_id, *rest = args
+            key = (method.__qualname__, tuple(rest), tuple(sorted(kwargs.items())))
+            cached = store.lookup(household_id, namespace, key)
+            if not store.is_miss(cached):
+                return cached
+
+            version = store.version(household_id, namespace)
+            result = await method(*args, **kwargs)
+            store.put(household_id, namespace, key, result, version=version)
+            return result
+
+        return wrapper
+
+    return decorator
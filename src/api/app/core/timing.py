@@ -0,0 +1,52 @@
+"""Stage Timing - Where did the time go? ⏱️
+
+A single "took 180 ms" doesn't say whether scoring, filtering or
+picking meals was slow. A StageTimer breaks a run into named stages,
+accumulating time when a stage is entered more than once (e.g. one
+selection pass per plan option).
+
+Fun fact: Formula 1 splits every lap into three timed sectors, so
+teams can see exactly which corners cost them! 🏎️
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class StageTimer:
+    """Accumulates wall-clock time per named stage. ⏱️
+
+    Stages keep the order they were first entered in.
+
+    Example:
+        >>> timer = StageTimer()
+        >>> with timer.stage("score"):
+        ...     scorer.score_recipes(recipes, pantry)
+        >>> timer.as_dict()
+        {'score': 41.237}
+    """
+
+    def __init__(self) -> None:
+        """Start the timer."""
+        self.stages: dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of work under a stage name."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    @property
+    def total_ms(self) -> float:
+        """Time since the timer was created."""
+        return (time.perf_counter() - self._started) * 1000
+
+    def as_dict(self) -> dict[str, float]:
+        """Get milliseconds per stage (rounded to microseconds)."""
+        return {name: round(ms, 3) for name, ms in self.stages.items()}
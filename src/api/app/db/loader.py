@@ -0,0 +1,129 @@
+"""Batching, de-duplicating loader for one request. 🚚
+
+Handlers and their dependencies often ask for the same rows on their own
+(a recipe here, the same recipe's ingredients there, the pantry in
+two places). A DataLoader sits in front of a batch query and:
+
+- serves repeated loads of a key from the first result (identity map:
+  every caller gets the same object)
+- collects the keys requested in the same event loop tick and fetches
+  them with a single batch call
+
+Loaders are meant to live for one request - nothing is ever evicted,
+and results don't see writes made after they were loaded.
+
+Fun fact: The pattern comes from Facebook's GraphQL servers, where one
+page could otherwise fetch the same user hundreds of times! 👥
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """Coalesces and caches loads of keys through a batch function. 🚚
+
+    The batch function gets a list of distinct keys and returns a
+    mapping of the ones it found. Missing keys resolve to `default`.
+
+    Example:
+        >>> loader = DataLoader(repository.get_by_ids)
+        >>> soup, salad = await asyncio.gather(loader.load(soup_id), loader.load(salad_id))
+        >>> # one get_by_ids([soup_id, salad_id]) call
+        >>> await loader.load(soup_id) is soup  # served from the first load
+        True
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        *,
+        default: V | None = None,
+        max_batch_size: int | None = None,
+    ) -> None:
+        """Initialize an empty loader.
+
+        Args:
+            batch_load: Fetches many keys at once.
+            default: Value for keys the batch function didn't return.
+            max_batch_size: Split larger batches into several calls.
+
+        Raises:
+            ValueError: If max_batch_size is not positive.
+        """
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+
+        self.batch_load = batch_load
+        self.default = default
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self._results: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[tuple[K, asyncio.Future[V | None]]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Load one key, batched with every other key requested this tick."""
+        future = self._results.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._results[key] = future
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append((key, future))
+        # Shielded, so one cancelled caller doesn't fail the others
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """Load many keys (in one batch, minus any already loaded)."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed a key's value (no-op if the key was already requested).
+
+        Lets a bigger load (e.g. a whole catalog) answer later loads of
+        its parts.
+        """
+        if key in self._results:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._results[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget a key, so the next load fetches it again."""
+        self._results.pop(key, None)
+
+    def _dispatch(self) -> None:
+        """Send the queued keys to the batch function."""
+        queued, self._queue = self._queue, []
+        size = self.max_batch_size or len(queued)
+        for start in range(0, len(queued), size):
+            task = asyncio.create_task(self._load_batch(queued[start : start + size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, queued: list[tuple[K, asyncio.Future[V | None]]]) -> None:
+        """Fetch one batch and resolve its futures."""
+        self.batches += 1
+        try:
+            found = await self.batch_load(list(dict.fromkeys(key for key, _ in queued)))
+        except Exception as error:
+            for key, future in queued:
+                # Failures aren't cached: a later load tries again
+                if self._results.get(key) is future:
+                    del self._results[key]
+                future.set_exception(error)
+        else:
+            for key, future in queued:
+                future.set_result(found.get(key, self.default))
+        finally:
+            # Never leave callers waiting (e.g. if the batch was cancelled)
+            for _, future in queued:
+                if not future.done():
+                    future.cancel()
@@ -0,0 +1,105 @@
+"""Keyset pagination for PostgREST queries. 📜
+
+Offset paging (`.range(offset, ...)`) makes the database skip every row
+before the page, so late pages get slower and slower. Keyset paging
+remembers the sort key of the last row instead and asks for rows after
+it, so every page costs the same.
+
+Rows are ordered by a sort column plus `id` as a tie-breaker, which
+makes the cursor unique even when sort values repeat.
+
+Fun fact: Keyset pagination is sometimes called the "seek method" -
+the database seeks straight to the cursor in the index! 🔎
+"""
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+def quote_value(value: object) -> str:
+    """Quote a value for use inside a PostgREST logic filter.
+
+    Quoting keeps commas, dots and parentheses in values (e.g. pantry
+    names like "tomatoes, diced") from being read as filter syntax.
+    """
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def keyset_filter(
+    column: str,
+    value: object,
+    row_id: object,
+    *,
+    descending: bool = False,
+    id_column: str = "id",
+) -> str:
+    """Build an `or_` filter selecting rows after a cursor.
+
+    Example:
+        >>> keyset_filter("name", "milk", "42")
+        'name.gt."milk",and(name.eq."milk",id.gt."42")'
+    """
+    op = "lt" if descending else "gt"
+    quoted = quote_value(value)
+    return (
+        f"{column}.{op}.{quoted},"
+        f"and({column}.eq.{quoted},{id_column}.{op}.{quote_value(row_id)})"
+    )
+
+
+async def iter_keyset(
+    make_query: Callable[[], Any],
+    *,
+    sort_column: str,
+    descending: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    id_column: str = "id",
+) -> AsyncIterator[list[dict]]:
+    """Page through a query by keyset, one chunk of rows at a time.
+
+    Args:
+        make_query: Returns a fresh, filtered select query (called once
+            per chunk, since PostgREST builders can't be reused).
+        sort_column: Column to order by (must not be NULL).
+        descending: Sort direction.
+        chunk_size: Rows per request.
+        id_column: Unique tie-breaker column.
+
+    Yields:
+        Non-empty lists of raw rows, in sort order.
+
+    Raises:
+        ValueError: If chunk_size is not positive.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    cursor: tuple[object, object] | None = None
+    while True:
+        query = make_query()
+        if cursor is not None:
+            query = query.or_(
+                keyset_filter(
+                    sort_column,
+                    cursor[0],
+                    cursor[1],
+                    descending=descending,
+                    id_column=id_column,
+                )
+            )
+        result = await (
+            query.order(sort_column, desc=descending)
+            .order(id_column, desc=descending)
+            .limit(chunk_size)
+            .execute()
+        )
+
+        rows = result.data or []
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        cursor = (rows[-1][sort_column], rows[-1][id_column])
@@ -0,0 +1,154 @@
+"""Direct PostgreSQL access via asyncpg. 🐘
+
+PostgREST turns every read into JSON over HTTP, which the API then
+parses again. For the hottest reads (a household's recipes, its pantry,
+the active shopping list) repositories can instead query Postgres
+directly over `database_url`:
+
+- connections come from a pool opened at startup
+- each statement is prepared once per connection and reused
+- rows arrive in Postgres' binary format and are validated straight
+  into domain models
+
+Each repository picks its read backend in settings ("postgrest" or
+"asyncpg"). Writes always go through Supabase.
+
+asyncpg is optional - install it to use the direct read path.
+
+Fun fact: asyncpg decodes rows so fast that it beats most C-based
+PostgreSQL drivers, despite being driven from Python! 🏎️
+"""
+
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from src.api.app.core.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    import asyncpg
+
+# Read backends a repository can use
+POSTGREST_BACKEND = "postgrest"
+ASYNCPG_BACKEND = "asyncpg"
+READ_BACKENDS = (POSTGREST_BACKEND, ASYNCPG_BACKEND)
+
+
+async def _init_connection(connection: Any) -> None:
+    """Decode json/jsonb columns to Python objects, like PostgREST does."""
+    for type_name in ("json", "jsonb"):
+        await connection.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog",
+        )
+
+
+class PostgresPool:
+    """Lazily opened asyncpg connection pool. 🐘
+
+    Example:
+        >>> pool = PostgresPool(get_settings())
+        >>> await pool.open()
+        >>> rows = await pool.pool.fetch("SELECT id FROM recipes LIMIT 1")
+        >>> await pool.close()
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize a closed pool.
+
+        Args:
+            settings: Database URL, pool sizes and timeouts.
+        """
+        self.settings = settings
+        self._pool: asyncpg.Pool | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether connections are available."""
+        return self._pool is not None
+
+    @property
+    def pool(self) -> "asyncpg.Pool":
+        """The underlying asyncpg pool.
+
+        Raises:
+            RuntimeError: If the pool isn't open.
+        """
+        if self._pool is None:
+            raise RuntimeError("Postgres pool is not open")
+        return self._pool
+
+    async def open(self) -> "asyncpg.Pool":
+        """Connect the pool (no-op if already open).
+
+        Returns:
+            The asyncpg pool.
+
+        Raises:
+            RuntimeError: If asyncpg is not installed.
+        """
+        if self._pool is not None:
+            return self._pool
+
+        try:
+            import asyncpg
+        except ImportError as err:
+            raise RuntimeError(
+                "asyncpg is required for the asyncpg read backend. "
+                "Install it with: uv add asyncpg"
+            ) from err
+
+        settings = self.settings
+        self._pool = await asyncpg.create_pool(
+            settings.database_url,
+            min_size=settings.postgres_pool_min_size,
+            max_size=settings.postgres_pool_max_size,
+            command_timeout=settings.postgres_command_timeout_seconds,
+            statement_cache_size=settings.postgres_statement_cache_size,
+            init=_init_connection,
+        )
+        return self._pool
+
+    async def close(self) -> None:
+        """Close every connection."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await pool.close()
+
+
+@lru_cache
+def get_postgres_pool() -> PostgresPool:
+    """Get the process-wide Postgres pool (opened by the app lifespan)."""
+    return PostgresPool(get_settings())
+
+
+def uses_asyncpg(settings: Settings) -> bool:
+    """Check whether any repository is configured to read via asyncpg."""
+    return ASYNCPG_BACKEND in (
+        settings.recipes_read_backend,
+        settings.pantry_read_backend,
+        settings.shopping_read_backend,
+    )
+
+
+def read_pool_for(backend: str) -> "asyncpg.Pool | None":
+    """Get the pool a repository should read through.
+
+    Args:
+        backend: The repository's configured read backend.
+
+    Returns:
+        The asyncpg pool if the backend is asyncpg and the pool is open,
+        otherwise None (read through PostgREST).
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend not in READ_BACKENDS:
+        raise ValueError(f"Unknown read backend {backend!r}, expected one of {READ_BACKENDS}")
+    postgres = get_postgres_pool()
+    if backend == ASYNCPG_BACKEND and postgres.is_open:
+        return postgres.pool
+    return None
@@ -2,27 +2,135 @@
 
 Provides async database connections via Supabase Python client.
 For direct PostgreSQL access, we use asyncpg.
+
+The API shares one long-lived client, opened when the app starts and
+closed on shutdown. Its HTTP connections are pooled and kept alive, so
+requests skip the connection setup and TLS handshake a fresh client
+pays for. Outside the app (scripts, tests without a lifespan),
+`get_supabase` falls back to a short-lived client per use.
 """
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import httpx
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
+
+from src.api.app.core.config import Settings, get_settings
+from src.api.app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _supabase_key(settings: Settings) -> str:
+    """Use the service_role key (bypassing RLS), or the anon key if unset."""
+    return settings.supabase_service_role_key or settings.supabase_anon_key
+
+
+class SupabasePool:
+    """A shared Supabase client over a keep-alive connection pool. 🏊
+
+    One client is enough: concurrent requests are spread over the pool's
+    HTTP connections.
+
+    Example:
+        >>> pool = SupabasePool(get_settings())
+        >>> await pool.open()
+        >>> result = await pool.client.table("recipes").select("id").execute()
+        >>> await pool.close()
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize a closed pool.
 
-from supabase import AsyncClient, acreate_client
+        Args:
+            settings: Connection URL, key, pool size and timeouts.
+        """
+        self.settings = settings
+        self._http: httpx.AsyncClient | None = None
+        self._client: AsyncClient | None = None
 
-from src.api.app.core.config import get_settings
+    @property
+    def is_open(self) -> bool:
+        """Whether the shared client is available."""
+        return self._client is not None
+
+    @property
+    def client(self) -> AsyncClient:
+        """The shared client.
+
+        Raises:
+            RuntimeError: If the pool isn't open.
+        """
+        if self._client is None:
+            raise RuntimeError("Supabase pool is not open")
+        return self._client
+
+    async def open(self) -> AsyncClient:
+        """Create the shared client (no-op if already open).
+
+        Returns:
+            The shared client.
+        """
+        if self._client is not None:
+            return self._client
+
+        settings = self.settings
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.supabase_pool_size,
+                max_keepalive_connections=settings.supabase_pool_size,
+                keepalive_expiry=settings.supabase_keepalive_seconds,
+            ),
+            timeout=httpx.Timeout(
+                settings.supabase_timeout_seconds,
+                connect=settings.supabase_connect_timeout_seconds,
+            ),
+            follow_redirects=True,
+        )
+        try:
+            self._client = await acreate_client(
+                settings.supabase_url,
+                _supabase_key(settings),
+                AsyncClientOptions(httpx_client=self._http),
+            )
+        except Exception:
+            await self._http.aclose()
+            self._http = None
+            raise
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        http, self._http, self._client = self._http, None, None
+        if http is not None:
+            await http.aclose()
+
+
+@lru_cache
+def get_supabase_pool() -> SupabasePool:
+    """Get the process-wide Supabase pool (opened by the app lifespan)."""
+    return SupabasePool(get_settings())
 
 
 async def get_supabase_client() -> AsyncClient:
-    """Create an async Supabase client instance.
-    
+    """Get an async Supabase client instance.
+
+    Returns the shared client while the app is running. Otherwise a new
+    client is created.
+
     Uses service_role key to bypass RLS — the API is the trusted backend.
     Falls back to anon key if service_role key is not configured.
     """
+    pool = get_supabase_pool()
+    if pool.is_open:
+        return pool.client
+
     settings = get_settings()
-    key = settings.supabase_service_role_key or settings.supabase_anon_key
     return await acreate_client(
         settings.supabase_url,
-        key,
+        _supabase_key(settings),
     )
 
 
@@ -36,4 +144,4 @@ async def get_supabase() -> AsyncGenerator[AsyncClient]:
     """
     client = await get_supabase_client()
     yield client
-    # AsyncClient has no close method; no cleanup needed
+    # The shared client outlives the request; it's closed on shutdown
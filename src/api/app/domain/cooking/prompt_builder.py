@@ -11,6 +11,7 @@ from typing import cast
 from src.api.app.domain.cooking.models import ContextExportResponse, CookingContext
 from src.api.app.domain.pantry.models import PantryItem
 from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.pantry_index import PantryIndex
 from src.api.app.domain.recipes.models import ParsedIngredient, Recipe, RecipeIngredient
 
 
@@ -66,7 +67,7 @@ class PromptBuilder:
     def build_context(
         self,
         recipe: Recipe,
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
         *,
         user_preferences: list[str] | None = None,
     ) -> CookingContext:
@@ -74,12 +75,14 @@ class PromptBuilder:
 
         Args:
             recipe: The recipe to cook.
-            pantry_items: Current pantry items.
+            pantry_items: Current pantry items, or a prebuilt PantryIndex.
             user_preferences: User's cooking preferences.
 
         Returns:
             CookingContext with all relevant info.
         """
+        pantry = self.delta_service.build_pantry_index(pantry_items)
+
         # Format ingredients as strings
         ingredients = []
         for ing in recipe.ingredients or []:
@@ -100,7 +103,7 @@ class PromptBuilder:
         )
         result = self.delta_service.calculate_missing(
             recipe_ingredients,
-            pantry_items,
+            pantry,
         )
 
         available = [f"✓ {item.item_name}" for item in result.have_enough]
@@ -113,7 +116,7 @@ class PromptBuilder:
         # Generate substitution hints
         substitutions = self._generate_substitution_hints(
             [item.item_name for item in result.missing],
-            pantry_items,
+            pantry,
         )
 
         return CookingContext(
@@ -218,13 +221,13 @@ class PromptBuilder:
     def _generate_substitution_hints(
         self,
         missing_items: list[str],
-        pantry_items: list[PantryItem],
+        pantry: PantryIndex,
     ) -> list[str]:
         """Generate substitution suggestions.
 
         Args:
             missing_items: Items the user is missing.
-            pantry_items: What they have.
+            pantry: What they have.
 
         Returns:
             List of substitution suggestions.
@@ -245,7 +248,7 @@ class PromptBuilder:
             "chicken broth": ["vegetable broth", "water + bouillon"],
         }
 
-        pantry_names = {item.name.lower() for item in pantry_items}
+        pantry_names = pantry.names
 
         for missing in missing_items:
             missing_lower = missing.lower()
@@ -22,6 +22,7 @@ from src.api.app.domain.cooking.models import (
 from src.api.app.domain.cooking.prompt_builder import PromptBuilder
 from src.api.app.domain.pantry.models import PantryItem
 from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.pantry_index import PantryIndex
 from src.api.app.domain.recipes.models import Recipe
 
 
@@ -53,7 +54,7 @@ class CookingService:
     async def get_cooking_context(
         self,
         recipe: Recipe,
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
         *,
         user_preferences: list[str] | None = None,
     ) -> CookingContext:
@@ -61,7 +62,7 @@ class CookingService:
 
         Args:
             recipe: The recipe to cook.
-            pantry_items: Current inventory.
+            pantry_items: Current inventory, or a prebuilt PantryIndex.
             user_preferences: User's preferences.
 
         Returns:
@@ -69,21 +70,21 @@ class CookingService:
         """
         return self.prompt_builder.build_context(
             recipe,
-            pantry_items,
+            self.delta_service.build_pantry_index(pantry_items),
             user_preferences=user_preferences,
         )
 
     async def export_context(
         self,
         recipe: Recipe,
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
         request: ContextExportRequest,
     ) -> ContextExportResponse:
         """Export cooking context for clipboard.
 
         Args:
             recipe: The recipe.
-            pantry_items: Current inventory.
+            pantry_items: Current inventory, or a prebuilt PantryIndex.
             request: Export configuration.
 
         Returns:
@@ -180,14 +181,14 @@ class CookingService:
     async def mark_cooked(
         self,
         recipe: Recipe,
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
         request: MarkCookedRequest,
     ) -> MarkCookedResponse:
         """Mark a recipe as cooked and deduct inventory.
 
         Args:
             recipe: The cooked recipe.
-            pantry_items: Current inventory.
+            pantry_items: Current inventory, or a prebuilt PantryIndex.
             request: Cook request with servings.
 
         Returns:
@@ -202,6 +203,8 @@ class CookingService:
                 items_decremented=[],
             )
 
+        pantry = self.delta_service.build_pantry_index(pantry_items)
+
         # Calculate what was used
         for ing in recipe.ingredients or []:
             if not ing.quantity:
@@ -213,17 +216,12 @@ class CookingService:
             used_quantity = ing.quantity * scale_factor
 
             # Find matching pantry item
-            matched = False
-            for pantry_item in pantry_items:
-                if pantry_item.name.lower() == ing.item_name.lower():
-                    matched = True
-                    # In production: update database
-                    items_decremented.append(
-                        f"{ing.item_name}: -{used_quantity} {ing.unit or 'units'}"
-                    )
-                    break
-
-            if not matched:
+            if ing.item_name in pantry:
+                # In production: update database
+                items_decremented.append(
+                    f"{ing.item_name}: -{used_quantity} {ing.unit or 'units'}"
+                )
+            else:
                 warnings.append(f"Couldn't find {ing.item_name} in pantry")
 
         return MarkCookedResponse(
@@ -0,0 +1,126 @@
+"""Request loaders - Each row at most once per request. 🚚
+
+One request can reach the same data along several paths: the handler
+loads a recipe (with ingredients) and then its ingredients again, two
+dependencies each read the whole pantry. RequestLoaders puts a
+DataLoader in front of each of these reads for one household:
+
+- recipes by ID, batched into one `get_by_ids` call
+- ingredients by recipe ID, batched into one `in_` query, and answered
+  for free once their recipe (or the whole catalog) has been loaded
+- the household's full recipe catalog and pantry snapshot, each read
+  once however many callers ask, concurrently or not
+
+The catalog and pantry come from the repositories' cached reads, so
+across requests they're only re-read after a change (see core/cache).
+Build one per request; results aren't refreshed after writes.
+
+Fun fact: A well-stocked mise en place means never opening the fridge
+twice for the same onion! 🧅
+"""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.api.app.db.loader import DataLoader
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.pantry.pg_repository import make_pantry_repository
+from src.api.app.domain.pantry.repository import PantryRepository
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+from src.api.app.domain.recipes.pg_repository import make_recipe_repository
+from src.api.app.domain.recipes.repository import RecipeRepository
+
+if TYPE_CHECKING:
+    from supabase import AsyncClient
+
+
+class RequestLoaders:
+    """Batching, de-duplicating reads for one household and request. 🚚
+
+    Example:
+        >>> loaders = RequestLoaders(household_id, recipe_repo, pantry_repo)
+        >>> recipe, pantry = await asyncio.gather(
+        ...     loaders.get_recipe(recipe_id), loaders.get_pantry_items()
+        ... )
+        >>> await loaders.get_ingredients(recipe_id)  # no query: came with the recipe
+    """
+
+    def __init__(
+        self,
+        household_id: UUID,
+        recipes: RecipeRepository,
+        pantry: PantryRepository,
+    ) -> None:
+        """Initialize empty loaders.
+
+        Args:
+            household_id: The household every read is scoped to.
+            recipes: Repository for recipe and ingredient reads.
+            pantry: Repository for pantry reads.
+        """
+        self.household_id = household_id
+        self.recipes = recipes
+        self.pantry = pantry
+
+        self.recipe_loader: DataLoader[UUID, Recipe] = DataLoader(self._load_recipes)
+        self.ingredient_loader: DataLoader[UUID, list[RecipeIngredient]] = DataLoader(
+            self._load_ingredients
+        )
+        self.catalog_loader: DataLoader[UUID, list[Recipe]] = DataLoader(self._load_catalog)
+        self.pantry_loader: DataLoader[UUID, list[PantryItem]] = DataLoader(self._load_pantry)
+
+    @classmethod
+    def for_client(cls, household_id: UUID, supabase: "AsyncClient") -> "RequestLoaders":
+        """Build loaders over the configured repositories for a client."""
+        return cls(
+            household_id,
+            make_recipe_repository(supabase),
+            make_pantry_repository(supabase),
+        )
+
+    async def get_recipe(self, recipe_id: UUID) -> Recipe | None:
+        """Get a recipe with its ingredients (None if not found)."""
+        return await self.recipe_loader.load(recipe_id)
+
+    async def get_ingredients(self, recipe_id: UUID) -> list[RecipeIngredient]:
+        """Get a recipe's ingredients, in recipe order."""
+        return await self.ingredient_loader.load(recipe_id) or []
+
+    async def get_recipes(self) -> list[Recipe]:
+        """Get every recipe of the household, newest first."""
+        return await self.catalog_loader.load(self.household_id) or []
+
+    async def get_pantry_items(self) -> list[PantryItem]:
+        """Get every pantry item of the household, ordered by name."""
+        return await self.pantry_loader.load(self.household_id) or []
+
+    def _prime_recipe(self, recipe: Recipe) -> None:
+        """Share a loaded recipe (and its ingredients) with later loads."""
+        self.recipe_loader.prime(recipe.id, recipe)
+        if recipe.ingredients is not None:
+            self.ingredient_loader.prime(recipe.id, recipe.ingredients)
+
+    async def _load_recipes(self, recipe_ids: list[UUID]) -> dict[UUID, Recipe]:
+        """Batch function for recipes by ID."""
+        recipes = await self.recipes.get_by_ids(recipe_ids, self.household_id)
+        for recipe in recipes.values():
+            self._prime_recipe(recipe)
+        return recipes
+
+    async def _load_ingredients(
+        self, recipe_ids: list[UUID]
+    ) -> dict[UUID, list[RecipeIngredient]]:
+        """Batch function for ingredients by recipe ID."""
+        ingredients = await self.recipes._get_ingredients_for(recipe_ids)
+        return {recipe_id: ingredients.get(recipe_id, []) for recipe_id in recipe_ids}
+
+    async def _load_catalog(self, household_ids: list[UUID]) -> dict[UUID, list[Recipe]]:
+        """Batch function for the recipe catalog (always this household)."""
+        catalog = await self.recipes.get_catalog(self.household_id)
+        for recipe in catalog:
+            self._prime_recipe(recipe)
+        return {self.household_id: catalog}
+
+    async def _load_pantry(self, household_ids: list[UUID]) -> dict[UUID, list[PantryItem]]:
+        """Batch function for the pantry snapshot (always this household)."""
+        return {self.household_id: await self.pantry.get_snapshot(self.household_id)}
@@ -0,0 +1,99 @@
+"""Pantry repository - Direct Postgres reads. 🐘
+
+Reads pantry items over asyncpg instead of PostgREST, returning exactly
+what PantryRepository would. Writes are inherited and still go through
+Supabase.
+
+Fun fact: Scoring reads the whole pantry for every plan - the one read
+worth taking the shortcut for! 🏃
+"""
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.api.app.core.config import get_settings
+from src.api.app.db.pagination import DEFAULT_CHUNK_SIZE
+from src.api.app.db.postgres import read_pool_for
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.pantry.repository import PantryRepository
+
+if TYPE_CHECKING:
+    import asyncpg
+    from supabase import AsyncClient
+
+ITEM_BY_ID_SQL = "SELECT * FROM pantry_items WHERE id = $1 AND household_id = $2"
+
+FIRST_ITEMS_SQL = """
+SELECT * FROM pantry_items
+WHERE household_id = $1
+ORDER BY name, id
+LIMIT $2
+"""
+
+# Keyset page: rows strictly after the (name, id) cursor
+ITEMS_AFTER_SQL = """
+SELECT * FROM pantry_items
+WHERE household_id = $1 AND (name, id) > ($2, $3)
+ORDER BY name, id
+LIMIT $4
+"""
+
+
+class PostgresPantryRepository(PantryRepository):
+    """PantryRepository reading items straight from Postgres. 🐘"""
+
+    def __init__(self, supabase: "AsyncClient", pool: "asyncpg.Pool") -> None:
+        """Initialize repository.
+
+        Args:
+            supabase: Client used for writes.
+            pool: asyncpg pool used for reads.
+        """
+        super().__init__(supabase)
+        self.pool = pool
+
+    async def get_by_id(self, item_id: UUID, household_id: UUID) -> PantryItem | None:
+        """Get a single pantry item by ID."""
+        row = await self.pool.fetchrow(ITEM_BY_ID_SQL, item_id, household_id)
+        return PantryItem.model_validate(dict(row)) if row is not None else None
+
+    async def iter_by_household(
+        self,
+        household_id: UUID,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[list[PantryItem]]:
+        """Stream every pantry item of a household, ordered by name.
+
+        Pages by keyset on (name, id), like the PostgREST version.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        cursor: tuple | None = None
+        while True:
+            if cursor is None:
+                rows = await self.pool.fetch(FIRST_ITEMS_SQL, household_id, chunk_size)
+            else:
+                rows = await self.pool.fetch(ITEMS_AFTER_SQL, household_id, *cursor, chunk_size)
+
+            if rows:
+                yield [PantryItem.model_validate(dict(row)) for row in rows]
+            if len(rows) < chunk_size:
+                return
+            cursor = (rows[-1]["name"], rows[-1]["id"])
+
+
+def make_pantry_repository(supabase: "AsyncClient") -> PantryRepository:
+    """Build the pantry repository for the configured read backend.
+
+    Falls back to PostgREST reads if the Postgres pool isn't open.
+    """
+    pool = read_pool_for(get_settings().pantry_read_backend)
+    if pool is None:
+        return PantryRepository(supabase)
+    return PostgresPantryRepository(supabase, pool)
@@ -7,10 +7,13 @@ Fun fact: The word "repository" comes from Latin "repositorium",
 meaning "a place where things are stored" - perfect for a pantry! 📚
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from src.api.app.core.cache import PANTRY, cached_read
+from src.api.app.db.pagination import DEFAULT_CHUNK_SIZE, iter_keyset
 from src.api.app.domain.pantry.models import (
     CreatePantryItemDTO,
     PantryItem,
@@ -53,6 +56,7 @@ class PantryRepository:
             return PantryItem.model_validate(result.data)
         return None
 
+    @cached_read(PANTRY)
     async def get_all_by_household(
         self,
         household_id: UUID,
@@ -87,6 +91,43 @@ class PantryRepository:
 
         return items, total
 
+    async def iter_by_household(
+        self,
+        household_id: UUID,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[list[PantryItem]]:
+        """Stream every pantry item of a household, ordered by name.
+
+        Pages by keyset on (name, id) instead of offsets.
+
+        Args:
+            household_id: The household to fetch items for.
+            chunk_size: Items per request.
+
+        Yields:
+            Chunks of pantry items.
+        """
+        chunks = iter_keyset(
+            lambda: (
+                self.supabase.table(self.TABLE_NAME)
+                .select("*")
+                .eq("household_id", str(household_id))
+            ),
+            sort_column="name",
+            chunk_size=chunk_size,
+        )
+        async for rows in chunks:
+            yield [PantryItem.model_validate(row) for row in rows]
+
+    @cached_read(PANTRY)
+    async def get_snapshot(self, household_id: UUID) -> list[PantryItem]:
+        """Get every pantry item of a household, ordered by name.
+
+        Cached until the pantry changes.
+        """
+        return [item async for chunk in self.iter_by_household(household_id) for item in chunk]
+
     async def create(self, household_id: UUID, dto: CreatePantryItemDTO) -> PantryItem:
         """Create a new pantry item.
 
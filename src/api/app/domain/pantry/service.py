@@ -8,6 +8,8 @@ Fun fact: A well-organized pantry can reduce food waste by up to 25%! 🌍
 
 from uuid import UUID
 
+from src.api.app.core.background import DebouncedTaskRunner, get_background_runner
+from src.api.app.core.cache import PANTRY, HouseholdCache, get_household_cache
 from src.api.app.domain.pantry.models import (
     CreatePantryItemDTO,
     PantryItem,
@@ -15,6 +17,7 @@ from src.api.app.domain.pantry.models import (
     UpdatePantryItemDTO,
 )
 from src.api.app.domain.pantry.repository import PantryRepository
+from src.api.app.domain.planning.match_cache import MatchCache, get_match_cache
 
 
 class PantryItemNotFoundError(Exception):
@@ -32,13 +35,36 @@ class PantryService:
     applying business rules and validation.
     """
 
-    def __init__(self, repository: PantryRepository) -> None:
+    def __init__(
+        self,
+        repository: PantryRepository,
+        match_cache: MatchCache | None = None,
+        background_runner: DebouncedTaskRunner | None = None,
+        cache: HouseholdCache | None = None,
+    ) -> None:
         """Initialize service with repository.
 
         Args:
             repository: The pantry repository instance.
+            match_cache: Ingredient match cache to invalidate on writes
+                (uses the process-wide one if not provided).
+            background_runner: Runner notified on writes so planner results
+                are precomputed (uses the process-wide one if not provided).
+            cache: Read cache to invalidate on writes (uses the
+                process-wide one if not provided).
         """
         self.repository = repository
+        self.match_cache = match_cache if match_cache is not None else get_match_cache()
+        self.background_runner = (
+            background_runner if background_runner is not None else get_background_runner()
+        )
+        self.cache = cache if cache is not None else get_household_cache()
+
+    def _pantry_changed(self, household_id: UUID) -> None:
+        """Drop cached state derived from the household's pantry."""
+        self.match_cache.invalidate(household_id)
+        self.cache.bump(household_id, PANTRY)
+        self.background_runner.notify(household_id)
 
     async def get_item(self, item_id: UUID, household_id: UUID) -> PantryItem:
         """Get a single pantry item.
@@ -112,7 +138,9 @@ class PantryService:
             notes=dto.notes,
         )
 
-        return await self.repository.create(household_id, normalized_dto)
+        item = await self.repository.create(household_id, normalized_dto)
+        self._pantry_changed(household_id)
+        return item
 
     async def update_item(
         self,
@@ -147,6 +175,7 @@ class PantryService:
         item = await self.repository.update(item_id, household_id, dto)
         if not item:
             raise PantryItemNotFoundError(item_id)
+        self._pantry_changed(household_id)
         return item
 
     async def delete_item(self, item_id: UUID, household_id: UUID) -> None:
@@ -162,6 +191,7 @@ class PantryService:
         deleted = await self.repository.delete(item_id, household_id)
         if not deleted:
             raise PantryItemNotFoundError(item_id)
+        self._pantry_changed(household_id)
 
     async def search_items(
         self,
@@ -222,4 +252,6 @@ class PantryService:
             unit=unit,
         )
 
-        return await self.repository.create(household_id, dto)
+        item = await self.repository.create(household_id, dto)
+        self._pantry_changed(household_id)
+        return item
@@ -11,12 +11,16 @@ from src.api.app.domain.planner.models import (
     PlanSummary,
     RecipeScore,
     RecipeStub,
+    ScoringBackend,
     ScoringCriteria,
     SelectOptionRequest,
 )
+from src.api.app.domain.planner.optimizer import OptimizationResult, ShoppingOptimizer
+from src.api.app.domain.planner.plan_cache import PlanOptionsCache, get_plan_options_cache
 from src.api.app.domain.planner.repository import PlannerRepository
 from src.api.app.domain.planner.scorer import RecipeScorer
 from src.api.app.domain.planner.service import PlannerService, PlanNotFoundError
+from src.api.app.domain.planner.variety import VarietyIndex
 
 __all__ = [
     # Generator
@@ -32,8 +36,15 @@ __all__ = [
     "PlanSummary",
     "RecipeScore",
     "RecipeStub",
+    "ScoringBackend",
     "ScoringCriteria",
     "SelectOptionRequest",
+    # Optimizer
+    "OptimizationResult",
+    "ShoppingOptimizer",
+    # Plan cache
+    "PlanOptionsCache",
+    "get_plan_options_cache",
     # Repository
     "PlannerRepository",
     # Scorer
@@ -41,4 +52,6 @@ __all__ = [
     # Service
     "PlannerService",
     "PlanNotFoundError",
+    # Variety
+    "VarietyIndex",
 ]
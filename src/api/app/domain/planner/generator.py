@@ -8,10 +8,11 @@ reduces cognitive load by 60% compared to free-form planning! 🧠
 """
 
 import random
-import time
 from typing import Any, cast
-from uuid import uuid4
 
+from src.api.app.core.config import get_settings
+from src.api.app.core.logging import get_logger
+from src.api.app.core.timing import StageTimer
 from src.api.app.domain.pantry.models import PantryItem
 from src.api.app.domain.planner.models import (
     CreatePlanRequest,
@@ -19,9 +20,15 @@ from src.api.app.domain.planner.models import (
     PlanOptionsResponse,
     RecipeStub,
 )
+from src.api.app.domain.planner.optimizer import ShoppingOptimizer
 from src.api.app.domain.planner.scorer import RecipeScorer
+from src.api.app.domain.planner.variety import VarietyIndex
+from src.api.app.domain.planning.keyword_matcher import KeywordMatcher
+from src.api.app.domain.planning.pantry_index import PantryIndex
 from src.api.app.domain.recipes.models import Recipe
 
+logger = get_logger(__name__)
+
 # Theme definitions for plan options
 THEMES = {
     "efficiency": {
@@ -74,31 +81,51 @@ class PlanGenerator:
     def __init__(
         self,
         scorer: RecipeScorer | None = None,
+        optimizer: ShoppingOptimizer | None = None,
     ) -> None:
         """Initialize the generator.
 
         Args:
             scorer: Recipe scorer for ranking.
+            optimizer: Meal selector used when a request asks to
+                optimize shopping.
         """
         self.scorer = scorer or RecipeScorer()
+        self.optimizer = optimizer or ShoppingOptimizer(
+            budget_ms=get_settings().plan_optimizer_budget_ms
+        )
 
     def generate_options(
         self,
         request: CreatePlanRequest,
         recipes: list[Recipe],
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
+        *,
+        seed: int | None = None,
     ) -> PlanOptionsResponse:
         """Generate plan options for the user.
 
+        All randomness (theme picks, shuffles, option IDs) comes from one
+        generator seeded with `seed`, so equal inputs and seed give equal
+        options.
+
+        Each stage (scoring, constraint filtering, theme selection and
+        one selection pass per option) is timed. Timings are logged and
+        returned in `stage_timings_ms`.
+
         Args:
             request: The plan request with dates and constraints.
             recipes: Available recipes to choose from.
-            pantry_items: Current inventory.
+            pantry_items: Current inventory, or a prebuilt PantryIndex.
+            seed: Random seed (defaults to `request.seed`, then a random one).
 
         Returns:
             PlanOptionsResponse with generated options.
         """
-        start_time = time.time()
+        timer = StageTimer()
+        if seed is None:
+            seed = request.seed if request.seed is not None else random.randrange(2**32)
+        rng = random.Random(seed)
 
         # Calculate number of meals needed
         num_days = (request.end_date - request.start_date).days + 1
@@ -106,27 +133,33 @@ class PlanGenerator:
         total_meals = num_days * meals_per_day
 
         # Score all recipes
-        all_scores = self.scorer.score_recipes(recipes, pantry_items)
-        scored_recipes = {s.recipe_id: s for s in all_scores}
+        with timer.stage("score"):
+            all_scores = self.scorer.score_recipes(recipes, pantry_items)
+            scored_recipes = {s.recipe_id: s for s in all_scores}
 
         # Filter recipes based on constraints
-        filtered_recipes = self._apply_constraints(recipes, request.constraints)
+        with timer.stage("constraints"):
+            filtered_recipes = self._apply_constraints(recipes, request.constraints)
 
         # Select themes for options
-        selected_themes = self._select_themes(request.num_options, request.constraints)
+        with timer.stage("themes"):
+            selected_themes = self._select_themes(request.num_options, request.constraints, rng)
 
         # Generate each option
         options = []
         for theme_key in selected_themes:
             theme = cast(dict[str, Any], THEMES[theme_key])
-            option = self._generate_single_option(
-                theme_key,
-                theme,
-                filtered_recipes,
-                scored_recipes,
-                total_meals,
-                pantry_items,
-            )
+            with timer.stage(f"option:{theme_key}"):
+                option = self._generate_single_option(
+                    theme_key,
+                    theme,
+                    filtered_recipes,
+                    scored_recipes,
+                    total_meals,
+                    pantry_items,
+                    rng,
+                    optimize_shopping=request.optimize_shopping,
+                )
             if option:
                 options.append(option)
 
@@ -136,14 +169,17 @@ class PlanGenerator:
             for theme_key in THEMES:
                 if theme_key not in selected_themes:
                     theme = cast(dict[str, Any], THEMES[theme_key])
-                    option = self._generate_single_option(
-                        theme_key,
-                        theme,
-                        filtered_recipes,
-                        scored_recipes,
-                        total_meals,
-                        pantry_items,
-                    )
+                    with timer.stage(f"option:{theme_key}"):
+                        option = self._generate_single_option(
+                            theme_key,
+                            theme,
+                            filtered_recipes,
+                            scored_recipes,
+                            total_meals,
+                            pantry_items,
+                            rng,
+                            optimize_shopping=request.optimize_shopping,
+                        )
                     if option:
                         options.append(option)
                         selected_themes.append(theme_key)
@@ -151,23 +187,37 @@ class PlanGenerator:
             else:
                 break
 
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        total_ms = timer.total_ms
+        stages = timer.as_dict()
+        logger.info(
+            "Plan options generated",
+            total_ms=round(total_ms, 3),
+            stages=stages,
+            recipes=len(recipes),
+            meals=total_meals,
+            options=len(options),
+            optimize_shopping=request.optimize_shopping,
+        )
 
         return PlanOptionsResponse(
             options=options[: request.num_options],
-            generation_time_ms=elapsed_ms,
+            generation_time_ms=int(total_ms),
+            seed=seed,
+            stage_timings_ms=stages,
         )
 
     def _select_themes(
         self,
         num_options: int,
         constraints: list[str],
+        rng: random.Random,
     ) -> list[str]:
         """Select which themes to use based on constraints.
 
         Args:
             num_options: How many options to generate.
             constraints: User's constraints (may influence theme selection).
+            rng: Random generator for the run.
 
         Returns:
             List of theme keys to use.
@@ -187,7 +237,7 @@ class PlanGenerator:
 
         # Fill remaining slots with variety
         remaining = [k for k in THEMES if k not in selected]
-        random.shuffle(remaining)
+        rng.shuffle(remaining)
 
         while len(selected) < num_options and remaining:
             selected.append(remaining.pop())
@@ -231,13 +281,16 @@ class PlanGenerator:
         if not exclusions:
             return recipes
 
+        # Compile once, then each recipe is a single scan
+        excluded = KeywordMatcher(exclusions)
+
         filtered = []
         for recipe in recipes:
             recipe_text = recipe.title.lower()
             if recipe.ingredients:
                 recipe_text += " " + " ".join(i.item_name.lower() for i in recipe.ingredients)
 
-            if not any(excl in recipe_text for excl in exclusions):
+            if not excluded.matches(recipe_text):
                 filtered.append(recipe)
 
         return filtered
@@ -249,7 +302,10 @@ class PlanGenerator:
         recipes: list[Recipe],
         scored_recipes: dict,
         total_meals: int,
-        _pantry_items: list[PantryItem],
+        _pantry_items: list[PantryItem] | PantryIndex,
+        rng: random.Random,
+        *,
+        optimize_shopping: bool = False,
     ) -> PlanOption | None:
         """Generate a single plan option.
 
@@ -260,6 +316,9 @@ class PlanGenerator:
             scored_recipes: Pre-computed scores.
             total_meals: Number of meals to plan.
             _pantry_items: Current inventory (reserved for future use).
+            rng: Random generator for the run.
+            optimize_shopping: Pick meals with the optimizer instead of
+                taking the theme's top recipes.
 
         Returns:
             PlanOption or None if not enough recipes.
@@ -269,12 +328,23 @@ class PlanGenerator:
             return None
 
         # Select recipes based on theme priority
-        selected = self._select_recipes_for_theme(
-            theme,
-            recipes,
-            scored_recipes,
-            total_meals,
-        )
+        objective = None
+        if optimize_shopping:
+            result = self.optimizer.optimize(
+                self._rank_for_theme(theme, recipes, scored_recipes, rng),
+                scored_recipes,
+                total_meals,
+            )
+            selected = result.recipes
+            objective = result.objective
+        else:
+            selected = self._select_recipes_for_theme(
+                theme,
+                recipes,
+                scored_recipes,
+                total_meals,
+                rng,
+            )
 
         if len(selected) < min(3, total_meals):
             return None
@@ -307,7 +377,7 @@ class PlanGenerator:
         estimated_shopping = len(all_missing)
 
         return PlanOption(
-            id=f"{theme_key}_{uuid4().hex[:8]}",
+            id=f"{theme_key}_{rng.getrandbits(32):08x}",
             title=theme["title"],
             theme=theme_key,
             description=theme["description"],
@@ -315,6 +385,7 @@ class PlanGenerator:
             estimated_shopping_items=estimated_shopping,
             inventory_usage_percent=avg_match,
             difficulty=self._estimate_difficulty(selected),
+            optimizer_objective=objective,
         )
 
     def _select_recipes_for_theme(
@@ -323,6 +394,7 @@ class PlanGenerator:
         recipes: list[Recipe],
         scored_recipes: dict,
         count: int,
+        rng: random.Random,
     ) -> list[Recipe]:
         """Select recipes matching a theme.
 
@@ -331,10 +403,44 @@ class PlanGenerator:
             recipes: Available recipes.
             scored_recipes: Pre-computed scores.
             count: Number of recipes to select.
+            rng: Random generator for the run.
 
         Returns:
             List of selected recipes.
         """
+        sorted_recipes = self._rank_for_theme(theme, recipes, scored_recipes, rng)
+
+        # Ensure variety (don't repeat similar recipes)
+        selected: list[Recipe] = []
+        variety = VarietyIndex()
+        for recipe in sorted_recipes:
+            if variety.allows(recipe):
+                variety.add(recipe.id, recipe)
+                selected.append(recipe)
+
+            if len(selected) >= count:
+                break
+
+        return selected
+
+    def _rank_for_theme(
+        self,
+        theme: dict,
+        recipes: list[Recipe],
+        scored_recipes: dict,
+        rng: random.Random,
+    ) -> list[Recipe]:
+        """Order recipes by a theme's priority (best first).
+
+        Args:
+            theme: Theme configuration.
+            recipes: Available recipes.
+            scored_recipes: Pre-computed scores.
+            rng: Random generator for the run.
+
+        Returns:
+            Recipes sorted for the theme.
+        """
         priority = theme.get("priority", "inventory_match")
 
         if priority == "inventory_match":
@@ -372,23 +478,9 @@ class PlanGenerator:
         else:
             # Random for variety
             sorted_recipes = recipes.copy()
-            random.shuffle(sorted_recipes)
+            rng.shuffle(sorted_recipes)
 
-        # Ensure variety (don't repeat similar recipes)
-        selected = []
-        used_titles: set[str] = set()
-
-        for recipe in sorted_recipes:
-            # Simple deduplication by title similarity
-            title_words = set(recipe.title.lower().split())
-            if not any(len(title_words.intersection(set(t.split()))) > 2 for t in used_titles):
-                selected.append(recipe)
-                used_titles.add(recipe.title.lower())
-
-            if len(selected) >= count:
-                break
-
-        return selected
+        return sorted_recipes
 
     def _estimate_difficulty(self, recipes: list[Recipe]) -> str:
         """Estimate overall difficulty of a plan.
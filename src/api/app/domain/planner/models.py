@@ -30,6 +30,14 @@ class MealType(str, Enum):
     SNACK = "snack"
 
 
+class ScoringBackend(str, Enum):
+    """Where recipe scoring runs. ⚙️"""
+
+    INLINE = "inline"  # In the calling thread
+    THREAD = "thread"  # Chunks on a thread pool
+    PROCESS = "process"  # Chunks on a process pool (uses every core)
+
+
 class RecipeStub(BaseModel):
     """Minimal recipe info for plan previews. 📖
 
@@ -74,6 +82,7 @@ class PlanOption(BaseModel):
     estimated_shopping_items: int | None = None
     inventory_usage_percent: float | None = None
     difficulty: str | None = None  # "Easy", "Moderate", "Adventurous"
+    optimizer_objective: float | None = None  # Set when optimize_shopping was used
 
 
 class MealPlan(BaseModel):
@@ -114,13 +123,29 @@ class CreatePlanRequest(BaseModel):
         default_factory=lambda: [MealType.DINNER],
         description="Which meals to plan",
     )
+    optimize_shopping: bool = Field(
+        default=False,
+        description="Pick meals that share ingredients to keep the shopping list short",
+    )
+    seed: int | None = Field(
+        default=None,
+        ge=0,
+        description="Random seed for reproducible options (derived from the inputs if omitted)",
+    )
+    include_timings: bool = Field(
+        default=False,
+        description="Return per-stage generation timings with the options",
+    )
 
 
 class PlanOptionsResponse(BaseModel):
     """Response with generated plan options. 🎲"""
 
     options: list[PlanOption]
-    generation_time_ms: int | None = None
+    generation_time_ms: int | None = None  # Time the options originally took to generate
+    seed: int | None = None  # Seed the options were generated with
+    cache_hit: bool = False  # Served from the plan options cache
+    stage_timings_ms: dict[str, float] | None = None  # Per-stage times, if requested
 
 
 class SelectOptionRequest(BaseModel):
@@ -0,0 +1,300 @@
+"""Shopping Optimizer - Plans that share ingredients. 🧺
+
+Picking each theme's top N recipes independently often leaves a week
+full of one-off purchases. The optimizer instead picks the set of meals
+that needs the fewest distinct items to buy, while still preferring
+recipes the theme ranks highly and recipes the pantry covers well.
+
+It's an anytime algorithm: a greedy pass builds a valid plan quickly,
+then local search swaps meals in and out until no swap helps. While
+the wall-clock budget lasts, the search restarts from different seed
+meals. The best plan found so far is returned, along with the
+objective value reached.
+
+Fun fact: Picking sets to cover the fewest items is a cousin of the
+set cover problem - one of Karp's original 21 NP-complete problems! 🧩
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from src.api.app.domain.planner.models import RecipeScore
+from src.api.app.domain.planner.variety import VarietyIndex
+from src.api.app.domain.recipes.models import Recipe
+
+
+@dataclass
+class OptimizationResult:
+    """Outcome of one optimizer run."""
+
+    recipes: list[Recipe]
+    objective: float  # Lower is better
+    shopping_items: int  # Distinct items to buy
+    iterations: int = 0  # Local search moves applied
+    elapsed_ms: float = 0.0
+    completed: bool = True  # False if the time budget cut the search short
+    missing_items: set[str] = field(default_factory=set)
+
+
+class ShoppingOptimizer:
+    """Selects meals minimizing distinct items to buy. 🧺
+
+    The objective (lower is better) for a set of meals is::
+
+        distinct missing items - scale * sum(meal bonus)
+
+        meal bonus = pantry_weight * inventory match fraction
+                     + rank_weight * theme rank bonus
+
+    The rank bonus is 1.0 for the theme's favourite recipe, falling
+    linearly to 0 for its last candidate. `scale` keeps the bonuses of a
+    whole plan below 1, so one extra item to buy always costs more than
+    any bonus: the item count dominates and the bonuses break ties.
+
+    Example:
+        >>> optimizer = ShoppingOptimizer(budget_ms=50)
+        >>> result = optimizer.optimize(ranked_recipes, scores, count=7)
+        >>> result.shopping_items, result.objective
+        (9, 8.3)
+    """
+
+    # Deadline is checked every this many move evaluations
+    _CHECK_EVERY = 64
+
+    def __init__(
+        self,
+        *,
+        budget_ms: float = 50.0,
+        pantry_weight: float = 0.5,
+        rank_weight: float = 0.5,
+        max_candidates: int = 300,
+    ) -> None:
+        """Initialize the optimizer.
+
+        Args:
+            budget_ms: Wall-clock budget per run.
+            pantry_weight: Reward per meal for pantry coverage (0-1 match).
+            rank_weight: Reward per meal for the theme's ranking.
+            max_candidates: Only the theme's top candidates are considered.
+        """
+        self.budget_ms = budget_ms
+        self.pantry_weight = pantry_weight
+        self.rank_weight = rank_weight
+        self.max_candidates = max_candidates
+
+    def optimize(
+        self,
+        ranked: list[Recipe],
+        scores: dict,
+        count: int,
+    ) -> OptimizationResult:
+        """Pick `count` meals from the theme's ranked candidates.
+
+        Args:
+            ranked: Candidate recipes, best first by theme priority.
+            scores: RecipeScore by recipe ID.
+            count: Number of meals to pick.
+
+        Returns:
+            OptimizationResult with the meals in theme order. Fewer meals
+            are returned if the variety rule leaves too few candidates.
+        """
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000
+        problem = _Problem.build(ranked[: self.max_candidates], scores, self, count)
+
+        selection, iterations, completed = problem.solve(deadline)
+
+        chosen = sorted(selection)
+        recipes = [problem.recipes[i] for i in chosen]
+        missing = {item for i in chosen for item in problem.missing_names[i]}
+        return OptimizationResult(
+            recipes=recipes,
+            objective=round(problem.objective(selection), 4),
+            shopping_items=len(missing),
+            iterations=iterations,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+            completed=completed,
+            missing_items=missing,
+        )
+
+
+@dataclass
+class _Problem:
+    """Precomputed candidate data for one run.
+
+    Candidates are identified by their position in theme order. Missing
+    items are interned to ints so set operations stay cheap.
+    """
+
+    recipes: list[Recipe]
+    missing: list[frozenset[int]]
+    missing_names: list[frozenset[str]]
+    bonus: list[float]  # Pantry and rank reward per candidate (scaled)
+    conflicts: list[set[int]]  # Candidates too similar to each one
+    count: int
+    uses: Counter[int] = field(default_factory=Counter)  # Item -> selected meals needing it
+
+    @classmethod
+    def build(
+        cls,
+        recipes: list[Recipe],
+        scores: dict,
+        optimizer: ShoppingOptimizer,
+        count: int,
+    ) -> "_Problem":
+        """Precompute missing-item sets, rewards and variety conflicts."""
+        item_ids: dict[str, int] = {}
+        missing: list[frozenset[int]] = []
+        missing_names: list[frozenset[str]] = []
+        bonus: list[float] = []
+        total = len(recipes)
+        # Largest possible bonus sum of a plan, plus one: keeps it below 1
+        scale = 1 / (max(count, 1) * (optimizer.pantry_weight + optimizer.rank_weight) + 1)
+
+        for rank, recipe in enumerate(recipes):
+            score: RecipeScore | None = scores.get(recipe.id)
+            names = frozenset(score.missing_items) if score else frozenset()
+            missing_names.append(names)
+            missing.append(frozenset(item_ids.setdefault(name, len(item_ids)) for name in names))
+
+            match = score.inventory_match_percent / 100 if score else 0.0
+            rank_bonus = 1 - rank / (total - 1) if total > 1 else 1.0
+            reward = optimizer.pantry_weight * match + optimizer.rank_weight * rank_bonus
+            bonus.append(scale * reward)
+
+        # Variety conflicts come from indexes, so only candidates sharing
+        # title words or signature buckets are ever compared
+        conflicts: list[set[int]] = [set() for _ in recipes]
+        variety = VarietyIndex()
+        for i, recipe in enumerate(recipes):
+            for j in variety.conflicts(recipe):
+                conflicts[i].add(j)
+                conflicts[j].add(i)
+            variety.add(i, recipe)
+
+        return cls(recipes, missing, missing_names, bonus, conflicts, count)
+
+    def objective(self, selection: set[int]) -> float:
+        """Objective value of a selection (lower is better)."""
+        items = set().union(*(self.missing[i] for i in selection)) if selection else set()
+        return len(items) - sum(self.bonus[i] for i in selection)
+
+    def add(self, selection: set[int], candidate: int) -> None:
+        """Add a candidate to the selection."""
+        selection.add(candidate)
+        self.uses.update(self.missing[candidate])
+
+    def remove(self, selection: set[int], candidate: int) -> None:
+        """Remove a candidate from the selection."""
+        selection.discard(candidate)
+        self.uses.subtract(self.missing[candidate])
+
+    def add_delta(self, candidate: int) -> float:
+        """Objective change from adding a candidate."""
+        new_items = sum(1 for item in self.missing[candidate] if self.uses[item] <= 0)
+        return new_items - self.bonus[candidate]
+
+    def swap_delta(self, out: int, candidate: int) -> float:
+        """Objective change from replacing `out` with `candidate`."""
+        leaving = self.missing[out]
+        freed = sum(1 for item in leaving if self.uses[item] == 1)
+        added = sum(
+            1
+            for item in self.missing[candidate]
+            if self.uses[item] <= 0 or (self.uses[item] == 1 and item in leaving)
+        )
+        return added - freed - self.bonus[candidate] + self.bonus[out]
+
+    def allowed(self, selection: set[int], candidate: int, ignore: int = -1) -> bool:
+        """Check the variety rule against the selection."""
+        return candidate not in selection and not any(
+            other in selection for other in self.conflicts[candidate] if other != ignore
+        )
+
+    def solve(self, deadline: float) -> tuple[set[int], int, bool]:
+        """Run greedy + local search, restarting from seed meals.
+
+        The first run starts from an empty plan. Greedy alone can't see
+        that several meals sharing an item beat the theme's favourites,
+        so further runs force each candidate (in theme order) into the
+        plan first. The best local optimum found before the deadline wins.
+
+        Returns:
+            Tuple of (selection, local search moves, whether every
+            restart finished before the deadline).
+        """
+        best = self.greedy()
+        moves, completed = self.local_search(best, deadline)
+        best_value = self.objective(best)
+
+        for seed in range(len(self.recipes)):
+            if not completed or time.perf_counter() >= deadline:
+                return best, moves, False
+            if seed in best:
+                continue  # Already part of the best plan
+            selection = self.greedy(seed)
+            seed_moves, completed = self.local_search(selection, deadline)
+            moves += seed_moves
+            value = self.objective(selection)
+            if value < best_value - 1e-9:
+                best, best_value = selection, value
+
+        return best, moves, completed
+
+    def greedy(self, seed: int | None = None) -> set[int]:
+        """Build a plan by repeatedly adding the cheapest allowed meal.
+
+        Ties go to the theme's higher-ranked candidate.
+
+        Args:
+            seed: Candidate to put in the plan first, if any.
+        """
+        self.uses = Counter()
+        selection: set[int] = set()
+        if seed is not None and self.count > 0:
+            self.add(selection, seed)
+        while len(selection) < self.count:
+            best, best_delta = -1, 0.0
+            for candidate in range(len(self.recipes)):
+                if not self.allowed(selection, candidate):
+                    continue
+                delta = self.add_delta(candidate)
+                if best < 0 or delta < best_delta:
+                    best, best_delta = candidate, delta
+            if best < 0:
+                break  # Variety rule leaves nothing else to add
+            self.add(selection, best)
+        return selection
+
+    def local_search(self, selection: set[int], deadline: float) -> tuple[int, bool]:
+        """Improve the selection with single swaps until none helps.
+
+        Uses first-improvement moves and stops at the deadline.
+
+        Returns:
+            Tuple of (moves applied, whether the search finished).
+        """
+        moves = 0
+        evaluations = 0
+        improved = True
+        while improved:
+            improved = False
+            for out in sorted(selection):
+                for candidate in range(len(self.recipes)):
+                    evaluations += 1
+                    if evaluations % ShoppingOptimizer._CHECK_EVERY == 0:
+                        if time.perf_counter() >= deadline:
+                            return moves, False
+                    if not self.allowed(selection, candidate, ignore=out):
+                        continue
+                    if self.swap_delta(out, candidate) < -1e-9:
+                        self.remove(selection, out)
+                        self.add(selection, candidate)
+                        moves += 1
+                        improved = True
+                        break
+                if improved:
+                    break
+        return moves, True
@@ -0,0 +1,192 @@
+"""Plan Options Cache - Reuse generated options for unchanged inputs. 🗃️
+
+Generating options scores the whole catalog, so asking again a few
+minutes later (same recipes, same pantry, same request) repeats all of
+that work for the same answer. This cache stores each generated
+PlanOptionsResponse under a content address:
+
+    (catalog version, pantry version, normalized request, criteria, day, seed)
+
+Any change to an input changes the key, so entries never need explicit
+invalidation - stale ones simply stop being asked for and age out by
+TTL or least-recently-used eviction.
+
+Fun fact: Git stores every file under the hash of its contents - the
+same trick makes identical files free to store twice! 🌳
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+
+from src.api.app.core.config import get_settings
+from src.api.app.domain.planner.models import (
+    CreatePlanRequest,
+    PlanOptionsResponse,
+    ScoringCriteria,
+)
+
+
+def normalize_request(request: CreatePlanRequest) -> dict:
+    """Reduce a request to the fields that affect generation.
+
+    Constraints are compared case-insensitively and as a set, and meal
+    types as a set. The seed is keyed separately.
+    """
+    return {
+        "start_date": request.start_date.isoformat(),
+        "end_date": request.end_date.isoformat(),
+        "constraints": sorted({c.strip().lower() for c in request.constraints if c.strip()}),
+        "num_options": request.num_options,
+        "meal_types": sorted({meal_type.value for meal_type in request.meal_types}),
+        "optimize_shopping": request.optimize_shopping,
+    }
+
+
+def content_key(
+    catalog_version: str,
+    pantry_version: str,
+    request: CreatePlanRequest,
+    criteria: ScoringCriteria,
+    today: date | None = None,
+) -> str:
+    """Hash everything plan generation depends on (except the seed).
+
+    Today's date is included since spoilage scores depend on it.
+
+    Args:
+        catalog_version: Recipe catalog version.
+        pantry_version: Pantry snapshot version.
+        request: The plan request.
+        criteria: Scoring criteria in use.
+        today: Date to key on (defaults to today).
+
+    Returns:
+        Hex digest of the inputs.
+    """
+    payload = json.dumps(
+        {
+            "catalog": catalog_version,
+            "pantry": pantry_version,
+            "request": normalize_request(request),
+            "criteria": criteria.model_dump(mode="json"),
+            "day": (today or date.today()).isoformat(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def seed_for(key: str) -> int:
+    """Derive a stable seed from a content key.
+
+    Used when the request has no seed, so repeating a request with the
+    same inputs gives the same options.
+    """
+    return int(key[:8], 16)
+
+
+@dataclass
+class _Entry:
+    """A cached response and when it expires."""
+
+    response: PlanOptionsResponse
+    expires_at: float
+
+
+class PlanOptionsCache:
+    """TTL + LRU cache of generated plan options. 🗃️
+
+    Safe to share between threads. Counters record hits, misses and
+    evictions.
+
+    Example:
+        >>> cache = PlanOptionsCache(ttl_seconds=300, max_entries=256)
+        >>> cache.put(key, seed, response)
+        >>> cache.get(key, seed).cache_hit
+        True
+    """
+
+    def __init__(self, *, ttl_seconds: float = 300.0, max_entries: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: How long an entry is served after it's stored.
+            max_entries: Most entries kept (least recently used go first).
+                Zero disables caching.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, int], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, seed: int) -> PlanOptionsResponse | None:
+        """Get a cached response.
+
+        Args:
+            key: Content key from `content_key`.
+            seed: Seed the options were generated with.
+
+        Returns:
+            Copy of the stored response flagged as a cache hit (with its
+            original generation time), or None.
+        """
+        with self._lock:
+            entry = self._entries.get((key, seed))
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[(key, seed)]
+                    self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((key, seed))
+            self.hits += 1
+            return entry.response.model_copy(update={"cache_hit": True}, deep=True)
+
+    def put(self, key: str, seed: int, response: PlanOptionsResponse) -> None:
+        """Store a freshly generated response.
+
+        Args:
+            key: Content key from `content_key`.
+            seed: Seed the options were generated with.
+            response: The generated options.
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[(key, seed)] = _Entry(
+                response=response.model_copy(deep=True),
+                expires_at=time.monotonic() + self.ttl_seconds,
+            )
+            self._entries.move_to_end((key, seed))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache
+def get_plan_options_cache() -> PlanOptionsCache:
+    """Get the process-wide plan options cache."""
+    settings = get_settings()
+    return PlanOptionsCache(
+        ttl_seconds=settings.plan_cache_ttl_seconds,
+        max_entries=settings.plan_cache_max_entries,
+    )
@@ -2,18 +2,169 @@
 
 Handles meal slot locking, re-rolling, and refinement with directives.
 
+Each plan being refined gets a session holding the catalog's scores, so
+a reroll only has to mask out excluded recipes instead of rescoring.
+Sessions live in a process-wide store, so they outlast the request (and
+the RefinerService) that created them.
+
 Fun fact: The "slot machine" metaphor comes from the satisfying randomness
 of pulling a lever and getting a new combination! 🎲
 """
 
 import random
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from uuid import UUID, uuid4
 
+from src.api.app.core.config import get_settings
+from src.api.app.core.logging import get_logger
+from src.api.app.core.timing import StageTimer
 from src.api.app.domain.pantry.models import PantryItem
-from src.api.app.domain.planner.models import MealSlot, MealType, RecipeStub
+from src.api.app.domain.planner.models import MealSlot, MealType, RecipeScore, RecipeStub
 from src.api.app.domain.planner.scorer import RecipeScorer
+from src.api.app.domain.planner.variety import VarietyIndex
+from src.api.app.domain.planning.pantry_index import PantryIndex
+from src.api.app.domain.planning.precompute import catalog_version
 from src.api.app.domain.recipes.models import Recipe
 
+logger = get_logger(__name__)
+
+# Tags boosted by directive keywords
+PREFERENCE_TAGS = {
+    "healthy": ["healthy", "light", "low-fat", "vegetable"],
+    "spicy": ["spicy", "hot", "cajun", "thai", "mexican"],
+    "comfort": ["comfort", "hearty", "stew", "soup", "casserole"],
+    "vegetarian": ["vegetarian", "vegan", "meatless"],
+}
+
+
+@dataclass
+class RefinementSession:
+    """Score table for one plan's reroll session. 🗒️
+
+    The catalog is scored once; after that a reroll only walks the
+    ranking (best first) until it has enough candidates that pass the
+    exclusions and directive.
+    """
+
+    plan_id: UUID
+    version: tuple[str, str, str]  # (catalog, pantry, scoring criteria)
+    recipes: dict[UUID, Recipe]
+    scores: dict[UUID, RecipeScore]
+    ranking: list[UUID]  # Scored recipes, best first (catalog order on ties)
+    positions: dict[UUID, int] = field(default_factory=dict)  # Catalog order
+    source: tuple[Hashable, str] | None = None  # (caller's source version, criteria)
+    rerolls: int = 0
+
+    def top(
+        self,
+        count: int,
+        allowed: Callable[[Recipe], bool],
+        tie_break: Callable[[Recipe], tuple] = lambda _recipe: (),
+    ) -> list[RecipeScore]:
+        """Get the best allowed candidates.
+
+        Stops walking the ranking once `count` candidates are found and
+        the score drops below the last one, so ties are complete before
+        `tie_break` (then catalog order) decides between them.
+        """
+        found: list[RecipeScore] = []
+        for recipe_id in self.ranking:
+            score = self.scores[recipe_id]
+            if len(found) >= count and score.total_score != found[count - 1].total_score:
+                break
+            if allowed(self.recipes[recipe_id]):
+                found.append(score)
+
+        found.sort(
+            key=lambda s: (
+                -s.total_score,
+                tie_break(self.recipes[s.recipe_id]),
+                self.positions[s.recipe_id],
+            )
+        )
+        return found[:count]
+
+    def unscored(self, allowed: Callable[[Recipe], bool]) -> list[Recipe]:
+        """Get allowed recipes that have no score (no parsed ingredients)."""
+        return [
+            recipe
+            for recipe_id, recipe in self.recipes.items()
+            if recipe_id not in self.scores and allowed(recipe)
+        ]
+
+
+class RefinementSessionStore:
+    """Live reroll sessions by plan. 🗒️
+
+    Safe to share between threads. Past `max_sessions`, the least
+    recently used sessions are dropped.
+
+    Example:
+        >>> store = RefinementSessionStore(max_sessions=128)
+        >>> store.put(session)
+        >>> store.get(session.plan_id, session.version) is session
+        True
+    """
+
+    def __init__(self, *, max_sessions: int = 128) -> None:
+        """Initialize an empty store.
+
+        Args:
+            max_sessions: Most sessions kept.
+        """
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[UUID, RefinementSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, plan_id: UUID, version: tuple[str, str, str]) -> RefinementSession | None:
+        """Get a plan's session if it was scored at the given version."""
+        with self._lock:
+            session = self._sessions.get(plan_id)
+            if session is None or session.version != version:
+                return None
+            self._sessions.move_to_end(plan_id)
+            return session
+
+    def get_current(self, plan_id: UUID, source: tuple[Hashable, str]) -> RefinementSession | None:
+        """Get a plan's session if it was last checked against the given source."""
+        with self._lock:
+            session = self._sessions.get(plan_id)
+            if session is None or session.source != source:
+                return None
+            self._sessions.move_to_end(plan_id)
+            return session
+
+    def put(self, session: RefinementSession) -> None:
+        """Store (or replace) a plan's session."""
+        with self._lock:
+            self._sessions[session.plan_id] = session
+            self._sessions.move_to_end(session.plan_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def end(self, plan_id: UUID) -> None:
+        """Drop a plan's session."""
+        with self._lock:
+            self._sessions.pop(plan_id, None)
+
+    def clear(self) -> None:
+        """Drop every session."""
+        with self._lock:
+            self._sessions.clear()
+
+
+@lru_cache
+def get_refinement_sessions() -> RefinementSessionStore:
+    """Get the process-wide reroll session store."""
+    return RefinementSessionStore(max_sessions=get_settings().refiner_max_sessions)
+
 
 class RefinerService:
     """Service for refining meal plan slots. 🎰
@@ -30,22 +181,90 @@ class RefinerService:
     def __init__(
         self,
         scorer: RecipeScorer | None = None,
+        sessions: RefinementSessionStore | None = None,
     ) -> None:
         """Initialize the refiner.
 
         Args:
             scorer: Recipe scorer for ranking alternatives.
+            sessions: Reroll session store (uses the process-wide one
+                if not provided).
         """
         self.scorer = scorer or RecipeScorer()
+        self.sessions = sessions if sessions is not None else get_refinement_sessions()
+
+    async def get_session(
+        self,
+        plan_id: UUID,
+        available_recipes: list[Recipe],
+        pantry_items: list[PantryItem] | PantryIndex,
+        *,
+        source_version: Hashable | None = None,
+    ) -> RefinementSession:
+        """Get a plan's reroll session, scoring the catalog if needed.
+
+        The score table is reused until the catalog, the pantry or the
+        scoring criteria change. Checking that hashes the whole catalog,
+        unless the caller passes `source_version`: while it's unchanged
+        the session is returned as is, and only a new one triggers the
+        content check.
+
+        Args:
+            plan_id: The plan being refined.
+            available_recipes: All available recipes.
+            pantry_items: Current inventory, or a prebuilt PantryIndex.
+            source_version: Version of where the recipes and pantry were
+                read from, e.g. the household cache's RECIPES and PANTRY
+                namespace versions. Read it before loading them.
+
+        Returns:
+            RefinementSession for the plan.
+        """
+        criteria = self.scorer.criteria.model_dump_json()
+        source = (source_version, criteria) if source_version is not None else None
+        if source is not None:
+            session = self.sessions.get_current(plan_id, source)
+            if session is not None:
+                return session
+
+        pantry = self.scorer.delta_service.build_pantry_index(pantry_items)
+        version = (catalog_version(available_recipes), pantry.version, criteria)
+
+        session = self.sessions.get(plan_id, version)
+        if session is not None:
+            session.source = source
+            return session
+
+        scores = await self.scorer.score_recipes_async(available_recipes, pantry)
+        positions = {recipe.id: position for position, recipe in enumerate(available_recipes)}
+        session = RefinementSession(
+            plan_id=plan_id,
+            version=version,
+            recipes={recipe.id: recipe for recipe in available_recipes},
+            scores={score.recipe_id: score for score in scores},
+            # score_recipes sorts stably, so ties are already in catalog order
+            ranking=[score.recipe_id for score in scores],
+            positions=positions,
+            source=source,
+        )
+
+        self.sessions.put(session)
+        return session
+
+    def end_session(self, plan_id: UUID) -> None:
+        """Drop a plan's reroll session (e.g. once the plan is saved)."""
+        self.sessions.end(plan_id)
 
     async def reroll_slot(
         self,
         slot: MealSlot,
         available_recipes: list[Recipe],
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
         directive: str | None = None,
         *,
         exclude_recipe_ids: list[UUID] | None = None,
+        source_version: Hashable | None = None,
+        timer: StageTimer | None = None,
     ) -> RecipeStub:
         """Re-roll a single meal slot.
 
@@ -57,9 +276,13 @@ class RefinerService:
         Args:
             slot: The slot to re-roll.
             available_recipes: All available recipes.
-            pantry_items: Current inventory.
+            pantry_items: Current inventory, or a prebuilt PantryIndex.
             directive: Optional text directive (e.g., "Make it healthy").
             exclude_recipe_ids: Recipe IDs to exclude from selection.
+            source_version: Version of the recipes' and pantry's source
+                (see `get_session`).
+            timer: Collects stage timings (session, masks, select) for
+                the caller. Timings are logged either way.
 
         Returns:
             RecipeStub for the new recipe.
@@ -70,99 +293,121 @@ class RefinerService:
         if slot.is_locked:
             raise ValueError(f"Cannot reroll locked slot {slot.id}")
 
+        timer = timer or StageTimer()
         exclude_ids = set(exclude_recipe_ids or [])
         if slot.recipe_id:
             exclude_ids.add(slot.recipe_id)
 
-        # Filter recipes
-        candidates = [r for r in available_recipes if r.id not in exclude_ids]
-
-        # Apply directive filter if provided
-        if directive:
-            candidates = self._apply_directive_filter(candidates, directive)
-
-        if not candidates:
-            raise ValueError("No suitable recipes found for reroll")
-
-        # Score remaining candidates
-        scores = self.scorer.score_recipes(candidates, pantry_items)
-
-        # Add some randomness - pick from top 5
-        top_candidates = scores[:5]
-        if top_candidates:
-            selected = random.choice(top_candidates)
-            recipe = next(r for r in candidates if r.id == selected.recipe_id)
-            return RecipeStub(
-                id=recipe.id,
-                title=recipe.title,
-                prep_time_minutes=recipe.prep_time_minutes,
-                inventory_match_percent=selected.inventory_match_percent,
-                tags=recipe.tags or [],
+        # Scores come from the plan's session - only the masks are per reroll
+        with timer.stage("session"):
+            session = await self.get_session(
+                slot.plan_id, available_recipes, pantry_items, source_version=source_version
             )
+            session.rerolls += 1
+
+        with timer.stage("masks"):
+            directive_allows, tie_break = self._directive_mask(directive)
+
+            # Keep the plan varied: avoid near-copies of the replaced and excluded
+            # recipes, unless nothing else is left
+            variety = VarietyIndex()
+            for recipe_id in exclude_ids:
+                if recipe_id in session.recipes:
+                    variety.add(recipe_id, session.recipes[recipe_id])
+
+        def allowed(recipe: Recipe) -> bool:
+            return recipe.id not in exclude_ids and directive_allows(recipe)
 
-        # Fallback: random selection
-        recipe = random.choice(candidates)
-        return RecipeStub(
-            id=recipe.id,
-            title=recipe.title,
-            prep_time_minutes=recipe.prep_time_minutes,
-            tags=recipe.tags or [],
+        def varied(recipe: Recipe) -> bool:
+            return allowed(recipe) and variety.allows(recipe)
+
+        with timer.stage("select"):
+            # Add some randomness - pick from top 5
+            top_candidates = session.top(5, varied, tie_break) or session.top(
+                5, allowed, tie_break
+            )
+            if top_candidates:
+                selected = random.choice(top_candidates)
+                recipe = session.recipes[selected.recipe_id]
+                stub = RecipeStub(
+                    id=recipe.id,
+                    title=recipe.title,
+                    prep_time_minutes=recipe.prep_time_minutes,
+                    inventory_match_percent=selected.inventory_match_percent,
+                    tags=recipe.tags or [],
+                )
+            else:
+                candidates = session.unscored(varied) or session.unscored(allowed)
+                if not candidates:
+                    raise ValueError("No suitable recipes found for reroll")
+
+                # Fallback: random selection
+                recipe = random.choice(candidates)
+                stub = RecipeStub(
+                    id=recipe.id,
+                    title=recipe.title,
+                    prep_time_minutes=recipe.prep_time_minutes,
+                    tags=recipe.tags or [],
+                )
+
+        logger.info(
+            "Slot rerolled",
+            plan_id=str(slot.plan_id),
+            total_ms=round(timer.total_ms, 3),
+            stages=timer.as_dict(),
+            rerolls=session.rerolls,
         )
+        return stub
 
-    def _apply_directive_filter(
+    def _directive_mask(
         self,
-        recipes: list[Recipe],
-        directive: str,
-    ) -> list[Recipe]:
-        """Apply user directive to filter recipes.
+        directive: str | None,
+    ) -> tuple[Callable[[Recipe], bool], Callable[[Recipe], tuple]]:
+        """Turn a directive into a filter and a tie-break key.
 
         Supports:
-        - "no X" / "without X" - exclude recipes with ingredient/tag X
-        - "X" / "with X" - prefer recipes with ingredient/tag X
-        - "quick" / "fast" - prefer recipes under 30 min
-        - "healthy" / "light" - prefer healthy-tagged recipes
-        - "spicy" - prefer spicy-tagged recipes
+        - "no X" / "without X" / "exclude X" - drop recipes with ingredient/tag X
+        - "quick" / "fast" / "easy" / "simple" - drop recipes over 30 min
+        - Preference keywords ("healthy", "spicy", ...) - among equal scores,
+          prefer recipes with the matching PREFERENCE_TAGS
+
+        Rules are evaluated per recipe, so they can be applied to a
+        session's ranking lazily.
 
         Args:
-            recipes: Recipes to filter.
-            directive: User's text directive.
+            directive: User's text directive, if any.
 
         Returns:
-            Filtered/sorted list of recipes.
+            Tuple of (allowed predicate, tie-break key). Lower keys win.
         """
+        if not directive:
+            return (lambda _recipe: True), (lambda _recipe: ())
+
         directive_lower = directive.lower()
-        result = recipes.copy()
-
-        # Handle exclusions: "no chicken", "without mushrooms"
-        exclusion_words = ["no ", "without ", "exclude "]
-        for word in exclusion_words:
-            if word in directive_lower:
-                # Extract what to exclude
-                exclude_term = directive_lower.split(word)[-1].strip().split()[0]
-                result = [r for r in result if not self._recipe_contains(r, exclude_term)]
-
-        # Handle time preferences
-        if any(w in directive_lower for w in ["quick", "fast", "easy", "simple"]):
-            result = [r for r in result if r.prep_time_minutes is None or r.prep_time_minutes <= 30]
-
-        # Handle tag-based preferences
-        preference_tags = {
-            "healthy": ["healthy", "light", "low-fat", "vegetable"],
-            "spicy": ["spicy", "hot", "cajun", "thai", "mexican"],
-            "comfort": ["comfort", "hearty", "stew", "soup", "casserole"],
-            "vegetarian": ["vegetarian", "vegan", "meatless"],
-        }
-
-        for keyword, tags in preference_tags.items():
-            if keyword in directive_lower:
-                # Boost recipes with these tags (sort to top)
-                result = sorted(
-                    result,
-                    key=lambda r: sum(1 for t in (r.tags or []) if t.lower() in tags),
-                    reverse=True,
-                )
+        exclude_terms = [
+            directive_lower.split(word)[-1].strip().split()[0]
+            for word in ["no ", "without ", "exclude "]
+            if word in directive_lower
+        ]
+        quick = any(w in directive_lower for w in ["quick", "fast", "easy", "simple"])
+        # Later keywords were applied as the outer sort, so they come first
+        preferences = [
+            tags for keyword, tags in PREFERENCE_TAGS.items() if keyword in directive_lower
+        ][::-1]
+
+        def allowed(recipe: Recipe) -> bool:
+            if any(self._recipe_contains(recipe, term) for term in exclude_terms):
+                return False
+            return not (
+                quick and recipe.prep_time_minutes is not None and recipe.prep_time_minutes > 30
+            )
+
+        def tie_break(recipe: Recipe) -> tuple:
+            return tuple(
+                -sum(1 for t in (recipe.tags or []) if t.lower() in tags) for tags in preferences
+            )
 
-        return result
+        return allowed, tie_break
 
     def _recipe_contains(self, recipe: Recipe, term: str) -> bool:
         """Check if recipe contains a term in title, tags, or ingredients.
@@ -224,8 +469,10 @@ class RefinerService:
         self,
         day_slots: list[MealSlot],
         available_recipes: list[Recipe],
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
         directive: str | None = None,
+        *,
+        source_version: Hashable | None = None,
     ) -> list[tuple[MealSlot, RecipeStub]]:
         """Re-roll all unlocked slots for a day.
 
@@ -236,6 +483,8 @@ class RefinerService:
             available_recipes: Available recipes.
             pantry_items: Current inventory.
             directive: Optional directive for all rerolls.
+            source_version: Version of the recipes' and pantry's source
+                (see `get_session`).
 
         Returns:
             List of (slot, new_recipe) tuples for unlocked slots.
@@ -243,6 +492,13 @@ class RefinerService:
         results = []
         used_recipe_ids: list[UUID] = []
 
+        # Every reroll scores against the same pantry - index it once
+        pantry = self.scorer.delta_service.build_pantry_index(pantry_items)
+        # The inputs can't change between this day's rerolls, so the catalog
+        # needs hashing at most once
+        if source_version is None:
+            source_version = object()
+
         # Include already-locked recipes in exclusion list
         for slot in day_slots:
             if slot.is_locked and slot.recipe_id:
@@ -255,9 +511,10 @@ class RefinerService:
             new_recipe = await self.reroll_slot(
                 slot,
                 available_recipes,
-                pantry_items,
+                pantry,
                 directive,
                 exclude_recipe_ids=used_recipe_ids,
+                source_version=source_version,
             )
 
             if new_recipe.id:
@@ -9,6 +9,7 @@ from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from src.api.app.db.pagination import iter_keyset
 from src.api.app.domain.planner.models import (
     MealPlan,
     MealSlot,
@@ -26,6 +27,8 @@ class PlannerRepository:
 
     PLANS_TABLE = "meal_plans"
     SLOTS_TABLE = "meal_slots"
+    # PostgREST's default row cap - slot counts page past it
+    SUMMARY_PAGE_SIZE = 1000
 
     def __init__(self, supabase: "AsyncClient") -> None:
         """Initialize repository with Supabase client."""
@@ -120,34 +123,52 @@ class PlannerRepository:
             query = query.in_("status", [PlanStatus.DRAFT.value, PlanStatus.ACTIVE.value])
 
         result = await query.execute()
-
-        summaries = []
-        for row in result.data or []:
-            # Get slot counts
-            slots_result = await (
-                self.supabase.table(self.SLOTS_TABLE)
-                .select("id, recipe_id")
-                .eq("plan_id", row["id"])
-                .execute()
-            )
-            slots = slots_result.data or []
-            total = len(slots)
-            completed = sum(1 for s in slots if s.get("recipe_id"))
-
-            summaries.append(
-                PlanSummary(
-                    id=row["id"],
-                    name=row["name"],
-                    start_date=row["start_date"],
-                    end_date=row["end_date"],
-                    status=row["status"],
-                    total_meals=total,
-                    completed_meals=completed,
-                    created_at=row["created_at"],
-                )
+        rows = result.data or []
+
+        # Slot counts for every plan in one query, grouped here
+        counts = await self._count_slots([row["id"] for row in rows])
+
+        return [
+            PlanSummary(
+                id=row["id"],
+                name=row["name"],
+                start_date=row["start_date"],
+                end_date=row["end_date"],
+                status=row["status"],
+                total_meals=counts.get(row["id"], (0, 0))[0],
+                completed_meals=counts.get(row["id"], (0, 0))[1],
+                created_at=row["created_at"],
             )
+            for row in rows
+        ]
+
+    async def _count_slots(self, plan_ids: list[str]) -> dict[str, tuple[int, int]]:
+        """Count total and filled slots per plan.
 
-        return summaries
+        One query covers every plan; further pages are only fetched if
+        the slots exceed the PostgREST row cap.
+
+        Returns:
+            (total, with a recipe) by plan ID.
+        """
+        counts: dict[str, tuple[int, int]] = {}
+        if not plan_ids:
+            return counts
+
+        chunks = iter_keyset(
+            lambda: (
+                self.supabase.table(self.SLOTS_TABLE)
+                .select("id, plan_id, recipe_id")
+                .in_("plan_id", plan_ids)
+            ),
+            sort_column="plan_id",
+            chunk_size=self.SUMMARY_PAGE_SIZE,
+        )
+        async for slots in chunks:
+            for slot in slots:
+                total, completed = counts.get(slot["plan_id"], (0, 0))
+                counts[slot["plan_id"]] = (total + 1, completed + bool(slot.get("recipe_id")))
+        return counts
 
     async def create_plan(
         self,
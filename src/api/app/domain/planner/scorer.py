@@ -3,17 +3,58 @@
 Scores recipes based on how well they match the current inventory,
 prioritizing items that are expiring soon.
 
+Scoring is pure CPU work. Large catalogs can be split into chunks and
+scored on a thread or process pool (see ScoringBackend), and async
+callers use `score_recipes_async` so the event loop is never blocked.
+
 Fun fact: Using expiring ingredients first can reduce food waste by 40%! 🌍
 """
 
+import asyncio
+import multiprocessing
+import pickle
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date, timedelta
+from multiprocessing import shared_memory
 from typing import cast
 
+from src.api.app.core.config import get_settings
 from src.api.app.domain.pantry.models import PantryItem
-from src.api.app.domain.planner.models import RecipeScore, ScoringCriteria
+from src.api.app.domain.planner.models import RecipeScore, ScoringBackend, ScoringCriteria
 from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.keyword_matcher import KeywordMatcher
+from src.api.app.domain.planning.models import ComparisonResult
+from src.api.app.domain.planning.pantry_index import PantryIndex
 from src.api.app.domain.recipes.models import ParsedIngredient, Recipe, RecipeIngredient
 
+# Keywords that mark an ingredient as fresh produce/herbs
+FRESH_MATCHER = KeywordMatcher(
+    [
+        "fresh",
+        "herb",
+        "basil",
+        "cilantro",
+        "parsley",
+        "mint",
+        "dill",
+        "chive",
+        "lettuce",
+        "spinach",
+        "arugula",
+        "tomato",
+        "cucumber",
+        "bell pepper",
+        "lemon",
+        "lime",
+        "orange",
+        "avocado",
+    ]
+)
+
 
 class RecipeScorer:
     """Scores recipes based on inventory match and freshness. 📊
@@ -30,56 +71,150 @@ class RecipeScorer:
         self,
         delta_service: DeltaService | None = None,
         criteria: ScoringCriteria | None = None,
+        *,
+        backend: ScoringBackend | None = None,
+        max_workers: int | None = None,
+        chunk_size: int | None = None,
     ) -> None:
         """Initialize the scorer.
 
         Args:
             delta_service: Service for comparing ingredients.
             criteria: Scoring configuration.
+            backend: Where to run scoring (defaults to settings).
+            max_workers: Pool size for the thread/process backends.
+            chunk_size: Recipes per pool task. Catalogs no bigger than
+                one chunk are always scored inline.
         """
+        settings = get_settings()
         self.delta_service = delta_service or DeltaService()
         self.criteria = criteria or ScoringCriteria()
+        self.backend = backend or ScoringBackend(settings.scoring_backend)
+        self.max_workers = max_workers or settings.scoring_workers
+        self.chunk_size = max(1, chunk_size or settings.scoring_chunk_size)
 
     def score_recipes(
         self,
         recipes: list[Recipe],
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
     ) -> list[RecipeScore]:
         """Score multiple recipes against the pantry.
 
+        The pantry is indexed once and shared by every recipe in the run.
+        With a pool backend the catalog is scored in chunks; results are
+        merged in catalog order before sorting, so the ranking (ties
+        included) is the same as scoring inline.
+
         Args:
             recipes: List of candidate recipes.
-            pantry_items: Current inventory.
+            pantry_items: Current inventory, or a prebuilt PantryIndex.
 
         Returns:
             List of RecipeScore sorted by total_score (descending).
         """
-        scores = [
-            self._score_single_recipe(recipe, pantry_items)
-            for recipe in recipes
-            if recipe.ingredients  # Skip recipes without parsed ingredients
-        ]
+        pantry = self.delta_service.build_pantry_index(pantry_items)
+        scores = self._score_unsorted(recipes, pantry)
 
         # Sort by total score descending
         scores.sort(key=lambda s: s.total_score, reverse=True)
         return scores
 
+    async def score_recipes_async(
+        self,
+        recipes: list[Recipe],
+        pantry_items: list[PantryItem] | PantryIndex,
+    ) -> list[RecipeScore]:
+        """Score recipes without blocking the event loop.
+
+        Same result as `score_recipes`, run in a worker thread.
+        """
+        return await asyncio.to_thread(self.score_recipes, recipes, pantry_items)
+
+    def _score_unsorted(self, recipes: list[Recipe], pantry: PantryIndex) -> list[RecipeScore]:
+        """Score recipes with the configured backend, in catalog order."""
+        # Skip recipes without parsed ingredients
+        candidates = [recipe for recipe in recipes if recipe.ingredients]
+
+        if self.backend is ScoringBackend.INLINE or len(candidates) <= self.chunk_size:
+            return [self._score_single_recipe(recipe, pantry) for recipe in candidates]
+        return self._score_on_pool(candidates, pantry)
+
+    def _score_on_pool(
+        self,
+        recipes: list[Recipe],
+        pantry: PantryIndex,
+    ) -> list[RecipeScore]:
+        """Score recipes in chunks on the configured pool.
+
+        Process workers get their chunk of recipes plus a handle to a
+        pantry snapshot published once per run in shared memory; each
+        worker reads and unpacks it only when its pantry is out of date.
+
+        Returns:
+            Scores in the same order as `recipes`.
+        """
+        chunks = [
+            recipes[start : start + self.chunk_size]
+            for start in range(0, len(recipes), self.chunk_size)
+        ]
+        executor = get_scoring_executor(self.backend, self.max_workers)
+
+        if self.backend is ScoringBackend.THREAD:
+            futures = [executor.submit(self._score_chunk, chunk, pantry) for chunk in chunks]
+            return _collect(futures)
+
+        with PantrySnapshot.from_index(pantry).shared() as shared:
+            futures = [
+                executor.submit(_score_chunk_in_worker, shared, self.criteria, chunk)
+                for chunk in chunks
+            ]
+            try:
+                return _collect(futures)
+            finally:
+                # On failure, drop chunks that haven't started and let running
+                # ones finish: the block must outlive every reader
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+
+    def _score_chunk(self, recipes: list[Recipe], pantry: PantryIndex) -> list[RecipeScore]:
+        """Score one chunk of recipes in order."""
+        return [self._score_single_recipe(recipe, pantry) for recipe in recipes]
+
     def _score_single_recipe(
         self,
         recipe: Recipe,
-        pantry_items: list[PantryItem],
+        pantry: PantryIndex,
     ) -> RecipeScore:
         """Score a single recipe.
 
         Args:
             recipe: Recipe to score.
-            pantry_items: Current inventory.
+            pantry: Indexed inventory snapshot.
 
         Returns:
             RecipeScore for the recipe.
         """
+        _, score = self.evaluate(recipe, pantry)
+        return score
+
+    def evaluate(
+        self,
+        recipe: Recipe,
+        pantry: PantryIndex,
+    ) -> tuple[ComparisonResult | None, RecipeScore]:
+        """Compare a recipe to the pantry and score it.
+
+        Args:
+            recipe: Recipe to score.
+            pantry: Indexed inventory snapshot.
+
+        Returns:
+            Tuple of (ComparisonResult, RecipeScore). The comparison is
+            None for recipes without parsed ingredients.
+        """
         if not recipe.ingredients:
-            return RecipeScore(
+            return None, RecipeScore(
                 recipe_id=recipe.id,
                 recipe_title=recipe.title,
                 inventory_match_percent=0.0,
@@ -96,7 +231,7 @@ class RecipeScorer:
         )
         comparison = self.delta_service.calculate_missing(
             ingredients,
-            pantry_items,
+            pantry,
         )
 
         total_ingredients = len(recipe.ingredients)
@@ -106,7 +241,7 @@ class RecipeScorer:
         # Calculate spoilage score (prioritize expiring items)
         spoilage_score = self._calculate_spoilage_score(
             comparison.have_enough,
-            pantry_items,
+            pantry,
         )
 
         # Calculate freshness score (prefer fresh produce)
@@ -123,7 +258,7 @@ class RecipeScorer:
         missing = [item.item_name for item in comparison.missing]
         missing.extend([item.item_name for item in comparison.partial])
 
-        return RecipeScore(
+        return comparison, RecipeScore(
             recipe_id=recipe.id,
             recipe_title=recipe.title,
             inventory_match_percent=inventory_match * 100,
@@ -136,7 +271,7 @@ class RecipeScorer:
     def _calculate_spoilage_score(
         self,
         matched_items: list,
-        pantry_items: list[PantryItem],
+        pantry: PantryIndex,
     ) -> float:
         """Calculate score based on using items about to expire.
 
@@ -148,28 +283,11 @@ class RecipeScorer:
         today = date.today()
         week_later = today + timedelta(days=7)
 
-        # Build lookup of pantry items by name
-        pantry_by_name: dict[str, PantryItem] = {}
-        for item in pantry_items:
-            key = item.name.lower().strip()
-            if key not in pantry_by_name:
-                pantry_by_name[key] = item
-            else:
-                existing = pantry_by_name[key]
-                # Keep the one expiring sooner
-                if item.expiry_date and existing.expiry_date:
-                    if item.expiry_date < existing.expiry_date:
-                        pantry_by_name[key] = item
-                elif item.expiry_date and not existing.expiry_date:
-                    pantry_by_name[key] = item
-
         expiring_count = 0
         for delta_item in matched_items:
-            key = delta_item.item_name.lower().strip()
-            if key in pantry_by_name:
-                pantry_item = pantry_by_name[key]
-                if pantry_item.expiry_date and pantry_item.expiry_date <= week_later:
-                    expiring_count += 1
+            expiry = pantry.earliest_expiry.get(pantry.normalize_name(delta_item.item_name))
+            if expiry and expiry <= week_later:
+                expiring_count += 1
 
         return expiring_count / len(matched_items) if matched_items else 0.0
 
@@ -181,32 +299,9 @@ class RecipeScorer:
         if not recipe.ingredients:
             return 0.0
 
-        fresh_keywords = {
-            "fresh",
-            "herb",
-            "basil",
-            "cilantro",
-            "parsley",
-            "mint",
-            "dill",
-            "chive",
-            "lettuce",
-            "spinach",
-            "arugula",
-            "tomato",
-            "cucumber",
-            "bell pepper",
-            "lemon",
-            "lime",
-            "orange",
-            "avocado",
-        }
-
-        fresh_count = 0
-        for ingredient in recipe.ingredients:
-            name_lower = ingredient.item_name.lower()
-            if any(keyword in name_lower for keyword in fresh_keywords):
-                fresh_count += 1
+        fresh_count = sum(
+            1 for ingredient in recipe.ingredients if FRESH_MATCHER.matches(ingredient.item_name)
+        )
 
         return fresh_count / len(recipe.ingredients)
 
@@ -270,3 +365,147 @@ class RecipeScorer:
             result.append(recipe)
 
         return result
+
+
+# =============================================================================
+# Pool backends
+# =============================================================================
+
+_PANTRY_FIELDS = tuple(PantryItem.model_fields)
+
+
+@dataclass(frozen=True)
+class PantrySnapshot:
+    """Compact, picklable pantry for process workers. 📦
+
+    Items are stored as pickled field tuples keyed by the snapshot
+    version, so a worker rebuilds its PantryIndex only when the pantry
+    actually changed.
+    """
+
+    version: str
+    payload: bytes
+
+    @classmethod
+    def from_index(cls, pantry: PantryIndex) -> "PantrySnapshot":
+        """Pack a pantry index."""
+        rows = [tuple(getattr(item, name) for name in _PANTRY_FIELDS) for item in pantry.items]
+        return cls(pantry.version, pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def to_index(self) -> PantryIndex:
+        """Unpack into a fresh pantry index."""
+        rows = pickle.loads(self.payload)
+        return PantryIndex(
+            [
+                PantryItem.model_construct(**dict(zip(_PANTRY_FIELDS, row, strict=True)))
+                for row in rows
+            ]
+        )
+
+    @contextmanager
+    def shared(self) -> Iterator["SharedPantrySnapshot"]:
+        """Publish the payload in shared memory for the duration of a run.
+
+        Yields:
+            A small handle that workers use to read the payload.
+        """
+        size = len(self.payload)
+        memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            memory.buf[:size] = self.payload
+            yield SharedPantrySnapshot(self.version, memory.name, size)
+        finally:
+            memory.close()
+            memory.unlink()
+
+
+@dataclass(frozen=True)
+class SharedPantrySnapshot:
+    """Handle to a pantry snapshot published in shared memory. 🔗
+
+    Only the version and the block's name travel with each chunk, so the
+    payload crosses into a worker at most once per pantry version.
+    """
+
+    version: str
+    name: str
+    size: int
+
+    def load(self) -> PantrySnapshot:
+        """Copy the snapshot out of shared memory."""
+        memory = shared_memory.SharedMemory(name=self.name, track=False)
+        try:
+            return PantrySnapshot(self.version, bytes(memory.buf[: self.size]))
+        finally:
+            memory.close()
+
+
+# Latest pantry unpacked in this (worker) process
+_worker_pantry: PantryIndex | None = None
+
+
+def _score_chunk_in_worker(
+    shared: SharedPantrySnapshot,
+    criteria: ScoringCriteria,
+    recipes: list[Recipe],
+) -> list[RecipeScore]:
+    """Score a chunk of recipes inside a process worker."""
+    global _worker_pantry
+    if _worker_pantry is None or _worker_pantry.version != shared.version:
+        _worker_pantry = shared.load().to_index()
+
+    scorer = RecipeScorer(criteria=criteria, backend=ScoringBackend.INLINE)
+    return scorer._score_chunk(recipes, _worker_pantry)
+
+
+def _collect(futures: list[Future[list[RecipeScore]]]) -> list[RecipeScore]:
+    """Merge chunk results in submission order."""
+    scores: list[RecipeScore] = []
+    for future in futures:
+        scores.extend(future.result())
+    return scores
+
+
+_executors: dict[tuple[ScoringBackend, int | None], Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_scoring_executor(backend: ScoringBackend, max_workers: int | None = None) -> Executor:
+    """Get the process-wide pool for a scoring backend.
+
+    Pools are created on first use and reused afterwards. Process pools
+    use the "spawn" start method, which is safe alongside the event loop
+    and other threads.
+
+    Args:
+        backend: THREAD or PROCESS.
+        max_workers: Pool size (None = one per CPU).
+
+    Raises:
+        ValueError: If called with the INLINE backend.
+    """
+    if backend is ScoringBackend.INLINE:
+        raise ValueError("The inline scoring backend doesn't use a pool")
+
+    key = (backend, max_workers)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            if backend is ScoringBackend.THREAD:
+                executor = ThreadPoolExecutor(max_workers, thread_name_prefix="recipe-scorer")
+            else:
+                executor = ProcessPoolExecutor(
+                    max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            _executors[key] = executor
+        return executor
+
+
+def shutdown_scoring_executors() -> None:
+    """Shut down every scoring pool (called on application shutdown)."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True, cancel_futures=True)
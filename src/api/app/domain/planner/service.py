@@ -5,6 +5,8 @@ Orchestrates meal plan generation and management.
 Fun fact: Meal planning can reduce food costs by up to 20%! 💰
 """
 
+import asyncio
+from datetime import date, timedelta
 from uuid import UUID
 
 from src.api.app.domain.pantry.models import PantryItem
@@ -20,11 +22,35 @@ from src.api.app.domain.planner.models import (
     ScoringCriteria,
     SelectOptionRequest,
 )
+from src.api.app.domain.planner.plan_cache import (
+    PlanOptionsCache,
+    content_key,
+    get_plan_options_cache,
+    seed_for,
+)
 from src.api.app.domain.planner.repository import PlannerRepository
 from src.api.app.domain.planner.scorer import RecipeScorer
+from src.api.app.domain.planning.precompute import (
+    PrecomputeStore,
+    catalog_version,
+    get_precompute_store,
+)
 from src.api.app.domain.recipes.models import Recipe
 
 
+# Length of the plan precomputed in the background (the planner's default week)
+DEFAULT_PLAN_DAYS = 7
+
+
+def default_plan_request(today: date | None = None) -> CreatePlanRequest:
+    """Get the request the planner sends when nothing is customized."""
+    start = today or date.today()
+    return CreatePlanRequest(
+        start_date=start,
+        end_date=start + timedelta(days=DEFAULT_PLAN_DAYS - 1),
+    )
+
+
 class PlanNotFoundError(Exception):
     """Raised when a meal plan is not found. 🔍"""
 
@@ -44,6 +70,8 @@ class PlannerService:
         repository: PlannerRepository,
         scorer: RecipeScorer | None = None,
         generator: PlanGenerator | None = None,
+        precompute_store: PrecomputeStore | None = None,
+        plan_cache: PlanOptionsCache | None = None,
     ) -> None:
         """Initialize service.
 
@@ -51,10 +79,18 @@ class PlannerService:
             repository: The planner repository instance.
             scorer: Optional recipe scorer.
             generator: Optional plan generator.
+            precompute_store: Store of precomputed recipe results (uses the
+                process-wide one if not provided).
+            plan_cache: Cache of generated plan options (uses the
+                process-wide one if not provided).
         """
         self.repository = repository
         self.scorer = scorer or RecipeScorer()
         self.generator = generator or PlanGenerator(self.scorer)
+        self.precompute_store = (
+            precompute_store if precompute_store is not None else get_precompute_store()
+        )
+        self.plan_cache = plan_cache if plan_cache is not None else get_plan_options_cache()
 
     # =========================================================================
     # Plan Generation (Phase 5A)
@@ -69,7 +105,11 @@ class PlannerService:
     ) -> PlanOptionsResponse:
         """Generate plan options for the user.
 
-        The "Choose Your Own Adventure" flow.
+        The "Choose Your Own Adventure" flow. Options are cached by the
+        content of their inputs, so repeating a request while recipes and
+        pantry are unchanged returns the stored options (`cache_hit`).
+        Without a seed in the request, the seed is derived from the
+        inputs, which makes such repeats reproducible.
 
         Args:
             _household_id: The household (reserved for future filtering).
@@ -80,7 +120,33 @@ class PlannerService:
         Returns:
             PlanOptionsResponse with options to choose from.
         """
-        return self.generator.generate_options(request, recipes, pantry_items)
+        # Hashing, scoring and selection are CPU-bound - keep them off the event loop
+        return await asyncio.to_thread(self._generate_cached, request, recipes, pantry_items)
+
+    def _generate_cached(
+        self,
+        request: CreatePlanRequest,
+        recipes: list[Recipe],
+        pantry_items: list[PantryItem],
+    ) -> PlanOptionsResponse:
+        """Serve plan options from the cache or generate them (blocking)."""
+        pantry = self.scorer.delta_service.build_pantry_index(pantry_items)
+        key = content_key(
+            catalog_version(recipes),
+            pantry.version,
+            request,
+            self.scorer.criteria,
+        )
+        seed = request.seed if request.seed is not None else seed_for(key)
+
+        response = self.plan_cache.get(key, seed)
+        if response is None:
+            response = self.generator.generate_options(request, recipes, pantry, seed=seed)
+            self.plan_cache.put(key, seed, response)
+
+        if not request.include_timings:
+            response.stage_timings_ms = None
+        return response
 
     async def score_recipes(
         self,
@@ -88,6 +154,7 @@ class PlannerService:
         pantry_items: list[PantryItem],
         *,
         criteria: ScoringCriteria | None = None,
+        household_id: UUID | None = None,
     ) -> list[RecipeScore]:
         """Score recipes against current inventory.
 
@@ -97,13 +164,54 @@ class PlannerService:
             recipes: Recipes to score.
             pantry_items: Current inventory.
             criteria: Optional scoring configuration.
+            household_id: If given, results are served from the precompute
+                store and only recipes affected by changes are rescored.
+                `recipes` must then be the household's full catalog.
 
         Returns:
             List of RecipeScore sorted by total score.
         """
         if criteria:
             self.scorer.criteria = criteria
-        return self.scorer.score_recipes(recipes, pantry_items)
+        if household_id is None:
+            return await self.scorer.score_recipes_async(recipes, pantry_items)
+
+        return await asyncio.to_thread(
+            self._score_precomputed, household_id, recipes, pantry_items
+        )
+
+    async def precompute(
+        self,
+        household_id: UUID,
+        recipes: list[Recipe],
+        pantry_items: list[PantryItem],
+    ) -> None:
+        """Warm the precompute store and the default plan options.
+
+        Run in the background after pantry or recipe changes, so the
+        next "Can I Cook This?" call and a default `/planner/generate`
+        request are served from cache.
+
+        Args:
+            household_id: The household.
+            recipes: The household's full catalog.
+            pantry_items: Current inventory.
+        """
+        await self.score_recipes(recipes, pantry_items, household_id=household_id)
+        if len(recipes) >= 3:  # Same minimum as the generate endpoint
+            await self.generate_options(
+                household_id, default_plan_request(), recipes, pantry_items
+            )
+
+    def _score_precomputed(
+        self,
+        household_id: UUID,
+        recipes: list[Recipe],
+        pantry_items: list[PantryItem],
+    ) -> list[RecipeScore]:
+        """Score the catalog through the precompute store (blocking)."""
+        pantry = self.scorer.delta_service.build_pantry_index(pantry_items)
+        return self.precompute_store.get_scores(household_id, recipes, pantry, self.scorer)
 
     # =========================================================================
     # Plan Management (Phase 5B)
@@ -0,0 +1,63 @@
+"""Variety Index - Keep near-identical meals out of one plan. 🌈
+
+A plan shouldn't contain two recipes that are really the same dish.
+Two rules decide that:
+
+- the titles share more than two words ("Slow Cooker Chicken Chili" vs
+  "Slow Cooker Chicken Chili Verde"), or
+- the recipes are near-duplicates by title words and ingredients
+  ("Beef Stew" vs "Hearty Beef and Bean Stew"), found through the
+  recipes' MinHash signatures.
+
+Both are answered from indexes over the recipes already chosen, so a
+check costs a few lookups no matter how big the plan is.
+
+Fun fact: Nutritionists recommend "eating the rainbow" - variety in
+colour is a good proxy for variety in nutrients! 🥕🥦🍆
+"""
+
+from collections import Counter
+from collections.abc import Hashable
+
+from src.api.app.domain.recipes.models import Recipe
+from src.api.app.domain.recipes.similarity import NearDuplicateIndex
+
+# Titles sharing more than this many words are too similar
+MAX_SHARED_TITLE_WORDS = 2
+
+
+class VarietyIndex:
+    """Recipes already in a plan, indexed for variety checks. 🌈
+
+    Example:
+        >>> variety = VarietyIndex()
+        >>> variety.add(stew.id, stew)
+        >>> variety.allows(bean_stew)
+        False
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._keys_by_word: dict[str, list[Hashable]] = {}
+        self._duplicates = NearDuplicateIndex()
+
+    def __len__(self) -> int:
+        return len(self._duplicates)
+
+    def add(self, key: Hashable, recipe: Recipe) -> None:
+        """Add a chosen recipe."""
+        for word in set(recipe.title.lower().split()):
+            self._keys_by_word.setdefault(word, []).append(key)
+        self._duplicates.add(key, recipe)
+
+    def conflicts(self, recipe: Recipe) -> set[Hashable]:
+        """Get keys of indexed recipes too similar to this one."""
+        shared: Counter[Hashable] = Counter()
+        for word in set(recipe.title.lower().split()):
+            shared.update(self._keys_by_word.get(word, ()))
+        similar = {key for key, words in shared.items() if words > MAX_SHARED_TITLE_WORDS}
+        return similar | self._duplicates.near_duplicates(recipe)
+
+    def allows(self, recipe: Recipe) -> bool:
+        """Check whether a recipe can join the indexed ones."""
+        return not self.conflicts(recipe)
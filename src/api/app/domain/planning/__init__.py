@@ -1,6 +1,10 @@
 # Planning domain module - Delta Engine
-from src.api.app.domain.planning.converter import UnitConverter
+from src.api.app.domain.planning.converter import UnitConverter, get_density_index
 from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.density import DensityIndex
+from src.api.app.domain.planning.fuzzy_index import TrigramIndex
+from src.api.app.domain.planning.keyword_matcher import KeywordMatch, KeywordMatcher
+from src.api.app.domain.planning.match_cache import MatchCache, get_match_cache
 from src.api.app.domain.planning.models import (
     ComparisonResult,
     DeltaItem,
@@ -8,13 +12,30 @@ from src.api.app.domain.planning.models import (
     VerificationRequest,
     VerificationResponse,
 )
+from src.api.app.domain.planning.pantry_index import PantryIndex
+from src.api.app.domain.planning.precompute import (
+    PrecomputeStore,
+    RecipeIndex,
+    get_precompute_store,
+)
 
 __all__ = [
     "ComparisonResult",
     "DeltaItem",
     "DeltaService",
     "DeltaStatus",
+    "DensityIndex",
+    "KeywordMatch",
+    "KeywordMatcher",
+    "MatchCache",
+    "PantryIndex",
+    "PrecomputeStore",
+    "RecipeIndex",
+    "TrigramIndex",
     "UnitConverter",
     "VerificationRequest",
     "VerificationResponse",
+    "get_density_index",
+    "get_match_cache",
+    "get_precompute_store",
 ]
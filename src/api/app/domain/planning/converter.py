@@ -6,8 +6,11 @@ Fun fact: 1 cup of flour weighs about 120g, but 1 cup of sugar weighs 200g! 🧁
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 
-from src.api.app.domain.recipes.unit_registry import UnitRegistry
+from src.api.app.core.config import get_settings
+from src.api.app.domain.planning.density import DensityIndex
+from src.api.app.domain.recipes.unit_registry import UnitRegistry, get_unit_registry
 
 
 @dataclass
@@ -107,13 +110,19 @@ class UnitConverter:
         "table salt": "salt",
     }
 
-    def __init__(self, unit_registry: UnitRegistry | None = None) -> None:
+    def __init__(
+        self,
+        unit_registry: UnitRegistry | None = None,
+        density_index: DensityIndex | None = None,
+    ) -> None:
         """Initialize the converter.
 
         Args:
-            unit_registry: Optional unit registry (creates one if not provided).
+            unit_registry: Optional unit registry (uses the shared one if not provided).
+            density_index: Optional density index (uses the shared one if not provided).
         """
-        self.unit_registry = unit_registry or UnitRegistry()
+        self.unit_registry = unit_registry or get_unit_registry()
+        self.density_index = density_index if density_index is not None else get_density_index()
 
     def convert(
         self,
@@ -146,16 +155,15 @@ class UnitConverter:
                 method="direct",
             )
 
-        # Try direct conversion first (same dimension)
-        if self.unit_registry.are_compatible(from_unit, to_unit):
-            converted = self.unit_registry.convert(value, from_unit, to_unit)
-            if converted is not None:
-                return ConversionResult(
-                    success=True,
-                    value=converted,
-                    target_unit=to_unit,
-                    method="direct",
-                )
+        # Try direct conversion first (None if the dimensions differ)
+        converted = self.unit_registry.convert(value, from_unit, to_unit)
+        if converted is not None:
+            return ConversionResult(
+                success=True,
+                value=converted,
+                target_unit=to_unit,
+                method="direct",
+            )
 
         # Try density-based conversion (volume <-> weight)
         if ingredient:
@@ -189,13 +197,8 @@ class UnitConverter:
         Returns:
             ConversionResult with converted value or error.
         """
-        # Normalize ingredient name
-        ingredient_lower = ingredient.lower().strip()
-        if ingredient_lower in self.INGREDIENT_ALIASES:
-            ingredient_lower = self.INGREDIENT_ALIASES[ingredient_lower]
-
-        # Look up density (grams per cup)
-        density = self._get_density(ingredient_lower)
+        # Look up density (grams per cup) - aliases are part of the index
+        density = self._get_density(ingredient)
         if density is None:
             return ConversionResult(
                 success=False,
@@ -278,18 +281,9 @@ class UnitConverter:
     def _get_density(self, ingredient: str) -> float | None:
         """Get density for an ingredient (grams per cup).
 
-        Tries exact match first, then partial match.
+        Picks the most specific known entry ("brown sugar" over "sugar").
         """
-        # Exact match
-        if ingredient in self.DENSITY_DB:
-            return self.DENSITY_DB[ingredient]
-
-        # Partial match (ingredient contains a known key)
-        for known, density in self.DENSITY_DB.items():
-            if known in ingredient or ingredient in known:
-                return density
-
-        return None
+        return self.density_index.get(ingredient)
 
     def _is_volume_unit(self, unit: str) -> bool:
         """Check if a unit is a volume unit."""
@@ -313,4 +307,18 @@ class UnitConverter:
 
     def get_known_ingredients(self) -> list[str]:
         """Get list of ingredients with known densities."""
-        return sorted(set(self.DENSITY_DB.keys()) | set(self.INGREDIENT_ALIASES.keys()))
+        return self.density_index.names
+
+
+@lru_cache
+def get_density_index() -> DensityIndex:
+    """Get the process-wide density index.
+
+    Built from the defaults in `UnitConverter`, plus the CSV file at
+    `Settings.density_data_path` if one is configured.
+    """
+    index = DensityIndex(UnitConverter.DENSITY_DB, UnitConverter.INGREDIENT_ALIASES)
+    data_path = get_settings().density_data_path
+    if data_path:
+        index.load_csv(data_path)
+    return index
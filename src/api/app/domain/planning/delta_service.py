@@ -7,16 +7,49 @@ Fun fact: The concept of "mise en place" (everything in its place)
 originated in French professional kitchens in the 19th century! 👨‍🍳
 """
 
-from difflib import SequenceMatcher
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import UUID
 
 from src.api.app.domain.pantry.models import PantryItem
 from src.api.app.domain.planning.converter import UnitConverter
+from src.api.app.domain.planning.keyword_matcher import KeywordMatcher
+from src.api.app.domain.planning.match_cache import CachedMatch, MatchCache, get_match_cache
 from src.api.app.domain.planning.models import (
     ComparisonResult,
     DeltaItem,
     DeltaStatus,
 )
-from src.api.app.domain.recipes.models import ParsedIngredient, RecipeIngredient
+from src.api.app.domain.planning.pantry_index import PantryIndex
+from src.api.app.domain.recipes.models import ParsedIngredient, Recipe, RecipeIngredient
+
+if TYPE_CHECKING:
+    from src.api.app.domain.planner.models import MealSlot
+
+
+@dataclass
+class PlanRequirement:
+    """Total amount of one ingredient needed across a plan."""
+
+    item_name: str
+    unit: str
+    quantity: float | None = None  # None if no recipe gave an amount
+    recipe_titles: list[str] = field(default_factory=list)
+
+    def add(self, quantity: float) -> None:
+        """Add a quantity already expressed in this requirement's unit."""
+        self.quantity = (self.quantity or 0) + quantity
+
+    def to_ingredient(self) -> ParsedIngredient:
+        """Express the total as an ingredient line for comparison."""
+        amount = f"{self.quantity:g} " if self.quantity is not None else ""
+        return ParsedIngredient(
+            raw_text=f"{amount}{self.unit} {self.item_name}",
+            quantity=self.quantity,
+            unit=self.unit,
+            item_name=self.item_name,
+        )
 
 
 class DeltaService:
@@ -29,6 +62,15 @@ class DeltaService:
         >>> service = DeltaService()
         >>> result = service.calculate_missing(recipe_ingredients, pantry_items)
         >>> print(f"Need to buy: {len(result.shopping_list_items)} items")
+
+    When comparing many recipes against the same pantry, build the
+    pantry index once and pass it instead of the raw item list:
+        >>> pantry = service.build_pantry_index(pantry_items)
+        >>> results = [service.calculate_missing(r, pantry) for r in recipes]
+
+    For a whole week, compare the plan in one pass so shared ingredients
+    are summed first and the pantry is only subtracted once:
+        >>> result = service.calculate_missing_for_plan(plan.slots, recipes_by_id, pantry)
     """
 
     # Items commonly assumed to be in any kitchen (staples)
@@ -44,22 +86,45 @@ class DeltaService:
             "vegetable oil",
         }
     )
+    STAPLE_MATCHER = KeywordMatcher(sorted(ASSUMED_STAPLES))
 
     # Minimum similarity score for fuzzy matching (0.0 - 1.0)
     FUZZY_MATCH_THRESHOLD = 0.7
 
-    def __init__(self, converter: UnitConverter | None = None) -> None:
+    def __init__(
+        self,
+        converter: UnitConverter | None = None,
+        match_cache: MatchCache | None = None,
+    ) -> None:
         """Initialize the delta service.
 
         Args:
             converter: Optional unit converter (creates one if not provided).
+            match_cache: Optional match cache (uses the process-wide one if not provided).
         """
         self.converter = converter or UnitConverter()
+        self.match_cache = match_cache if match_cache is not None else get_match_cache()
+
+    def build_pantry_index(
+        self,
+        pantry_items: list[PantryItem] | PantryIndex,
+    ) -> PantryIndex:
+        """Build a reusable pantry index (or pass an existing one through).
+
+        Args:
+            pantry_items: Current inventory items, or an already built index.
+
+        Returns:
+            PantryIndex sharing this service's unit converter.
+        """
+        if isinstance(pantry_items, PantryIndex):
+            return pantry_items
+        return PantryIndex(pantry_items, self.converter)
 
     def calculate_missing(
         self,
         recipe_ingredients: list[RecipeIngredient | ParsedIngredient],
-        pantry_items: list[PantryItem],
+        pantry_items: list[PantryItem] | PantryIndex,
         *,
         include_staples_in_assumptions: bool = True,
     ) -> ComparisonResult:
@@ -67,7 +132,7 @@ class DeltaService:
 
         Args:
             recipe_ingredients: Parsed ingredients from a recipe.
-            pantry_items: Current inventory items.
+            pantry_items: Current inventory items, or a prebuilt PantryIndex.
             include_staples_in_assumptions: Whether to assume common staples.
 
         Returns:
@@ -75,42 +140,154 @@ class DeltaService:
         """
         result = ComparisonResult(total_ingredients=len(recipe_ingredients))
 
-        # Build pantry lookup by normalized name
-        pantry_lookup = self._build_pantry_lookup(pantry_items)
+        pantry = self.build_pantry_index(pantry_items)
 
         for ingredient in recipe_ingredients:
             delta = self._compare_single_ingredient(
                 ingredient,
-                pantry_lookup,
+                pantry,
                 include_staples_in_assumptions,
             )
 
-            # Categorize by status
-            match delta.status:
-                case DeltaStatus.HAS_ENOUGH:
-                    result.have_enough.append(delta)
-                case DeltaStatus.PARTIAL:
-                    result.partial.append(delta)
-                case DeltaStatus.MISSING:
-                    result.missing.append(delta)
-                case DeltaStatus.ASSUMED:
-                    result.assumptions.append(delta)
-                case DeltaStatus.UNIT_MISMATCH:
-                    result.unresolved.append(delta)
+            self._categorize(result, delta)
 
         return result
 
+    def calculate_missing_for_plan(
+        self,
+        slots: list["MealSlot"],
+        recipes: Mapping[UUID, Recipe],
+        pantry_items: list[PantryItem] | PantryIndex,
+        *,
+        include_staples_in_assumptions: bool = True,
+    ) -> ComparisonResult:
+        """Calculate what's missing to cook every meal in a plan.
+
+        Each slot's recipe is scaled by `servings`, requirements are summed
+        per ingredient name in a common unit, and the pantry is subtracted
+        once from the totals. Two recipes that each need 3 onions against
+        a pantry of 4 correctly come out 2 short.
+
+        Args:
+            slots: Meal slots in the plan (slots without a recipe are skipped).
+            recipes: Recipes by ID, with `ingredients` populated.
+            pantry_items: Current inventory items, or a prebuilt PantryIndex.
+            include_staples_in_assumptions: Whether to assume common staples.
+
+        Returns:
+            ComparisonResult with one entry per ingredient (or per
+            unconvertible unit of an ingredient).
+        """
+        requirements = self._sum_plan_requirements(slots, recipes)
+        result = ComparisonResult(total_ingredients=len(requirements))
+
+        pantry = self.build_pantry_index(pantry_items)
+
+        for requirement in requirements:
+            delta = self._compare_single_ingredient(
+                requirement.to_ingredient(),
+                pantry,
+                include_staples_in_assumptions,
+            )
+            if delta.notes is None:
+                delta.notes = f"For: {', '.join(requirement.recipe_titles)}"
+            self._categorize(result, delta)
+
+        return result
+
+    def _sum_plan_requirements(
+        self,
+        slots: list["MealSlot"],
+        recipes: Mapping[UUID, Recipe],
+    ) -> list[PlanRequirement]:
+        """Sum scaled recipe requirements per normalized ingredient name.
+
+        Quantities are converted into the first unit seen for a name;
+        quantities in units that can't be converted get their own line.
+
+        Args:
+            slots: Meal slots in the plan.
+            recipes: Recipes by ID, with `ingredients` populated.
+
+        Returns:
+            Requirements in first-seen order.
+        """
+        totals: dict[str, list[PlanRequirement]] = {}
+
+        for slot in slots:
+            recipe = recipes.get(slot.recipe_id) if slot.recipe_id else None
+            if recipe is None:
+                continue
+            scale = slot.servings / recipe.servings if recipe.servings else 1.0
+
+            for ingredient in recipe.ingredients or []:
+                key = ingredient.item_name.lower().strip()
+                unit = self.converter.unit_registry.normalize_unit(ingredient.unit or "count")
+                quantity = ingredient.quantity * scale if ingredient.quantity is not None else None
+
+                group = self._add_to_requirements(totals.setdefault(key, []), key, quantity, unit)
+                if group is None:
+                    group = PlanRequirement(
+                        item_name=ingredient.item_name,
+                        unit=unit,
+                        quantity=quantity,
+                    )
+                    totals[key].append(group)
+                if recipe.title not in group.recipe_titles:
+                    group.recipe_titles.append(recipe.title)
+
+        return [requirement for groups in totals.values() for requirement in groups]
+
+    def _add_to_requirements(
+        self,
+        requirements: list[PlanRequirement],
+        name: str,
+        quantity: float | None,
+        unit: str,
+    ) -> PlanRequirement | None:
+        """Add a quantity to the first requirement it converts into.
+
+        Returns:
+            The requirement the quantity was added to, or None if none fits.
+        """
+        for requirement in requirements:
+            if quantity is None:
+                return requirement
+            if requirement.unit == unit:
+                requirement.add(quantity)
+                return requirement
+            conversion = self.converter.convert(quantity, unit, requirement.unit, ingredient=name)
+            if conversion.success and conversion.value is not None:
+                requirement.add(conversion.value)
+                return requirement
+        return None
+
+    @staticmethod
+    def _categorize(result: ComparisonResult, delta: DeltaItem) -> None:
+        """Append a delta item to the matching result bucket."""
+        match delta.status:
+            case DeltaStatus.HAS_ENOUGH:
+                result.have_enough.append(delta)
+            case DeltaStatus.PARTIAL:
+                result.partial.append(delta)
+            case DeltaStatus.MISSING:
+                result.missing.append(delta)
+            case DeltaStatus.ASSUMED:
+                result.assumptions.append(delta)
+            case DeltaStatus.UNIT_MISMATCH:
+                result.unresolved.append(delta)
+
     def _compare_single_ingredient(
         self,
         ingredient: RecipeIngredient | ParsedIngredient,
-        pantry_lookup: dict[str, list[PantryItem]],
+        pantry: PantryIndex,
         include_staples: bool,
     ) -> DeltaItem:
         """Compare a single ingredient against pantry.
 
         Args:
             ingredient: The recipe ingredient to check.
-            pantry_lookup: Pantry items indexed by normalized name.
+            pantry: Indexed pantry snapshot.
             include_staples: Whether to assume common staples.
 
         Returns:
@@ -131,7 +308,7 @@ class DeltaService:
             )
 
         # Try to find matching pantry item
-        match = self._find_pantry_match(item_name, pantry_lookup)
+        match = self._find_pantry_match(item_name, pantry)
 
         if match is None:
             # Not in pantry at all
@@ -280,129 +457,48 @@ class DeltaService:
             matched_pantry_item_id=pantry_item.id,
         )
 
-    def _build_pantry_lookup(
-        self,
-        pantry_items: list[PantryItem],
-    ) -> dict[str, list[PantryItem]]:
-        """Build a lookup dictionary from pantry items.
-
-        Groups items by normalized name for efficient lookup.
-        """
-        lookup: dict[str, list[PantryItem]] = {}
-        for item in pantry_items:
-            key = item.name.lower().strip()
-            if key not in lookup:
-                lookup[key] = []
-            lookup[key].append(item)
-        return lookup
-
     def _find_pantry_match(
         self,
         ingredient_name: str,
-        pantry_lookup: dict[str, list[PantryItem]],
+        pantry: PantryIndex,
     ) -> tuple[PantryItem, float] | None:
         """Find best matching pantry item for an ingredient.
 
-        Uses exact match first, then fuzzy matching.
-        Aggregates multiple pantry items with the same name into one.
+        Uses exact match first, then fuzzy matching via the trigram index.
+        Fuzzy results are memoized per pantry version in the match cache.
+        Multiple pantry items with the same name come back aggregated.
 
         Args:
             ingredient_name: Normalized ingredient name.
-            pantry_lookup: Pantry items indexed by name.
+            pantry: Indexed pantry snapshot.
 
         Returns:
             Tuple of (PantryItem, confidence) or None if no match.
         """
         # Exact match
-        if ingredient_name in pantry_lookup:
-            items = pantry_lookup[ingredient_name]
-            aggregated = self._aggregate_pantry_items(items)
+        aggregated = pantry.aggregated(ingredient_name)
+        if aggregated is not None:
             return (aggregated, 1.0)
 
         # Fuzzy match
-        best_match: tuple[PantryItem, float] | None = None
-        best_score = 0.0
+        cached = self.match_cache.get(pantry.household_id, pantry.version, ingredient_name)
+        if cached is None:
+            best = pantry.fuzzy_index.best_match(ingredient_name, self.FUZZY_MATCH_THRESHOLD)
+            cached = CachedMatch(*best) if best else CachedMatch(None, 0.0)
+            self.match_cache.put(pantry.household_id, pantry.version, ingredient_name, cached)
 
-        for pantry_name, items in pantry_lookup.items():
-            score = self._similarity_score(ingredient_name, pantry_name)
-            if score >= self.FUZZY_MATCH_THRESHOLD and score > best_score:
-                best_score = score
-                aggregated = self._aggregate_pantry_items(items)
-                best_match = (aggregated, score)
+        if cached.pantry_name is None:
+            return None
 
-        return best_match
-
-    def _aggregate_pantry_items(self, items: list[PantryItem]) -> PantryItem:
-        """Aggregate multiple pantry items with same name into one.
-
-        Combines quantities when units are compatible.
-        Uses the first item as the base and aggregates quantities.
-
-        Args:
-            items: List of pantry items with the same name.
-
-        Returns:
-            A single PantryItem with aggregated quantity.
-        """
-        if len(items) == 1:
-            return items[0]
-
-        # Use first item as base
-        base = items[0]
-        base_unit = self.converter.unit_registry.normalize_unit(base.unit or "count")
-        total_quantity = base.quantity or 0
-
-        # Try to add quantities from other items
-        for item in items[1:]:
-            if item.quantity is None:
-                continue
-
-            item_unit = self.converter.unit_registry.normalize_unit(item.unit or "count")
-
-            if item_unit == base_unit:
-                # Same unit - simple addition
-                total_quantity += item.quantity
-            else:
-                # Try to convert
-                conversion = self.converter.convert(
-                    item.quantity,
-                    item_unit,
-                    base_unit,
-                    ingredient=base.name,
-                )
-                if conversion.success and conversion.value is not None:
-                    total_quantity += conversion.value
-                # If conversion fails, skip this item (can't aggregate)
-
-        # Return a new PantryItem with aggregated quantity
-        return PantryItem(
-            id=base.id,
-            household_id=base.household_id,
-            name=base.name,
-            quantity=total_quantity,
-            unit=base.unit,
-            location=base.location,
-            expiry_date=base.expiry_date,
-            notes=base.notes,
-            is_staple=base.is_staple,
-            created_at=base.created_at,
-            updated_at=base.updated_at,
-        )
-
-    def _similarity_score(self, a: str, b: str) -> float:
-        """Calculate similarity between two strings.
-
-        Uses SequenceMatcher for basic fuzzy matching.
-        Could be upgraded to use trigrams or Levenshtein.
-        """
-        return SequenceMatcher(None, a, b).ratio()
+        aggregated = pantry.aggregated(cached.pantry_name)
+        if aggregated is None:
+            return None
+        return (aggregated, cached.confidence)
 
     def _is_staple(self, item_name: str) -> bool:
         """Check if an item is a common kitchen staple."""
-        # Check exact match or if any staple is contained in the name
-        return item_name in self.ASSUMED_STAPLES or any(
-            staple in item_name for staple in self.ASSUMED_STAPLES
-        )
+        # Exact match or any staple contained in the name, in one scan
+        return self.STAPLE_MATCHER.matches(item_name)
 
     def get_staples_list(self) -> list[str]:
         """Get list of items assumed to be staples."""
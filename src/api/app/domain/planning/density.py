@@ -0,0 +1,168 @@
+"""Density Index - Grams-per-cup lookup for volume <-> weight. 🧁
+
+Ingredient names are split into normalized tokens and every known name
+is stored under its token tuple. Looking up "dark brown sugar" tries the
+contiguous token runs of the query from longest to shortest, so the
+most specific known entry ("brown sugar") wins over a generic one
+("sugar"). The cost depends on the length of the query, not the size of
+the table, so USDA-sized tables with thousands of entries stay fast.
+
+Fun fact: A cup of sifted flour weighs about 20% less than a cup of
+scooped flour - bakers weigh for a reason! ⚖️
+"""
+
+import csv
+import re
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9%]+")
+
+
+def tokenize(name: str) -> tuple[str, ...]:
+    """Split a name into normalized tokens.
+
+    Lowercases, drops punctuation, and strips a plural "s"
+    ("rolled oats" -> ("rolled", "oat")).
+    """
+    return tuple(
+        token[:-1] if len(token) > 3 and token.endswith("s") and not token.endswith("ss") else token
+        for token in _TOKEN_PATTERN.findall(name.lower())
+    )
+
+
+class DensityIndex:
+    """Indexed ingredient density store (grams per cup). 🗂️
+
+    Example:
+        >>> index = DensityIndex({"sugar": 200.0, "brown sugar": 220.0})
+        >>> index.get("Dark Brown Sugar")
+        220.0
+        >>> index.get("organic cane sugar")
+        200.0
+    """
+
+    # Resolved lookups kept per index (ingredient vocabularies are small)
+    MAX_CACHED_LOOKUPS = 10_000
+
+    def __init__(
+        self,
+        densities: Mapping[str, float] | None = None,
+        aliases: Mapping[str, str] | None = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            densities: Ingredient name -> grams per cup.
+            aliases: Alternative name -> canonical name in `densities`.
+        """
+        self._entries: dict[tuple[str, ...], float] = {}
+        self._names: dict[str, float] = {}
+        self._resolved: dict[str, float | None] = {}
+        self.add_many((densities or {}).items())
+        if aliases:
+            self.add_aliases(aliases)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and tokenize(name) in self._entries
+
+    @property
+    def names(self) -> list[str]:
+        """Known ingredient names (including aliases), sorted."""
+        return sorted(self._names)
+
+    def add(self, name: str, grams_per_cup: float) -> None:
+        """Add or replace one entry."""
+        key = tokenize(name)
+        if not key:
+            return
+        self._entries[key] = grams_per_cup
+        self._names[name.lower().strip()] = grams_per_cup
+        self._resolved.clear()
+
+    def add_many(self, entries: Iterable[tuple[str, float]]) -> None:
+        """Add or replace several entries (later entries win)."""
+        for name, grams_per_cup in entries:
+            self.add(name, grams_per_cup)
+
+    def add_aliases(self, aliases: Mapping[str, str]) -> None:
+        """Register alternative names for existing entries.
+
+        Aliases whose target is unknown are ignored.
+        """
+        for alias, canonical in aliases.items():
+            density = self._entries.get(tokenize(canonical))
+            if density is not None:
+                self.add(alias, density)
+
+    def load_csv(self, path: str | Path) -> int:
+        """Load entries from a CSV file.
+
+        The file needs `name` and `grams_per_cup` columns. An optional
+        `aliases` column holds "|"-separated alternative names.
+
+        Args:
+            path: CSV file to read.
+
+        Returns:
+            Number of rows loaded.
+
+        Raises:
+            ValueError: If a required column is missing or a density isn't a number.
+        """
+        loaded = 0
+        with Path(path).open(newline="", encoding="utf-8") as handle:
+            reader = csv.DictReader(handle)
+            missing = {"name", "grams_per_cup"} - set(reader.fieldnames or [])
+            if missing:
+                raise ValueError(f"Density file {path} is missing columns: {sorted(missing)}")
+
+            for row in reader:
+                name = (row.get("name") or "").strip()
+                if not name:
+                    continue
+                try:
+                    grams_per_cup = float(row["grams_per_cup"])
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Invalid density for '{name}' in {path}") from e
+
+                self.add(name, grams_per_cup)
+                for alias in (row.get("aliases") or "").split("|"):
+                    if alias.strip():
+                        self.add(alias, grams_per_cup)
+                loaded += 1
+        return loaded
+
+    def get(self, ingredient: str) -> float | None:
+        """Get the density of the most specific matching entry.
+
+        Tries the whole name first, then shorter and shorter runs of
+        consecutive words. Among runs of the same length the one closest
+        to the end wins, since the main noun usually comes last.
+
+        Args:
+            ingredient: Ingredient name as written in a recipe.
+
+        Returns:
+            Grams per cup, or None if nothing matches.
+        """
+        if ingredient in self._resolved:
+            return self._resolved[ingredient]
+
+        density = self._match(tokenize(ingredient))
+
+        if len(self._resolved) < self.MAX_CACHED_LOOKUPS:
+            self._resolved[ingredient] = density
+        return density
+
+    def _match(self, tokens: tuple[str, ...]) -> float | None:
+        """Find the longest (then rightmost) known run of tokens."""
+        for length in range(len(tokens), 0, -1):
+            for start in range(len(tokens) - length, -1, -1):
+                density = self._entries.get(tokens[start : start + length])
+                if density is not None:
+                    return density
+        return None
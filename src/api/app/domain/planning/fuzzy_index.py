@@ -0,0 +1,204 @@
+"""Trigram Index - Fast fuzzy lookup for pantry names. 🔤
+
+An inverted index from character trigrams to pantry names, built once
+per pantry snapshot. Candidates that share trigrams with the query are
+scored first, and cheap upper bounds on the similarity ratio prune
+everything that can't possibly beat the best match so far.
+
+The final score is still `SequenceMatcher.ratio()`, so results are
+identical to a brute-force scan over every pantry name.
+
+Fun fact: PostgreSQL's pg_trgm extension uses the same trick to make
+LIKE '%onion%' queries fast! 🐘
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from difflib import SequenceMatcher
+
+
+def _ratio_bound(matches: int, total_length: int) -> float:
+    """Compute a similarity ratio the same way SequenceMatcher does."""
+    if total_length:
+        return 2.0 * matches / total_length
+    return 1.0
+
+
+class TrigramIndex:
+    """Inverted trigram index for fuzzy name matching. 🔍
+
+    Names keep their insertion order, which is used to break ties the
+    same way a linear scan would (first name with the best score wins).
+
+    Example:
+        >>> index = TrigramIndex(["yellow onion", "garlic", "olive oil"])
+        >>> index.best_match("yellow onions", 0.7)
+        ('yellow onion', 0.96)
+    """
+
+    N = 3
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """Build the index.
+
+        Args:
+            names: Normalized names to index (duplicates are ignored).
+        """
+        self._names: list[str] = list(dict.fromkeys(names))
+        self._char_counts: list[Counter[str]] = []
+        self._postings: dict[str, list[int]] = {}
+        self._by_length: dict[int, list[int]] = {}
+
+        for position, name in enumerate(self._names):
+            self._char_counts.append(Counter(name))
+            self._by_length.setdefault(len(name), []).append(position)
+            for gram in self._trigrams(name):
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def names(self) -> list[str]:
+        """Indexed names in insertion order."""
+        return list(self._names)
+
+    def candidates(self, query: str) -> list[str]:
+        """Get names sharing at least one trigram with the query.
+
+        Ordered by number of shared trigrams (most first).
+        """
+        shared = self._shared_trigram_counts(query)
+        ordered = sorted(shared, key=lambda pos: (-shared[pos], pos))
+        return [self._names[pos] for pos in ordered]
+
+    def best_match(self, query: str, threshold: float) -> tuple[str, float] | None:
+        """Find the most similar indexed name.
+
+        Equivalent to scoring every name with `SequenceMatcher.ratio()`
+        and keeping the first one with the highest score at or above
+        the threshold - just without scoring most of them.
+
+        Args:
+            query: Normalized name to look up.
+            threshold: Minimum similarity score (0.0 - 1.0).
+
+        Returns:
+            Tuple of (name, score) or None if nothing clears the threshold.
+        """
+        if not self._names:
+            return None
+
+        query_length = len(query)
+        query_counts = Counter(query)
+        shared = self._shared_trigram_counts(query)
+
+        # Names sharing trigrams are the likeliest winners - score them first
+        # so the bounds below can prune the rest aggressively.
+        ordered = sorted(shared, key=lambda pos: (-shared[pos], pos))
+        ordered.extend(
+            pos
+            for pos in self._length_eligible(query_length, threshold)
+            if pos not in shared
+        )
+
+        best_position = -1
+        best_score = 0.0
+
+        for position in ordered:
+            name = self._names[position]
+            total_length = query_length + len(name)
+
+            # Upper bound 1: a ratio can't exceed what the shorter string allows
+            bound = _ratio_bound(min(query_length, len(name)), total_length)
+            if not self._can_win(bound, position, threshold, best_score, best_position):
+                continue
+
+            # Upper bound 2: matched characters can't exceed the shared multiset
+            overlap = sum(
+                min(count, self._char_counts[position][char])
+                for char, count in query_counts.items()
+            )
+            bound = _ratio_bound(overlap, total_length)
+            if not self._can_win(bound, position, threshold, best_score, best_position):
+                continue
+
+            score = SequenceMatcher(None, query, name).ratio()
+            if self._can_win(score, position, threshold, best_score, best_position):
+                best_position = position
+                best_score = score
+
+        if best_position < 0:
+            return None
+        return (self._names[best_position], best_score)
+
+    def similar(self, query: str, threshold: float) -> list[str]:
+        """Get every indexed name that scores at or above the threshold.
+
+        Scores are checked in both argument orders, so the result also
+        covers lookups where `query` is the indexed side.
+
+        Args:
+            query: Normalized name to look up.
+            threshold: Minimum similarity score (0.0 - 1.0).
+
+        Returns:
+            Matching names in insertion order.
+        """
+        query_length = len(query)
+        query_counts = Counter(query)
+
+        matches: list[str] = []
+        for position in self._length_eligible(query_length, threshold):
+            name = self._names[position]
+            overlap = sum(
+                min(count, self._char_counts[position][char])
+                for char, count in query_counts.items()
+            )
+            if _ratio_bound(overlap, query_length + len(name)) < threshold:
+                continue
+            if (
+                SequenceMatcher(None, query, name).ratio() >= threshold
+                or SequenceMatcher(None, name, query).ratio() >= threshold
+            ):
+                matches.append(name)
+        return matches
+
+    @staticmethod
+    def _can_win(
+        score: float,
+        position: int,
+        threshold: float,
+        best_score: float,
+        best_position: int,
+    ) -> bool:
+        """Check whether a (possible) score would replace the current best."""
+        if score < threshold:
+            return False
+        if best_position < 0 or score > best_score:
+            return True
+        return score == best_score and position < best_position
+
+    def _length_eligible(self, query_length: int, threshold: float) -> list[int]:
+        """Get positions of names whose length allows reaching the threshold."""
+        positions: list[int] = []
+        for length, bucket in self._by_length.items():
+            bound = _ratio_bound(min(query_length, length), query_length + length)
+            if bound >= threshold:
+                positions.extend(bucket)
+        positions.sort()
+        return positions
+
+    def _shared_trigram_counts(self, query: str) -> dict[int, int]:
+        """Count shared trigrams per indexed name."""
+        shared: dict[int, int] = {}
+        for gram in self._trigrams(query):
+            for position in self._postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        return shared
+
+    @classmethod
+    def _trigrams(cls, text: str) -> set[str]:
+        """Split text into padded character trigrams."""
+        padded = f"  {text} "
+        return {padded[i : i + cls.N] for i in range(len(padded) - cls.N + 1)}
@@ -0,0 +1,178 @@
+"""Keyword Matcher - Find every keyword in a name with one scan. 🔎
+
+Staples, shopping categories, store aisles, fresh produce and diet
+exclusions all ask the same question: "does any of these keywords occur
+in this item name?". Instead of looping over the whole table for every
+item, the keywords are compiled once into an Aho-Corasick automaton, so
+matching costs the same whether the table has 10 keywords or 10,000.
+
+Fun fact: Aho-Corasick was invented in 1975 for bibliographic search at
+Bell Labs, and it still powers the original Unix `fgrep`! 📚
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Generic, NamedTuple, TypeVar
+
+V = TypeVar("V")
+
+
+class KeywordMatch(NamedTuple, Generic[V]):
+    """A keyword found in a piece of text."""
+
+    keyword: str
+    value: V
+    start: int  # Offset into the lowercased text
+    rank: int  # Position of the keyword in its table (lower wins ties)
+
+
+class KeywordMatcher(Generic[V]):
+    """Compiled multi-keyword matcher (Aho-Corasick). 🤖
+
+    Built once per keyword table. Matching is case-insensitive and finds
+    keywords anywhere in the text, like `keyword in name.lower()`.
+
+    When several keywords match, the longest one wins, so "olive oil"
+    beats "oil". Equal lengths go to the keyword listed first.
+
+    Example:
+        >>> matcher = KeywordMatcher({"oil": "Pantry", "olive oil": "Condiments"})
+        >>> matcher.lookup("Extra Virgin Olive Oil")
+        'Condiments'
+        >>> matcher.matches("Sesame oil")
+        True
+    """
+
+    def __init__(self, keywords: Mapping[str, V] | Iterable[str]) -> None:
+        """Compile the keyword table.
+
+        Args:
+            keywords: Keyword -> value mapping, or plain keywords (the
+                value is then the keyword itself). Order sets tie priority.
+        """
+        entries = keywords.items() if isinstance(keywords, Mapping) else ((k, k) for k in keywords)
+
+        self._keywords: list[str] = []
+        self._values: list[V] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+
+        seen: set[str] = set()
+        for keyword, value in entries:
+            keyword = keyword.lower()
+            if not keyword or keyword in seen:
+                continue  # First occurrence keeps its priority
+            seen.add(keyword)
+            self._add(keyword, value)
+
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+    @property
+    def keywords(self) -> list[str]:
+        """Compiled keywords in priority order."""
+        return list(self._keywords)
+
+    def find_all(self, text: str) -> list[KeywordMatch[V]]:
+        """Find every keyword occurrence, overlapping ones included.
+
+        Args:
+            text: Text to search (case-insensitive).
+
+        Returns:
+            Matches ordered by start offset, then by table order.
+        """
+        matches = [
+            KeywordMatch(
+                self._keywords[rank],
+                self._values[rank],
+                end - len(self._keywords[rank]) + 1,
+                rank,
+            )
+            for end, rank in self._scan(text)
+        ]
+        matches.sort(key=lambda match: (match.start, match.rank))
+        return matches
+
+    def best(self, text: str) -> KeywordMatch[V] | None:
+        """Find the highest-priority match (longest, then first listed).
+
+        Args:
+            text: Text to search (case-insensitive).
+
+        Returns:
+            The winning match, or None if no keyword occurs.
+        """
+        best: KeywordMatch[V] | None = None
+        for end, rank in self._scan(text):
+            keyword = self._keywords[rank]
+            if (
+                best is None
+                or len(keyword) > len(best.keyword)
+                or (len(keyword) == len(best.keyword) and rank < best.rank)
+            ):
+                best = KeywordMatch(keyword, self._values[rank], end - len(keyword) + 1, rank)
+        return best
+
+    def lookup(self, text: str, default: V | None = None) -> V | None:
+        """Get the value of the best match.
+
+        Args:
+            text: Text to search (case-insensitive).
+            default: Returned when no keyword occurs.
+
+        Returns:
+            Value of the winning keyword, or the default.
+        """
+        best = self.best(text)
+        return best.value if best is not None else default
+
+    def matches(self, text: str) -> bool:
+        """Check whether any keyword occurs in the text (stops at the first hit)."""
+        return next(self._scan(text), None) is not None
+
+    def _add(self, keyword: str, value: V) -> None:
+        """Add a keyword to the trie."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        self._output[state].append(len(self._keywords))
+        self._keywords.append(keyword)
+        self._values.append(value)
+
+    def _link(self) -> None:
+        """Compute failure links breadth-first and merge outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def _scan(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield (end offset, keyword rank) for every occurrence."""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for end, char in enumerate(text.lower()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for rank in output[state]:
+                yield end, rank
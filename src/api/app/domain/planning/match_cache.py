@@ -0,0 +1,134 @@
+"""Match Cache - Memoized ingredient-to-pantry resolution. 🧠
+
+The same ingredient names ("garlic", "olive oil", "yellow onion") show up
+in dozens of recipes. Resolving one against the pantry only depends on
+the pantry snapshot, so the answer is cached per household and keyed by
+the pantry version - any pantry change produces a new version and a
+fresh set of entries.
+
+Fun fact: Professional line cooks memorize where every ingredient lives
+on their station so they never have to look twice! 🔪
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import NamedTuple
+from uuid import UUID
+
+from src.api.app.core.config import get_settings
+
+
+class CachedMatch(NamedTuple):
+    """A resolved ingredient match."""
+
+    pantry_name: str | None  # Normalized pantry bucket, None if nothing matched
+    confidence: float
+
+
+class MatchCache:
+    """Bounded LRU cache of ingredient-to-pantry matches. 🗃️
+
+    Entries are keyed by (household, pantry version, ingredient name).
+    Safe to share between threads.
+
+    Example:
+        >>> cache = MatchCache(max_size=1000)
+        >>> cache.put(household_id, "v1", "onions", CachedMatch("onion", 0.91))
+        >>> cache.get(household_id, "v1", "onions")
+        CachedMatch(pantry_name='onion', confidence=0.91)
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[UUID | None, str, str], CachedMatch] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        household_id: UUID | None,
+        pantry_version: str,
+        ingredient_name: str,
+    ) -> CachedMatch | None:
+        """Look up a cached match.
+
+        Args:
+            household_id: The household the pantry belongs to.
+            pantry_version: Version hash of the pantry snapshot.
+            ingredient_name: Normalized ingredient name.
+
+        Returns:
+            CachedMatch if cached, None on a miss.
+        """
+        key = (household_id, pantry_version, ingredient_name)
+        with self._lock:
+            match = self._entries.get(key)
+            if match is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return match
+
+    def put(
+        self,
+        household_id: UUID | None,
+        pantry_version: str,
+        ingredient_name: str,
+        match: CachedMatch,
+    ) -> None:
+        """Store a resolved match, evicting the least recently used entry if full.
+
+        Args:
+            household_id: The household the pantry belongs to.
+            pantry_version: Version hash of the pantry snapshot.
+            ingredient_name: Normalized ingredient name.
+            match: The resolved match.
+        """
+        key = (household_id, pantry_version, ingredient_name)
+        with self._lock:
+            self._entries[key] = match
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, household_id: UUID) -> int:
+        """Drop every entry for a household (called on pantry writes).
+
+        Args:
+            household_id: The household whose pantry changed.
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == household_id]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+@lru_cache
+def get_match_cache() -> MatchCache:
+    """Get the process-wide match cache."""
+    return MatchCache(max_size=get_settings().match_cache_size)
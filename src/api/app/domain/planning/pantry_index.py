@@ -0,0 +1,193 @@
+"""Pantry Index - A precompiled pantry snapshot for the Delta Engine. 🗂️
+
+Scoring a catalog means comparing hundreds of recipes against the same
+pantry. Everything that only depends on the pantry (name buckets,
+aggregated quantities, earliest expiry, fuzzy lookup structures) lives
+here so it's computed once per snapshot instead of once per recipe.
+
+Fun fact: Librarians were building card-catalog indexes centuries
+before databases existed - the idea is the same! 📇
+"""
+
+import hashlib
+from collections.abc import Iterator
+from datetime import date
+from functools import cached_property
+from uuid import UUID
+
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.planning.converter import UnitConverter
+from src.api.app.domain.planning.fuzzy_index import TrigramIndex
+
+
+class PantryIndex:
+    """Precompiled, read-only view of a household's pantry. 🗂️
+
+    Build it once per pantry snapshot and share it across every
+    `DeltaService.calculate_missing` call in a scoring run.
+
+    Example:
+        >>> index = PantryIndex(pantry_items)
+        >>> index.aggregated("onion").quantity
+        7.0
+        >>> scorer.score_recipes(recipes, index)
+    """
+
+    def __init__(
+        self,
+        pantry_items: list[PantryItem],
+        converter: UnitConverter | None = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            pantry_items: Current inventory items.
+            converter: Unit converter used to aggregate quantities.
+        """
+        self.items = list(pantry_items)
+        self.converter = converter or UnitConverter()
+        self.household_id: UUID | None = self.items[0].household_id if self.items else None
+
+        # Group items by normalized name
+        self.buckets: dict[str, list[PantryItem]] = {}
+        for item in self.items:
+            self.buckets.setdefault(self.normalize_name(item.name), []).append(item)
+
+        # Earliest known expiry per name (None if nothing is dated)
+        self.earliest_expiry: dict[str, date | None] = {}
+        for key, bucket in self.buckets.items():
+            dated = [item.expiry_date for item in bucket if item.expiry_date]
+            self.earliest_expiry[key] = min(dated) if dated else None
+
+        self.fuzzy_index = TrigramIndex(self.buckets)
+
+        # Aggregated items are filled in lazily - most lookups only touch
+        # a fraction of the pantry.
+        self._aggregated: dict[str, PantryItem] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.normalize_name(name) in self.buckets
+
+    def __iter__(self) -> Iterator[PantryItem]:
+        return iter(self.items)
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Normalize an item name for lookup."""
+        return name.lower().strip()
+
+    @cached_property
+    def version(self) -> str:
+        """Content hash of the snapshot.
+
+        Any pantry write (add, update, delete) changes the version, so it
+        can key caches derived from the pantry.
+        """
+        digest = hashlib.sha1(usedforsecurity=False)
+        for row in sorted(
+            (
+                str(item.id),
+                item.name,
+                repr(item.quantity),
+                item.unit or "",
+                item.expiry_date.isoformat() if item.expiry_date else "",
+                item.updated_at.isoformat(),
+            )
+            for item in self.items
+        ):
+            digest.update("\x1f".join(row).encode())
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    @cached_property
+    def signatures(self) -> dict[str, tuple[tuple[str, ...], ...]]:
+        """Per-name fingerprint of the rows in each bucket.
+
+        Comparing two snapshots' signatures tells exactly which names
+        changed between them.
+        """
+        return {
+            key: tuple(
+                sorted(
+                    (
+                        str(item.id),
+                        repr(item.quantity),
+                        item.unit or "",
+                        item.expiry_date.isoformat() if item.expiry_date else "",
+                    )
+                    for item in bucket
+                )
+            )
+            for key, bucket in self.buckets.items()
+        }
+
+    @property
+    def names(self) -> list[str]:
+        """Normalized item names in the pantry."""
+        return list(self.buckets)
+
+    def aggregated(self, name: str) -> PantryItem | None:
+        """Get all items with a name combined into a single item.
+
+        Quantities are summed in the first item's unit; items whose units
+        can't be converted are skipped.
+
+        Args:
+            name: Item name (normalized on lookup).
+
+        Returns:
+            Aggregated PantryItem or None if the name isn't in the pantry.
+        """
+        key = self.normalize_name(name)
+        if key in self._aggregated:
+            return self._aggregated[key]
+
+        bucket = self.buckets.get(key)
+        if not bucket:
+            return None
+
+        aggregated = self._aggregate(bucket)
+        self._aggregated[key] = aggregated
+        return aggregated
+
+    def _aggregate(self, items: list[PantryItem]) -> PantryItem:
+        """Aggregate multiple pantry items with same name into one.
+
+        Combines quantities when units are compatible.
+        Uses the first item as the base and aggregates quantities.
+        """
+        if len(items) == 1:
+            return items[0]
+
+        # Use first item as base
+        base = items[0]
+        base_unit = self.converter.unit_registry.normalize_unit(base.unit or "count")
+        total_quantity = base.quantity or 0
+
+        # Try to add quantities from other items
+        for item in items[1:]:
+            if item.quantity is None:
+                continue
+
+            item_unit = self.converter.unit_registry.normalize_unit(item.unit or "count")
+
+            if item_unit == base_unit:
+                # Same unit - simple addition
+                total_quantity += item.quantity
+            else:
+                # Try to convert
+                conversion = self.converter.convert(
+                    item.quantity,
+                    item_unit,
+                    base_unit,
+                    ingredient=base.name,
+                )
+                if conversion.success and conversion.value is not None:
+                    total_quantity += conversion.value
+                # If conversion fails, skip this item (can't aggregate)
+
+        # Return a new PantryItem with aggregated quantity
+        return base.model_copy(update={"quantity": total_quantity})
@@ -0,0 +1,321 @@
+"""Precompute Store - Incremental "can I cook this?" results. ♻️
+
+Keeps each household's latest ComparisonResult and RecipeScore per
+recipe, plus a reverse index from ingredient name to the recipes that use
+it. When the pantry changes, only recipes with an ingredient that equals
+or fuzzy-matches a changed pantry name are recomputed - everything else
+is served as stored.
+
+Changes are found by diffing pantry snapshots name by name, so pantry
+writes from anywhere (the pantry API, cooking, voice hooks) are picked up.
+
+Fun fact: Spreadsheets have recalculated only the cells affected by an
+edit since VisiCalc in 1979! 📈
+"""
+
+import hashlib
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.api.app.domain.planning.fuzzy_index import TrigramIndex
+from src.api.app.domain.planning.models import ComparisonResult
+from src.api.app.domain.planning.pantry_index import PantryIndex
+from src.api.app.domain.recipes.models import Recipe
+
+if TYPE_CHECKING:
+    from src.api.app.domain.planner.models import RecipeScore
+    from src.api.app.domain.planner.scorer import RecipeScorer
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an ingredient name the way the Delta Engine does."""
+    return name.lower().strip()
+
+
+class RecipeIndex:
+    """Reverse index from ingredient name to recipe IDs. 🔁
+
+    Example:
+        >>> index = RecipeIndex()
+        >>> index.set_recipe(recipe_id, ["Onions", "garlic"])
+        >>> index.recipes_using(["onion"], threshold=0.7)
+        {recipe_id}
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._recipes_by_name: dict[str, set[UUID]] = {}
+        self._names_by_recipe: dict[UUID, frozenset[str]] = {}
+        self._fuzzy_index: TrigramIndex | None = None
+
+    def __len__(self) -> int:
+        return len(self._names_by_recipe)
+
+    def __contains__(self, recipe_id: object) -> bool:
+        return recipe_id in self._names_by_recipe
+
+    def set_recipe(self, recipe_id: UUID, ingredient_names: Iterable[str]) -> None:
+        """Index (or re-index) a recipe's ingredients."""
+        self.remove_recipe(recipe_id)
+        names = frozenset(normalize_name(name) for name in ingredient_names)
+        self._names_by_recipe[recipe_id] = names
+        for name in names:
+            if name not in self._recipes_by_name:
+                self._fuzzy_index = None
+            self._recipes_by_name.setdefault(name, set()).add(recipe_id)
+
+    def remove_recipe(self, recipe_id: UUID) -> None:
+        """Drop a recipe from the index."""
+        for name in self._names_by_recipe.pop(recipe_id, frozenset()):
+            recipes = self._recipes_by_name.get(name)
+            if recipes is None:
+                continue
+            recipes.discard(recipe_id)
+            if not recipes:
+                del self._recipes_by_name[name]
+                self._fuzzy_index = None
+
+    def recipes_using(self, pantry_names: Iterable[str], threshold: float) -> set[UUID]:
+        """Get recipes whose ingredients could match any of the pantry names.
+
+        Args:
+            pantry_names: Pantry item names that changed.
+            threshold: Fuzzy match threshold used by the Delta Engine.
+
+        Returns:
+            IDs of recipes with an ingredient equal or similar to a name.
+        """
+        if self._fuzzy_index is None:
+            self._fuzzy_index = TrigramIndex(self._recipes_by_name)
+
+        affected: set[UUID] = set()
+        for pantry_name in pantry_names:
+            for name in self._fuzzy_index.similar(normalize_name(pantry_name), threshold):
+                affected |= self._recipes_by_name[name]
+        return affected
+
+
+@dataclass
+class PrecomputedResult:
+    """Stored comparison and score for one recipe."""
+
+    comparison: ComparisonResult | None
+    score: "RecipeScore"
+    fingerprint: int  # Recipe content the result was computed from
+
+
+@dataclass
+class _HouseholdState:
+    """Everything the store keeps for one household."""
+
+    recipe_index: RecipeIndex = field(default_factory=RecipeIndex)
+    results: dict[UUID, PrecomputedResult] = field(default_factory=dict)
+    pantry_signatures: dict[str, tuple] = field(default_factory=dict)
+    scored_on: date | None = None
+    criteria: dict | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class PrecomputeStore:
+    """Per-household store of precomputed recipe results. 🗄️
+
+    Safe to share between threads. Each household has its own lock, so a
+    long scoring run only blocks callers for the same household. Counters
+    record how many results were recomputed versus served as stored.
+
+    Example:
+        >>> store = PrecomputeStore()
+        >>> scores = store.get_scores(household_id, recipes, pantry, scorer)
+        >>> store.recipe_changed(household_id, recipe.id, ["onion"])
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.recomputed = 0
+        self.reused = 0
+        self._households: dict[UUID, _HouseholdState] = {}
+        self._lock = threading.Lock()  # Guards the household map and counters
+
+    def _state(self, household_id: UUID) -> _HouseholdState:
+        """Get (or create) a household's state."""
+        with self._lock:
+            return self._households.setdefault(household_id, _HouseholdState())
+
+    def recipe_changed(
+        self,
+        household_id: UUID,
+        recipe_id: UUID,
+        ingredient_names: Iterable[str] | None = None,
+    ) -> None:
+        """Record a created or re-parsed recipe and drop its stored result.
+
+        Args:
+            household_id: The household.
+            recipe_id: The recipe that changed.
+            ingredient_names: The recipe's full ingredient list. If not
+                known, the recipe is re-indexed on the next scoring run.
+        """
+        state = self._state(household_id)
+        with state.lock:
+            if ingredient_names is not None:
+                state.recipe_index.set_recipe(recipe_id, ingredient_names)
+            state.results.pop(recipe_id, None)
+
+    def recipe_removed(self, household_id: UUID, recipe_id: UUID) -> None:
+        """Forget a deleted recipe."""
+        with self._lock:
+            state = self._households.get(household_id)
+        if state is not None:
+            with state.lock:
+                state.recipe_index.remove_recipe(recipe_id)
+                state.results.pop(recipe_id, None)
+
+    def invalidate(self, household_id: UUID) -> None:
+        """Drop everything stored for a household."""
+        with self._lock:
+            self._households.pop(household_id, None)
+
+    def get_result(self, household_id: UUID, recipe_id: UUID) -> PrecomputedResult | None:
+        """Get the stored result for a recipe, if any."""
+        with self._lock:
+            state = self._households.get(household_id)
+        if state is None:
+            return None
+        with state.lock:
+            return state.results.get(recipe_id)
+
+    def get_scores(
+        self,
+        household_id: UUID,
+        recipes: list[Recipe],
+        pantry: PantryIndex,
+        scorer: "RecipeScorer",
+    ) -> list["RecipeScore"]:
+        """Score the catalog, recomputing only what the changes touched.
+
+        A recipe is recomputed when it has no stored result, its
+        ingredients changed, or one of its ingredients matches a pantry
+        name that changed since the last call. Everything is recomputed
+        when the day or the scoring criteria change, since spoilage
+        scores depend on today's date.
+
+        Args:
+            household_id: The household.
+            recipes: The full recipe catalog (with ingredients).
+            pantry: Current pantry snapshot.
+            scorer: Scorer used for recomputation.
+
+        Returns:
+            RecipeScores sorted by total score (descending).
+        """
+        state = self._state(household_id)
+        recomputed = reused = 0
+        with state.lock:
+            criteria = scorer.criteria.model_dump()
+            today = date.today()
+            if state.scored_on != today or state.criteria != criteria:
+                state.results.clear()
+                state.scored_on = today
+                state.criteria = criteria
+
+            signatures = pantry.signatures
+            changed = {
+                name
+                for name in signatures.keys() | state.pantry_signatures.keys()
+                if signatures.get(name) != state.pantry_signatures.get(name)
+            }
+            state.pantry_signatures = signatures
+            affected = (
+                state.recipe_index.recipes_using(
+                    changed,
+                    scorer.delta_service.FUZZY_MATCH_THRESHOLD,
+                )
+                if changed
+                else set()
+            )
+
+            scores: list[RecipeScore] = []
+            catalog: set[UUID] = set()
+            for recipe in recipes:
+                if not recipe.ingredients:
+                    continue  # Same rule as RecipeScorer.score_recipes
+                catalog.add(recipe.id)
+
+                fingerprint = _fingerprint(recipe)
+                stored = state.results.get(recipe.id)
+                if stored is None or stored.fingerprint != fingerprint:
+                    state.recipe_index.set_recipe(
+                        recipe.id,
+                        (ingredient.item_name for ingredient in recipe.ingredients),
+                    )
+                elif recipe.id not in affected:
+                    reused += 1
+                    scores.append(stored.score)
+                    continue
+
+                comparison, score = scorer.evaluate(recipe, pantry)
+                state.results[recipe.id] = PrecomputedResult(comparison, score, fingerprint)
+                recomputed += 1
+                scores.append(score)
+
+            # Recipes that left the catalog
+            for recipe_id in state.results.keys() - catalog:
+                del state.results[recipe_id]
+                state.recipe_index.remove_recipe(recipe_id)
+
+        with self._lock:
+            self.recomputed += recomputed
+            self.reused += reused
+
+        scores.sort(key=lambda s: s.total_score, reverse=True)
+        return scores
+
+
+def _fingerprint(recipe: Recipe) -> int:
+    """Hash the recipe fields a score depends on."""
+    return hash(
+        (
+            recipe.title,
+            tuple(
+                (ingredient.item_name, ingredient.quantity, ingredient.unit)
+                for ingredient in recipe.ingredients or []
+            ),
+        )
+    )
+
+
+def catalog_version(recipes: list[Recipe]) -> str:
+    """Content hash of a recipe catalog.
+
+    Covers every recipe field plan generation and scoring read, so any
+    edit (including replaced ingredients) changes the version. Recipe
+    order matters too, since it breaks ranking ties.
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    for recipe in recipes:
+        row = (
+            str(recipe.id),
+            recipe.title,
+            recipe.updated_at.isoformat(),
+            repr(recipe.prep_time_minutes),
+            repr(recipe.total_time_minutes),
+            ",".join(recipe.tags or []),
+            *(
+                f"{ingredient.item_name}:{ingredient.quantity!r}:{ingredient.unit or ''}"
+                for ingredient in recipe.ingredients or []
+            ),
+        )
+        digest.update("\x1f".join(row).encode())
+        digest.update(b"\x1e")
+    return digest.hexdigest()
+
+
+@lru_cache
+def get_precompute_store() -> PrecomputeStore:
+    """Get the process-wide precompute store."""
+    return PrecomputeStore()
@@ -7,14 +7,18 @@ from src.api.app.domain.recipes.models import (
     UpdateRecipeDTO,
 )
 from src.api.app.domain.recipes.parser import IngredientParser
-from src.api.app.domain.recipes.unit_registry import UnitRegistry
+from src.api.app.domain.recipes.similarity import NearDuplicateIndex, compute_signature
+from src.api.app.domain.recipes.unit_registry import UnitRegistry, get_unit_registry
 
 __all__ = [
     "CreateRecipeDTO",
     "IngredientParser",
+    "NearDuplicateIndex",
     "ParsedIngredient",
     "Recipe",
     "RecipeIngredient",
     "UnitRegistry",
     "UpdateRecipeDTO",
+    "compute_signature",
+    "get_unit_registry",
 ]
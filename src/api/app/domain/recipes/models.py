@@ -65,6 +65,7 @@ class Recipe(BaseModel):
     is_parsed: bool
     created_at: datetime
     updated_at: datetime
+    minhash: list[int] | None = None  # Near-duplicate signature (see similarity.py)
 
     # Related ingredients (populated by joins)
     ingredients: list[RecipeIngredient] | None = None
@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from typing import Protocol
 
 from src.api.app.domain.recipes.models import ParsedIngredient
-from src.api.app.domain.recipes.unit_registry import UnitRegistry
+from src.api.app.domain.recipes.unit_registry import get_unit_registry
 
 
 class LLMAdapter(Protocol):
@@ -113,7 +113,7 @@ class IngredientParser:
         """
         self.config = config or ParserConfig()
         self.llm_adapter = llm_adapter
-        self.unit_registry = UnitRegistry()
+        self.unit_registry = get_unit_registry()
 
     def parse(self, text: str) -> ParsedIngredient:
         """Parse an ingredient string into structured data.
@@ -0,0 +1,169 @@
+"""Recipe repository - Direct Postgres reads. 🐘
+
+Reads recipes and their ingredients over asyncpg instead of PostgREST,
+returning exactly what RecipeRepository would. Every other operation
+is inherited and still goes through Supabase.
+
+Fun fact: A full catalog used to be two JSON documents per chunk - now
+it's two prepared statements and a stream of binary rows! 📦
+"""
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.api.app.core.config import get_settings
+from src.api.app.db.pagination import DEFAULT_CHUNK_SIZE
+from src.api.app.db.postgres import read_pool_for
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+from src.api.app.domain.recipes.repository import RecipeRepository
+
+if TYPE_CHECKING:
+    import asyncpg
+    from supabase import AsyncClient
+
+RECIPE_BY_ID_SQL = "SELECT * FROM recipes WHERE id = $1 AND household_id = $2"
+
+RECIPES_BY_IDS_SQL = "SELECT * FROM recipes WHERE id = ANY($1::uuid[]) AND household_id = $2"
+
+NEWEST_RECIPES_SQL = """
+SELECT * FROM recipes
+WHERE household_id = $1
+ORDER BY created_at DESC, id DESC
+LIMIT $2
+"""
+
+# Keyset page: rows strictly after the (created_at, id) cursor, newest first
+RECIPES_AFTER_SQL = """
+SELECT * FROM recipes
+WHERE household_id = $1 AND (created_at, id) < ($2, $3)
+ORDER BY created_at DESC, id DESC
+LIMIT $4
+"""
+
+INGREDIENTS_SQL = """
+SELECT * FROM recipe_ingredients
+WHERE recipe_id = ANY($1::uuid[])
+ORDER BY recipe_id, sort_order, id
+"""
+
+
+class PostgresRecipeRepository(RecipeRepository):
+    """RecipeRepository reading recipes straight from Postgres. 🐘"""
+
+    def __init__(self, supabase: "AsyncClient", pool: "asyncpg.Pool") -> None:
+        """Initialize repository.
+
+        Args:
+            supabase: Client used for writes.
+            pool: asyncpg pool used for reads.
+        """
+        super().__init__(supabase)
+        self.pool = pool
+
+    async def get_by_id(
+        self,
+        recipe_id: UUID,
+        household_id: UUID,
+        *,
+        include_ingredients: bool = True,
+    ) -> Recipe | None:
+        """Get a recipe by ID with optional ingredients."""
+        async with self.pool.acquire() as connection:
+            row = await connection.fetchrow(RECIPE_BY_ID_SQL, recipe_id, household_id)
+            if row is None:
+                return None
+
+            recipe = Recipe.model_validate(dict(row))
+            if include_ingredients:
+                ingredients = await self._fetch_ingredients(connection, [recipe.id])
+                recipe.ingredients = ingredients.get(recipe.id, [])
+        return recipe
+
+    async def get_by_ids(
+        self,
+        recipe_ids: list[UUID],
+        household_id: UUID,
+        *,
+        include_ingredients: bool = True,
+    ) -> dict[UUID, Recipe]:
+        """Get many recipes by ID, with ingredients, in two statements."""
+        if not recipe_ids:
+            return {}
+
+        async with self.pool.acquire() as connection:
+            rows = await connection.fetch(RECIPES_BY_IDS_SQL, recipe_ids, household_id)
+            recipes = {
+                recipe.id: recipe for recipe in (Recipe.model_validate(dict(row)) for row in rows)
+            }
+            if include_ingredients and recipes:
+                ingredients = await self._fetch_ingredients(connection, list(recipes))
+                for recipe in recipes.values():
+                    recipe.ingredients = ingredients.get(recipe.id, [])
+        return recipes
+
+    async def iter_by_household(
+        self,
+        household_id: UUID,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        include_ingredients: bool = True,
+    ) -> AsyncIterator[list[Recipe]]:
+        """Stream every recipe of a household, newest first.
+
+        Pages by keyset on (created_at, id), like the PostgREST version.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        cursor: tuple | None = None
+        while True:
+            async with self.pool.acquire() as connection:
+                if cursor is None:
+                    rows = await connection.fetch(NEWEST_RECIPES_SQL, household_id, chunk_size)
+                else:
+                    rows = await connection.fetch(
+                        RECIPES_AFTER_SQL, household_id, *cursor, chunk_size
+                    )
+                recipes = [Recipe.model_validate(dict(row)) for row in rows]
+                if include_ingredients and recipes:
+                    ingredients = await self._fetch_ingredients(
+                        connection, [recipe.id for recipe in recipes]
+                    )
+                    for recipe in recipes:
+                        recipe.ingredients = ingredients.get(recipe.id, [])
+
+            if recipes:
+                yield recipes
+            if len(rows) < chunk_size:
+                return
+            cursor = (rows[-1]["created_at"], rows[-1]["id"])
+
+    async def _fetch_ingredients(
+        self,
+        connection: "asyncpg.Connection",
+        recipe_ids: list[UUID],
+    ) -> dict[UUID, list[RecipeIngredient]]:
+        """Get ingredients for many recipes in one statement, grouped by recipe."""
+        grouped: dict[UUID, list[RecipeIngredient]] = {}
+        if not recipe_ids:
+            return grouped
+
+        for row in await connection.fetch(INGREDIENTS_SQL, recipe_ids):
+            ingredient = RecipeIngredient.model_validate(dict(row))
+            grouped.setdefault(ingredient.recipe_id, []).append(ingredient)
+        return grouped
+
+
+def make_recipe_repository(supabase: "AsyncClient") -> RecipeRepository:
+    """Build the recipe repository for the configured read backend.
+
+    Falls back to PostgREST reads if the Postgres pool isn't open.
+    """
+    pool = read_pool_for(get_settings().recipes_read_backend)
+    if pool is None:
+        return RecipeRepository(supabase)
+    return PostgresRecipeRepository(supabase, pool)
@@ -5,11 +5,14 @@ Handles all database operations for recipes and ingredients.
 Fun fact: The average American household has about 30 recipes in regular rotation! 📚
 """
 
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 from uuid import UUID, uuid4
 
+from src.api.app.core.cache import RECIPES, cached_read
+from src.api.app.db.pagination import DEFAULT_CHUNK_SIZE, iter_keyset
 from src.api.app.domain.recipes.models import (
     CreateRecipeDTO,
     ParsedIngredient,
@@ -28,6 +31,14 @@ class RecipeRepository:
     RECIPES_TABLE = "recipes"
     INGREDIENTS_TABLE = "recipe_ingredients"
 
+    # PostgREST caps rows per response (Supabase default: 1000)
+    INGREDIENT_PAGE_SIZE = 1000
+
+    # Stored procedure swapping ingredient sets in one transaction. Calls
+    # send at most INGREDIENT_PAGE_SIZE new rows; appends can still return
+    # more (the existing rows come back too), so a capped one is re-read
+    REPLACE_INGREDIENTS_RPC = "replace_recipe_ingredients"
+
     def __init__(self, supabase: "AsyncClient") -> None:
         """Initialize repository with Supabase client."""
         self.supabase = supabase
@@ -68,6 +79,45 @@ class RecipeRepository:
 
         return recipe
 
+    async def get_by_ids(
+        self,
+        recipe_ids: list[UUID],
+        household_id: UUID,
+        *,
+        include_ingredients: bool = True,
+    ) -> dict[UUID, Recipe]:
+        """Get many recipes by ID, with ingredients, in two queries.
+
+        Args:
+            recipe_ids: The recipes to fetch.
+            household_id: The household to scope the query to (RLS).
+            include_ingredients: Whether to fetch ingredients.
+
+        Returns:
+            The recipes found, by ID (missing IDs are left out).
+        """
+        if not recipe_ids:
+            return {}
+
+        result = await (
+            self.supabase.table(self.RECIPES_TABLE)
+            .select("*")
+            .in_("id", [str(recipe_id) for recipe_id in recipe_ids])
+            .eq("household_id", str(household_id))
+            .execute()
+        )
+
+        recipes = {
+            recipe.id: recipe
+            for recipe in (Recipe.model_validate(row) for row in result.data or [])
+        }
+        if include_ingredients:
+            ingredients = await self._get_ingredients_for(list(recipes))
+            for recipe in recipes.values():
+                recipe.ingredients = ingredients.get(recipe.id, [])
+
+        return recipes
+
     async def get_by_url(
         self,
         source_url: str,
@@ -135,6 +185,54 @@ class RecipeRepository:
 
         return recipes, total
 
+    async def iter_by_household(
+        self,
+        household_id: UUID,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        include_ingredients: bool = True,
+    ) -> AsyncIterator[list[Recipe]]:
+        """Stream every recipe of a household, newest first.
+
+        Pages by keyset on (created_at, id), so large catalogs come back
+        complete without deep offsets or one huge response.
+
+        Args:
+            household_id: The household to fetch recipes for.
+            chunk_size: Recipes per request.
+            include_ingredients: Whether to attach ingredients (one extra
+                query per chunk).
+
+        Yields:
+            Chunks of recipes.
+        """
+        chunks = iter_keyset(
+            lambda: (
+                self.supabase.table(self.RECIPES_TABLE)
+                .select("*")
+                .eq("household_id", str(household_id))
+            ),
+            sort_column="created_at",
+            descending=True,
+            chunk_size=chunk_size,
+        )
+        async for rows in chunks:
+            recipes = [Recipe.model_validate(row) for row in rows]
+            if include_ingredients:
+                ingredients = await self._get_ingredients_for([recipe.id for recipe in recipes])
+                for recipe in recipes:
+                    recipe.ingredients = ingredients.get(recipe.id, [])
+            yield recipes
+
+    @cached_read(RECIPES)
+    async def get_catalog(self, household_id: UUID) -> list[Recipe]:
+        """Get every recipe of a household with ingredients, newest first.
+
+        Cached until the catalog changes.
+        """
+        chunks = self.iter_by_household(household_id)
+        return [recipe async for chunk in chunks for recipe in chunk]
+
     async def search_by_title(
         self,
         household_id: UUID,
@@ -167,12 +265,15 @@ class RecipeRepository:
         self,
         household_id: UUID,
         dto: CreateRecipeDTO,
+        *,
+        minhash: list[int] | None = None,
     ) -> Recipe:
         """Create a new recipe.
 
         Args:
             household_id: The household this recipe belongs to.
             dto: The recipe data.
+            minhash: Near-duplicate signature to store with the recipe.
 
         Returns:
             The created Recipe.
@@ -207,6 +308,7 @@ class RecipeRepository:
             "tags": dto.tags,
             "raw_markdown": dto.raw_markdown,
             "is_parsed": False,
+            "minhash": minhash,
             "created_at": now.isoformat(),
             "updated_at": now.isoformat(),
         }
@@ -287,6 +389,15 @@ class RecipeRepository:
 
         return len(result.data) > 0
 
+    async def set_minhash(self, recipe_id: UUID, minhash: list[int]) -> None:
+        """Store a recipe's near-duplicate signature."""
+        await (
+            self.supabase.table(self.RECIPES_TABLE)
+            .update({"minhash": minhash})
+            .eq("id", str(recipe_id))
+            .execute()
+        )
+
     async def mark_as_parsed(self, recipe_id: UUID) -> None:
         """Mark a recipe as having parsed ingredients."""
         await (
@@ -312,6 +423,40 @@ class RecipeRepository:
 
         return [RecipeIngredient.model_validate(row) for row in result.data]
 
+    async def _get_ingredients_for(
+        self,
+        recipe_ids: list[UUID],
+    ) -> dict[UUID, list[RecipeIngredient]]:
+        """Get ingredients for many recipes, grouped by recipe.
+
+        One query covers every recipe; further pages are only fetched
+        if the result hits the PostgREST row cap.
+        """
+        grouped: dict[UUID, list[RecipeIngredient]] = {}
+        if not recipe_ids:
+            return grouped
+
+        offset = 0
+        while True:
+            result = await (
+                self.supabase.table(self.INGREDIENTS_TABLE)
+                .select("*")
+                .in_("recipe_id", [str(recipe_id) for recipe_id in recipe_ids])
+                .order("recipe_id")
+                .order("sort_order")
+                .order("id")  # sort_order can repeat, and pages need a total order
+                .range(offset, offset + self.INGREDIENT_PAGE_SIZE - 1)
+                .execute()
+            )
+            rows = result.data or []
+            for row in rows:
+                ingredient = RecipeIngredient.model_validate(row)
+                grouped.setdefault(ingredient.recipe_id, []).append(ingredient)
+
+            if len(rows) < self.INGREDIENT_PAGE_SIZE:
+                return grouped
+            offset += self.INGREDIENT_PAGE_SIZE
+
     async def add_ingredients(
         self,
         recipe_id: UUID,
@@ -373,26 +518,178 @@ class RecipeRepository:
 
     async def replace_ingredients(
         self, recipe_id: UUID, ingredient_texts: list[str]
-    ) -> None:
+    ) -> list[RecipeIngredient]:
         """Replace all ingredients with raw text entries.
 
-        Clears existing ingredients, then inserts new ones from text.
+        Swaps the old ingredients for new ones from text in a single
+        transaction (the recipe's parsed flag is left alone).
+
+        Returns:
+            The new ingredients.
         """
-        await self.clear_ingredients(recipe_id)
-        rows = []
-        for i, text in enumerate(ingredient_texts):
-            rows.append(
-                {
-                    "id": str(uuid4()),
-                    "recipe_id": str(recipe_id),
-                    "raw_text": text,
-                    "item_name": text.split()[-1] if text.strip() else text,
-                    "sort_order": i,
-                }
-            )
-        if rows:
-            await (
-                self.supabase.table(self.INGREDIENTS_TABLE)
-                .insert(rows)
-                .execute()
+        rows = [
+            self._ingredient_row(
+                position,
+                raw_text=text,
+                item_name=text.split()[-1] if text.strip() else text,
             )
+            for position, text in enumerate(ingredient_texts)
+        ]
+        replaced = await self._replace_ingredient_rows(
+            [{"recipe_id": str(recipe_id), "ingredients": rows}]
+        )
+        return replaced.get(recipe_id, [])
+
+    async def set_parsed_ingredients(
+        self,
+        recipe_id: UUID,
+        ingredients: list[ParsedIngredient],
+        *,
+        append: bool = False,
+        minhash: list[int] | None = None,
+    ) -> list[RecipeIngredient]:
+        """Store a recipe's parsed ingredients and mark it parsed, atomically.
+
+        Args:
+            recipe_id: The recipe.
+            ingredients: Parsed ingredients, in recipe order.
+            append: Add after the existing ingredients instead of
+                replacing them.
+            minhash: Near-duplicate signature to store in the same
+                transaction, if known.
+
+        Returns:
+            All of the recipe's ingredients after the change.
+        """
+        stored = await self.set_parsed_ingredients_many(
+            {recipe_id: ingredients},
+            append=append,
+            minhashes={recipe_id: minhash} if minhash is not None else None,
+        )
+        return stored.get(recipe_id, [])
+
+    async def set_parsed_ingredients_many(
+        self,
+        ingredients_by_recipe: dict[UUID, list[ParsedIngredient]],
+        *,
+        append: bool = False,
+        minhashes: dict[UUID, list[int]] | None = None,
+        sections: dict[UUID, list[str | None]] | None = None,
+    ) -> dict[UUID, list[RecipeIngredient]]:
+        """Store parsed ingredients for many recipes (e.g. a re-parse job).
+
+        Recipes are batched up to INGREDIENT_PAGE_SIZE ingredient rows.
+        Each batch is one round trip and one transaction: a failure
+        leaves that batch's recipes exactly as they were, never
+        half-replaced.
+
+        Args:
+            ingredients_by_recipe: Parsed ingredients by recipe ID.
+            append: Add after the existing ingredients instead of
+                replacing them.
+            minhashes: Signatures to store alongside, by recipe ID.
+            sections: Section headings by recipe ID, one per ingredient
+                in the same order (parsing doesn't know them, so a
+                re-parse passes the stored ones through).
+
+        Returns:
+            Every affected recipe's ingredients after the change.
+        """
+        entries = []
+        for recipe_id, ingredients in ingredients_by_recipe.items():
+            recipe_sections = (sections or {}).get(recipe_id) or []
+            entry: dict = {
+                "recipe_id": str(recipe_id),
+                "ingredients": [
+                    self._ingredient_row(
+                        position,
+                        raw_text=ingredient.raw_text,
+                        item_name=ingredient.item_name,
+                        quantity=ingredient.quantity,
+                        unit=ingredient.unit,
+                        notes=ingredient.notes,
+                        confidence=ingredient.confidence,
+                        section=(
+                            recipe_sections[position]
+                            if position < len(recipe_sections)
+                            else None
+                        ),
+                    )
+                    for position, ingredient in enumerate(ingredients)
+                ],
+                "append": append,
+                "is_parsed": True,
+            }
+            if minhashes and minhashes.get(recipe_id) is not None:
+                entry["minhash"] = minhashes[recipe_id]
+            entries.append(entry)
+
+        stored: dict[UUID, list[RecipeIngredient]] = {}
+        batch: list[dict] = []
+        batch_rows = 0
+        for entry in entries:
+            rows = len(entry["ingredients"])
+            if batch and batch_rows + rows > self.INGREDIENT_PAGE_SIZE:
+                stored.update(await self._replace_ingredient_rows(batch))
+                batch, batch_rows = [], 0
+            batch.append(entry)
+            batch_rows += rows
+        if batch:
+            stored.update(await self._replace_ingredient_rows(batch))
+        return stored
+
+    async def _replace_ingredient_rows(
+        self,
+        entries: list[dict],
+    ) -> dict[UUID, list[RecipeIngredient]]:
+        """Run the replace RPC for a batch of recipes.
+
+        Appends return the existing rows too, so their response can
+        reach the row cap and be cut short; the committed rows are then
+        read back in pages instead.
+
+        Returns:
+            Each recipe's ingredients after the change (empty lists for
+            recipes left without any).
+        """
+        result = await self.supabase.rpc(
+            self.REPLACE_INGREDIENTS_RPC, {"p_recipes": entries}
+        ).execute()
+
+        stored: dict[UUID, list[RecipeIngredient]] = {
+            UUID(entry["recipe_id"]): [] for entry in entries
+        }
+        rows = result.data or []
+        appended = any(entry.get("append") for entry in entries)
+        if appended and len(rows) >= self.INGREDIENT_PAGE_SIZE:
+            stored.update(await self._get_ingredients_for(list(stored)))
+            return stored
+        for row in rows:
+            ingredient = RecipeIngredient.model_validate(row)
+            stored[ingredient.recipe_id].append(ingredient)
+        return stored
+
+    @staticmethod
+    def _ingredient_row(
+        position: int,
+        *,
+        raw_text: str,
+        item_name: str,
+        quantity: float | None = None,
+        unit: str | None = None,
+        notes: str | None = None,
+        confidence: float | None = None,
+        section: str | None = None,
+    ) -> dict:
+        """Build one ingredient for the replace RPC payload."""
+        return {
+            "id": str(uuid4()),
+            "raw_text": raw_text,
+            "quantity": quantity,
+            "unit": unit,
+            "item_name": item_name,
+            "notes": notes,
+            "section": section,
+            "sort_order": position,
+            "confidence": confidence,
+        }
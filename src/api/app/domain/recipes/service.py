@@ -7,6 +7,9 @@ Fun fact: The first printed cookbook was published in 1485! 📖
 
 from uuid import UUID
 
+from src.api.app.core.background import DebouncedTaskRunner, get_background_runner
+from src.api.app.core.cache import RECIPES, HouseholdCache, get_household_cache
+from src.api.app.domain.planning.precompute import PrecomputeStore, get_precompute_store
 from src.api.app.domain.recipes.models import (
     CreateRecipeDTO,
     IngestRecipeResponse,
@@ -16,6 +19,7 @@ from src.api.app.domain.recipes.models import (
 )
 from src.api.app.domain.recipes.parser import IngredientParser
 from src.api.app.domain.recipes.repository import RecipeRepository
+from src.api.app.domain.recipes.similarity import compute_signature
 
 
 class RecipeNotFoundError(Exception):
@@ -45,15 +49,37 @@ class RecipeService:
         self,
         repository: RecipeRepository,
         parser: IngredientParser | None = None,
+        precompute_store: PrecomputeStore | None = None,
+        background_runner: DebouncedTaskRunner | None = None,
+        cache: HouseholdCache | None = None,
     ) -> None:
         """Initialize service.
 
         Args:
             repository: The recipe repository instance.
             parser: Optional ingredient parser (created if not provided).
+            precompute_store: Store of precomputed recipe results to keep in
+                sync (uses the process-wide one if not provided).
+            background_runner: Runner notified on catalog changes so planner
+                results are precomputed (uses the process-wide one if not
+                provided).
+            cache: Read cache to invalidate on catalog changes (uses the
+                process-wide one if not provided).
         """
         self.repository = repository
         self.parser = parser or IngredientParser()
+        self.precompute_store = (
+            precompute_store if precompute_store is not None else get_precompute_store()
+        )
+        self.background_runner = (
+            background_runner if background_runner is not None else get_background_runner()
+        )
+        self.cache = cache if cache is not None else get_household_cache()
+
+    def _catalog_changed(self, household_id: UUID) -> None:
+        """Drop cached catalog reads and schedule planner precompute."""
+        self.cache.bump(household_id, RECIPES)
+        self.background_runner.notify(household_id)
 
     async def get_recipe(
         self,
@@ -161,15 +187,25 @@ class RecipeService:
             raw_markdown=dto.raw_markdown,
         )
 
-        recipe = await self.repository.create(household_id, dto)
+        # Parse first so the near-duplicate signature is stored with the recipe
+        parsed = self.parser.parse_many(ingredient_texts) if ingredient_texts else []
+        recipe = await self.repository.create(
+            household_id,
+            dto,
+            minhash=compute_signature(dto.title, (ingredient.item_name for ingredient in parsed)),
+        )
 
-        # Parse ingredients if provided
+        # Store parsed ingredients if provided (one round trip, marks it parsed)
         if ingredient_texts:
-            parsed = self.parser.parse_many(ingredient_texts)
-            await self.repository.add_ingredients(recipe.id, parsed)
-            await self.repository.mark_as_parsed(recipe.id)
-            recipe.ingredients = await self.repository._get_ingredients(recipe.id)
-
+            recipe.ingredients = await self.repository.set_parsed_ingredients(recipe.id, parsed)
+            recipe.is_parsed = True
+            self.precompute_store.recipe_changed(
+                household_id,
+                recipe.id,
+                [ingredient.item_name for ingredient in parsed],
+            )
+
+        self._catalog_changed(household_id)
         return recipe
 
     async def update_recipe(
@@ -200,9 +236,24 @@ class RecipeService:
             raise RecipeNotFoundError(recipe_id)
 
         if ingredient_texts:
-            await self.repository.replace_ingredients(recipe_id, ingredient_texts)
-            recipe.ingredients = await self.repository._get_ingredients(recipe_id)
-
+            recipe.ingredients = await self.repository.replace_ingredients(
+                recipe_id, ingredient_texts
+            )
+            self.precompute_store.recipe_changed(
+                household_id,
+                recipe_id,
+                [ingredient.item_name for ingredient in recipe.ingredients],
+            )
+        else:
+            # Title changes show up in stored scores too
+            self.precompute_store.recipe_changed(household_id, recipe_id)
+
+        if ingredient_texts or dto.title is not None:
+            if recipe.ingredients is None:
+                recipe.ingredients = await self.repository._get_ingredients(recipe_id)
+            await self._store_signature(recipe)
+
+        self._catalog_changed(household_id)
         return recipe
 
     async def delete_recipe(self, recipe_id: UUID, household_id: UUID) -> None:
@@ -218,6 +269,8 @@ class RecipeService:
         deleted = await self.repository.delete(recipe_id, household_id)
         if not deleted:
             raise RecipeNotFoundError(recipe_id)
+        self.precompute_store.recipe_removed(household_id, recipe_id)
+        self._catalog_changed(household_id)
 
     async def parse_ingredients(
         self,
@@ -250,17 +303,88 @@ class RecipeService:
         if not recipe:
             raise RecipeNotFoundError(recipe_id)
 
-        # Clear existing if requested
-        if replace_existing:
-            await self.repository.clear_ingredients(recipe_id)
-
-        # Parse and store
         parsed = self.parser.parse_many(ingredient_texts)
-        await self.repository.add_ingredients(recipe_id, parsed)
-        await self.repository.mark_as_parsed(recipe_id)
+
+        if replace_existing:
+            # The signature is known up front, so it's stored in the same call
+            recipe.minhash = compute_signature(
+                recipe.title, (ingredient.item_name for ingredient in parsed)
+            )
+            recipe.ingredients = await self.repository.set_parsed_ingredients(
+                recipe_id, parsed, minhash=recipe.minhash
+            )
+        else:
+            recipe.ingredients = await self.repository.set_parsed_ingredients(
+                recipe_id, parsed, append=True
+            )
+            await self._store_signature(recipe)
+
+        # Appended ingredients are re-indexed on the next scoring run
+        self.precompute_store.recipe_changed(
+            household_id,
+            recipe_id,
+            [ingredient.item_name for ingredient in parsed] if replace_existing else None,
+        )
+        self._catalog_changed(household_id)
 
         return parsed
 
+    async def reparse_recipes(self, household_id: UUID) -> int:
+        """Re-parse every recipe of a household from its raw ingredient text.
+
+        Used after parser improvements. Ingredients are written in bulk,
+        one transaction per batch of recipes, so no recipe is ever left
+        half re-parsed. Section headings aren't part of the raw text, so
+        the stored ones are kept.
+
+        Args:
+            household_id: The household whose recipes to re-parse.
+
+        Returns:
+            How many recipes were re-parsed.
+        """
+        reparsed = 0
+        async for chunk in self.repository.iter_by_household(household_id):
+            parsed_by_recipe: dict[UUID, list[ParsedIngredient]] = {}
+            minhashes: dict[UUID, list[int]] = {}
+            sections: dict[UUID, list[str | None]] = {}
+            for recipe in chunk:
+                if not recipe.ingredients:
+                    continue
+                parsed = self.parser.parse_many(
+                    [ingredient.raw_text for ingredient in recipe.ingredients]
+                )
+                parsed_by_recipe[recipe.id] = parsed
+                sections[recipe.id] = [ingredient.section for ingredient in recipe.ingredients]
+                minhashes[recipe.id] = compute_signature(
+                    recipe.title, (ingredient.item_name for ingredient in parsed)
+                )
+
+            if not parsed_by_recipe:
+                continue
+            await self.repository.set_parsed_ingredients_many(
+                parsed_by_recipe, minhashes=minhashes, sections=sections
+            )
+            for recipe_id, parsed in parsed_by_recipe.items():
+                self.precompute_store.recipe_changed(
+                    household_id,
+                    recipe_id,
+                    [ingredient.item_name for ingredient in parsed],
+                )
+            reparsed += len(parsed_by_recipe)
+
+        if reparsed:
+            self._catalog_changed(household_id)
+        return reparsed
+
+    async def _store_signature(self, recipe: Recipe) -> None:
+        """Recompute and store a recipe's near-duplicate signature."""
+        recipe.minhash = compute_signature(
+            recipe.title,
+            (ingredient.item_name for ingredient in recipe.ingredients or []),
+        )
+        await self.repository.set_minhash(recipe.id, recipe.minhash)
+
     async def search_recipes(
         self,
         household_id: UUID,
@@ -316,7 +440,10 @@ class RecipeService:
             source_url=url,
         )
 
-        recipe = await self.repository.create(household_id, dto)
+        recipe = await self.repository.create(
+            household_id, dto, minhash=compute_signature(dto.title, [])
+        )
+        self._catalog_changed(household_id)
 
         return IngestRecipeResponse(
             recipe=recipe,
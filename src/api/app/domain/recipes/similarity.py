@@ -0,0 +1,216 @@
+"""Recipe Similarity - MinHash signatures for near-duplicate detection. 👯
+
+Two recipes are near-duplicates when their sets of title words and
+ingredient names overlap a lot (Jaccard similarity). Comparing every
+pair is quadratic, so each recipe gets a MinHash signature instead: the
+fraction of positions where two signatures agree estimates their
+Jaccard similarity.
+
+Signatures are split into bands and each band is hashed into a bucket
+(locality-sensitive hashing). Similar recipes very likely share at
+least one bucket, so finding a recipe's near-duplicates is a handful of
+dictionary lookups instead of a scan. The few recipes found that way are
+then checked with their exact Jaccard similarity, so estimation noise
+never flags a pair below the threshold.
+
+Signatures only depend on the recipe's content, so they're computed
+when a recipe is created or re-parsed and stored with it.
+
+Fun fact: AltaVista used MinHash in 1997 to find near-duplicate web
+pages among millions of crawled documents! 🕸️
+"""
+
+import hashlib
+import random
+import re
+from collections.abc import Hashable, Iterable
+from functools import lru_cache
+
+from src.api.app.domain.recipes.models import Recipe
+
+NUM_PERM = 128  # Signature length
+BANDS = 32  # LSH bands (rows per band = NUM_PERM // BANDS)
+NEAR_DUPLICATE_THRESHOLD = 0.6  # Minimum Jaccard similarity of two recipes
+
+# Words that say nothing about what a dish is
+STOPWORDS = frozenset({"a", "an", "and", "the", "with", "of", "in", "on", "&", "style"})
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 61) - 1
+# Fixed seed: stored signatures must stay comparable across processes
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+
+def recipe_shingles(title: str, ingredient_names: Iterable[str]) -> set[str]:
+    """Get the features compared between recipes.
+
+    Title words (minus stopwords) and whole ingredient names, each in
+    their own namespace.
+    """
+    words = {
+        f"t:{word}" for word in re.findall(r"[\w']+", title.lower()) if word not in STOPWORDS
+    }
+    names = {f"i:{name.lower().strip()}" for name in ingredient_names if name.strip()}
+    return words | names
+
+
+def minhash_signature(shingles: Iterable[str]) -> list[int]:
+    """Compute a MinHash signature.
+
+    Args:
+        shingles: Features of the recipe.
+
+    Returns:
+        NUM_PERM integers (each fits a signed 64-bit column).
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for shingle in shingles
+    ]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def shingles_for(recipe: Recipe) -> set[str]:
+    """Get a recipe's features (title words and ingredient names)."""
+    return recipe_shingles(
+        recipe.title,
+        (ingredient.item_name for ingredient in recipe.ingredients or []),
+    )
+
+
+def compute_signature(title: str, ingredient_names: Iterable[str]) -> list[int]:
+    """Compute the signature stored with a recipe."""
+    return minhash_signature(recipe_shingles(title, ingredient_names))
+
+
+def signature_for(recipe: Recipe) -> list[int]:
+    """Get a recipe's signature, computing it if none is stored.
+
+    Stored signatures of the wrong length (from other parameters) are
+    ignored. Computed ones are memoized by content, so recipes saved
+    before signatures existed only pay for it once per process.
+    """
+    if recipe.minhash is not None and len(recipe.minhash) == NUM_PERM:
+        return recipe.minhash
+    return list(
+        _cached_signature(
+            recipe.title,
+            tuple(ingredient.item_name for ingredient in recipe.ingredients or []),
+        )
+    )
+
+
+@lru_cache(maxsize=20_000)
+def _cached_signature(title: str, ingredient_names: tuple[str, ...]) -> tuple[int, ...]:
+    """Memoized `compute_signature`."""
+    return tuple(compute_signature(title, ingredient_names))
+
+
+def estimated_similarity(first: list[int], second: list[int]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(first, second, strict=True) if a == b) / NUM_PERM
+
+
+def jaccard(first: set[str], second: set[str]) -> float:
+    """Exact Jaccard similarity of two feature sets."""
+    union = len(first | second)
+    return len(first & second) / union if union else 1.0
+
+
+class NearDuplicateIndex:
+    """LSH index of recipe signatures. 🪣
+
+    Keys can be anything hashable (recipe IDs, positions in a list).
+    Bucket hits are confirmed with the exact Jaccard similarity, so
+    results are the keys at or above the threshold (a true near-duplicate
+    is missed only if it shares no bucket - rare above the threshold).
+
+    Example:
+        >>> index = NearDuplicateIndex()
+        >>> index.add(stew.id, stew)
+        >>> index.near_duplicates(bean_stew)
+        {stew.id}
+    """
+
+    def __init__(
+        self,
+        *,
+        bands: int = BANDS,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            bands: Number of LSH bands (must divide NUM_PERM).
+            threshold: Minimum Jaccard similarity for a near-duplicate.
+
+        Raises:
+            ValueError: If bands doesn't divide NUM_PERM.
+        """
+        if bands < 1 or NUM_PERM % bands:
+            raise ValueError(f"bands must divide {NUM_PERM}, got {bands}")
+        self.rows = NUM_PERM // bands
+        self.threshold = threshold
+        self._buckets: dict[tuple[int, tuple[int, ...]], set[Hashable]] = {}
+        self._entries: dict[Hashable, tuple[list[int], set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def add(self, key: Hashable, recipe: Recipe) -> None:
+        """Index a recipe (replacing anything stored under the key)."""
+        self.add_features(key, signature_for(recipe), shingles_for(recipe))
+
+    def add_features(self, key: Hashable, signature: list[int], shingles: set[str]) -> None:
+        """Index a precomputed signature and feature set."""
+        self.remove(key)
+        self._entries[key] = (signature, shingles)
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a key from the index."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band in self._bands(entry[0]):
+            bucket = self._buckets[band]
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[band]
+
+    def near_duplicates(self, recipe: Recipe) -> set[Hashable]:
+        """Get indexed keys whose recipe is a near-duplicate of this one."""
+        return self.near_duplicates_of(signature_for(recipe), shingles_for(recipe))
+
+    def near_duplicates_of(self, signature: list[int], shingles: set[str]) -> set[Hashable]:
+        """Get indexed keys near-duplicating a precomputed signature and feature set."""
+        candidates: set[Hashable] = set()
+        for band in self._bands(signature):
+            candidates |= self._buckets.get(band, set())
+        return {
+            key for key in candidates if jaccard(shingles, self._entries[key][1]) >= self.threshold
+        }
+
+    def near_duplicates_of_key(self, key: Hashable) -> set[Hashable]:
+        """Get other indexed keys near-duplicating an indexed one."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return set()
+        return self.near_duplicates_of(*entry) - {key}
+
+    def _bands(self, signature: list[int]) -> list[tuple[int, tuple[int, ...]]]:
+        """Split a signature into (band number, rows) bucket keys."""
+        return [
+            (band, tuple(signature[band * self.rows : (band + 1) * self.rows]))
+            for band in range(NUM_PERM // self.rows)
+        ]
@@ -7,6 +7,8 @@ Fun fact: A "pinch" is approximately 1/16 of a teaspoon! 🤏
 """
 
 import re
+import threading
+from collections.abc import Sequence
 from typing import NamedTuple
 
 import pint
@@ -90,6 +92,41 @@ class UnitRegistry:
         "doz": "dozen",
     }
 
+    # Precomputed conversion table: canonical unit -> (dimension, factor).
+    # Factors are relative to milliliter (volume), gram (mass) and count,
+    # and match Pint's definitions plus the custom ones in __init__, so
+    # converting between these units is a lookup and a multiply.
+    UNIT_FACTORS: dict[str, tuple[str, float]] = {
+        # Volume (US customary + metric)
+        "teaspoon": ("volume", 4.92892159375),
+        "tablespoon": ("volume", 14.78676478125),
+        "fluid_ounce": ("volume", 29.5735295625),
+        "cup": ("volume", 236.5882365),
+        "pint": ("volume", 473.176473),
+        "quart": ("volume", 946.352946),
+        "gallon": ("volume", 3785.411784),
+        "milliliter": ("volume", 1.0),
+        "liter": ("volume", 1000.0),
+        "pinch": ("volume", 0.3),
+        "dash": ("volume", 0.6),
+        "splash": ("volume", 5.0),
+        "can": ("volume", 400.0),
+        # Mass
+        "gram": ("mass", 1.0),
+        "kilogram": ("mass", 1000.0),
+        "ounce": ("mass", 28.349523125),
+        "pound": ("mass", 453.59237),
+        "handful": ("mass", 30.0),
+        # Count
+        "count": ("count", 1.0),
+        "dozen": ("count", 12.0),
+        "bunch": ("count", 1.0),
+        "sprig": ("count", 1.0),
+        "clove": ("count", 1.0),
+        "head": ("count", 1.0),
+        "stalk": ("count", 1.0),
+    }
+
     # Implicit count patterns (no unit = count)
     COUNTABLE_PATTERN = re.compile(
         r"^\d+\s*(large|medium|small|whole)?\s*"
@@ -114,6 +151,20 @@ class UnitRegistry:
         self._ureg.define("can = 400 milliliter")  # Standard can size
         self._ureg.define("dozen = 12 count")
 
+        # Pint mutates internal parse caches, so fallback lookups are serialized.
+        # Table lookups are read-only and need no lock.
+        self._pint_lock = threading.Lock()
+
+    def warm(self) -> "UnitRegistry":
+        """Pre-parse every table unit through Pint so first requests are fast.
+
+        Returns:
+            The registry itself, for chaining.
+        """
+        for unit in self.UNIT_FACTORS:
+            self._pint_convert(1.0, unit, unit)
+        return self
+
     def parse_fraction(self, text: str) -> float | None:
         """Parse a fraction or mixed number string to float.
 
@@ -242,6 +293,18 @@ class UnitRegistry:
         """Check if a unit is vague/unmeasurable."""
         return self.normalize_unit(unit) in self.VAGUE_UNITS
 
+    def unit_dimension(self, unit: str) -> str | None:
+        """Get the dimension of a unit from the factor table.
+
+        Args:
+            unit: Unit string (normalized first).
+
+        Returns:
+            "volume", "mass", "count", or None if not in the table.
+        """
+        entry = self.UNIT_FACTORS.get(self.normalize_unit(unit))
+        return entry[0] if entry else None
+
     def convert(
         self,
         value: float,
@@ -250,6 +313,8 @@ class UnitRegistry:
     ) -> float | None:
         """Convert a value between units.
 
+        Table units convert with a multiply; anything else goes through Pint.
+
         Args:
             value: The quantity to convert.
             from_unit: Source unit.
@@ -262,11 +327,57 @@ class UnitRegistry:
             >>> registry.convert(500, "gram", "kilogram")
             0.5
         """
-        try:
-            quantity = value * self._ureg(self.normalize_unit(from_unit))
-            return quantity.to(self.normalize_unit(to_unit)).magnitude
-        except (pint.DimensionalityError, pint.UndefinedUnitError):
-            return None
+        from_unit = self.normalize_unit(from_unit)
+        to_unit = self.normalize_unit(to_unit)
+
+        source = self.UNIT_FACTORS.get(from_unit)
+        target = self.UNIT_FACTORS.get(to_unit)
+        if source and target:
+            if source[0] != target[0]:
+                return None
+            return value * source[1] / target[1]
+
+        return self._pint_convert(value, from_unit, to_unit)
+
+    def convert_many(
+        self,
+        values: Sequence[float],
+        from_units: Sequence[str] | str,
+        to_unit: str,
+    ) -> list[float | None]:
+        """Convert a batch of values into one unit.
+
+        Args:
+            values: Quantities to convert.
+            from_units: Source unit per value, or one unit for all of them.
+            to_unit: Target unit.
+
+        Returns:
+            Converted values in input order (None where not possible).
+
+        Raises:
+            ValueError: If values and from_units differ in length.
+
+        Example:
+            >>> registry.convert_many([1, 8], ["cup", "tbsp"], "cup")
+            [1.0, 0.5]
+        """
+        if isinstance(from_units, str):
+            from_units = [from_units] * len(values)
+        if len(from_units) != len(values):
+            raise ValueError(
+                f"Got {len(values)} values but {len(from_units)} units",
+            )
+
+        # One factor per distinct source unit
+        factors: dict[str, float | None] = {}
+        results: list[float | None] = []
+        for value, from_unit in zip(values, from_units, strict=True):
+            if from_unit not in factors:
+                factors[from_unit] = self.convert(1.0, from_unit, to_unit)
+            factor = factors[from_unit]
+            results.append(value * factor if factor is not None else None)
+        return results
 
     def are_compatible(self, unit1: str, unit2: str) -> bool:
         """Check if two units are dimensionally compatible.
@@ -284,10 +395,50 @@ class UnitRegistry:
             >>> registry.are_compatible("gram", "cup")
             False  # Needs density
         """
+        unit1 = self.normalize_unit(unit1)
+        unit2 = self.normalize_unit(unit2)
+
+        first = self.UNIT_FACTORS.get(unit1)
+        second = self.UNIT_FACTORS.get(unit2)
+        if first and second:
+            return first[0] == second[0]
+
         try:
-            q1 = 1 * self._ureg(self.normalize_unit(unit1))
-            q2 = 1 * self._ureg(self.normalize_unit(unit2))
-            q1.to(q2.units)
+            with self._pint_lock:
+                q1 = 1 * self._ureg(unit1)
+                q2 = 1 * self._ureg(unit2)
+                q1.to(q2.units)
             return True
         except (pint.DimensionalityError, pint.UndefinedUnitError):
             return False
+
+    def _pint_convert(self, value: float, from_unit: str, to_unit: str) -> float | None:
+        """Convert through Pint (fallback for units not in the table)."""
+        try:
+            with self._pint_lock:
+                quantity = value * self._ureg(from_unit)
+                return quantity.to(to_unit).magnitude
+        except (pint.DimensionalityError, pint.UndefinedUnitError):
+            return None
+
+
+_shared_registry: UnitRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_unit_registry() -> UnitRegistry:
+    """Get the process-wide unit registry. 🌍
+
+    Building a Pint registry takes tens of milliseconds, so services share
+    one instead of constructing their own. Created on first use (or warmed
+    in the API lifespan); safe to call from any thread.
+
+    Returns:
+        The shared UnitRegistry.
+    """
+    global _shared_registry
+    if _shared_registry is None:
+        with _shared_registry_lock:
+            if _shared_registry is None:
+                _shared_registry = UnitRegistry()
+    return _shared_registry
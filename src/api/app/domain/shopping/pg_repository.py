@@ -0,0 +1,104 @@
+"""Shopping repository - Direct Postgres reads. 🐘
+
+Reads shopping lists and their items over asyncpg instead of PostgREST,
+returning exactly what ShoppingRepository would. Writes are inherited
+and still go through Supabase.
+
+Fun fact: The active list is re-read every time someone checks an item
+off in the store - often with one bar of signal! 📶
+"""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from src.api.app.core.cache import SHOPPING, cached_read
+from src.api.app.core.config import get_settings
+from src.api.app.db.postgres import read_pool_for
+from src.api.app.domain.shopping.models import ShoppingItem, ShoppingList
+from src.api.app.domain.shopping.repository import ShoppingRepository
+
+if TYPE_CHECKING:
+    import asyncpg
+    from supabase import AsyncClient
+
+LIST_BY_ID_SQL = "SELECT * FROM shopping_lists WHERE id = $1 AND household_id = $2"
+
+ACTIVE_LIST_SQL = """
+SELECT * FROM shopping_lists
+WHERE household_id = $1 AND status = 'active'
+ORDER BY created_at DESC
+LIMIT 1
+"""
+
+ITEMS_SQL = """
+SELECT * FROM shopping_list_items
+WHERE shopping_list_id = $1
+ORDER BY category NULLS LAST, name
+"""
+
+
+class PostgresShoppingRepository(ShoppingRepository):
+    """ShoppingRepository reading lists straight from Postgres. 🐘"""
+
+    def __init__(self, supabase: "AsyncClient", pool: "asyncpg.Pool") -> None:
+        """Initialize repository.
+
+        Args:
+            supabase: Client used for writes.
+            pool: asyncpg pool used for reads.
+        """
+        super().__init__(supabase)
+        self.pool = pool
+
+    async def get_list_by_id(
+        self,
+        list_id: UUID,
+        household_id: UUID,
+        *,
+        include_items: bool = True,
+    ) -> ShoppingList | None:
+        """Get a shopping list by ID."""
+        async with self.pool.acquire() as connection:
+            row = await connection.fetchrow(LIST_BY_ID_SQL, list_id, household_id)
+            if row is None:
+                return None
+
+            shopping_list = ShoppingList.model_validate(dict(row))
+            if include_items:
+                shopping_list.items = await self._fetch_items(connection, shopping_list.id)
+        return shopping_list
+
+    @cached_read(SHOPPING)
+    async def get_active_list(
+        self,
+        household_id: UUID,
+    ) -> ShoppingList | None:
+        """Get the active shopping list for a household, with its items."""
+        async with self.pool.acquire() as connection:
+            row = await connection.fetchrow(ACTIVE_LIST_SQL, household_id)
+            if row is None:
+                return None
+
+            shopping_list = ShoppingList.model_validate(dict(row))
+            shopping_list.items = await self._fetch_items(connection, shopping_list.id)
+        return shopping_list
+
+    async def _fetch_items(
+        self,
+        connection: "asyncpg.Connection",
+        list_id: UUID,
+    ) -> list[ShoppingItem]:
+        """Get all items for a shopping list."""
+        rows = await connection.fetch(ITEMS_SQL, list_id)
+        return [ShoppingItem.model_validate(dict(row)) for row in rows]
+
+
+def make_shopping_repository(supabase: "AsyncClient") -> ShoppingRepository:
+    """Build the shopping repository for the configured read backend.
+
+    Falls back to PostgREST reads if the Postgres pool isn't open.
+    """
+    pool = read_pool_for(get_settings().shopping_read_backend)
+    if pool is None:
+        return ShoppingRepository(supabase)
+    return PostgresShoppingRepository(supabase, pool)
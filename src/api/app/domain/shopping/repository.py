@@ -9,6 +9,8 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from src.api.app.core.cache import SHOPPING, cached_read
+from src.api.app.db.pagination import iter_keyset
 from src.api.app.domain.shopping.models import (
     CreateShoppingItemDTO,
     CreateShoppingListDTO,
@@ -28,6 +30,8 @@ class ShoppingRepository:
 
     LISTS_TABLE = "shopping_lists"
     ITEMS_TABLE = "shopping_list_items"
+    # PostgREST's default row cap - item counts page past it
+    SUMMARY_PAGE_SIZE = 1000
 
     def __init__(self, supabase: "AsyncClient") -> None:
         """Initialize repository with Supabase client."""
@@ -73,6 +77,7 @@ class ShoppingRepository:
 
         return shopping_list
 
+    @cached_read(SHOPPING)
     async def get_active_list(
         self,
         household_id: UUID,
@@ -125,32 +130,53 @@ class ShoppingRepository:
             query = query.eq("status", "active")
 
         result = await query.execute()
+        rows = result.data or []
+
+        # Item counts for every list in one query, grouped here
+        counts = await self._count_items([row["id"] for row in rows])
+
+        return [
+            ShoppingListSummary(
+                id=row["id"],
+                name=row["name"],
+                status=row["status"],
+                total_items=counts.get(row["id"], (0, 0))[0],
+                checked_items=counts.get(row["id"], (0, 0))[1],
+                created_at=row["created_at"],
+            )
+            for row in rows
+        ]
+
+    async def _count_items(self, list_ids: list[str]) -> dict[str, tuple[int, int]]:
+        """Count total and checked items per list.
 
-        summaries = []
-        for row in result.data or []:
-            # Get item counts for each list
-            items_result = await (
+        One query covers every list; further pages are only fetched if
+        the items exceed the PostgREST row cap.
+
+        Returns:
+            (total, checked) by list ID.
+        """
+        counts: dict[str, tuple[int, int]] = {}
+        if not list_ids:
+            return counts
+
+        chunks = iter_keyset(
+            lambda: (
                 self.supabase.table(self.ITEMS_TABLE)
-                .select("status")
-                .eq("shopping_list_id", row["id"])
-                .execute()
-            )
-            items = items_result.data or []
-            total = len(items)
-            checked = sum(1 for i in items if i["status"] == "checked")
-
-            summaries.append(
-                ShoppingListSummary(
-                    id=row["id"],
-                    name=row["name"],
-                    status=row["status"],
-                    total_items=total,
-                    checked_items=checked,
-                    created_at=row["created_at"],
+                .select("id, shopping_list_id, status")
+                .in_("shopping_list_id", list_ids)
+            ),
+            sort_column="shopping_list_id",
+            chunk_size=self.SUMMARY_PAGE_SIZE,
+        )
+        async for items in chunks:
+            for item in items:
+                total, checked = counts.get(item["shopping_list_id"], (0, 0))
+                counts[item["shopping_list_id"]] = (
+                    total + 1,
+                    checked + (item["status"] == ShoppingItemStatus.CHECKED.value),
                 )
-            )
-
-        return summaries
+        return counts
 
     async def create_list(
         self,
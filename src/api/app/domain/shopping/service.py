@@ -7,7 +7,9 @@ Fun fact: Shoppers who use lists spend 23% less than those who don't! 💰
 
 from uuid import UUID
 
+from src.api.app.core.cache import SHOPPING, HouseholdCache, get_household_cache
 from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.keyword_matcher import KeywordMatcher
 from src.api.app.domain.planning.models import DeltaItem
 from src.api.app.domain.shopping.models import (
     AggregatedItem,
@@ -104,6 +106,7 @@ CATEGORY_MAP: dict[str, str] = {
     "thyme": "Spices",
     "cinnamon": "Spices",
 }
+CATEGORY_MATCHER = KeywordMatcher(CATEGORY_MAP)
 
 
 class ShoppingService:
@@ -116,15 +119,23 @@ class ShoppingService:
         self,
         repository: ShoppingRepository,
         delta_service: DeltaService | None = None,
+        cache: HouseholdCache | None = None,
     ) -> None:
         """Initialize service.
 
         Args:
             repository: The shopping repository instance.
             delta_service: Optional delta service for list generation.
+            cache: Read cache to invalidate on writes (uses the
+                process-wide one if not provided).
         """
         self.repository = repository
         self.delta_service = delta_service or DeltaService()
+        self.cache = cache if cache is not None else get_household_cache()
+
+    def _lists_changed(self, household_id: UUID) -> None:
+        """Drop cached reads of the household's shopping lists."""
+        self.cache.bump(household_id, SHOPPING)
 
     # =========================================================================
     # Shopping Lists
@@ -188,7 +199,9 @@ class ShoppingService:
 
         # Create a new list
         dto = CreateShoppingListDTO(name="Shopping List")
-        return await self.repository.create_list(household_id, dto)
+        created = await self.repository.create_list(household_id, dto)
+        self._lists_changed(household_id)
+        return created
 
     async def list_all(
         self,
@@ -224,7 +237,9 @@ class ShoppingService:
         Returns:
             The created ShoppingList.
         """
-        return await self.repository.create_list(household_id, dto)
+        created = await self.repository.create_list(household_id, dto)
+        self._lists_changed(household_id)
+        return created
 
     async def complete_list(
         self,
@@ -250,6 +265,7 @@ class ShoppingService:
         )
         if not result:
             raise ShoppingListNotFoundError(list_id)
+        self._lists_changed(household_id)
         return result
 
     async def delete_list(
@@ -269,6 +285,7 @@ class ShoppingService:
         deleted = await self.repository.delete_list(list_id, household_id)
         if not deleted:
             raise ShoppingListNotFoundError(list_id)
+        self._lists_changed(household_id)
 
     # =========================================================================
     # Shopping Items
@@ -313,7 +330,9 @@ class ShoppingService:
                 recipe_source=dto.recipe_source,
             )
 
-        return await self.repository.add_item(list_id, dto)
+        item = await self.repository.add_item(list_id, dto)
+        self._lists_changed(household_id)
+        return item
 
     async def update_item(
         self,
@@ -348,6 +367,7 @@ class ShoppingService:
         result = await self.repository.update_item(item_id, list_id, dto)
         if not result:
             raise ShoppingItemNotFoundError(item_id)
+        self._lists_changed(household_id)
         return result
 
     async def check_item(
@@ -383,6 +403,7 @@ class ShoppingService:
         result = await self.repository.check_item(item_id, list_id, user_id)
         if not result:
             raise ShoppingItemNotFoundError(item_id)
+        self._lists_changed(household_id)
         return result
 
     async def uncheck_item(
@@ -416,6 +437,7 @@ class ShoppingService:
         result = await self.repository.uncheck_item(item_id, list_id)
         if not result:
             raise ShoppingItemNotFoundError(item_id)
+        self._lists_changed(household_id)
         return result
 
     async def delete_item(
@@ -446,6 +468,7 @@ class ShoppingService:
         deleted = await self.repository.delete_item(item_id, list_id)
         if not deleted:
             raise ShoppingItemNotFoundError(item_id)
+        self._lists_changed(household_id)
 
     async def clear_checked(
         self,
@@ -473,7 +496,9 @@ class ShoppingService:
         if not shopping_list:
             raise ShoppingListNotFoundError(list_id)
 
-        return await self.repository.clear_checked_items(list_id)
+        deleted = await self.repository.clear_checked_items(list_id)
+        self._lists_changed(household_id)
+        return deleted
 
     # =========================================================================
     # List Generation (Phase 7A)
@@ -560,11 +585,5 @@ class ShoppingService:
         Returns:
             Category string or None if unknown.
         """
-        name_lower = item_name.lower()
-
-        # Check exact matches first
-        for keyword, category in CATEGORY_MAP.items():
-            if keyword in name_lower:
-                return category
-
-        return None
+        # Longest keyword wins ("sour cream" over "cream")
+        return CATEGORY_MATCHER.lookup(item_name)
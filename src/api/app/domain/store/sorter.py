@@ -7,6 +7,7 @@ Fun fact: Following a sorted list can reduce shopping time by 30%! ⏱️
 
 from uuid import UUID
 
+from src.api.app.domain.planning.keyword_matcher import KeywordMatcher
 from src.api.app.domain.shopping.models import ShoppingItem
 from src.api.app.domain.store.models import (
     AisleConfig,
@@ -132,6 +133,7 @@ DEFAULT_AISLE_MAP: dict[str, str] = {
     "nuts": "Snacks",
     "popcorn": "Snacks",
 }
+DEFAULT_AISLE_MATCHER = KeywordMatcher(DEFAULT_AISLE_MAP)
 
 # Default aisle order for store traversal
 DEFAULT_AISLE_ORDER = [
@@ -259,12 +261,8 @@ class StoreSorter:
         if name_lower in self._mapping_lookup:
             return self._mapping_lookup[name_lower]
 
-        # Check default mappings (partial match)
-        for keyword, aisle in DEFAULT_AISLE_MAP.items():
-            if keyword in name_lower:
-                return aisle
-
-        return "Unknown"
+        # Check default mappings (partial match, longest keyword wins)
+        return DEFAULT_AISLE_MATCHER.lookup(name_lower, "Unknown")
 
     def get_aisle_summary(
         self,
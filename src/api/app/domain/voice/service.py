@@ -10,6 +10,7 @@ from uuid import UUID, uuid4
 
 from supabase import AsyncClient
 
+from src.api.app.core.cache import PANTRY, HouseholdCache, get_household_cache
 from src.api.app.domain.voice.models import (
     ParsedVoiceCommand,
     VoiceCommandType,
@@ -34,9 +35,11 @@ class VoiceService:
         self,
         supabase: AsyncClient | None = None,
         parser: VoiceParser | None = None,
+        cache: HouseholdCache | None = None,
     ) -> None:
         self.supabase = supabase
         self.parser = parser or VoiceParser()
+        self.cache = cache if cache is not None else get_household_cache()
 
     async def process_command(
         self,
@@ -260,6 +263,7 @@ class VoiceService:
                 for item in parsed.items
             ]
             await self.supabase.table("pantry_items").insert(rows).execute()
+            self.cache.bump(household_id, PANTRY)
 
         message = f"Added {', '.join(item_names)} to your {loc}."
 
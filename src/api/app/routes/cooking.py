@@ -5,13 +5,13 @@ REST endpoints for cooking assistance and context export.
 Fun fact: The "mise en place" philosophy can reduce cooking stress by 50%! 🧘
 """
 
+import asyncio
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
-from src.api.app.db.session import get_supabase
 from src.api.app.domain.cooking.models import (
     ContextExportRequest,
     ContextExportResponse,
@@ -22,8 +22,9 @@ from src.api.app.domain.cooking.models import (
     RecipeStep,
 )
 from src.api.app.domain.cooking.service import CookingService
-from src.api.app.domain.pantry.repository import PantryRepository
-from src.api.app.domain.recipes.repository import RecipeRepository
+from src.api.app.domain.loaders import RequestLoaders
+from src.api.app.domain.recipes.models import Recipe
+from src.api.app.routes.dependencies import get_current_household_id, get_request_loaders
 
 router = APIRouter(prefix="/cooking", tags=["Cooking 👨‍🍳"])
 
@@ -33,10 +34,19 @@ async def get_cooking_service() -> CookingService:
     return CookingService()
 
 
-# TODO: Replace with actual auth
-async def get_current_household_id() -> UUID:
-    """Get the current user's household ID."""
-    return UUID("a0000000-0000-0000-0000-000000000001")
+async def load_recipe(loaders: RequestLoaders, recipe_id: UUID) -> Recipe:
+    """Load a recipe with its ingredients.
+
+    Raises:
+        HTTPException: 404 if the recipe doesn't exist.
+    """
+    recipe = await loaders.get_recipe(recipe_id)
+    if not recipe:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Recipe {recipe_id} not found",
+        )
+    return recipe
 
 
 class CookingContextResponse(BaseModel):
@@ -54,26 +64,16 @@ class CookingContextResponse(BaseModel):
 async def get_cooking_context(
     recipe_id: UUID,
     service: Annotated[CookingService, Depends(get_cooking_service)],
-    household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
 ) -> CookingContextResponse:
     """Get cooking context for a recipe. 📋
 
     Returns recipe info with inventory comparison for AI assistance.
     """
     # Fetch recipe and pantry items
-    async with get_supabase() as supabase:
-        recipe_repo = RecipeRepository(supabase)
-        pantry_repo = PantryRepository(supabase)
-
-        recipe = await recipe_repo.get_by_id(recipe_id, household_id)
-        if not recipe:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Recipe {recipe_id} not found",
-            )
-
-        recipe.ingredients = await recipe_repo._get_ingredients(recipe_id)
-        pantry_items, _ = await pantry_repo.get_all_by_household(household_id)
+    recipe, pantry_items = await asyncio.gather(
+        load_recipe(loaders, recipe_id), loaders.get_pantry_items()
+    )
 
     context = await service.get_cooking_context(recipe, pantry_items)
 
@@ -92,25 +92,15 @@ async def export_cooking_context(
     recipe_id: UUID,
     request: ContextExportRequest,
     service: Annotated[CookingService, Depends(get_cooking_service)],
-    household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
 ) -> ContextExportResponse:
     """Export cooking context for clipboard. 📋
 
     Returns formatted context for pasting into AI assistants.
     """
-    async with get_supabase() as supabase:
-        recipe_repo = RecipeRepository(supabase)
-        pantry_repo = PantryRepository(supabase)
-
-        recipe = await recipe_repo.get_by_id(recipe_id, household_id)
-        if not recipe:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Recipe {recipe_id} not found",
-            )
-
-        recipe.ingredients = await recipe_repo._get_ingredients(recipe_id)
-        pantry_items, _ = await pantry_repo.get_all_by_household(household_id)
+    recipe, pantry_items = await asyncio.gather(
+        load_recipe(loaders, recipe_id), loaders.get_pantry_items()
+    )
 
     return await service.export_context(recipe, pantry_items, request)
 
@@ -119,23 +109,13 @@ async def export_cooking_context(
 async def get_mise_en_place(
     recipe_id: UUID,
     service: Annotated[CookingService, Depends(get_cooking_service)],
-    household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
 ) -> list[MiseEnPlaceItem]:
     """Get mise en place checklist for a recipe. ✅
 
     Returns prep tasks to complete before cooking.
     """
-    async with get_supabase() as supabase:
-        recipe_repo = RecipeRepository(supabase)
-
-        recipe = await recipe_repo.get_by_id(recipe_id, household_id)
-        if not recipe:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Recipe {recipe_id} not found",
-            )
-
-        recipe.ingredients = await recipe_repo._get_ingredients(recipe_id)
+    recipe = await load_recipe(loaders, recipe_id)
 
     return await service.get_mise_en_place(recipe)
 
@@ -144,21 +124,13 @@ async def get_mise_en_place(
 async def get_recipe_steps(
     recipe_id: UUID,
     service: Annotated[CookingService, Depends(get_cooking_service)],
-    household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
 ) -> list[RecipeStep]:
     """Get recipe as step-by-step cards. 👣
 
     Returns individual steps for step-by-step cooking view.
     """
-    async with get_supabase() as supabase:
-        recipe_repo = RecipeRepository(supabase)
-
-        recipe = await recipe_repo.get_by_id(recipe_id, household_id)
-        if not recipe:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Recipe {recipe_id} not found",
-            )
+    recipe = await load_recipe(loaders, recipe_id)
 
     return await service.get_recipe_steps(recipe)
 
@@ -167,25 +139,15 @@ async def get_recipe_steps(
 async def mark_recipe_cooked(
     request: MarkCookedRequest,
     service: Annotated[CookingService, Depends(get_cooking_service)],
-    household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
 ) -> MarkCookedResponse:
     """Mark a recipe as cooked and update inventory. ✅
 
     Decrements pantry quantities based on recipe ingredients.
     """
-    async with get_supabase() as supabase:
-        recipe_repo = RecipeRepository(supabase)
-        pantry_repo = PantryRepository(supabase)
-
-        recipe = await recipe_repo.get_by_id(request.recipe_id, household_id)
-        if not recipe:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Recipe {request.recipe_id} not found",
-            )
-
-        recipe.ingredients = await recipe_repo._get_ingredients(request.recipe_id)
-        pantry_items, _ = await pantry_repo.get_all_by_household(household_id)
+    recipe, pantry_items = await asyncio.gather(
+        load_recipe(loaders, request.recipe_id), loaders.get_pantry_items()
+    )
 
     return await service.mark_cooked(recipe, pantry_items, request)
 
@@ -194,21 +156,13 @@ async def mark_recipe_cooked(
 async def start_cooking_session(
     recipe_id: UUID,
     service: Annotated[CookingService, Depends(get_cooking_service)],
-    household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
     servings: Annotated[int, Query(ge=1, le=20)] = 2,
 ) -> CookingSession:
     """Start a new cooking session. 🍳
 
     Returns a session object for tracking cooking progress.
     """
-    async with get_supabase() as supabase:
-        recipe_repo = RecipeRepository(supabase)
-
-        recipe = await recipe_repo.get_by_id(recipe_id, household_id)
-        if not recipe:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Recipe {recipe_id} not found",
-            )
+    recipe = await load_recipe(loaders, recipe_id)
 
     return await service.start_cooking_session(recipe, servings)
@@ -0,0 +1,32 @@
+"""Shared route dependencies. 🔌
+
+Dependencies used by more than one router. A route that takes request
+loaders must resolve its household through the same dependency as the
+loaders, so both live here.
+
+Fun fact: A professional kitchen's "pass" is shared by every station -
+one counter where all the plates meet before they go out! 🍽️
+"""
+
+from collections.abc import AsyncGenerator
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+
+from src.api.app.db.session import get_supabase
+from src.api.app.domain.loaders import RequestLoaders
+
+
+# TODO: Replace with actual auth
+async def get_current_household_id() -> UUID:
+    """Get the current user's household ID."""
+    return UUID("a0000000-0000-0000-0000-000000000001")
+
+
+async def get_request_loaders(
+    household_id: Annotated[UUID, Depends(get_current_household_id)],
+) -> AsyncGenerator[RequestLoaders]:
+    """Dependency injection for this request's recipe and pantry loaders."""
+    async with get_supabase() as supabase:
+        yield RequestLoaders.for_client(household_id, supabase)
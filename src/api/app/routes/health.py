@@ -3,8 +3,13 @@
 System health endpoints for monitoring and Docker healthchecks.
 """
 
+from dataclasses import asdict
+
 from fastapi import APIRouter
 
+from src.api.app.core.background import get_background_runner
+from src.api.app.core.cache import get_household_cache
+
 router = APIRouter(tags=["Health 🏥"])
 
 
@@ -24,3 +29,23 @@ async def readiness_check() -> dict:
     TODO: Add database connectivity check.
     """
     return {"status": "ready", "checks": {"database": "ok"}}
+
+
+@router.get("/health/background")
+async def background_status() -> dict:
+    """Background precompute activity.
+
+    Queue depth, task latency and how many tasks were cancelled by newer
+    pantry or recipe changes.
+    """
+    runner = get_background_runner()
+    return {"started": runner.started, **asdict(runner.stats())}
+
+
+@router.get("/health/cache")
+async def cache_status() -> dict:
+    """Household read cache activity.
+
+    Hit rate, evictions under the byte budget and invalidations by writes.
+    """
+    return asdict(get_household_cache().stats())
@@ -19,7 +19,7 @@ from src.api.app.domain.pantry.models import (
     PantryItemList,
     UpdatePantryItemDTO,
 )
-from src.api.app.domain.pantry.repository import PantryRepository
+from src.api.app.domain.pantry.pg_repository import make_pantry_repository
 from src.api.app.domain.pantry.service import PantryItemNotFoundError, PantryService
 
 router = APIRouter(prefix="/pantry", tags=["Pantry 🥫"])
@@ -28,7 +28,7 @@ router = APIRouter(prefix="/pantry", tags=["Pantry 🥫"])
 async def get_pantry_service() -> AsyncGenerator[PantryService]:
     """Dependency injection for PantryService."""
     async with get_supabase() as supabase:
-        repository = PantryRepository(supabase)
+        repository = make_pantry_repository(supabase)
         yield PantryService(repository)
 
 
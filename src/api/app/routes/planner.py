@@ -6,6 +6,7 @@ The "Choose Your Own Adventure" planner interface.
 Fun fact: 70% of people decide what to eat less than an hour before the meal! 🤔
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Annotated
 from uuid import UUID
@@ -14,7 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 
 from src.api.app.db.session import get_supabase
-from src.api.app.domain.pantry.repository import PantryRepository
+from src.api.app.domain.loaders import RequestLoaders
 from src.api.app.domain.planner.models import (
     CreatePlanRequest,
     MealPlan,
@@ -26,7 +27,7 @@ from src.api.app.domain.planner.models import (
 )
 from src.api.app.domain.planner.repository import PlannerRepository
 from src.api.app.domain.planner.service import PlannerService, PlanNotFoundError
-from src.api.app.domain.recipes.repository import RecipeRepository
+from src.api.app.routes.dependencies import get_current_household_id, get_request_loaders
 
 router = APIRouter(prefix="/planner", tags=["Planner 📅"])
 
@@ -38,43 +39,19 @@ async def get_planner_service() -> AsyncGenerator[PlannerService]:
         yield PlannerService(repository)
 
 
-async def get_recipes_for_planning() -> list:
-    """Get all recipes for planning.
+async def precompute_household(household_id: UUID) -> None:
+    """Precompute scores and default plan options for a household.
 
-    In production, this would be a dependency.
+    Run by the background runner once the household's pantry and recipe
+    changes settle.
     """
     async with get_supabase() as supabase:
-        repository = RecipeRepository(supabase)
-        recipes, _ = await repository.get_all_by_household(
-            UUID("a0000000-0000-0000-0000-000000000001"),
-            page=1,
-            per_page=200,  # Get all
+        loaders = RequestLoaders.for_client(household_id, supabase)
+        recipes, pantry_items = await asyncio.gather(
+            loaders.get_recipes(), loaders.get_pantry_items()
         )
-        # Fetch ingredients for each
-        for recipe in recipes:
-            recipe.ingredients = await repository._get_ingredients(recipe.id)
-        return recipes
-
-
-async def get_pantry_items() -> list:
-    """Get all pantry items for planning.
-
-    In production, this would be a dependency.
-    """
-    async with get_supabase() as supabase:
-        repository = PantryRepository(supabase)
-        items, _ = await repository.get_all_by_household(
-            UUID("a0000000-0000-0000-0000-000000000001"),
-            page=1,
-            per_page=500,  # Get all
-        )
-        return items
-
-
-# TODO: Replace with actual auth
-async def get_current_household_id() -> UUID:
-    """Get the current user's household ID."""
-    return UUID("a0000000-0000-0000-0000-000000000001")
+        service = PlannerService(PlannerRepository(supabase))
+        await service.precompute(household_id, recipes, pantry_items)
 
 
 # =========================================================================
@@ -87,15 +64,16 @@ async def generate_plan_options(
     request: CreatePlanRequest,
     service: Annotated[PlannerService, Depends(get_planner_service)],
     household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
 ) -> PlanOptionsResponse:
     """Generate meal plan options. 🎲
 
     Returns 3 thematic options for the user to choose from.
-    This is the "Choose Your Own Adventure" interface.
+    This is the "Choose Your Own Adventure" interface. Default requests
+    are usually precomputed in the background after data changes.
     """
-    # Get recipes and pantry items
-    recipes = await get_recipes_for_planning()
-    pantry_items = await get_pantry_items()
+    # Get recipes and pantry items (concurrently)
+    recipes, pantry_items = await asyncio.gather(loaders.get_recipes(), loaders.get_pantry_items())
 
     if len(recipes) < 3:
         raise HTTPException(
@@ -114,18 +92,19 @@ async def generate_plan_options(
 @router.post("/score-recipes", response_model=list[RecipeScore])
 async def score_recipes(
     service: Annotated[PlannerService, Depends(get_planner_service)],
-    _household_id: Annotated[UUID, Depends(get_current_household_id)],
+    household_id: Annotated[UUID, Depends(get_current_household_id)],
+    loaders: Annotated[RequestLoaders, Depends(get_request_loaders)],
     limit: Annotated[int, Query(ge=1, le=50)] = 10,
 ) -> list[RecipeScore]:
     """Score all recipes against current inventory. 📊
 
     Returns recipes sorted by how much of the ingredients you have.
-    Useful for "What can I cook now?" feature.
+    Useful for "What can I cook now?" feature. Results are precomputed
+    and only recipes touched by pantry or recipe changes are rescored.
     """
-    recipes = await get_recipes_for_planning()
-    pantry_items = await get_pantry_items()
+    recipes, pantry_items = await asyncio.gather(loaders.get_recipes(), loaders.get_pantry_items())
 
-    scores = await service.score_recipes(recipes, pantry_items)
+    scores = await service.score_recipes(recipes, pantry_items, household_id=household_id)
     return scores[:limit]
 
 
@@ -23,7 +23,7 @@ from src.api.app.domain.recipes.models import (
     UpdateRecipeDTO,
 )
 from src.api.app.domain.recipes.parser import IngredientParser
-from src.api.app.domain.recipes.repository import RecipeRepository
+from src.api.app.domain.recipes.pg_repository import make_recipe_repository
 from src.api.app.domain.recipes.service import (
     RecipeAlreadyExistsError,
     RecipeNotFoundError,
@@ -36,7 +36,7 @@ router = APIRouter(prefix="/recipes", tags=["Recipes 📖"])
 async def get_recipe_service() -> AsyncGenerator[RecipeService]:
     """Dependency injection for RecipeService."""
     async with get_supabase() as supabase:
-        repository = RecipeRepository(supabase)
+        repository = make_recipe_repository(supabase)
         parser = IngredientParser()
         yield RecipeService(repository, parser)
 
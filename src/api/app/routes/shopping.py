@@ -22,7 +22,7 @@ from src.api.app.domain.shopping.models import (
     ShoppingListSummary,
     UpdateShoppingItemDTO,
 )
-from src.api.app.domain.shopping.repository import ShoppingRepository
+from src.api.app.domain.shopping.pg_repository import make_shopping_repository
 from src.api.app.domain.shopping.service import (
     ShoppingItemNotFoundError,
     ShoppingListNotFoundError,
@@ -36,7 +36,7 @@ router = APIRouter(prefix="/shopping", tags=["Shopping 🛒"])
 async def get_shopping_service() -> AsyncGenerator[ShoppingService]:
     """Dependency injection for ShoppingService."""
     async with get_supabase() as supabase:
-        repository = ShoppingRepository(supabase)
+        repository = make_shopping_repository(supabase)
         yield ShoppingService(repository)
 
 
@@ -7,15 +7,22 @@ meal planning, and inventory tracking.
 Fun fact: The first commercial kitchen robot was introduced in 2016! 🤖
 """
 
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.api.app.core.background import get_background_runner
 from src.api.app.core.config import get_settings
 from src.api.app.core.logging import configure_logging, get_logger
+from src.api.app.db.postgres import get_postgres_pool, uses_asyncpg
+from src.api.app.db.session import get_supabase_pool
+from src.api.app.domain.planner.scorer import shutdown_scoring_executors
+from src.api.app.domain.recipes.unit_registry import get_unit_registry
 from src.api.app.routes import cooking, health, hooks, pantry, planner, recipes, shopping, vision
+from src.api.app.routes.planner import precompute_household
 
 
 @asynccontextmanager
@@ -34,9 +41,45 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
         debug=settings.debug,
     )
 
+    # Build the shared unit registry once instead of on the first requests
+    started = time.perf_counter()
+    get_unit_registry().warm()
+    logger.info(
+        "Unit registry ready",
+        warmup_ms=round((time.perf_counter() - started) * 1000, 1),
+    )
+
+    # One Supabase client with keep-alive connections for every request
+    supabase_pool = get_supabase_pool()
+    try:
+        await supabase_pool.open()
+        logger.info("Supabase pool ready", pool_size=settings.supabase_pool_size)
+    except Exception as e:
+        # Requests fall back to a client per use (and fail there if misconfigured)
+        logger.warning("Supabase pool unavailable", error=str(e))
+
+    # Direct Postgres reads, for repositories configured to use asyncpg
+    postgres_pool = get_postgres_pool()
+    if uses_asyncpg(settings):
+        try:
+            await postgres_pool.open()
+            logger.info("Postgres pool ready", max_size=settings.postgres_pool_max_size)
+        except Exception as e:
+            # Repositories fall back to PostgREST reads
+            logger.warning("Postgres pool unavailable", error=str(e))
+
+    # Precompute planner results after pantry/recipe changes settle
+    runner = get_background_runner()
+    if settings.precompute_in_background:
+        runner.start(precompute_household)
+
     yield
 
     logger.info("Shutting down Kitchen API")
+    await runner.stop()
+    await supabase_pool.close()
+    await postgres_pool.close()
+    shutdown_scoring_executors()
 
 
 def create_app() -> FastAPI:
@@ -0,0 +1,389 @@
+"""Delta Engine Benchmark Suite. 🏎️
+
+Times the hot paths of the Delta Engine and the planner against
+synthetic households of increasing size - no database needed:
+
+- `DeltaService.calculate_missing` (one recipe vs. the pantry)
+- `RecipeScorer.score_recipes` (whole catalog vs. the pantry)
+- `UnitConverter.convert` (mixed kitchen units, with densities)
+- `PlanGenerator.generate_options` (a week of dinners)
+
+Households are generated from a fixed seed, with pantry and recipe
+names drawn from a shared vocabulary (plus modifiers and plurals) so
+exact, fuzzy and missing matches all show up in realistic proportions.
+
+Results are written as JSON. Pass a previous results file with
+`--baseline` to flag regressions; the script exits non-zero if any
+median got slower than the allowed tolerance.
+
+Usage:
+    uv run python src/api/scripts/benchmark_delta.py --scales small,medium
+    uv run python src/api/scripts/benchmark_delta.py --output new.json --baseline old.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from src.api.app.domain.pantry.models import PantryItem, PantryLocation
+from src.api.app.domain.planner.generator import PlanGenerator
+from src.api.app.domain.planner.models import CreatePlanRequest
+from src.api.app.domain.planner.scorer import RecipeScorer
+from src.api.app.domain.planning.converter import UnitConverter
+from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.match_cache import get_match_cache
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+
+# (pantry items, recipes) per scale
+SCALES: dict[str, tuple[int, int]] = {
+    "small": (50, 100),
+    "medium": (500, 1_000),
+    "large": (5_000, 10_000),
+}
+
+BASE_INGREDIENTS = [
+    "onion", "garlic", "carrot", "celery", "potato", "tomato", "bell pepper",
+    "spinach", "kale", "broccoli", "zucchini", "mushroom", "lettuce", "cucumber",
+    "avocado", "lemon", "lime", "apple", "banana", "ginger", "cilantro", "parsley",
+    "basil", "thyme", "rosemary", "chicken breast", "chicken thigh", "ground beef",
+    "pork chop", "bacon", "salmon", "shrimp", "tofu", "eggs", "milk", "butter",
+    "heavy cream", "cheddar cheese", "parmesan", "mozzarella", "yogurt",
+    "sour cream", "flour", "sugar", "brown sugar", "rice", "pasta", "spaghetti",
+    "quinoa", "oats", "bread", "tortilla", "black beans", "chickpeas", "lentils",
+    "olive oil", "vegetable oil", "soy sauce", "honey", "maple syrup", "vinegar",
+    "chicken broth", "beef broth", "coconut milk", "peanut butter", "almonds",
+    "walnuts", "cumin", "paprika", "chili powder", "cinnamon", "oregano",
+]  # fmt: skip
+
+MODIFIERS = [
+    "", "", "", "fresh", "organic", "red", "yellow", "chopped", "frozen",
+    "large", "small", "dried", "whole", "low-fat", "unsalted",
+]  # fmt: skip
+
+# (unit, typical quantity range) - a mix of volume, weight and count
+UNIT_MIX: list[tuple[str | None, tuple[float, float]]] = [
+    ("cup", (0.25, 3)),
+    ("tbsp", (1, 4)),
+    ("tsp", (0.5, 3)),
+    ("gram", (50, 500)),
+    ("kg", (0.25, 2)),
+    ("oz", (2, 16)),
+    ("lb", (0.5, 3)),
+    ("ml", (50, 500)),
+    ("count", (1, 6)),
+    (None, (1, 1)),
+]
+
+CONVERSIONS = [
+    (1.0, "cup", "ml", None),
+    (2.0, "tbsp", "tsp", None),
+    (500.0, "gram", "lb", None),
+    (1.0, "cup", "gram", "flour"),
+    (250.0, "gram", "cup", "brown sugar"),
+    (3.0, "oz", "gram", None),
+    (1.5, "quart", "cup", None),
+    (1.0, "cup", "gram", "dark brown sugar"),
+]
+
+
+@dataclass
+class Household:
+    """A synthetic household."""
+
+    pantry: list[PantryItem]
+    recipes: list[Recipe]
+
+
+def ingredient_name(rng: random.Random) -> str:
+    """Draw an ingredient name with an optional modifier or plural."""
+    name = rng.choice(BASE_INGREDIENTS)
+    modifier = rng.choice(MODIFIERS)
+    if modifier:
+        name = f"{modifier} {name}"
+    if rng.random() < 0.15 and not name.endswith("s"):
+        name += "s"
+    return name
+
+
+def quantity_and_unit(rng: random.Random) -> tuple[float | None, str | None]:
+    """Draw a quantity and unit from the kitchen unit mix."""
+    unit, (low, high) = rng.choice(UNIT_MIX)
+    if unit is None and rng.random() < 0.5:
+        return None, None
+    return round(rng.uniform(low, high), 2), unit
+
+
+def make_household(pantry_size: int, recipe_count: int, seed: int) -> Household:
+    """Generate a reproducible synthetic household.
+
+    Args:
+        pantry_size: Number of pantry items.
+        recipe_count: Number of recipes (each with 4-14 ingredients).
+        seed: Random seed.
+
+    Returns:
+        Household with pantry items and fully parsed recipes.
+    """
+    rng = random.Random(seed)
+    household_id = uuid4()
+    now = datetime.now(UTC)
+    today = date.today()
+    locations = list(PantryLocation)
+
+    pantry = []
+    for _ in range(pantry_size):
+        quantity, unit = quantity_and_unit(rng)
+        expiry_days = rng.choice([None, None, 1, 3, 7, 30])
+        pantry.append(
+            PantryItem(
+                id=uuid4(),
+                household_id=household_id,
+                name=ingredient_name(rng),
+                quantity=quantity,
+                unit=unit,
+                location=rng.choice(locations),
+                expiry_date=today + timedelta(days=expiry_days) if expiry_days else None,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    recipes = [
+        make_recipe(rng, household_id, f"Recipe {number}", now) for number in range(recipe_count)
+    ]
+    return Household(pantry=pantry, recipes=recipes)
+
+
+def make_recipe(rng: random.Random, household_id: UUID, title: str, now: datetime) -> Recipe:
+    """Generate one synthetic recipe."""
+    recipe_id = uuid4()
+    ingredients = []
+    for position in range(rng.randint(4, 14)):
+        name = ingredient_name(rng)
+        quantity, unit = quantity_and_unit(rng)
+        ingredients.append(
+            RecipeIngredient(
+                id=uuid4(),
+                recipe_id=recipe_id,
+                raw_text=f"{quantity or ''} {unit or ''} {name}".strip(),
+                quantity=quantity,
+                unit=unit,
+                item_name=name,
+                notes=None,
+                section=None,
+                sort_order=position,
+                confidence=1.0,
+                created_at=now,
+            )
+        )
+
+    return Recipe(
+        id=recipe_id,
+        household_id=household_id,
+        title=title,
+        source_url=None,
+        source_domain=None,
+        servings=rng.choice([2, 4, 6]),
+        prep_time_minutes=rng.choice([10, 20, 30, 45, 60]),
+        cook_time_minutes=None,
+        total_time_minutes=None,
+        description=None,
+        instructions=None,
+        tags=rng.sample(["vegetarian", "quick", "comfort", "healthy", "spicy"], k=2),
+        is_parsed=True,
+        created_at=now,
+        updated_at=now,
+        ingredients=ingredients,
+    )
+
+
+def time_ms(
+    func: Callable[[], object],
+    iterations: int,
+    setup: Callable[[], object] | None = None,
+) -> list[float]:
+    """Run a callable repeatedly and return each run's duration in ms.
+
+    `setup` runs before every iteration and is not timed.
+    """
+    timings = []
+    for _ in range(iterations):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def summarize(timings: list[float], operations: int = 1) -> dict[str, float]:
+    """Summarize timings (per run, in ms)."""
+    return {
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "max_ms": max(timings),
+        "per_op_us": statistics.median(timings) * 1000 / operations,
+        "runs": len(timings),
+    }
+
+
+def run_scale(pantry_size: int, recipe_count: int, iterations: int, seed: int) -> dict:
+    """Benchmark every operation for one household size."""
+    household = make_household(pantry_size, recipe_count, seed)
+    delta_service = DeltaService()
+    scorer = RecipeScorer(delta_service=delta_service)
+    generator = PlanGenerator(scorer)
+    converter = UnitConverter()
+    match_cache = get_match_cache()
+
+    # Cold runs: no memoized pantry matches from earlier iterations
+    cold = match_cache.clear
+
+    sample = household.recipes[: min(50, len(household.recipes))]
+    results = {
+        "calculate_missing": summarize(
+            time_ms(
+                lambda: [
+                    delta_service.calculate_missing(recipe.ingredients or [], household.pantry)
+                    for recipe in sample
+                ],
+                iterations,
+                setup=cold,
+            ),
+            operations=len(sample),
+        ),
+        "score_recipes": summarize(
+            time_ms(
+                lambda: scorer.score_recipes(household.recipes, household.pantry),
+                iterations,
+                setup=cold,
+            ),
+            operations=len(household.recipes),
+        ),
+        "unit_convert": summarize(
+            time_ms(
+                lambda: [
+                    converter.convert(value, from_unit, to_unit, ingredient=ingredient)
+                    for _ in range(100)
+                    for value, from_unit, to_unit, ingredient in CONVERSIONS
+                ],
+                iterations,
+            ),
+            operations=100 * len(CONVERSIONS),
+        ),
+    }
+
+    start = date.today()
+    request = CreatePlanRequest(start_date=start, end_date=start + timedelta(days=6))
+
+    def generate() -> None:
+        random.seed(seed)  # The generator shuffles themes with the global RNG
+        generator.generate_options(request, household.recipes, household.pantry)
+
+    results["generate_options"] = summarize(time_ms(generate, iterations, setup=cold))
+
+    return {
+        "pantry_items": pantry_size,
+        "recipes": recipe_count,
+        "operations": results,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """List operations whose median got slower than the tolerance allows."""
+    regressions = []
+    for scale, result in current["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+        if previous is None:
+            continue
+        for operation, stats in result["operations"].items():
+            before = previous["operations"].get(operation)
+            if before is None or before["median_ms"] <= 0:
+                continue
+            change = stats["median_ms"] / before["median_ms"] - 1
+            if change > tolerance:
+                regressions.append(
+                    f"{scale}/{operation}: {before['median_ms']:.2f} ms -> "
+                    f"{stats['median_ms']:.2f} ms (+{change:.0%})"
+                )
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmark the Delta Engine offline")
+    parser.add_argument(
+        "--scales",
+        default="small,medium,large",
+        help=f"Comma-separated scales to run ({', '.join(SCALES)})",
+    )
+    parser.add_argument("--iterations", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the synthetic data")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("delta_benchmark.json"),
+        help="Where to write the JSON results",
+    )
+    parser.add_argument("--baseline", type=Path, help="Previous results to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown vs. the baseline before flagging (0.2 = 20%%)",
+    )
+    args = parser.parse_args()
+
+    scales = [scale.strip() for scale in args.scales.split(",") if scale.strip()]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"Unknown scales: {', '.join(unknown)}")
+
+    print("🏎️  Delta Engine benchmark\n")
+
+    report: dict = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "scales": {},
+    }
+    for scale in scales:
+        pantry_size, recipe_count = SCALES[scale]
+        print(f"{scale}: {pantry_size} pantry items, {recipe_count} recipes")
+        result = run_scale(pantry_size, recipe_count, args.iterations, args.seed)
+        report["scales"][scale] = result
+        for operation, stats in result["operations"].items():
+            print(
+                f"  {operation:<20} median {stats['median_ms']:10.2f} ms"
+                f"   per op {stats['per_op_us']:10.1f} µs"
+            )
+
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"\n📝 Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print("\n❌ Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\n✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
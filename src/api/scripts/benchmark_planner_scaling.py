@@ -0,0 +1,221 @@
+"""Plan Generation Scaling Benchmark. 📈
+
+Sweeps catalog size and plan length (days × meal types) and times
+`PlanGenerator.generate_options` stage by stage:
+
+- score: scoring the whole catalog against the pantry
+- constraints: filtering recipes by the request's constraints
+- themes: picking the option themes
+- options: the selection passes, summed over every option
+
+Households come from the Delta Engine benchmark's synthetic generator
+(pantry half the size of the catalog), so the numbers line up with its
+`generate_options` results. Every run starts with a cold match cache.
+
+Results are written as JSON. With `--plot`, total and per-stage
+medians are also plotted against catalog size, one line per plan
+length (needs matplotlib, which isn't a project dependency).
+
+Usage:
+    uv run python src/api/scripts/benchmark_planner_scaling.py
+    uv run python src/api/scripts/benchmark_planner_scaling.py --sizes 100,1000 --days 7,14
+    uv run --with matplotlib python src/api/scripts/benchmark_planner_scaling.py --plot scaling.png
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from collections import defaultdict
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from src.api.app.domain.planner.generator import PlanGenerator
+from src.api.app.domain.planner.models import CreatePlanRequest, MealType
+from src.api.app.domain.planner.scorer import RecipeScorer
+from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.match_cache import get_match_cache
+from src.api.scripts.benchmark_delta import make_household
+
+STAGES = ["score", "constraints", "themes", "options"]
+MEAL_TYPE_ORDER = [MealType.DINNER, MealType.LUNCH, MealType.BREAKFAST, MealType.SNACK]
+
+
+def parse_ints(text: str) -> list[int]:
+    """Parse a comma-separated list of positive integers."""
+    values = [int(part) for part in text.split(",") if part.strip()]
+    if not values or any(value < 1 for value in values):
+        raise argparse.ArgumentTypeError(f"expected positive integers, got {text!r}")
+    return values
+
+
+def group_stages(stages: dict[str, float]) -> dict[str, float]:
+    """Fold the per-option stages into one `options` stage."""
+    grouped = {stage: 0.0 for stage in STAGES}
+    for name, ms in stages.items():
+        grouped["options" if name.startswith("option:") else name] += ms
+    return grouped
+
+
+def run_point(
+    generator: PlanGenerator,
+    household,
+    days: int,
+    meal_types: int,
+    iterations: int,
+    seed: int,
+    optimize_shopping: bool = False,
+) -> dict:
+    """Time one (catalog size, plan length) combination."""
+    start = date.today()
+    request = CreatePlanRequest(
+        start_date=start,
+        end_date=start + timedelta(days=days - 1),
+        meal_types=MEAL_TYPE_ORDER[:meal_types],
+        optimize_shopping=optimize_shopping,
+    )
+    match_cache = get_match_cache()
+
+    totals: list[float] = []
+    stages: dict[str, list[float]] = defaultdict(list)
+    options = 0
+    for _ in range(iterations):
+        match_cache.clear()
+        response = generator.generate_options(
+            request, household.recipes, household.pantry, seed=seed
+        )
+        grouped = group_stages(response.stage_timings_ms or {})
+        totals.append(sum(grouped.values()))
+        for name, ms in grouped.items():
+            stages[name].append(ms)
+        options = len(response.options)
+
+    return {
+        "days": days,
+        "meal_types": meal_types,
+        "meals": days * meal_types,
+        "options": options,
+        "median_ms": statistics.median(totals),
+        "stages_ms": {name: statistics.median(values) for name, values in stages.items()},
+    }
+
+
+def plot(report: dict, path: Path) -> None:
+    """Plot medians against catalog size, one line per plan length."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("⚠️  matplotlib is not installed - skipping the plot")
+        print("   Try: uv run --with matplotlib python <this script> --plot ...")
+        return
+
+    lines: dict[str, list[dict]] = defaultdict(list)
+    for point in report["points"]:
+        lines[f"{point['days']}d × {point['meal_types']} meals"].append(point)
+
+    panels = ["total", *STAGES]
+    figure, axes = plt.subplots(1, len(panels), figsize=(4 * len(panels), 4), sharex=True)
+    for axis, panel in zip(axes, panels, strict=True):
+        for label, points in lines.items():
+            points.sort(key=lambda point: point["recipes"])
+            values = [
+                point["median_ms"] if panel == "total" else point["stages_ms"][panel]
+                for point in points
+            ]
+            axis.plot([point["recipes"] for point in points], values, marker="o", label=label)
+        axis.set_title(panel)
+        axis.set_xscale("log")
+        axis.set_xlabel("recipes")
+        axis.set_ylabel("median ms")
+        axis.grid(True, alpha=0.3)
+    axes[0].legend(fontsize="small")
+    figure.suptitle("generate_options scaling")
+    figure.tight_layout()
+    figure.savefig(path, dpi=120)
+    print(f"📊 Plot written to {path}")
+
+
+def main() -> None:
+    """Run the sweep."""
+    parser = argparse.ArgumentParser(description="Benchmark plan generation scaling")
+    parser.add_argument(
+        "--sizes",
+        type=parse_ints,
+        default=[100, 500, 1_000, 5_000],
+        help="Comma-separated catalog sizes",
+    )
+    parser.add_argument(
+        "--days", type=parse_ints, default=[3, 7, 14], help="Comma-separated plan lengths"
+    )
+    parser.add_argument(
+        "--meal-types",
+        type=parse_ints,
+        default=[1, 3],
+        help=f"Comma-separated meal types per day (1-{len(MEAL_TYPE_ORDER)})",
+    )
+    parser.add_argument("--optimize-shopping", action="store_true", help="Use the optimizer")
+    parser.add_argument("--iterations", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for data and generation")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("planner_scaling.json"),
+        help="Where to write the JSON results",
+    )
+    parser.add_argument("--plot", type=Path, help="Also plot the results to this image")
+    args = parser.parse_args()
+
+    if max(args.meal_types) > len(MEAL_TYPE_ORDER):
+        parser.error(f"--meal-types can't exceed {len(MEAL_TYPE_ORDER)}")
+
+    generator = PlanGenerator(RecipeScorer(delta_service=DeltaService()))
+
+    print("📈 Plan generation scaling benchmark\n")
+    header = "  ".join(f"{stage:>11}" for stage in STAGES)
+    print(f"  {'recipes':>8} {'days':>5} {'types':>5} {'total':>10}  {header}")
+
+    report: dict = {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "iterations": args.iterations,
+        "optimize_shopping": args.optimize_shopping,
+        "points": [],
+    }
+    for size in args.sizes:
+        household = make_household(max(1, size // 2), size, args.seed)
+        for days in args.days:
+            for meal_types in args.meal_types:
+                point = run_point(
+                    generator,
+                    household,
+                    days,
+                    meal_types,
+                    args.iterations,
+                    args.seed,
+                    optimize_shopping=args.optimize_shopping,
+                )
+                point["recipes"] = size
+                report["points"].append(point)
+                print(
+                    f"  {size:>8} {days:>5} {meal_types:>5} {point['median_ms']:>8.1f}ms  "
+                    + "  ".join(f"{point['stages_ms'][stage]:>9.1f}ms" for stage in STAGES)
+                )
+
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"\n📝 Results written to {args.output}")
+
+    if args.plot:
+        plot(report, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Unit Registry Startup Benchmark. ⏱️
+
+Compares building a fresh Pint-backed UnitRegistry per service (the old
+per-request behaviour) with reusing the process-wide shared registry.
+
+Usage:
+    uv run python src/api/scripts/benchmark_unit_registry.py --iterations 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from src.api.app.domain.planning.converter import UnitConverter
+from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.recipes.unit_registry import UnitRegistry, get_unit_registry
+
+
+def time_ms(func: Callable[[], object], iterations: int) -> list[float]:
+    """Run a callable repeatedly and return each run's duration in ms."""
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    """Print median and max for a set of timings."""
+    print(f"  {label:<38} median {statistics.median(timings):8.3f} ms   max {max(timings):8.3f} ms")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark unit registry construction")
+    parser.add_argument("--iterations", type=int, default=20, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print("⏱️  Unit registry startup benchmark\n")
+
+    warmup = time_ms(lambda: get_unit_registry().warm(), 1)
+    report("Shared registry warm-up (once)", warmup)
+
+    print("\nPer-request construction:")
+    fresh = time_ms(
+        lambda: DeltaService(converter=UnitConverter(UnitRegistry())),
+        args.iterations,
+    )
+    shared = time_ms(DeltaService, args.iterations)
+    report("DeltaService with a fresh registry", fresh)
+    report("DeltaService with the shared registry", shared)
+
+    saving = statistics.median(fresh) - statistics.median(shared)
+    print(f"\n✅ Saves ~{saving:.1f} ms per service construction")
+
+
+if __name__ == "__main__":
+    main()
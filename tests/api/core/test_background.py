@@ -0,0 +1,113 @@
+"""Tests for the debounced background task runner. ⏳"""
+
+import asyncio
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.api.app.core.background import DebouncedTaskRunner
+
+
+class Recorder:
+    """Work function that records each household it ran for."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.calls: list[UUID] = []
+
+    async def __call__(self, household_id: UUID) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        self.calls.append(household_id)
+
+
+class TestDebouncedTaskRunner:
+    """Tests for DebouncedTaskRunner."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_mutations_runs_once(self):
+        """Mutations within the debounce period collapse into one run."""
+        runner = DebouncedTaskRunner(debounce_seconds=0.05)
+        work = Recorder()
+        runner.start(work)
+        household_id = uuid4()
+
+        for _ in range(5):
+            runner.notify(household_id)
+        assert runner.stats().queue_depth == 1
+        await runner.wait_idle()
+
+        stats = runner.stats()
+        assert work.calls == [household_id]
+        assert (stats.completed, stats.cancelled, stats.queue_depth) == (1, 4, 0)
+        assert stats.last_latency_ms is not None
+        assert stats.last_latency_ms >= stats.last_run_ms
+
+    @pytest.mark.asyncio
+    async def test_households_are_debounced_separately(self):
+        runner = DebouncedTaskRunner(debounce_seconds=0.01)
+        work = Recorder()
+        runner.start(work)
+        first, second = uuid4(), uuid4()
+
+        runner.notify(first)
+        runner.notify(second)
+        assert runner.stats().queue_depth == 2
+        await runner.wait_idle()
+
+        assert sorted(work.calls) == sorted([first, second])
+
+    @pytest.mark.asyncio
+    async def test_newer_mutation_cancels_running_task(self):
+        """A running task is cancelled and rerun after a newer mutation."""
+        runner = DebouncedTaskRunner(debounce_seconds=0)
+        work = Recorder(delay=0.1)
+        runner.start(work)
+        household_id = uuid4()
+
+        runner.notify(household_id)
+        await asyncio.sleep(0.02)
+        assert runner.stats().running == 1
+
+        runner.notify(household_id)
+        await runner.wait_idle()
+
+        assert work.calls == [household_id]
+        assert (runner.completed, runner.cancelled) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted(self):
+        runner = DebouncedTaskRunner(debounce_seconds=0)
+        runner.start(Recorder(fail=True))
+
+        runner.notify(uuid4())
+        await runner.wait_idle()
+
+        assert (runner.completed, runner.failed) == (0, 1)
+
+    @pytest.mark.asyncio
+    async def test_notifications_ignored_until_started(self):
+        runner = DebouncedTaskRunner(debounce_seconds=0)
+
+        assert runner.notify(uuid4()) is False
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_tasks(self):
+        runner = DebouncedTaskRunner(debounce_seconds=10)
+        work = Recorder()
+        runner.start(work)
+        runner.notify(uuid4())
+
+        await runner.stop()
+
+        assert work.calls == []
+        assert runner.cancelled == 1
+        assert runner.notify(uuid4()) is False
+
+    def test_notify_outside_event_loop_is_ignored(self):
+        runner = DebouncedTaskRunner()
+        runner.start(Recorder())
+
+        assert runner.notify(uuid4()) is False
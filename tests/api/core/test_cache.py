@@ -0,0 +1,196 @@
+"""Tests for the household read cache. 🧊
+
+Cached reads must be served until the household's namespace is bumped,
+never outlive a write they raced with, and stay within the byte budget.
+"""
+
+import asyncio
+from uuid import UUID, uuid4
+
+from src.api.app.core.cache import PANTRY, RECIPES, HouseholdCache, cached_read
+
+
+def put(cache: HouseholdCache, household_id: UUID, key: str, value, namespace=PANTRY) -> None:
+    """Store a value at the namespace's current version."""
+    version = cache.version(household_id, namespace)
+    cache.put(household_id, namespace, key, value, version=version)
+
+
+def make_repository(cache: HouseholdCache):
+    """Create a repository whose pantry read goes through the given cache."""
+
+    class FakeRepository:
+        """Repository whose reads count their calls."""
+
+        def __init__(self) -> None:
+            self.calls = 0
+            self.items: dict[UUID, list[str]] = {}
+
+        @cached_read(PANTRY, cache=cache)
+        async def get_items(self, household_id: UUID, limit: int = 10) -> list[str]:
+            self.calls += 1
+            await asyncio.sleep(0)
+            return self.items.get(household_id, [])[:limit]
+
+    return FakeRepository()
+
+
+class TestHouseholdCache:
+    """Tests for HouseholdCache."""
+
+    def test_hit_and_miss(self):
+        """Test: stored values are served, unknown keys miss."""
+        cache = HouseholdCache()
+        household_id = uuid4()
+
+        assert cache.get(household_id, PANTRY, "snapshot") is None
+        put(cache, household_id, "snapshot", ["onion"])
+
+        assert cache.get(household_id, PANTRY, "snapshot") == ["onion"]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_values_are_copies(self):
+        """Test: mutating a cached value doesn't change the cache."""
+        cache = HouseholdCache()
+        household_id = uuid4()
+        items = ["onion"]
+        put(cache, household_id, "snapshot", items)
+
+        items.append("garlic")
+        served = cache.get(household_id, PANTRY, "snapshot")
+        served.append("salt")
+
+        assert cache.get(household_id, PANTRY, "snapshot") == ["onion"]
+
+    def test_bump_invalidates_only_that_namespace(self):
+        """Test: a bump drops the namespace's entries, not other namespaces or households."""
+        cache = HouseholdCache()
+        household_id, neighbour = uuid4(), uuid4()
+        put(cache, household_id, "snapshot", ["onion"])
+        put(cache, household_id, "catalog", ["soup"], namespace=RECIPES)
+        put(cache, neighbour, "snapshot", ["leek"])
+
+        cache.bump(household_id, PANTRY)
+
+        assert cache.get(household_id, PANTRY, "snapshot") is None
+        assert cache.get(household_id, RECIPES, "catalog") == ["soup"]
+        assert cache.get(neighbour, PANTRY, "snapshot") == ["leek"]
+        assert cache.stats().invalidations == 1
+
+    def test_bump_without_namespaces_invalidates_all(self):
+        """Test: a bare bump drops every namespace of the household."""
+        cache = HouseholdCache()
+        household_id = uuid4()
+        put(cache, household_id, "snapshot", ["onion"])
+        put(cache, household_id, "catalog", ["soup"], namespace=RECIPES)
+
+        cache.bump(household_id)
+
+        assert len(cache) == 0
+        assert cache.stats().bytes == 0
+
+    def test_put_after_bump_is_dropped(self):
+        """Test: a value read before a write isn't cached after it."""
+        cache = HouseholdCache()
+        household_id = uuid4()
+        version = cache.version(household_id, PANTRY)
+
+        cache.bump(household_id, PANTRY)  # A write lands while we read
+        cache.put(household_id, PANTRY, "snapshot", ["stale"], version=version)
+
+        assert cache.get(household_id, PANTRY, "snapshot") is None
+
+    def test_lru_eviction_within_byte_budget(self):
+        """Test: the least recently used entries go once the budget is exceeded."""
+        cache = HouseholdCache(max_bytes=300)
+        household_id = uuid4()
+        put(cache, household_id, "a", "x" * 100)
+        put(cache, household_id, "b", "x" * 100)
+        cache.get(household_id, PANTRY, "a")  # Now "b" is least recently used
+
+        put(cache, household_id, "c", "x" * 100)
+
+        assert cache.get(household_id, PANTRY, "b") is None
+        assert cache.get(household_id, PANTRY, "a") is not None
+        assert cache.get(household_id, PANTRY, "c") is not None
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.bytes <= stats.max_bytes
+
+    def test_oversized_value_not_stored(self):
+        """Test: a value bigger than the whole budget is skipped."""
+        cache = HouseholdCache(max_bytes=50)
+        household_id = uuid4()
+
+        put(cache, household_id, "big", "x" * 100)
+
+        assert len(cache) == 0
+
+    def test_expired_entry_misses(self):
+        """Test: entries past their TTL are stale."""
+        cache = HouseholdCache(ttl_seconds=0)
+        household_id = uuid4()
+        put(cache, household_id, "snapshot", ["onion"])
+
+        assert cache.get(household_id, PANTRY, "snapshot") is None
+        assert cache.stats().stale == 1
+
+    def test_disabled_stores_nothing(self):
+        """Test: a zero budget disables caching."""
+        cache = HouseholdCache(max_bytes=0)
+        household_id = uuid4()
+
+        put(cache, household_id, "snapshot", ["onion"])
+
+        assert not cache.enabled
+        assert len(cache) == 0
+
+
+class TestCachedRead:
+    """Tests for the cached_read decorator."""
+
+    async def test_repeat_reads_hit_cache(self):
+        """Test: the second read with the same arguments skips the repository."""
+        repository = make_repository(HouseholdCache())
+        household_id = uuid4()
+        repository.items[household_id] = ["onion", "salt"]
+
+        assert await repository.get_items(household_id) == ["onion", "salt"]
+        assert await repository.get_items(household_id) == ["onion", "salt"]
+        assert await repository.get_items(household_id, limit=1) == ["onion"]
+
+        assert repository.calls == 2
+
+    async def test_bump_forces_fresh_read(self):
+        """Test: after a bump the repository is read again."""
+        cache = HouseholdCache()
+        repository = make_repository(cache)
+        household_id = uuid4()
+        await repository.get_items(household_id)
+
+        repository.items[household_id] = ["garlic"]
+        cache.bump(household_id, PANTRY)
+
+        assert await repository.get_items(household_id) == ["garlic"]
+        assert repository.calls == 2
+
+    async def test_empty_results_are_cached(self):
+        """Test: an empty pantry is cached like any other result."""
+        repository = make_repository(HouseholdCache())
+        household_id = uuid4()
+
+        await repository.get_items(household_id)
+        await repository.get_items(household_id)
+
+        assert repository.calls == 1
+
+    async def test_disabled_cache_always_reads(self):
+        """Test: with caching disabled every call reaches the repository."""
+        repository = make_repository(HouseholdCache(max_bytes=0))
+        household_id = uuid4()
+
+        await repository.get_items(household_id)
+        await repository.get_items(household_id)
+
+        assert repository.calls == 2
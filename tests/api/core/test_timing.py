@@ -0,0 +1,53 @@
+"""Tests for per-stage timing. ⏱️"""
+
+import time
+
+import pytest
+
+from src.api.app.core.timing import StageTimer
+
+
+class TestStageTimer:
+    """Tests for StageTimer."""
+
+    def test_records_stages_in_entry_order(self):
+        """Stages keep the order they were first entered in."""
+        timer = StageTimer()
+
+        with timer.stage("score"):
+            pass
+        with timer.stage("select"):
+            pass
+
+        assert list(timer.as_dict()) == ["score", "select"]
+
+    def test_repeated_stage_accumulates(self):
+        """Entering a stage twice adds both durations."""
+        timer = StageTimer()
+
+        with timer.stage("select"):
+            time.sleep(0.01)
+        first = timer.stages["select"]
+        with timer.stage("select"):
+            time.sleep(0.01)
+
+        assert timer.stages["select"] > first >= 10
+        assert len(timer.stages) == 1
+
+    def test_failed_stage_is_still_recorded(self):
+        """A stage that raises still counts its time."""
+        timer = StageTimer()
+
+        with pytest.raises(RuntimeError), timer.stage("score"):
+            raise RuntimeError("boom")
+
+        assert "score" in timer.stages
+
+    def test_total_covers_stages(self):
+        """The total includes every stage."""
+        timer = StageTimer()
+
+        with timer.stage("score"):
+            time.sleep(0.005)
+
+        assert timer.total_ms >= timer.stages["score"]
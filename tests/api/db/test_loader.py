@@ -0,0 +1,139 @@
+"""Tests for the request DataLoader. 🚚
+
+Keys requested together must share one batch call, repeated keys must
+be served once, and failures must not stick.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.app.db.loader import DataLoader
+
+
+class RecordingBatch:
+    """Batch function that squares numbers and records every call."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls: list[list[int]] = []
+        self.fail = fail
+
+    async def __call__(self, keys: list[int]) -> dict[int, int]:
+        self.calls.append(keys)
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        return {key: key * key for key in keys if key >= 0}
+
+
+class TestDataLoader:
+    """Tests for DataLoader batching and caching."""
+
+    async def test_concurrent_loads_share_one_batch(self):
+        """Test: keys requested in the same tick are fetched together."""
+        batch = RecordingBatch()
+        loader = DataLoader(batch)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3))
+
+        assert results == [1, 4, 9]
+        assert batch.calls == [[1, 2, 3]]
+
+    async def test_duplicate_keys_fetched_once(self):
+        """Test: the same key requested twice is one key in one batch."""
+        batch = RecordingBatch()
+        loader = DataLoader(batch)
+
+        assert await loader.load_many([2, 2, 3]) == [4, 4, 9]
+        assert batch.calls == [[2, 3]]
+
+    async def test_repeat_loads_are_cached(self):
+        """Test: later loads of a key don't query again."""
+        batch = RecordingBatch()
+        loader = DataLoader(batch)
+
+        await loader.load(2)
+        await loader.load(2)
+        await loader.load_many([2, 3])
+
+        assert batch.calls == [[2], [3]]
+        assert loader.batches == 2
+
+    async def test_same_object_for_same_key(self):
+        """Test: every caller gets the identical object (identity map)."""
+        loader = DataLoader(self.load_lists)
+
+        first, second = await asyncio.gather(loader.load("a"), loader.load("a"))
+
+        assert first is second
+        assert await loader.load("a") is first
+
+    @staticmethod
+    async def load_lists(keys: list[str]) -> dict[str, list[str]]:
+        return {key: [key] for key in keys}
+
+    async def test_missing_keys_get_default(self):
+        """Test: keys the batch didn't return resolve to the default."""
+        loader = DataLoader(RecordingBatch(), default=0)
+
+        assert await loader.load_many([-1, 2]) == [0, 4]
+
+    async def test_prime_skips_query(self):
+        """Test: a primed key is served without a batch call."""
+        batch = RecordingBatch()
+        loader = DataLoader(batch)
+
+        loader.prime(5, 99)
+
+        assert await loader.load(5) == 99
+        assert batch.calls == []
+
+    async def test_clear_refetches(self):
+        """Test: a cleared key is fetched again."""
+        batch = RecordingBatch()
+        loader = DataLoader(batch)
+
+        await loader.load(2)
+        loader.clear(2)
+        await loader.load(2)
+
+        assert batch.calls == [[2], [2]]
+
+    @pytest.mark.parametrize("max_batch_size, expected", [(2, [[1, 2], [3, 4], [5]]), (10, None)])
+    async def test_max_batch_size(self, max_batch_size, expected):
+        """Test: large batches are split into several calls."""
+        batch = RecordingBatch()
+        loader = DataLoader(batch, max_batch_size=max_batch_size)
+
+        assert await loader.load_many([1, 2, 3, 4, 5]) == [1, 4, 9, 16, 25]
+        assert batch.calls == (expected or [[1, 2, 3, 4, 5]])
+
+    def test_rejects_bad_batch_size(self):
+        """Test: max_batch_size must be positive."""
+        with pytest.raises(ValueError, match="positive"):
+            DataLoader(RecordingBatch(), max_batch_size=0)
+
+    async def test_failure_reaches_every_caller_and_is_not_cached(self):
+        """Test: a failed batch fails its callers, and the next load retries."""
+        batch = RecordingBatch(fail=True)
+        loader = DataLoader(batch)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        batch.fail = False
+        assert await loader.load(1) == 1
+        assert batch.calls == [[1, 2], [1]]
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test: cancelling one waiter leaves the shared load running."""
+        batch = RecordingBatch()
+        loader = DataLoader(batch)
+
+        first = asyncio.create_task(loader.load(3))
+        second = asyncio.create_task(loader.load(3))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 9
+        assert first.cancelled()
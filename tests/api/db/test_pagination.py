@@ -0,0 +1,111 @@
+"""Tests for keyset pagination. 📜
+
+Cursors must survive awkward values, and iteration must stop exactly
+when the data runs out.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.app.db.pagination import iter_keyset, keyset_filter, quote_value
+
+
+class FakeQuery:
+    """Returns prepared pages and records the calls made on it."""
+
+    def __init__(self, pages: list[list[dict]], log: list[list[tuple]]) -> None:
+        self.pages = pages
+        self.calls: list[tuple] = []
+        log.append(self.calls)
+
+    def __getattr__(self, name: str):
+        def chain(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return chain
+
+    async def execute(self) -> SimpleNamespace:
+        return SimpleNamespace(data=self.pages.pop(0) if self.pages else [])
+
+
+def make_rows(*names: str) -> list[dict]:
+    """Helper to create rows with a name and an id."""
+    return [{"id": str(position), "name": name} for position, name in enumerate(names)]
+
+
+async def collect(pages: list[list[dict]], chunk_size: int) -> tuple[list[list[dict]], list]:
+    """Run iter_keyset over prepared pages."""
+    log: list[list[tuple]] = []
+    chunks = [
+        chunk
+        async for chunk in iter_keyset(
+            lambda: FakeQuery(pages, log),
+            sort_column="name",
+            chunk_size=chunk_size,
+        )
+    ]
+    return chunks, log
+
+
+class TestKeysetFilter:
+    """Tests for cursor filters."""
+
+    def test_ascending(self):
+        """Test: ascending cursors ask for greater keys."""
+        assert keyset_filter("name", "milk", "42") == (
+            'name.gt."milk",and(name.eq."milk",id.gt."42")'
+        )
+
+    def test_descending(self):
+        """Test: descending cursors ask for smaller keys."""
+        assert keyset_filter("created_at", "2024-01-01T00:00:00+00:00", "7", descending=True) == (
+            'created_at.lt."2024-01-01T00:00:00+00:00",'
+            'and(created_at.eq."2024-01-01T00:00:00+00:00",id.lt."7")'
+        )
+
+    def test_quotes_syntax_characters(self):
+        """Test: commas, parentheses and quotes stay inside the value."""
+        assert quote_value('tomatoes, diced (14.5 "oz")') == '"tomatoes, diced (14.5 \\"oz\\")"'
+
+
+class TestIterKeyset:
+    """Tests for chunked iteration."""
+
+    async def test_pages_until_short_page(self):
+        """Test: iteration stops after the first page smaller than the chunk."""
+        chunks, log = await collect([make_rows("a", "b"), make_rows("c")], chunk_size=2)
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert len(log) == 2
+
+    async def test_cursor_from_last_row(self):
+        """Test: the second request resumes after the last row of the first."""
+        _, log = await collect([make_rows("a", "b"), []], chunk_size=2)
+
+        assert not [call for call in log[0] if call[0] == "or_"]
+        cursor = [call for call in log[1] if call[0] == "or_"]
+        assert cursor[0][1][0] == keyset_filter("name", "b", "1")
+
+    async def test_exact_multiple_needs_one_empty_page(self):
+        """Test: a full last page is followed by one empty request, no empty chunk."""
+        chunks, log = await collect([make_rows("a", "b"), []], chunk_size=2)
+
+        assert len(chunks) == 1
+        assert len(log) == 2
+
+    async def test_orders_by_key_and_id(self):
+        """Test: rows are ordered by the sort column, then id, with a limit."""
+        _, log = await collect([[]], chunk_size=5)
+
+        assert [call for call in log[0] if call[0] in {"order", "limit"}] == [
+            ("order", ("name",), {"desc": False}),
+            ("order", ("id",), {"desc": False}),
+            ("limit", (5,), {}),
+        ]
+
+    async def test_rejects_bad_chunk_size(self):
+        """Test: chunk sizes must be positive."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            await collect([], chunk_size=0)
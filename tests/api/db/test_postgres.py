@@ -0,0 +1,117 @@
+"""Tests for read backend selection. 🐘
+
+The direct Postgres path itself is covered by the parity suite, which
+needs a local database.
+"""
+
+import sys
+
+import pytest
+
+from src.api.app.core.config import Settings
+from src.api.app.db import postgres
+from src.api.app.db.postgres import PostgresPool, read_pool_for, uses_asyncpg
+from src.api.app.domain.pantry import pg_repository as pantry_pg
+from src.api.app.domain.pantry.pg_repository import PostgresPantryRepository
+from src.api.app.domain.pantry.repository import PantryRepository
+from src.api.app.domain.recipes import pg_repository as recipes_pg
+from src.api.app.domain.recipes.pg_repository import PostgresRecipeRepository
+from src.api.app.domain.recipes.repository import RecipeRepository
+from src.api.app.domain.shopping import pg_repository as shopping_pg
+from src.api.app.domain.shopping.pg_repository import PostgresShoppingRepository
+from src.api.app.domain.shopping.repository import ShoppingRepository
+
+
+@pytest.fixture
+def open_pool(monkeypatch) -> object:
+    """Pretend the process-wide Postgres pool is open."""
+    fake_pool = object()
+    pool = PostgresPool(Settings())
+    pool._pool = fake_pool
+    monkeypatch.setattr(postgres, "get_postgres_pool", lambda: pool)
+    return fake_pool
+
+
+def use_settings(monkeypatch, **backends) -> None:
+    """Point every pg_repository module at settings with these backends."""
+    settings = Settings(**backends)
+    for module in (recipes_pg, pantry_pg, shopping_pg):
+        monkeypatch.setattr(module, "get_settings", lambda: settings)
+
+
+class TestReadPoolFor:
+    """Tests for read_pool_for."""
+
+    def test_postgrest_backend_has_no_pool(self, open_pool):
+        """PostgREST reads never get the pool."""
+        assert read_pool_for("postgrest") is None
+
+    def test_asyncpg_backend_gets_open_pool(self, open_pool):
+        """asyncpg reads get the pool once it's open."""
+        assert read_pool_for("asyncpg") is open_pool
+
+    def test_asyncpg_backend_without_open_pool(self, monkeypatch):
+        """A closed pool falls back to PostgREST."""
+        monkeypatch.setattr(postgres, "get_postgres_pool", lambda: PostgresPool(Settings()))
+
+        assert read_pool_for("asyncpg") is None
+
+    def test_unknown_backend_raises(self):
+        """Typos in settings are reported, not silently ignored."""
+        with pytest.raises(ValueError, match="Unknown read backend"):
+            read_pool_for("asyncpgg")
+
+    def test_uses_asyncpg(self):
+        """The pool is only needed if some repository reads through it."""
+        assert not uses_asyncpg(Settings())
+        assert uses_asyncpg(Settings(pantry_read_backend="asyncpg"))
+
+
+class TestPostgresPool:
+    """Tests for PostgresPool."""
+
+    def test_closed_pool_raises(self):
+        """Using a closed pool is an error."""
+        with pytest.raises(RuntimeError, match="not open"):
+            _ = PostgresPool(Settings()).pool
+
+    async def test_open_without_asyncpg(self, monkeypatch):
+        """A missing asyncpg install gets a helpful error."""
+        monkeypatch.setitem(sys.modules, "asyncpg", None)
+
+        with pytest.raises(RuntimeError, match="asyncpg is required"):
+            await PostgresPool(Settings()).open()
+
+
+class TestRepositorySelection:
+    """Tests for choosing a repository per read backend."""
+
+    def test_defaults_to_postgrest(self, monkeypatch, open_pool):
+        """Every repository reads through PostgREST by default."""
+        use_settings(monkeypatch)
+
+        assert type(recipes_pg.make_recipe_repository(None)) is RecipeRepository
+        assert type(pantry_pg.make_pantry_repository(None)) is PantryRepository
+        assert type(shopping_pg.make_shopping_repository(None)) is ShoppingRepository
+
+    def test_selectable_per_repository(self, monkeypatch, open_pool):
+        """Only repositories configured for asyncpg read through it."""
+        use_settings(monkeypatch, recipes_read_backend="asyncpg")
+
+        recipes = recipes_pg.make_recipe_repository(None)
+
+        assert isinstance(recipes, PostgresRecipeRepository)
+        assert recipes.pool is open_pool
+        assert type(pantry_pg.make_pantry_repository(None)) is PantryRepository
+
+    def test_all_asyncpg(self, monkeypatch, open_pool):
+        """Each domain has a Postgres-backed repository."""
+        use_settings(
+            monkeypatch,
+            recipes_read_backend="asyncpg",
+            pantry_read_backend="asyncpg",
+            shopping_read_backend="asyncpg",
+        )
+
+        assert isinstance(pantry_pg.make_pantry_repository(None), PostgresPantryRepository)
+        assert isinstance(shopping_pg.make_shopping_repository(None), PostgresShoppingRepository)
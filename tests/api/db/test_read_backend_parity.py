@@ -0,0 +1,190 @@
+"""Parity tests for the PostgREST and asyncpg read paths. ⚖️
+
+Every hot read runs through both backends against the local Supabase
+stack, and both must return the same models. Reads only - point it at
+a seeded household (`just dev-setup` seeds the default one).
+
+Needs asyncpg and a running stack, so it only runs when
+KITCHEN_PARITY_TESTS=1:
+
+    KITCHEN_PARITY_TESTS=1 uv run --with asyncpg pytest tests/api/db/test_read_backend_parity.py
+"""
+
+import os
+from collections.abc import AsyncGenerator
+from uuid import UUID, uuid4
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("KITCHEN_PARITY_TESTS"),
+    reason="Set KITCHEN_PARITY_TESTS=1 to run against a local Supabase stack",
+)
+
+from supabase import acreate_client  # noqa: E402
+
+from src.api.app.core.config import get_settings  # noqa: E402
+from src.api.app.db.postgres import PostgresPool  # noqa: E402
+from src.api.app.domain.pantry.pg_repository import PostgresPantryRepository  # noqa: E402
+from src.api.app.domain.pantry.repository import PantryRepository  # noqa: E402
+from src.api.app.domain.recipes.models import Recipe  # noqa: E402
+from src.api.app.domain.recipes.pg_repository import PostgresRecipeRepository  # noqa: E402
+from src.api.app.domain.recipes.repository import RecipeRepository  # noqa: E402
+from src.api.app.domain.shopping.models import ShoppingList  # noqa: E402
+from src.api.app.domain.shopping.pg_repository import PostgresShoppingRepository  # noqa: E402
+from src.api.app.domain.shopping.repository import ShoppingRepository  # noqa: E402
+
+HOUSEHOLD_ID = UUID(
+    os.environ.get("KITCHEN_PARITY_HOUSEHOLD_ID", "a0000000-0000-0000-0000-000000000001")
+)
+
+
+@pytest.fixture
+async def backends() -> AsyncGenerator[tuple]:
+    """Open a Supabase client and an asyncpg pool on the local stack."""
+    settings = get_settings()
+    supabase = await acreate_client(
+        settings.supabase_url,
+        settings.supabase_service_role_key or settings.supabase_anon_key,
+    )
+    postgres = PostgresPool(settings)
+    pool = await postgres.open()
+    yield supabase, pool
+    await postgres.close()
+
+
+def recipe_dump(recipe: Recipe) -> dict:
+    """Dump a recipe with ingredients in a backend-independent order."""
+    data = recipe.model_dump()
+    if data["ingredients"] is not None:
+        data["ingredients"].sort(key=lambda row: (row["sort_order"], str(row["id"])))
+    return data
+
+
+def list_dump(shopping_list: ShoppingList | None) -> dict | None:
+    """Dump a shopping list with items in a backend-independent order."""
+    if shopping_list is None:
+        return None
+    data = shopping_list.model_dump()
+    if data["items"] is not None:
+        data["items"].sort(
+            key=lambda row: (row["category"] is None, row["category"] or "", row["name"], row["id"])
+        )
+    return data
+
+
+class TestRecipeParity:
+    """Recipes with ingredients read the same through both backends."""
+
+    async def test_iter_by_household(self, backends):
+        """Keyset chunks match, including across chunk boundaries."""
+        supabase, pool = backends
+        postgrest = RecipeRepository(supabase)
+        direct = PostgresRecipeRepository(supabase, pool)
+
+        expected = [
+            [recipe_dump(recipe) for recipe in chunk]
+            async for chunk in postgrest.iter_by_household(HOUSEHOLD_ID, chunk_size=7)
+        ]
+        actual = [
+            [recipe_dump(recipe) for recipe in chunk]
+            async for chunk in direct.iter_by_household(HOUSEHOLD_ID, chunk_size=7)
+        ]
+
+        assert actual == expected
+
+    async def test_get_by_id(self, backends):
+        """A single recipe and its ingredients match."""
+        supabase, pool = backends
+        postgrest = RecipeRepository(supabase)
+        recipes = await anext(postgrest.iter_by_household(HOUSEHOLD_ID, chunk_size=1), [])
+        if not recipes:
+            pytest.skip("Household has no recipes")
+
+        expected = await postgrest.get_by_id(recipes[0].id, HOUSEHOLD_ID)
+        actual = await PostgresRecipeRepository(supabase, pool).get_by_id(
+            recipes[0].id, HOUSEHOLD_ID
+        )
+
+        assert expected is not None and actual is not None
+        assert recipe_dump(actual) == recipe_dump(expected)
+
+    async def test_get_by_ids(self, backends):
+        """A batch of recipes (plus an unknown ID) matches."""
+        supabase, pool = backends
+        postgrest = RecipeRepository(supabase)
+        recipes = await anext(postgrest.iter_by_household(HOUSEHOLD_ID, chunk_size=10), [])
+        ids = [recipe.id for recipe in recipes] + [uuid4()]
+
+        expected = await postgrest.get_by_ids(ids, HOUSEHOLD_ID)
+        actual = await PostgresRecipeRepository(supabase, pool).get_by_ids(ids, HOUSEHOLD_ID)
+
+        assert {key: recipe_dump(recipe) for key, recipe in actual.items()} == {
+            key: recipe_dump(recipe) for key, recipe in expected.items()
+        }
+
+
+class TestPantryParity:
+    """The full pantry reads the same through both backends."""
+
+    async def test_iter_by_household(self, backends):
+        """Keyset chunks match, including across chunk boundaries."""
+        supabase, pool = backends
+        postgrest = PantryRepository(supabase)
+        direct = PostgresPantryRepository(supabase, pool)
+
+        expected = [
+            [item.model_dump() for item in chunk]
+            async for chunk in postgrest.iter_by_household(HOUSEHOLD_ID, chunk_size=5)
+        ]
+        actual = [
+            [item.model_dump() for item in chunk]
+            async for chunk in direct.iter_by_household(HOUSEHOLD_ID, chunk_size=5)
+        ]
+
+        assert actual == expected
+
+    async def test_get_by_id(self, backends):
+        """A single item matches."""
+        supabase, pool = backends
+        postgrest = PantryRepository(supabase)
+        chunks = postgrest.iter_by_household(HOUSEHOLD_ID)
+        items = [item async for chunk in chunks for item in chunk]
+        if not items:
+            pytest.skip("Household has no pantry items")
+
+        expected = await postgrest.get_by_id(items[0].id, HOUSEHOLD_ID)
+        actual = await PostgresPantryRepository(supabase, pool).get_by_id(
+            items[0].id, HOUSEHOLD_ID
+        )
+
+        assert actual == expected
+
+
+class TestShoppingParity:
+    """Shopping lists with items read the same through both backends."""
+
+    async def test_get_active_list(self, backends):
+        """The active list and its items match."""
+        supabase, pool = backends
+
+        expected = await ShoppingRepository(supabase).get_active_list(HOUSEHOLD_ID)
+        actual = await PostgresShoppingRepository(supabase, pool).get_active_list(HOUSEHOLD_ID)
+
+        assert list_dump(actual) == list_dump(expected)
+
+    async def test_get_list_by_id(self, backends):
+        """A list fetched by ID matches."""
+        supabase, pool = backends
+        postgrest = ShoppingRepository(supabase)
+        summaries = await postgrest.get_all_lists(HOUSEHOLD_ID, include_completed=True)
+        if not summaries:
+            pytest.skip("Household has no shopping lists")
+
+        expected = await postgrest.get_list_by_id(summaries[0].id, HOUSEHOLD_ID)
+        actual = await PostgresShoppingRepository(supabase, pool).get_list_by_id(
+            summaries[0].id, HOUSEHOLD_ID
+        )
+
+        assert list_dump(actual) == list_dump(expected)
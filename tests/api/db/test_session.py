@@ -0,0 +1,85 @@
+"""Tests for the shared Supabase client pool. 🏊"""
+
+import pytest
+
+from src.api.app.core.config import Settings
+from src.api.app.db import session
+from src.api.app.db.session import SupabasePool
+
+
+def make_settings(**overrides) -> Settings:
+    """Helper to create settings pointing at a local Supabase."""
+    values = {
+        "supabase_url": "http://localhost:8000",
+        "supabase_service_role_key": "service-role-key",
+        "supabase_pool_size": 7,
+        "supabase_keepalive_seconds": 12.0,
+        "supabase_connect_timeout_seconds": 1.5,
+        "supabase_timeout_seconds": 9.0,
+    }
+    values.update(overrides)
+    return Settings(**values)
+
+
+class TestSupabasePool:
+    """Tests for SupabasePool."""
+
+    async def test_open_creates_one_client(self):
+        """Opening twice keeps the same client."""
+        pool = SupabasePool(make_settings())
+
+        client = await pool.open()
+
+        assert pool.is_open
+        assert await pool.open() is client
+        assert pool.client is client
+        await pool.close()
+
+    async def test_connections_use_configured_limits(self):
+        """The shared HTTP client gets the pool size and timeouts from settings."""
+        pool = SupabasePool(make_settings())
+
+        client = await pool.open()
+
+        http = client.options.httpx_client
+        assert http is not None
+        assert http.timeout.connect == 1.5
+        assert http.timeout.read == 9.0
+        pool_limits = http._transport._pool
+        assert pool_limits._max_connections == 7
+        assert pool_limits._keepalive_expiry == 12.0
+        await pool.close()
+
+    async def test_close_releases_client(self):
+        """A closed pool has no client."""
+        pool = SupabasePool(make_settings())
+        client = await pool.open()
+        http = client.options.httpx_client
+
+        await pool.close()
+
+        assert not pool.is_open
+        assert http.is_closed
+        with pytest.raises(RuntimeError, match="not open"):
+            _ = pool.client
+
+    async def test_failed_open_stays_closed(self):
+        """Missing credentials leave the pool closed."""
+        pool = SupabasePool(make_settings(supabase_service_role_key="", supabase_anon_key=""))
+
+        with pytest.raises(Exception, match="supabase_key"):
+            await pool.open()
+
+        assert not pool.is_open
+
+    async def test_get_supabase_reuses_shared_client(self, monkeypatch):
+        """While the pool is open, every request gets the same client."""
+        pool = SupabasePool(make_settings())
+        monkeypatch.setattr(session, "get_supabase_pool", lambda: pool)
+        client = await pool.open()
+
+        async with session.get_supabase() as first, session.get_supabase() as second:
+            assert first is client
+            assert second is client
+        assert await session.get_supabase_client() is client
+        await pool.close()
@@ -10,6 +10,7 @@ from uuid import uuid4
 
 import pytest
 
+from src.api.app.core.cache import PANTRY, RECIPES, HouseholdCache
 from src.api.app.domain.pantry.models import (
     CreatePantryItemDTO,
     PantryItem,
@@ -20,6 +21,7 @@ from src.api.app.domain.pantry.service import (
     PantryItemNotFoundError,
     PantryService,
 )
+from src.api.app.domain.planning.match_cache import CachedMatch, MatchCache
 
 
 @pytest.fixture
@@ -191,3 +193,108 @@ class TestPantryServiceConfirmPossession:
         assert dto.name == "Cumin"
         assert dto.quantity == 1.0
         assert dto.unit == "count"
+
+
+class TestPantryServiceMatchCacheInvalidation:
+    """Pantry writes drop the household's memoized ingredient matches. 🧠"""
+
+    @pytest.fixture
+    def match_cache(self):
+        """Create an isolated match cache."""
+        return MatchCache(max_size=100)
+
+    @pytest.fixture
+    def cached_service(self, mock_repository, match_cache):
+        """Create a PantryService with its own match cache."""
+        return PantryService(mock_repository, match_cache=match_cache)
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates(
+        self, cached_service, mock_repository, match_cache, sample_item
+    ):
+        """Test that creating an item clears the household's matches."""
+        household_id = uuid4()
+        other_household = uuid4()
+        match_cache.put(household_id, "v1", "onions", CachedMatch("onion", 0.9))
+        match_cache.put(other_household, "v1", "onions", CachedMatch("onion", 0.9))
+        mock_repository.create.return_value = sample_item
+
+        await cached_service.create_item(
+            household_id,
+            CreatePantryItemDTO(name="garlic", quantity=1, unit="count"),
+        )
+
+        assert match_cache.get(household_id, "v1", "onions") is None
+        assert match_cache.get(other_household, "v1", "onions") is not None
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_invalidate(
+        self, cached_service, mock_repository, match_cache, sample_item
+    ):
+        """Test that updates and deletes clear the household's matches."""
+        household_id = uuid4()
+        mock_repository.update.return_value = sample_item
+        mock_repository.delete.return_value = True
+
+        match_cache.put(household_id, "v1", "onions", CachedMatch("onion", 0.9))
+        await cached_service.update_item(sample_item.id, household_id, UpdatePantryItemDTO())
+        assert len(match_cache) == 0
+
+        match_cache.put(household_id, "v2", "onions", CachedMatch("onion", 0.9))
+        await cached_service.delete_item(sample_item.id, household_id)
+        assert len(match_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_cache(self, cached_service, mock_repository, match_cache):
+        """Test that a missing item doesn't invalidate anything."""
+        household_id = uuid4()
+        mock_repository.delete.return_value = False
+        match_cache.put(household_id, "v1", "onions", CachedMatch("onion", 0.9))
+
+        with pytest.raises(PantryItemNotFoundError):
+            await cached_service.delete_item(uuid4(), household_id)
+
+        assert len(match_cache) == 1
+
+
+class TestPantryServiceReadCacheInvalidation:
+    """Pantry writes drop the household's cached pantry reads. 🧊"""
+
+    @pytest.fixture
+    def cache(self):
+        """Create an isolated household cache."""
+        return HouseholdCache()
+
+    @pytest.fixture
+    def cached_service(self, mock_repository, cache):
+        """Create a PantryService with its own read cache."""
+        return PantryService(mock_repository, cache=cache)
+
+    @pytest.mark.asyncio
+    async def test_create_invalidates(self, cached_service, mock_repository, cache, sample_item):
+        """Test that creating an item drops the household's cached snapshot."""
+        household_id = uuid4()
+        cache.put(household_id, PANTRY, "snapshot", [sample_item], version=0)
+        cache.put(household_id, RECIPES, "catalog", [], version=0)
+        mock_repository.create.return_value = sample_item
+
+        await cached_service.create_item(
+            household_id,
+            CreatePantryItemDTO(name="garlic", quantity=1, unit="count"),
+        )
+
+        assert cache.get(household_id, PANTRY, "snapshot") is None
+        assert cache.get(household_id, RECIPES, "catalog") == []
+
+    @pytest.mark.asyncio
+    async def test_failed_write_keeps_cache(self, cached_service, mock_repository, cache):
+        """Test that a missing item doesn't invalidate anything."""
+        household_id = uuid4()
+        mock_repository.delete.return_value = False
+        cache.put(household_id, PANTRY, "snapshot", [], version=0)
+
+        with pytest.raises(PantryItemNotFoundError):
+            await cached_service.delete_item(uuid4(), household_id)
+
+        assert cache.version(household_id, PANTRY) == 0
+        assert len(cache) == 1
@@ -3,6 +3,7 @@
 Tests plan option generation with different themes.
 """
 
+import random
 from datetime import date, timedelta
 from uuid import uuid4
 
@@ -206,3 +207,72 @@ class TestPlanGenerator:
 
         # Should still return some options but might be fewer
         assert len(response.options) <= 3
+
+    def test_same_seed_gives_same_options(self) -> None:
+        """Seeded runs are reproducible, including theme picks and IDs."""
+        generator = PlanGenerator()
+        request = CreatePlanRequest(
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=2),
+            num_options=3,
+        )
+        recipes = [make_recipe(f"Dish {i}", [f"item {i}"]) for i in range(12)]
+        pantry = [make_pantry_item("item 1")]
+
+        first = generator.generate_options(request, recipes, pantry, seed=42)
+        second = generator.generate_options(request, recipes, pantry, seed=42)
+
+        assert first.seed == second.seed == 42
+        assert first.options == second.options
+
+    def test_request_seed_is_used(self) -> None:
+        """Without an explicit seed, the request's seed applies."""
+        generator = PlanGenerator()
+        request = CreatePlanRequest(
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=2),
+            seed=7,
+        )
+        recipes = [make_recipe(f"Dish {i}", [f"item {i}"]) for i in range(12)]
+
+        response = generator.generate_options(request, recipes, [])
+
+        assert response.seed == 7
+
+    def test_select_recipes_skips_near_duplicates(self) -> None:
+        """Recipes with reworded titles but the same ingredients aren't both picked."""
+        generator = PlanGenerator()
+        stew = ["beef chuck", "potato", "carrot", "onion", "beef broth", "garlic", "salt"]
+        recipes = [
+            make_recipe("Beef Stew", stew),
+            make_recipe("Hearty Beef and Bean Stew", [*stew, "kidney beans"]),
+            make_recipe("Lemon Pasta", ["pasta", "lemon", "parmesan"]),
+        ]
+        theme = {"priority": "variety"}
+
+        selected = generator._select_recipes_for_theme(
+            theme, recipes, {}, count=3, rng=random.Random(0)
+        )
+
+        titles = {recipe.title for recipe in selected}
+        assert len(selected) == 2
+        assert "Lemon Pasta" in titles
+
+    def test_generate_options_times_each_stage(self) -> None:
+        """Scoring, filtering, theme picks and every option are timed."""
+        generator = PlanGenerator()
+        request = CreatePlanRequest(
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=2),
+            num_options=3,
+        )
+        recipes = [make_recipe(f"Dish {i}", [f"item {i}"]) for i in range(12)]
+
+        response = generator.generate_options(request, recipes, [])
+
+        timings = response.stage_timings_ms
+        assert timings is not None
+        assert {"score", "constraints", "themes"} <= timings.keys()
+        for option in response.options:
+            assert f"option:{option.theme}" in timings
+        assert all(ms >= 0 for ms in timings.values())
@@ -0,0 +1,246 @@
+"""Tests for the Shopping Optimizer. 🧺
+
+The optimizer should choose meals that share what needs buying, keep
+the variety rule, and always return a valid plan within its budget.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from itertools import combinations
+from uuid import uuid4
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.planner.generator import THEMES, PlanGenerator
+from src.api.app.domain.planner.models import CreatePlanRequest, RecipeScore
+from src.api.app.domain.planner.optimizer import ShoppingOptimizer
+from src.api.app.domain.planner.variety import VarietyIndex
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+
+
+def make_recipe(title: str, ingredients: list[str] | None = None) -> Recipe:
+    """Create a test recipe."""
+    now = datetime.now(UTC)
+    recipe_id = uuid4()
+    return Recipe(
+        id=recipe_id,
+        household_id=uuid4(),
+        title=title,
+        ingredients=[
+            RecipeIngredient(
+                id=uuid4(),
+                recipe_id=recipe_id,
+                item_name=name,
+                quantity=1,
+                unit="count",
+                raw_text=name,
+                notes=None,
+                section=None,
+                sort_order=position,
+                confidence=1.0,
+                created_at=now,
+            )
+            for position, name in enumerate(ingredients or [])
+        ],
+        tags=[],
+        prep_time_minutes=30,
+        source_url=None,
+        source_domain=None,
+        servings=4,
+        cook_time_minutes=None,
+        total_time_minutes=None,
+        description=None,
+        instructions=None,
+        is_parsed=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def make_score(recipe: Recipe, missing: list[str], match: float = 50.0) -> RecipeScore:
+    """Create a RecipeScore with the given missing items."""
+    return RecipeScore(
+        recipe_id=recipe.id,
+        recipe_title=recipe.title,
+        inventory_match_percent=match,
+        spoilage_score=0.0,
+        freshness_score=0.0,
+        total_score=match / 100,
+        missing_items=missing,
+    )
+
+
+def distinct_missing(recipes: list[Recipe], scores: dict) -> int:
+    """Count distinct items to buy for a plan."""
+    return len({item for recipe in recipes for item in scores[recipe.id].missing_items})
+
+
+class TestShoppingOptimizer:
+    """Tests for meal selection."""
+
+    def test_prefers_shared_ingredients(self):
+        """Test: three meals sharing two items beat three one-off meals."""
+        one_offs = [make_recipe(f"Special {n}") for n in range(3)]
+        sharers = [make_recipe(f"Taco night {n}") for n in range(3)]
+        ranked = one_offs + sharers
+        scores = {r.id: make_score(r, [f"item {n}a", f"item {n}b"]) for n, r in enumerate(one_offs)}
+        scores.update({r.id: make_score(r, ["tortillas", "salsa"]) for r in sharers})
+
+        result = ShoppingOptimizer().optimize(ranked, scores, count=3)
+
+        assert {r.id for r in result.recipes} == {r.id for r in sharers}
+        assert result.shopping_items == 2
+        assert result.completed
+
+    def test_theme_order_breaks_ties(self):
+        """Test: with equal shopping, the theme's favourites win."""
+        ranked = [make_recipe(f"Dish {n}") for n in range(6)]
+        scores = {r.id: make_score(r, ["lemons"]) for r in ranked}
+
+        result = ShoppingOptimizer().optimize(ranked, scores, count=3)
+
+        assert result.recipes == ranked[:3]
+
+    def test_fewer_items_beat_any_bonus(self):
+        """Test: well-stocked favourites never outweigh one extra item to buy."""
+        favourites = [make_recipe("Roast Chicken"), make_recipe("Fish Tacos")]
+        fallbacks = [make_recipe("Lentil Soup"), make_recipe("Bean Chili")]
+        ranked = favourites + fallbacks
+        scores = {
+            favourites[0].id: make_score(favourites[0], ["thyme"], match=100.0),
+            favourites[1].id: make_score(favourites[1], ["cod"], match=100.0),
+            fallbacks[0].id: make_score(fallbacks[0], ["cumin"], match=0.0),
+            fallbacks[1].id: make_score(fallbacks[1], ["cumin"], match=0.0),
+        }
+
+        result = ShoppingOptimizer(budget_ms=1000).optimize(ranked, scores, count=2)
+
+        assert {r.id for r in result.recipes} == {r.id for r in fallbacks}
+        assert result.shopping_items == 1
+        assert 0 < result.objective < 1
+
+    def test_respects_variety_rule(self):
+        """Test: near-identical titles are never picked together."""
+        ranked = [
+            make_recipe("Slow Cooker Chicken Chili"),
+            make_recipe("Slow Cooker Chicken Chili Verde"),
+            make_recipe("Lentil Soup"),
+        ]
+        scores = {r.id: make_score(r, ["beans"]) for r in ranked}
+
+        result = ShoppingOptimizer().optimize(ranked, scores, count=3)
+
+        assert len(result.recipes) == 2
+        variety = VarietyIndex()
+        variety.add(result.recipes[0].id, result.recipes[0])
+        assert variety.allows(result.recipes[1])
+
+    def test_zero_budget_still_returns_plan(self):
+        """Test: running out of time returns the greedy plan, not nothing."""
+        ranked = [make_recipe(f"Meal {n}") for n in range(400)]
+        scores = {
+            r.id: make_score(r, [f"item {n % 37}", f"item {n % 11}"]) for n, r in enumerate(ranked)
+        }
+
+        result = ShoppingOptimizer(budget_ms=0).optimize(ranked, scores, count=7)
+
+        assert len(result.recipes) == 7
+        assert result.shopping_items == distinct_missing(result.recipes, scores)
+
+    @given(
+        missing=st.lists(
+            st.lists(st.sampled_from("abcdefgh"), max_size=4),
+            min_size=3,
+            max_size=9,
+        ),
+        count=st.integers(min_value=1, max_value=3),
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_no_single_swap_improves(self, missing: list[list[str]], count: int):
+        """Property: a finished search is a 1-swap local optimum."""
+        ranked = [make_recipe(f"Meal {n}") for n in range(len(missing))]
+        scores = {r.id: make_score(r, items) for r, items in zip(ranked, missing, strict=True)}
+        optimizer = ShoppingOptimizer(budget_ms=1000)
+
+        result = optimizer.optimize(ranked, scores, count=count)
+
+        def objective(plan: list[Recipe]) -> float:
+            return distinct_missing(plan, scores) - sum(
+                0.5 * scores[r.id].inventory_match_percent / 100
+                + 0.5 * (1 - ranked.index(r) / (len(ranked) - 1))
+                for r in plan
+            ) / (count + 1)
+
+        assert result.completed
+        assert result.objective == round(objective(result.recipes), 4)
+        chosen = set(r.id for r in result.recipes)
+        for out in result.recipes:
+            for candidate in ranked:
+                if candidate.id in chosen:
+                    continue
+                swapped = [r for r in result.recipes if r is not out] + [candidate]
+                assert objective(swapped) >= objective(result.recipes) - 1e-9
+
+    def test_close_to_brute_force(self):
+        """Test: on a small catalog the result matches the exhaustive optimum."""
+        ranked = [make_recipe(f"Meal {n}") for n in range(10)]
+        pools = ["rice", "beans", "limes", "feta", "dill", "leeks", "tofu", "kale"]
+        scores = {
+            r.id: make_score(r, [pools[n % 8], pools[(n * 3) % 8]]) for n, r in enumerate(ranked)
+        }
+
+        result = ShoppingOptimizer(budget_ms=1000).optimize(ranked, scores, count=4)
+
+        best = min(distinct_missing(list(plan), scores) for plan in combinations(ranked, 4))
+        assert result.shopping_items == best
+
+
+class TestGeneratorOptimizerMode:
+    """The generator uses the optimizer when asked."""
+
+    def test_optimized_options_report_objective(self):
+        """Test: optimized options need no more shopping and report the objective."""
+        pantry = [
+            PantryItem(
+                id=uuid4(),
+                household_id=uuid4(),
+                name=name,
+                quantity=10,
+                unit="count",
+                location="pantry",
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+            )
+            for name in ["rice", "salsa", "corn", "avocado", "lime"]
+        ]
+        recipes = [make_recipe(f"Solo dish {n}", ["rice", f"rare item {n}"]) for n in range(4)]
+        # Each bowl has its own topping, so they aren't near-duplicates
+        recipes += [
+            make_recipe(f"Bean bowl {n}", ["rice", "black beans", topping])
+            for n, topping in enumerate(["salsa", "corn", "avocado", "lime"])
+        ]
+        start = date.today()
+        generator = PlanGenerator(optimizer=ShoppingOptimizer(budget_ms=1000))
+
+        plain = generator.generate_options(
+            CreatePlanRequest(start_date=start, end_date=start + timedelta(days=2), num_options=1),
+            recipes,
+            pantry,
+        ).options[0]
+        optimized = generator.generate_options(
+            CreatePlanRequest(
+                start_date=start,
+                end_date=start + timedelta(days=2),
+                num_options=1,
+                optimize_shopping=True,
+            ),
+            recipes,
+            pantry,
+        ).options[0]
+
+        assert plain.optimizer_objective is None
+        assert optimized.optimizer_objective is not None
+        assert optimized.theme in THEMES
+        assert optimized.estimated_shopping_items == 1
+        assert optimized.estimated_shopping_items <= (plain.estimated_shopping_items or 0)
@@ -0,0 +1,251 @@
+"""Tests for the plan options cache. 🗃️"""
+
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.api.app.domain.pantry.models import PantryItem, PantryLocation
+from src.api.app.domain.planner.models import (
+    CreatePlanRequest,
+    MealType,
+    PlanOptionsResponse,
+    ScoringCriteria,
+)
+from src.api.app.domain.planner.plan_cache import (
+    PlanOptionsCache,
+    content_key,
+    normalize_request,
+    seed_for,
+)
+from src.api.app.domain.planner.service import PlannerService, default_plan_request
+from src.api.app.domain.planning.precompute import PrecomputeStore
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+
+
+def make_recipe(title: str, ingredients: list[str]) -> Recipe:
+    """Create a test recipe."""
+    now = datetime.now(UTC)
+    recipe_id = uuid4()
+    return Recipe(
+        id=recipe_id,
+        household_id=uuid4(),
+        title=title,
+        ingredients=[
+            RecipeIngredient(
+                id=uuid4(),
+                recipe_id=recipe_id,
+                item_name=name,
+                quantity=1,
+                unit="count",
+                raw_text=name,
+                notes=None,
+                section=None,
+                sort_order=0,
+                confidence=1.0,
+                created_at=now,
+            )
+            for name in ingredients
+        ],
+        tags=[],
+        prep_time_minutes=30,
+        source_url=None,
+        source_domain=None,
+        servings=4,
+        cook_time_minutes=None,
+        total_time_minutes=None,
+        description=None,
+        instructions=None,
+        is_parsed=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def make_pantry_item(name: str, quantity: float = 1.0) -> PantryItem:
+    """Create a test pantry item."""
+    now = datetime.now(UTC)
+    return PantryItem(
+        id=uuid4(),
+        household_id=uuid4(),
+        name=name,
+        quantity=quantity,
+        unit="count",
+        location=PantryLocation.PANTRY,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def make_request(**overrides) -> CreatePlanRequest:
+    """Create a three-day plan request."""
+    fields = {"start_date": date(2026, 3, 2), "end_date": date(2026, 3, 4)}
+    return CreatePlanRequest(**{**fields, **overrides})
+
+
+class TestContentKey:
+    """Tests for cache keys."""
+
+    def test_equivalent_requests_share_a_key(self):
+        """Constraint case/order and duplicate meal types don't matter."""
+        first = make_request(constraints=["Vegetarian", "quick"])
+        second = make_request(
+            constraints=["quick ", "vegetarian"],
+            meal_types=[MealType.DINNER, MealType.DINNER],
+        )
+
+        assert normalize_request(first) == normalize_request(second)
+        assert content_key("c", "p", first, ScoringCriteria()) == content_key(
+            "c", "p", second, ScoringCriteria()
+        )
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"catalog_version": "c2"},
+            {"pantry_version": "p2"},
+            {"request": make_request(num_options=2)},
+            {"criteria": ScoringCriteria(spoilage_weight=0.9)},
+            {"today": date(2026, 3, 3)},
+        ],
+    )
+    def test_any_input_changes_the_key(self, change):
+        """Each input is part of the key."""
+        base = {
+            "catalog_version": "c",
+            "pantry_version": "p",
+            "request": make_request(),
+            "criteria": ScoringCriteria(),
+            "today": date(2026, 3, 2),
+        }
+
+        assert content_key(**base) != content_key(**{**base, **change})
+
+    def test_seed_for_is_stable(self):
+        assert seed_for("00000010abc") == 16
+
+
+class TestPlanOptionsCache:
+    """Tests for PlanOptionsCache."""
+
+    def test_hit_keeps_original_generation_time(self):
+        cache = PlanOptionsCache()
+        cache.put("key", 1, PlanOptionsResponse(options=[], generation_time_ms=120, seed=1))
+
+        cached = cache.get("key", 1)
+
+        assert cached is not None
+        assert cached.cache_hit is True
+        assert cached.generation_time_ms == 120
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_seed_is_part_of_the_key(self):
+        cache = PlanOptionsCache()
+        cache.put("key", 1, PlanOptionsResponse(options=[]))
+
+        assert cache.get("key", 2) is None
+        assert cache.misses == 1
+
+    def test_expired_entries_are_dropped(self):
+        cache = PlanOptionsCache(ttl_seconds=0)
+        cache.put("key", 1, PlanOptionsResponse(options=[]))
+
+        assert cache.get("key", 1) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = PlanOptionsCache(max_entries=2)
+        for key in ["a", "b"]:
+            cache.put(key, 0, PlanOptionsResponse(options=[]))
+        cache.get("a", 0)
+        cache.put("c", 0, PlanOptionsResponse(options=[]))
+
+        assert cache.get("a", 0) is not None
+        assert cache.get("b", 0) is None
+        assert cache.evictions == 1
+
+    def test_zero_entries_disables_caching(self):
+        cache = PlanOptionsCache(max_entries=0)
+        cache.put("key", 1, PlanOptionsResponse(options=[]))
+
+        assert len(cache) == 0
+
+
+class TestPlannerServiceCaching:
+    """Tests for cached generation in PlannerService."""
+
+    @pytest.fixture
+    def service(self) -> PlannerService:
+        return PlannerService(repository=None, plan_cache=PlanOptionsCache())
+
+    @pytest.fixture
+    def recipes(self) -> list[Recipe]:
+        return [make_recipe(f"Dish {i}", [f"item {i}", "salt"]) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_is_served_from_cache(self, service, recipes):
+        """Unchanged inputs return the stored options, flagged as a hit."""
+        pantry = [make_pantry_item("salt")]
+
+        fresh = await service.generate_options(uuid4(), make_request(), recipes, pantry)
+        cached = await service.generate_options(uuid4(), make_request(), recipes, pantry)
+
+        assert fresh.cache_hit is False
+        assert cached.cache_hit is True
+        assert cached.options == fresh.options
+        assert cached.generation_time_ms == fresh.generation_time_ms
+        assert cached.seed == fresh.seed
+
+    @pytest.mark.asyncio
+    async def test_pantry_change_misses(self, service, recipes):
+        await service.generate_options(uuid4(), make_request(), recipes, [])
+        response = await service.generate_options(
+            uuid4(), make_request(), recipes, [make_pantry_item("salt")]
+        )
+
+        assert response.cache_hit is False
+
+    @pytest.mark.asyncio
+    async def test_catalog_change_misses(self, service, recipes):
+        await service.generate_options(uuid4(), make_request(), recipes, [])
+        edited = recipes[0].model_copy(update={"title": "Renamed Dish"})
+        response = await service.generate_options(
+            uuid4(), make_request(), [edited, *recipes[1:]], []
+        )
+
+        assert response.cache_hit is False
+
+    @pytest.mark.asyncio
+    async def test_cached_and_fresh_runs_match(self, recipes):
+        """A cold service with the same seed reproduces the cached options."""
+        pantry = [make_pantry_item("salt")]
+        request = make_request(seed=1234)
+        warm = PlannerService(repository=None, plan_cache=PlanOptionsCache())
+        await warm.generate_options(uuid4(), request, recipes, pantry)
+
+        cached = await warm.generate_options(uuid4(), request, recipes, pantry)
+        cold = await PlannerService(
+            repository=None, plan_cache=PlanOptionsCache()
+        ).generate_options(uuid4(), request, recipes, pantry)
+
+        assert cached.cache_hit and not cold.cache_hit
+        assert cached.options == cold.options
+        assert cold.seed == 1234
+
+    @pytest.mark.asyncio
+    async def test_precompute_warms_default_request(self, recipes):
+        """After a background precompute the default request is a hit."""
+        pantry = [make_pantry_item("salt")]
+        household_id = uuid4()
+        store = PrecomputeStore()
+        service = PlannerService(
+            repository=None, precompute_store=store, plan_cache=PlanOptionsCache()
+        )
+
+        await service.precompute(household_id, recipes, pantry)
+        response = await service.generate_options(
+            household_id, default_plan_request(), recipes, pantry
+        )
+
+        assert response.cache_hit is True
+        assert store.recomputed == len(recipes)
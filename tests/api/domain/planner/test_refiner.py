@@ -5,9 +5,11 @@ from uuid import uuid4
 
 import pytest
 
+from src.api.app.core.timing import StageTimer
 from src.api.app.domain.pantry.models import PantryItem, PantryLocation
+from src.api.app.domain.planner import refiner as refiner_module
 from src.api.app.domain.planner.models import MealSlot, MealType
-from src.api.app.domain.planner.refiner import RefinerService
+from src.api.app.domain.planner.refiner import RefinementSessionStore, RefinerService
 from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
 
 
@@ -157,7 +159,7 @@ class TestRefinerService:
 
     @pytest.fixture
     def refiner(self) -> RefinerService:
-        return RefinerService()
+        return RefinerService(sessions=RefinementSessionStore())
 
     @pytest.mark.asyncio
     async def test_reroll_slot_returns_new_recipe(
@@ -278,3 +280,315 @@ class TestRefinerService:
         # Only unlocked slot should be in results
         assert len(results) == 1
         assert results[0][0].meal_type == MealType.DINNER
+
+    async def test_reroll_slot_fills_timer(
+        self,
+        refiner: RefinerService,
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """A caller-supplied timer gets the reroll's stage timings."""
+        timer = StageTimer()
+
+        await refiner.reroll_slot(sample_slot, sample_recipes, sample_pantry_items, timer=timer)
+
+        assert list(timer.as_dict()) == ["session", "masks", "select"]
+
+
+class TestRefinementSession:
+    """Tests for per-plan reroll sessions."""
+
+    @pytest.fixture
+    def refiner(self) -> RefinerService:
+        return RefinerService(sessions=RefinementSessionStore())
+
+    @pytest.fixture
+    def count_scoring(self, refiner: RefinerService, monkeypatch) -> list[int]:
+        """Record the catalog size of every scoring run."""
+        calls: list[int] = []
+        original = refiner.scorer.score_recipes_async
+
+        async def counting(recipes, pantry_items):
+            calls.append(len(recipes))
+            return await original(recipes, pantry_items)
+
+        monkeypatch.setattr(refiner.scorer, "score_recipes_async", counting)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_catalog_scored_once_across_rerolls(
+        self,
+        refiner: RefinerService,
+        count_scoring: list[int],
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """Rerolls in one plan reuse the session's score table."""
+        for directive in [None, "quick", "no chicken", None]:
+            await refiner.reroll_slot(
+                sample_slot, sample_recipes, sample_pantry_items, directive=directive
+            )
+
+        session = await refiner.get_session(
+            sample_slot.plan_id, sample_recipes, sample_pantry_items
+        )
+        assert count_scoring == [len(sample_recipes)]
+        assert session.rerolls == 4
+
+    @pytest.fixture
+    def count_hashing(self, monkeypatch) -> list[int]:
+        """Record the catalog size of every catalog hash."""
+        calls: list[int] = []
+        original = refiner_module.catalog_version
+
+        def counting(recipes):
+            calls.append(len(recipes))
+            return original(recipes)
+
+        monkeypatch.setattr(refiner_module, "catalog_version", counting)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_source_version_skips_catalog_hash(
+        self,
+        refiner: RefinerService,
+        count_scoring: list[int],
+        count_hashing: list[int],
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """The catalog is hashed only when the caller's source version changes."""
+        for source_version in [(1, 1), (1, 1), (1, 1), (2, 1)]:
+            await refiner.reroll_slot(
+                sample_slot, sample_recipes, sample_pantry_items, source_version=source_version
+            )
+
+        assert len(count_hashing) == 2
+        assert len(count_scoring) == 1  # Same content under the new version
+
+    @pytest.mark.asyncio
+    async def test_reroll_day_hashes_catalog_once(
+        self,
+        refiner: RefinerService,
+        count_hashing: list[int],
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """A day's rerolls share one catalog check."""
+        slots = [
+            sample_slot.model_copy(update={"id": uuid4(), "meal_type": meal_type})
+            for meal_type in [MealType.BREAKFAST, MealType.LUNCH, MealType.DINNER]
+        ]
+
+        await refiner.reroll_day(slots, sample_recipes, sample_pantry_items)
+
+        assert len(count_hashing) == 1
+
+    @pytest.mark.asyncio
+    async def test_pantry_change_invalidates_session(
+        self,
+        refiner: RefinerService,
+        count_scoring: list[int],
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """A changed pantry rescores the catalog."""
+        await refiner.reroll_slot(sample_slot, sample_recipes, sample_pantry_items)
+        await refiner.reroll_slot(sample_slot, sample_recipes, [])
+
+        assert len(count_scoring) == 2
+
+    @pytest.mark.asyncio
+    async def test_catalog_change_invalidates_session(
+        self,
+        refiner: RefinerService,
+        count_scoring: list[int],
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """Adding or editing a recipe rescores the catalog."""
+        await refiner.reroll_slot(sample_slot, sample_recipes, sample_pantry_items)
+        await refiner.reroll_slot(sample_slot, sample_recipes[:-1], sample_pantry_items)
+
+        edited = sample_recipes[0].model_copy(update={"updated_at": datetime.now()})
+        await refiner.reroll_slot(
+            sample_slot, [edited, *sample_recipes[1:-1]], sample_pantry_items
+        )
+
+        assert len(count_scoring) == 3
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_per_plan(
+        self,
+        refiner: RefinerService,
+        count_scoring: list[int],
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """Each plan gets its own session; ending one drops it."""
+        other_slot = sample_slot.model_copy(update={"plan_id": uuid4()})
+
+        await refiner.reroll_slot(sample_slot, sample_recipes, sample_pantry_items)
+        await refiner.reroll_slot(other_slot, sample_recipes, sample_pantry_items)
+        refiner.end_session(sample_slot.plan_id)
+        await refiner.reroll_slot(sample_slot, sample_recipes, sample_pantry_items)
+
+        assert len(count_scoring) == 3
+
+    @pytest.mark.asyncio
+    async def test_sessions_outlive_the_service(
+        self,
+        refiner: RefinerService,
+        count_scoring: list[int],
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """A refiner built per request reuses sessions from the shared store."""
+        await refiner.reroll_slot(sample_slot, sample_recipes, sample_pantry_items)
+
+        next_request = RefinerService(refiner.scorer, sessions=refiner.sessions)
+        await next_request.reroll_slot(sample_slot, sample_recipes, sample_pantry_items)
+
+        assert len(count_scoring) == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_session_dropped(
+        self,
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """Past max_sessions the least recently used plan's session goes."""
+        refiner = RefinerService(sessions=RefinementSessionStore(max_sessions=1))
+        other_slot = sample_slot.model_copy(update={"plan_id": uuid4()})
+
+        first = await refiner.get_session(
+            sample_slot.plan_id, sample_recipes, sample_pantry_items
+        )
+        await refiner.get_session(other_slot.plan_id, sample_recipes, sample_pantry_items)
+
+        assert len(refiner.sessions) == 1
+        assert refiner.sessions.get(sample_slot.plan_id, first.version) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("directive", "stocked", "expected"),
+        [
+            (None, True, [0, 3]),  # The tacos use the stocked chicken
+            ("quick", True, [0]),  # The risotto takes 45 minutes
+            ("no chicken", True, [3]),
+            ("quick healthy meal", True, [0]),
+            (None, False, [0, 3]),  # Tied scores keep catalog order
+            ("something spicy", False, [0, 3]),
+            ("comfort food", False, [3, 0]),
+            ("spicy comfort", False, [3, 0]),  # Comfort outranks spicy on ties
+        ],
+    )
+    async def test_directive_candidates(
+        self,
+        refiner: RefinerService,
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+        directive,
+        stocked,
+        expected,
+    ):
+        """Directives filter the session's ranking and break ties by preference tags."""
+        session = await refiner.get_session(
+            sample_slot.plan_id, sample_recipes, sample_pantry_items if stocked else []
+        )
+        allowed, tie_break = refiner._directive_mask(directive)
+
+        top = session.top(5, allowed, tie_break)
+
+        assert [s.recipe_id for s in top] == [sample_recipes[i].id for i in expected]
+
+    @pytest.mark.asyncio
+    async def test_no_candidates_raises_error(
+        self,
+        refiner: RefinerService,
+        sample_slot,
+        sample_recipes,
+        sample_pantry_items,
+    ):
+        """Excluding every recipe still raises ValueError."""
+        with pytest.raises(ValueError, match="No suitable recipes"):
+            await refiner.reroll_slot(
+                sample_slot,
+                sample_recipes,
+                sample_pantry_items,
+                exclude_recipe_ids=[r.id for r in sample_recipes],
+            )
+
+    @pytest.mark.asyncio
+    async def test_reroll_avoids_near_duplicates(self, refiner: RefinerService, sample_slot):
+        """Rerolling a stew doesn't offer the same stew under another name."""
+        now = datetime.now()
+
+        def make(title: str, names: list[str]) -> Recipe:
+            recipe_id = uuid4()
+            return Recipe(
+                id=recipe_id,
+                household_id=uuid4(),
+                title=title,
+                source_url=None,
+                source_domain=None,
+                servings=4,
+                prep_time_minutes=30,
+                cook_time_minutes=None,
+                total_time_minutes=None,
+                description=None,
+                instructions=None,
+                tags=[],
+                is_parsed=True,
+                created_at=now,
+                updated_at=now,
+                ingredients=[
+                    RecipeIngredient(
+                        id=uuid4(),
+                        recipe_id=recipe_id,
+                        raw_text=name,
+                        quantity=1,
+                        unit="count",
+                        item_name=name,
+                        notes=None,
+                        section=None,
+                        sort_order=0,
+                        confidence=1.0,
+                        created_at=now,
+                    )
+                    for name in names
+                ],
+            )
+
+        stew = ["beef chuck", "potato", "carrot", "onion", "beef broth", "garlic", "salt"]
+        current = make("Beef Stew", stew)
+        copy = make("Hearty Beef and Bean Stew", [*stew, "kidney beans"])
+        other = make("Lemon Pasta", ["pasta", "lemon"])
+        pantry = [
+            PantryItem(
+                id=uuid4(),
+                household_id=uuid4(),
+                name=name,
+                quantity=5,
+                unit="count",
+                location=PantryLocation.PANTRY,
+                created_at=now,
+                updated_at=now,
+            )
+            for name in stew  # The copy scores far better than the pasta
+        ]
+        slot = sample_slot.model_copy(update={"recipe_id": current.id})
+
+        for _ in range(5):
+            result = await refiner.reroll_slot(slot, [current, copy, other], pantry)
+            assert result.id == other.id
@@ -0,0 +1,162 @@
+"""Tests for Planner Repository plan summaries. 🗄️
+
+Listing plans must cost the same number of queries however many plans
+a household has - slot counts come from one grouped fetch.
+"""
+
+import re
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.api.app.domain.planner.repository import PlannerRepository
+
+
+class FakeQuery:
+    """Chainable stand-in for a PostgREST query builder."""
+
+    def __init__(self, client: "FakeSupabase", table: str) -> None:
+        self.client = client
+        self.table = table
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name: str):
+        def chain(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return chain
+
+    async def execute(self) -> SimpleNamespace:
+        self.client.executed.append(self)
+        rows = list(self.client.rows[self.table])
+        for name, args, _ in self.calls:
+            if name == "eq":
+                rows = [row for row in rows if row[args[0]] == args[1]]
+            elif name == "in_":
+                rows = [row for row in rows if row[args[0]] in args[1]]
+        orders = [
+            (args[0], kwargs.get("desc", False))
+            for name, args, kwargs in self.calls
+            if name == "order"
+        ]
+        for column, descending in reversed(orders):
+            rows.sort(key=lambda row, column=column: row[column], reverse=descending)
+        for name, args, _ in self.calls:
+            if name == "or_":
+                # Keyset cursor: resume after the row whose id is in the filter
+                cursor_id = re.search(r'[(,]id\.(?:lt|gt)\."([^"]+)"', args[0]).group(1)
+                position = next(i for i, row in enumerate(rows) if row["id"] == cursor_id)
+                rows = rows[position + 1 :]
+            elif name == "limit":
+                rows = rows[: args[0]]
+        return SimpleNamespace(data=rows, count=len(rows))
+
+
+class FakeSupabase:
+    """Records every executed query."""
+
+    def __init__(self, rows: dict[str, list[dict]]) -> None:
+        self.rows = rows
+        self.executed: list[FakeQuery] = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+def plan_row(household_id: str, name: str) -> dict:
+    """Helper to create a meal_plans table row."""
+    return {
+        "id": str(uuid4()),
+        "household_id": household_id,
+        "name": name,
+        "start_date": date(2026, 1, 5).isoformat(),
+        "end_date": date(2026, 1, 11).isoformat(),
+        "status": "draft",
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+
+
+def slot_rows(plan_id: str, filled: int, empty: int) -> list[dict]:
+    """Helper to create meal_slots rows for a plan."""
+    return [
+        {
+            "id": str(uuid4()),
+            "plan_id": plan_id,
+            "recipe_id": str(uuid4()) if i < filled else None,
+        }
+        for i in range(filled + empty)
+    ]
+
+
+def build_client(num_plans: int) -> tuple[FakeSupabase, str, dict[str, tuple[int, int]]]:
+    """Build a household with plans of varying size.
+
+    Returns:
+        The client, the household ID and (total, completed) by plan ID.
+    """
+    household_id = str(uuid4())
+    plans = [plan_row(household_id, f"Week {i}") for i in range(num_plans)]
+    slots: list[dict] = []
+    expected: dict[str, tuple[int, int]] = {}
+    for i, plan in enumerate(plans):
+        filled, empty = i % 4, i % 3
+        slots.extend(slot_rows(plan["id"], filled, empty))
+        expected[plan["id"]] = (filled + empty, filled)
+    # Another household's plan must not leak into the counts
+    other = plan_row(str(uuid4()), "Not ours")
+    slots.extend(slot_rows(other["id"], 3, 0))
+    client = FakeSupabase({"meal_plans": [*plans, other], "meal_slots": slots})
+    return client, household_id, expected
+
+
+class TestGetAllPlans:
+    """Tests for PlannerRepository.get_all_plans. 📋"""
+
+    @pytest.mark.parametrize("num_plans", [1, 5, 40])
+    async def test_round_trips_constant(self, num_plans: int) -> None:
+        """Plans and their slot counts take two queries, however many plans."""
+        client, household_id, _ = build_client(num_plans)
+        repository = PlannerRepository(client)
+
+        summaries = await repository.get_all_plans(UUID(household_id))
+
+        assert len(summaries) == num_plans
+        assert [query.table for query in client.executed] == ["meal_plans", "meal_slots"]
+
+    async def test_counts_grouped_per_plan(self) -> None:
+        """Each summary gets its own plan's slot counts."""
+        client, household_id, expected = build_client(12)
+        repository = PlannerRepository(client)
+
+        summaries = await repository.get_all_plans(UUID(household_id))
+
+        assert {
+            str(summary.id): (summary.total_meals, summary.completed_meals)
+            for summary in summaries
+        } == expected
+
+    async def test_no_plans_skips_slot_query(self) -> None:
+        """A household without plans costs one query."""
+        client, _, _ = build_client(3)
+        repository = PlannerRepository(client)
+
+        summaries = await repository.get_all_plans(uuid4())
+
+        assert summaries == []
+        assert len(client.executed) == 1
+
+    async def test_slots_page_past_row_cap(self) -> None:
+        """Slot counts stay right when the slots exceed one page."""
+        client, household_id, expected = build_client(10)
+        repository = PlannerRepository(client)
+        repository.SUMMARY_PAGE_SIZE = 4
+
+        summaries = await repository.get_all_plans(UUID(household_id))
+
+        assert {
+            str(summary.id): (summary.total_meals, summary.completed_meals)
+            for summary in summaries
+        } == expected
@@ -3,11 +3,23 @@
 Tests recipe scoring based on inventory match.
 """
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, timedelta
 from uuid import uuid4
 
+import pytest
+
 from src.api.app.domain.pantry.models import PantryItem
-from src.api.app.domain.planner.scorer import RecipeScorer
+from src.api.app.domain.planner import scorer as scorer_module
+from src.api.app.domain.planner.models import ScoringBackend
+from src.api.app.domain.planner.scorer import (
+    PantrySnapshot,
+    RecipeScorer,
+    get_scoring_executor,
+)
+from src.api.app.domain.planning.pantry_index import PantryIndex
 from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
 
 
@@ -241,3 +253,126 @@ class TestRecipeScorer:
 
         assert len(filtered) == 1
         assert filtered[0].title == "Mild"
+
+
+@pytest.fixture
+def catalog() -> tuple[list[Recipe], list[PantryItem]]:
+    """A catalog big enough to span several chunks, with tied scores."""
+    names = ["onion", "garlic", "tomato", "basil", "rice", "chicken", "lemon", "butter"]
+    recipes = [
+        make_recipe(
+            f"Recipe {n}",
+            [(names[n % 8], 1, "count"), (names[(n * 3) % 8], 2, "count"), ("pasta", 1, "lb")],
+        )
+        for n in range(40)
+    ]
+    pantry = [
+        make_pantry_item("Onion", 3, "count", expiry_days=2),
+        make_pantry_item("Garlic", 5, "count"),
+        make_pantry_item("Basil", 1, "count", expiry_days=1),
+        make_pantry_item("Pasta", 1, "lb"),
+    ]
+    return recipes, pantry
+
+
+class TestScoringBackends:
+    """Pool backends must rank exactly like inline scoring."""
+
+    @pytest.mark.parametrize("backend", [ScoringBackend.THREAD, ScoringBackend.PROCESS])
+    def test_pool_matches_inline(self, backend, catalog) -> None:
+        """Chunked scoring returns the same scores in the same order."""
+        recipes, pantry = catalog
+        inline = RecipeScorer(backend=ScoringBackend.INLINE).score_recipes(recipes, pantry)
+
+        pooled = RecipeScorer(backend=backend, max_workers=2, chunk_size=7).score_recipes(
+            recipes, pantry
+        )
+
+        assert pooled == inline
+
+    def test_small_catalog_stays_inline(self, catalog) -> None:
+        """Catalogs that fit in one chunk never touch the pool."""
+        recipes, pantry = catalog
+        scorer = RecipeScorer(backend=ScoringBackend.PROCESS, chunk_size=len(recipes))
+
+        scorer._score_on_pool = None  # type: ignore[method-assign]
+
+        assert len(scorer.score_recipes(recipes, pantry)) == len(recipes)
+
+    async def test_async_does_not_block_loop(self, catalog) -> None:
+        """The event loop keeps running while a catalog is scored."""
+        recipes, pantry = catalog
+        scorer = RecipeScorer(backend=ScoringBackend.INLINE)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        scores = await scorer.score_recipes_async(recipes * 5, pantry)
+        task.cancel()
+
+        assert len(scores) == len(recipes) * 5
+        assert ticks > 1
+
+    def test_snapshot_round_trip(self, catalog) -> None:
+        """A pantry snapshot unpacks to an identical index."""
+        _, pantry = catalog
+        index = PantryIndex(pantry)
+
+        restored = PantrySnapshot.from_index(index).to_index()
+
+        assert restored.version == index.version
+        assert restored.names == index.names
+
+    def test_shared_snapshot_round_trip(self, catalog) -> None:
+        """A snapshot published in shared memory reads back unchanged, then is released."""
+        _, pantry = catalog
+        snapshot = PantrySnapshot.from_index(PantryIndex(pantry))
+
+        with snapshot.shared() as shared:
+            assert shared.load() == snapshot
+
+        with pytest.raises(FileNotFoundError):
+            shared.load()
+
+    def test_failed_chunk_waits_for_the_rest(self, catalog, monkeypatch) -> None:
+        """A failing chunk surfaces its own error and keeps the pantry block for the others."""
+        recipes, pantry = catalog
+        broken = recipes[0].model_copy(update={"ingredients": [None]})
+        submitted = []
+
+        class RecordingExecutor:
+            def __init__(self, executor: ProcessPoolExecutor) -> None:
+                self.executor = executor
+
+            def submit(self, *args):
+                future = self.executor.submit(*args)
+                submitted.append(future)
+                return future
+
+        executor = ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn"))
+        monkeypatch.setattr(
+            scorer_module, "get_scoring_executor", lambda *_: RecordingExecutor(executor)
+        )
+        scorer = RecipeScorer(backend=ScoringBackend.PROCESS, chunk_size=1)
+        try:
+            with pytest.raises(AttributeError):
+                scorer._score_on_pool([broken, *recipes[1:10]], PantryIndex(pantry))
+
+            assert all(future.done() for future in submitted)
+            assert not [
+                future
+                for future in submitted[1:]
+                if not future.cancelled() and future.exception() is not None
+            ]
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def test_inline_has_no_pool(self) -> None:
+        """Asking for an inline pool is an error."""
+        with pytest.raises(ValueError, match="inline"):
+            get_scoring_executor(ScoringBackend.INLINE)
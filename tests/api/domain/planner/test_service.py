@@ -16,6 +16,7 @@ from src.api.app.domain.planner.models import (
     CreatePlanRequest,
     PlanOptionsResponse,
 )
+from src.api.app.domain.planner.plan_cache import PlanOptionsCache
 from src.api.app.domain.planner.scorer import RecipeScorer
 from src.api.app.domain.planner.service import PlannerService
 from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
@@ -174,6 +175,45 @@ class TestPlannerServiceGeneration:
         assert len(response.options) > 0
 
 
+class TestPlannerServiceTimings:
+    """Tests for returning stage timings."""
+
+    @pytest.fixture
+    def timed_service(self, mock_repository) -> PlannerService:
+        return PlannerService(repository=mock_repository, plan_cache=PlanOptionsCache())
+
+    @staticmethod
+    def make_request(include_timings: bool) -> CreatePlanRequest:
+        return CreatePlanRequest(
+            start_date=date(2026, 3, 2),
+            end_date=date(2026, 3, 4),
+            include_timings=include_timings,
+        )
+
+    async def test_timings_omitted_by_default(self, timed_service):
+        """Stage timings are only returned when asked for."""
+        recipes = [make_recipe(f"Recipe {i}") for i in range(6)]
+
+        response = await timed_service.generate_options(
+            uuid4(), self.make_request(False), recipes, []
+        )
+
+        assert response.stage_timings_ms is None
+
+    async def test_timings_returned_when_requested(self, timed_service):
+        """Requested timings come back, including on a cache hit."""
+        recipes = [make_recipe(f"Recipe {i}") for i in range(6)]
+
+        await timed_service.generate_options(uuid4(), self.make_request(False), recipes, [])
+        response = await timed_service.generate_options(
+            uuid4(), self.make_request(True), recipes, []
+        )
+
+        assert response.cache_hit
+        assert response.stage_timings_ms is not None
+        assert "score" in response.stage_timings_ms
+
+
 class TestPlannerServiceScoring:
     """Tests for recipe scoring (Phase 5A)."""
 
@@ -0,0 +1,120 @@
+"""Tests for the Density Index. 🧁
+
+The index must pick the most specific known ingredient and load
+extra entries from a data file.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.api.app.domain.planning.converter import UnitConverter, get_density_index
+from src.api.app.domain.planning.density import DensityIndex, tokenize
+
+
+@pytest.fixture
+def index() -> DensityIndex:
+    """Create a small density index for testing."""
+    return DensityIndex(
+        {"sugar": 200.0, "brown sugar": 220.0, "flour": 120.0, "almonds": 143.0},
+        aliases={"muscovado": "brown sugar", "spelt": "unknown"},
+    )
+
+
+class TestTokenize:
+    """Tests for name normalization."""
+
+    def test_lowercase_and_punctuation(self):
+        """Test: case and punctuation don't matter."""
+        assert tokenize("All-Purpose Flour,") == ("all", "purpose", "flour")
+
+    def test_plural_stripped(self):
+        """Test: plural 's' is dropped but not from short words or 'ss'."""
+        assert tokenize("rolled oats") == ("rolled", "oat")
+        assert tokenize("gas glass") == ("gas", "glass")
+
+
+class TestDensityIndex:
+    """Tests for lookups."""
+
+    def test_exact(self, index: DensityIndex):
+        """Test: exact names resolve directly."""
+        assert index.get("sugar") == 200.0
+
+    def test_most_specific_wins(self, index: DensityIndex):
+        """Test: 'dark brown sugar' is brown sugar, not sugar."""
+        assert index.get("Dark Brown Sugar") == 220.0
+
+    def test_generic_fallback(self, index: DensityIndex):
+        """Test: unknown qualifiers fall back to the generic entry."""
+        assert index.get("organic cane sugar") == 200.0
+
+    def test_plural_match(self, index: DensityIndex):
+        """Test: singular names find plural entries."""
+        assert index.get("almond") == 143.0
+
+    def test_whole_words_only(self, index: DensityIndex):
+        """Test: keys don't match inside other words."""
+        assert index.get("sugarcane") is None
+
+    def test_aliases(self, index: DensityIndex):
+        """Test: aliases resolve, aliases to unknown names are skipped."""
+        assert index.get("muscovado") == 220.0
+        assert "spelt" not in index
+
+    def test_resolution_cached_and_reset(self, index: DensityIndex):
+        """Test: lookups are cached until the index changes."""
+        assert index.get("cane sugar") == 200.0
+
+        index.add("cane sugar", 205.0)
+
+        assert index.get("cane sugar") == 205.0
+
+    def test_load_csv(self, index: DensityIndex, tmp_path: Path):
+        """Test: entries and aliases load from a CSV file."""
+        path = tmp_path / "densities.csv"
+        path.write_text(
+            "name,grams_per_cup,aliases\n"
+            "bread flour,127,strong flour|baker's flour\n"
+            "sugar,198,\n"
+        )
+
+        loaded = index.load_csv(path)
+
+        assert loaded == 2
+        assert index.get("unbleached bread flour") == 127.0
+        assert index.get("strong flour") == 127.0
+        assert index.get("sugar") == 198.0  # File entries override
+
+    def test_load_csv_missing_column(self, index: DensityIndex, tmp_path: Path):
+        """Test: files without the required columns are rejected."""
+        path = tmp_path / "densities.csv"
+        path.write_text("ingredient,density\nsugar,200\n")
+
+        with pytest.raises(ValueError, match="grams_per_cup"):
+            index.load_csv(path)
+
+    def test_large_table(self):
+        """Test: a 100x larger table still resolves the specific entry."""
+        entries = {f"ingredient {n}": float(n) for n in range(5000)}
+        entries["brown sugar"] = 220.0
+        entries["sugar"] = 200.0
+        big = DensityIndex(entries)
+
+        assert big.get("light brown sugar") == 220.0
+        assert big.get("ingredient 4321") == 4321.0
+
+
+class TestConverterDensities:
+    """The converter uses the shared index."""
+
+    def test_shared_index(self):
+        """Test: converters share the process-wide index by default."""
+        assert UnitConverter().density_index is get_density_index()
+
+    def test_specific_density_in_conversion(self):
+        """Test: 1 cup of dark brown sugar uses the brown sugar density."""
+        result = UnitConverter().convert(1, "cup", "gram", ingredient="dark brown sugar")
+
+        assert result.success
+        assert result.value == pytest.approx(220.0)
@@ -0,0 +1,102 @@
+"""Tests for the Trigram Index. 🔤
+
+The index must return exactly what a brute-force SequenceMatcher scan
+over every pantry name would return - just faster.
+"""
+
+from difflib import SequenceMatcher
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.fuzzy_index import TrigramIndex
+
+THRESHOLD = DeltaService.FUZZY_MATCH_THRESHOLD
+
+
+def brute_force_match(query: str, names: list[str], threshold: float) -> tuple[str, float] | None:
+    """The original linear scan the index replaces."""
+    best: tuple[str, float] | None = None
+    best_score = 0.0
+    for name in names:
+        score = SequenceMatcher(None, query, name).ratio()
+        if score >= threshold and score > best_score:
+            best_score = score
+            best = (name, score)
+    return best
+
+
+class TestTrigramIndex:
+    """Tests for candidate generation and best-match lookup."""
+
+    def test_singular_plural(self):
+        """Test: 'onions' finds 'onion'."""
+        index = TrigramIndex(["onion", "garlic", "olive oil"])
+
+        match = index.best_match("onions", THRESHOLD)
+
+        assert match is not None
+        assert match[0] == "onion"
+
+    def test_no_match_below_threshold(self):
+        """Test: unrelated names don't match."""
+        index = TrigramIndex(["chicken breast", "rice"])
+
+        assert index.best_match("chocolate", THRESHOLD) is None
+
+    def test_empty_index(self):
+        """Test: empty pantry never matches."""
+        assert TrigramIndex([]).best_match("onion", THRESHOLD) is None
+
+    def test_candidates_ranked_by_shared_trigrams(self):
+        """Test: closest names come first in the candidate list."""
+        index = TrigramIndex(["red onion", "yellow onion", "garlic"])
+
+        candidates = index.candidates("yellow onions")
+
+        assert candidates[0] == "yellow onion"
+        assert "garlic" not in candidates
+
+    def test_tie_keeps_first_name(self):
+        """Test: equal scores resolve to the earliest indexed name."""
+        names = ["abcx", "abcy"]
+        index = TrigramIndex(names)
+
+        assert index.best_match("abcz", 0.5) == brute_force_match("abcz", names, 0.5)
+        assert index.best_match("abcz", 0.5)[0] == "abcx"
+
+    def test_match_without_shared_trigrams(self):
+        """Test: matches with no shared trigram are still found."""
+        names = ["aXbYcZd"]
+        index = TrigramIndex(names)
+
+        assert index.best_match("abcd", THRESHOLD) == brute_force_match("abcd", names, THRESHOLD)
+
+    @given(
+        query=st.text(alphabet="abcdeo ", max_size=10),
+        names=st.lists(st.text(alphabet="abcdeo ", max_size=10), max_size=15, unique=True),
+    )
+    @settings(max_examples=200)
+    def test_matches_brute_force(self, query: str, names: list[str]):
+        """Property: index result == linear SequenceMatcher scan."""
+        index = TrigramIndex(names)
+
+        assert index.best_match(query, THRESHOLD) == brute_force_match(query, names, THRESHOLD)
+
+    @given(
+        query=st.text(alphabet="abcdeo ", max_size=10),
+        names=st.lists(st.text(alphabet="abcdeo ", max_size=10), max_size=15, unique=True),
+    )
+    @settings(max_examples=200)
+    def test_similar_matches_brute_force(self, query: str, names: list[str]):
+        """Property: similar() == every name scoring >= threshold either way."""
+        index = TrigramIndex(names)
+
+        expected = [
+            name
+            for name in names
+            if SequenceMatcher(None, query, name).ratio() >= THRESHOLD
+            or SequenceMatcher(None, name, query).ratio() >= THRESHOLD
+        ]
+        assert index.similar(query, THRESHOLD) == expected
@@ -0,0 +1,95 @@
+"""Tests for the Keyword Matcher. 🔎
+
+The compiled matcher must find exactly what `keyword in name.lower()`
+finds, and pick the longest keyword when several match.
+"""
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.api.app.domain.planning.keyword_matcher import KeywordMatcher
+from src.api.app.domain.shopping.service import CATEGORY_MATCHER
+from src.api.app.domain.store.sorter import DEFAULT_AISLE_MATCHER
+
+
+class TestKeywordMatcher:
+    """Tests for matching and priority."""
+
+    def test_longest_match_wins(self):
+        """Test: 'olive oil' beats 'oil' regardless of table order."""
+        matcher = KeywordMatcher({"oil": "Pantry", "olive oil": "Condiments"})
+
+        assert matcher.lookup("Extra Virgin Olive Oil") == "Condiments"
+        assert matcher.lookup("Sesame Oil") == "Pantry"
+
+    def test_tie_goes_to_first_listed(self):
+        """Test: equal-length matches resolve by table order."""
+        matcher = KeywordMatcher({"beef": "Meat", "stew": "Soup"})
+
+        assert matcher.lookup("beef stew") == "Meat"
+
+    def test_case_insensitive(self):
+        """Test: keywords and text are compared lowercased."""
+        matcher = KeywordMatcher(["Basil"])
+
+        assert matcher.matches("FRESH BASIL")
+
+    def test_no_match(self):
+        """Test: unknown names fall back to the default."""
+        matcher = KeywordMatcher({"milk": "Dairy"})
+
+        assert not matcher.matches("widget")
+        assert matcher.lookup("widget") is None
+        assert matcher.lookup("widget", "Unknown") == "Unknown"
+
+    def test_find_all_overlapping(self):
+        """Test: nested and overlapping keywords are all reported."""
+        matcher = KeywordMatcher(["cream", "ice cream", "sour cream"])
+
+        hits = matcher.find_all("ice cream")
+
+        assert [(hit.keyword, hit.start) for hit in hits] == [("ice cream", 0), ("cream", 4)]
+
+    def test_empty_and_duplicate_keywords_ignored(self):
+        """Test: blank keywords are skipped, duplicates keep the first entry."""
+        matcher = KeywordMatcher({"": "x", "oil": "first", "OIL": "second"})
+
+        assert len(matcher) == 1
+        assert matcher.keywords == ["oil"]
+        assert matcher.lookup("oil") == "first"
+
+    @given(
+        text=st.text(alphabet="abc ", max_size=12),
+        keywords=st.lists(st.text(alphabet="abc", min_size=1, max_size=4), max_size=10),
+    )
+    @settings(max_examples=200)
+    def test_matches_brute_force(self, text: str, keywords: list[str]):
+        """Property: same hits and winner as a linear substring scan."""
+        matcher = KeywordMatcher(keywords)
+        unique = list(dict.fromkeys(keywords))
+
+        expected_hits = sorted(
+            (start, unique.index(keyword))
+            for keyword in unique
+            for start in range(len(text) - len(keyword) + 1)
+            if text.startswith(keyword, start)
+        )
+        found = [k for k in unique if k in text]
+        expected_best = max(found, key=lambda k: (len(k), -unique.index(k))) if found else None
+
+        assert [(hit.start, hit.rank) for hit in matcher.find_all(text)] == expected_hits
+        assert matcher.matches(text) == bool(found)
+        assert matcher.lookup(text) == expected_best
+
+
+class TestKeywordTables:
+    """The shared category and aisle tables prefer specific keywords."""
+
+    def test_category_prefers_longer_keyword(self):
+        """Test: 'ice cream' is Frozen even though 'cream' is Dairy."""
+        assert CATEGORY_MATCHER.lookup("vanilla ice cream") == "Frozen"
+
+    def test_aisle_prefers_longer_keyword(self):
+        """Test: 'garlic powder' is a spice, not produce."""
+        assert DEFAULT_AISLE_MATCHER.lookup("garlic powder") == "Spices"
+        assert DEFAULT_AISLE_MATCHER.lookup("olive oil") == "Condiments"
@@ -0,0 +1,133 @@
+"""Tests for the Match Cache. 🧠
+
+Ingredient-to-pantry matches are memoized per household and pantry
+version, with bounded LRU eviction.
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.match_cache import CachedMatch, MatchCache
+from src.api.app.domain.recipes.models import ParsedIngredient
+
+
+def make_pantry_item(name: str, quantity: float, unit: str, household_id) -> PantryItem:
+    """Helper to create a PantryItem for testing."""
+    return PantryItem(
+        id=uuid4(),
+        household_id=household_id,
+        name=name,
+        quantity=quantity,
+        unit=unit,
+        location="pantry",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+
+
+def make_ingredient(name: str, quantity: float, unit: str) -> ParsedIngredient:
+    """Helper to create a ParsedIngredient for testing."""
+    return ParsedIngredient(
+        raw_text=f"{quantity} {unit} {name}",
+        quantity=quantity,
+        unit=unit,
+        item_name=name,
+    )
+
+
+class TestMatchCache:
+    """Tests for the LRU cache itself."""
+
+    def test_get_put(self):
+        """Test: stored matches come back and count as hits."""
+        cache = MatchCache()
+        household_id = uuid4()
+
+        assert cache.get(household_id, "v1", "onions") is None
+        cache.put(household_id, "v1", "onions", CachedMatch("onion", 0.91))
+
+        assert cache.get(household_id, "v1", "onions") == CachedMatch("onion", 0.91)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_version_is_part_of_key(self):
+        """Test: a new pantry version misses."""
+        cache = MatchCache()
+        household_id = uuid4()
+        cache.put(household_id, "v1", "onions", CachedMatch("onion", 0.91))
+
+        assert cache.get(household_id, "v2", "onions") is None
+
+    def test_lru_eviction(self):
+        """Test: least recently used entries are evicted first."""
+        cache = MatchCache(max_size=2)
+        household_id = uuid4()
+        cache.put(household_id, "v1", "a", CachedMatch(None, 0.0))
+        cache.put(household_id, "v1", "b", CachedMatch(None, 0.0))
+        cache.get(household_id, "v1", "a")  # 'a' is now most recent
+        cache.put(household_id, "v1", "c", CachedMatch(None, 0.0))
+
+        assert cache.get(household_id, "v1", "b") is None
+        assert cache.get(household_id, "v1", "a") is not None
+        assert cache.evictions == 1
+
+    def test_invalidate_household(self):
+        """Test: invalidation only drops the given household."""
+        cache = MatchCache()
+        mine, theirs = uuid4(), uuid4()
+        cache.put(mine, "v1", "a", CachedMatch(None, 0.0))
+        cache.put(theirs, "v1", "a", CachedMatch(None, 0.0))
+
+        assert cache.invalidate(mine) == 1
+        assert len(cache) == 1
+
+
+class TestDeltaServiceMemoization:
+    """DeltaService reuses cached fuzzy matches."""
+
+    @pytest.fixture
+    def cache(self) -> MatchCache:
+        return MatchCache()
+
+    @pytest.fixture
+    def service(self, cache: MatchCache) -> DeltaService:
+        return DeltaService(match_cache=cache)
+
+    def test_repeat_lookup_hits_cache(self, service: DeltaService, cache: MatchCache):
+        """Test: the second recipe using 'onions' is a cache hit."""
+        household_id = uuid4()
+        pantry = service.build_pantry_index([make_pantry_item("onion", 5, "count", household_id)])
+
+        first = service.calculate_missing([make_ingredient("onions", 2, "count")], pantry)
+        second = service.calculate_missing([make_ingredient("onions", 2, "count")], pantry)
+
+        assert cache.misses == 1
+        assert cache.hits == 1
+        assert first.have_enough[0].confidence == second.have_enough[0].confidence
+
+    def test_misses_are_cached_too(self, service: DeltaService, cache: MatchCache):
+        """Test: 'nothing matched' is remembered as well."""
+        household_id = uuid4()
+        pantry = service.build_pantry_index([make_pantry_item("onion", 5, "count", household_id)])
+
+        for _ in range(3):
+            result = service.calculate_missing([make_ingredient("saffron", 1, "gram")], pantry)
+            assert len(result.missing) == 1
+
+        assert cache.hits == 2
+
+    def test_pantry_change_changes_version(self, service: DeltaService, cache: MatchCache):
+        """Test: a different pantry snapshot doesn't reuse stale matches."""
+        household_id = uuid4()
+        before = service.build_pantry_index([make_pantry_item("rice", 1, "cup", household_id)])
+        after = service.build_pantry_index(
+            [*before.items, make_pantry_item("onion", 5, "count", household_id)]
+        )
+
+        assert before.version != after.version
+        assert not service.calculate_missing([make_ingredient("onions", 1, "count")], before).have_enough
+        assert service.calculate_missing([make_ingredient("onions", 1, "count")], after).have_enough
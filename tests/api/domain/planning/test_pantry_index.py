@@ -0,0 +1,144 @@
+"""Tests for the Pantry Index. 🗂️
+
+The index is a precompiled pantry snapshot shared across a scoring run.
+Results through the index must match passing the raw item list.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.pantry_index import PantryIndex
+from src.api.app.domain.recipes.models import ParsedIngredient
+
+
+@pytest.fixture
+def service() -> DeltaService:
+    """Create a delta service instance for testing."""
+    return DeltaService()
+
+
+def make_pantry_item(
+    name: str,
+    quantity: float | None = None,
+    unit: str | None = None,
+    expiry_date: date | None = None,
+) -> PantryItem:
+    """Helper to create a PantryItem for testing."""
+    return PantryItem(
+        id=uuid4(),
+        household_id=uuid4(),
+        name=name,
+        quantity=quantity,
+        unit=unit,
+        location="pantry",
+        expiry_date=expiry_date,
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+
+
+def make_ingredient(
+    name: str,
+    quantity: float | None = None,
+    unit: str | None = None,
+) -> ParsedIngredient:
+    """Helper to create a ParsedIngredient for testing."""
+    return ParsedIngredient(
+        raw_text=f"{quantity or ''} {unit or ''} {name}".strip(),
+        quantity=quantity,
+        unit=unit,
+        item_name=name,
+    )
+
+
+class TestPantryIndex:
+    """Tests for the index structures."""
+
+    def test_buckets_by_normalized_name(self, service: DeltaService):
+        """Test: names are grouped case- and whitespace-insensitively."""
+        index = service.build_pantry_index(
+            [make_pantry_item("Onion", 2, "count"), make_pantry_item(" onion ", 3, "count")]
+        )
+
+        assert index.names == ["onion"]
+        assert len(index.buckets["onion"]) == 2
+        assert "ONION" in index
+
+    def test_aggregates_compatible_units(self, service: DeltaService):
+        """Test: 1 cup + 8 tbsp of milk aggregates to 1.5 cups."""
+        index = service.build_pantry_index(
+            [make_pantry_item("milk", 1, "cup"), make_pantry_item("milk", 8, "tablespoon")]
+        )
+
+        aggregated = index.aggregated("milk")
+
+        assert aggregated is not None
+        assert aggregated.quantity == pytest.approx(1.5)
+        assert aggregated.unit == "cup"
+
+    def test_aggregation_is_memoized(self, service: DeltaService):
+        """Test: repeated lookups return the same aggregated item."""
+        index = service.build_pantry_index(
+            [make_pantry_item("rice", 1, "cup"), make_pantry_item("rice", 1, "cup")]
+        )
+
+        assert index.aggregated("rice") is index.aggregated("rice")
+
+    def test_unknown_name(self, service: DeltaService):
+        """Test: missing names aggregate to None."""
+        index = service.build_pantry_index([make_pantry_item("rice", 1, "cup")])
+
+        assert index.aggregated("quinoa") is None
+
+    def test_earliest_expiry(self, service: DeltaService):
+        """Test: the soonest expiry wins, undated items are ignored."""
+        soon = date.today() + timedelta(days=2)
+        later = date.today() + timedelta(days=20)
+        index = service.build_pantry_index(
+            [
+                make_pantry_item("spinach", 1, "bunch"),
+                make_pantry_item("spinach", 1, "bunch", expiry_date=later),
+                make_pantry_item("spinach", 1, "bunch", expiry_date=soon),
+                make_pantry_item("rice", 1, "cup"),
+            ]
+        )
+
+        assert index.earliest_expiry["spinach"] == soon
+        assert index.earliest_expiry["rice"] is None
+
+    def test_existing_index_passes_through(self, service: DeltaService):
+        """Test: building from an index returns the same index."""
+        index = service.build_pantry_index([make_pantry_item("rice", 1, "cup")])
+
+        assert service.build_pantry_index(index) is index
+
+
+class TestCalculateMissingWithIndex:
+    """calculate_missing gives the same answers for lists and indexes."""
+
+    def test_same_result_as_list(self, service: DeltaService):
+        """Test: one index reused across recipes matches per-call lists."""
+        pantry = [
+            make_pantry_item("onion", 2, "count"),
+            make_pantry_item("onion", 3, "count"),
+            make_pantry_item("flour", 2, "cup"),
+            make_pantry_item("chicken breast", 1, "pound"),
+        ]
+        recipes = [
+            [make_ingredient("onions", 4, "count"), make_ingredient("flour", 300, "gram")],
+            [make_ingredient("chicken breast", 2, "pound"), make_ingredient("salt")],
+            [make_ingredient("saffron", 1, "pinch")],
+        ]
+        index = PantryIndex(pantry, service.converter)
+
+        for recipe in recipes:
+            from_list = service.calculate_missing(recipe, pantry)
+            from_index = service.calculate_missing(recipe, index)
+
+            assert from_index.model_dump(exclude={"comparison_time"}) == from_list.model_dump(
+                exclude={"comparison_time"}
+            )
@@ -0,0 +1,216 @@
+"""Tests for plan-level delta computation. 📅
+
+A week of meals is compared in one pass: requirements are summed first,
+then the pantry is subtracted once.
+"""
+
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.planner.models import MealSlot, MealType
+from src.api.app.domain.planning.delta_service import DeltaService
+from src.api.app.domain.planning.models import DeltaStatus
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+
+
+@pytest.fixture
+def service() -> DeltaService:
+    """Create a delta service instance for testing."""
+    return DeltaService()
+
+
+def make_pantry_item(
+    name: str,
+    quantity: float | None = None,
+    unit: str | None = None,
+) -> PantryItem:
+    """Helper to create a PantryItem for testing."""
+    return PantryItem(
+        id=uuid4(),
+        household_id=uuid4(),
+        name=name,
+        quantity=quantity,
+        unit=unit,
+        location="pantry",
+        created_at=datetime.now(UTC),
+        updated_at=datetime.now(UTC),
+    )
+
+
+def make_recipe(
+    title: str,
+    ingredients: list[tuple[str, float | None, str | None]],
+    servings: int | None = 2,
+) -> Recipe:
+    """Helper to create a Recipe with (name, quantity, unit) ingredients."""
+    recipe_id = uuid4()
+    now = datetime.now(UTC)
+    return Recipe(
+        id=recipe_id,
+        household_id=uuid4(),
+        title=title,
+        source_url=None,
+        source_domain=None,
+        servings=servings,
+        prep_time_minutes=None,
+        cook_time_minutes=None,
+        total_time_minutes=None,
+        description=None,
+        instructions=None,
+        tags=None,
+        is_parsed=True,
+        created_at=now,
+        updated_at=now,
+        ingredients=[
+            RecipeIngredient(
+                id=uuid4(),
+                recipe_id=recipe_id,
+                raw_text=f"{quantity or ''} {unit or ''} {name}".strip(),
+                quantity=quantity,
+                unit=unit,
+                item_name=name,
+                notes=None,
+                section=None,
+                sort_order=position,
+                confidence=1.0,
+                created_at=now,
+            )
+            for position, (name, quantity, unit) in enumerate(ingredients)
+        ],
+    )
+
+
+def make_slot(recipe: Recipe | None, servings: int = 2) -> MealSlot:
+    """Helper to create a dinner MealSlot for a recipe."""
+    return MealSlot(
+        id=uuid4(),
+        plan_id=uuid4(),
+        date=date.today(),
+        meal_type=MealType.DINNER,
+        recipe_id=recipe.id if recipe else None,
+        recipe_title=recipe.title if recipe else None,
+        servings=servings,
+    )
+
+
+class TestCalculateMissingForPlan:
+    """Tests for DeltaService.calculate_missing_for_plan."""
+
+    def test_pantry_subtracted_once(self, service: DeltaService):
+        """Test: two recipes needing 3 onions each vs 4 in pantry -> buy 2."""
+        soup = make_recipe("Onion Soup", [("onion", 3, "count")])
+        tart = make_recipe("Onion Tart", [("onion", 3, "count")])
+        pantry = [make_pantry_item("onion", 4, "count")]
+
+        result = service.calculate_missing_for_plan(
+            [make_slot(soup), make_slot(tart)],
+            {soup.id: soup, tart.id: tart},
+            pantry,
+        )
+
+        assert result.total_ingredients == 1
+        assert len(result.partial) == 1
+        assert result.partial[0].recipe_quantity == pytest.approx(6)
+        assert result.partial[0].delta_quantity == pytest.approx(2)
+        assert result.partial[0].notes == "For: Onion Soup, Onion Tart"
+
+    def test_scaled_by_servings(self, service: DeltaService):
+        """Test: a 2-serving recipe cooked for 4 needs double."""
+        bowl = make_recipe("Quinoa Bowl", [("quinoa", 1, "cup")], servings=2)
+
+        result = service.calculate_missing_for_plan(
+            [make_slot(bowl, servings=4)],
+            {bowl.id: bowl},
+            [],
+        )
+
+        assert result.missing[0].delta_quantity == pytest.approx(2)
+
+    def test_sums_in_common_unit(self, service: DeltaService):
+        """Test: 1 cup + 8 tbsp of milk is 1.5 cups against a 1 cup pantry."""
+        pancakes = make_recipe("Pancakes", [("milk", 1, "cup")])
+        sauce = make_recipe("Bechamel", [("Milk", 8, "tablespoon")])
+        pantry = [make_pantry_item("milk", 1, "cup")]
+
+        result = service.calculate_missing_for_plan(
+            [make_slot(pancakes), make_slot(sauce)],
+            {pancakes.id: pancakes, sauce.id: sauce},
+            pantry,
+        )
+
+        assert len(result.partial) == 1
+        assert result.partial[0].delta_quantity == pytest.approx(0.5)
+        assert result.partial[0].delta_unit == "cup"
+
+    def test_unconvertible_units_kept_apart(self, service: DeltaService):
+        """Test: quantities that can't be converted get separate lines."""
+        stew = make_recipe("Stew", [("carrot", 2, "count")])
+        cake = make_recipe("Carrot Cake", [("carrot", 1, "cup")])
+
+        result = service.calculate_missing_for_plan(
+            [make_slot(stew), make_slot(cake)],
+            {stew.id: stew, cake.id: cake},
+            [],
+        )
+
+        assert result.total_ingredients == 2
+        assert {item.delta_unit for item in result.missing} == {"count", "cup"}
+
+    def test_staples_assumed(self, service: DeltaService):
+        """Test: staples are assumed once for the whole plan."""
+        soup = make_recipe("Soup", [("salt", 1, "teaspoon")])
+        tart = make_recipe("Tart", [("salt", 0.5, "teaspoon")])
+
+        result = service.calculate_missing_for_plan(
+            [make_slot(soup), make_slot(tart)],
+            {soup.id: soup, tart.id: tart},
+            [],
+        )
+
+        assert len(result.assumptions) == 1
+        assert result.assumptions[0].recipe_quantity == pytest.approx(1.5)
+
+    def test_skips_empty_and_unknown_slots(self, service: DeltaService):
+        """Test: slots with no recipe or an unloaded recipe are ignored."""
+        unknown = make_recipe("Not Loaded", [("saffron", 1, "pinch")])
+
+        result = service.calculate_missing_for_plan(
+            [make_slot(None), make_slot(unknown)],
+            {},
+            [],
+        )
+
+        assert result.total_ingredients == 0
+        assert not result.needs_shopping
+
+    def test_matches_single_recipe(self, service: DeltaService):
+        """Test: a one-meal plan gives the same statuses as calculate_missing."""
+        recipe = make_recipe(
+            "Chicken Dinner",
+            [("chicken breast", 2, "pound"), ("flour", 300, "gram"), ("salt", None, None)],
+        )
+        pantry = [
+            make_pantry_item("chicken breast", 1, "pound"),
+            make_pantry_item("flour", 5, "cup"),
+        ]
+
+        plan_result = service.calculate_missing_for_plan(
+            [make_slot(recipe)], {recipe.id: recipe}, pantry
+        )
+        recipe_result = service.calculate_missing(recipe.ingredients, pantry)
+
+        def statuses(result):
+            return sorted(
+                (item.item_name, item.status, item.delta_quantity)
+                for item in result.have_enough
+                + result.partial
+                + result.missing
+                + result.assumptions
+                + result.unresolved
+            )
+
+        assert statuses(plan_result) == statuses(recipe_result)
+        assert plan_result.partial[0].status == DeltaStatus.PARTIAL
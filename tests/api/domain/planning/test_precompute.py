@@ -0,0 +1,270 @@
+"""Tests for the Precompute Store. ♻️
+
+After a pantry change only recipes that use the changed ingredient are
+rescored, and the results match scoring from scratch.
+"""
+
+import threading
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from src.api.app.domain.pantry.models import PantryItem
+from src.api.app.domain.planner.scorer import RecipeScorer
+from src.api.app.domain.planning.pantry_index import PantryIndex
+from src.api.app.domain.planning.precompute import PrecomputeStore, RecipeIndex
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+
+HOUSEHOLD_ID = uuid4()
+
+
+@pytest.fixture
+def store() -> PrecomputeStore:
+    """Create an empty precompute store."""
+    return PrecomputeStore()
+
+
+@pytest.fixture
+def scorer() -> RecipeScorer:
+    """Create a recipe scorer."""
+    return RecipeScorer()
+
+
+def make_pantry_item(name: str, quantity: float = 1.0, unit: str | None = None) -> PantryItem:
+    """Helper to create a PantryItem for testing."""
+    now = datetime.now(UTC)
+    return PantryItem(
+        id=uuid4(),
+        household_id=HOUSEHOLD_ID,
+        name=name,
+        quantity=quantity,
+        unit=unit,
+        location="pantry",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def make_recipe(title: str, ingredient_names: list[str]) -> Recipe:
+    """Helper to create a Recipe with one-of-each ingredients."""
+    recipe_id = uuid4()
+    now = datetime.now(UTC)
+    return Recipe(
+        id=recipe_id,
+        household_id=HOUSEHOLD_ID,
+        title=title,
+        source_url=None,
+        source_domain=None,
+        servings=2,
+        prep_time_minutes=None,
+        cook_time_minutes=None,
+        total_time_minutes=None,
+        description=None,
+        instructions=None,
+        tags=None,
+        is_parsed=True,
+        created_at=now,
+        updated_at=now,
+        ingredients=[
+            RecipeIngredient(
+                id=uuid4(),
+                recipe_id=recipe_id,
+                raw_text=f"1 {name}",
+                quantity=1.0,
+                unit=None,
+                item_name=name,
+                notes=None,
+                section=None,
+                sort_order=position,
+                confidence=1.0,
+                created_at=now,
+            )
+            for position, name in enumerate(ingredient_names)
+        ],
+    )
+
+
+def pantry_of(scorer: RecipeScorer, items: list[PantryItem]) -> PantryIndex:
+    """Build the pantry snapshot the scorer would use."""
+    return scorer.delta_service.build_pantry_index(items)
+
+
+@pytest.fixture
+def catalog() -> list[Recipe]:
+    """A small recipe catalog."""
+    return [
+        make_recipe("Onion Soup", ["onions", "butter", "beef broth"]),
+        make_recipe("Garlic Bread", ["bread", "garlic", "butter"]),
+        make_recipe("Fried Rice", ["rice", "eggs", "soy sauce"]),
+        make_recipe("Pasta Aglio", ["spaghetti", "garlic", "olive oil"]),
+    ]
+
+
+def as_pairs(scores) -> dict:
+    """Reduce scores to comparable recipe_id -> (total, missing) pairs."""
+    return {s.recipe_id: (s.total_score, sorted(s.missing_items)) for s in scores}
+
+
+class TestRecipeIndex:
+    """Tests for the ingredient -> recipe reverse index."""
+
+    def test_exact_and_fuzzy_lookup(self):
+        """Test: 'onion' finds recipes using 'onions'."""
+        index = RecipeIndex()
+        soup, salad = uuid4(), uuid4()
+        index.set_recipe(soup, ["Onions", "butter"])
+        index.set_recipe(salad, ["lettuce"])
+
+        assert index.recipes_using(["onion"], 0.7) == {soup}
+        assert index.recipes_using(["butter"], 0.7) == {soup}
+        assert index.recipes_using(["chocolate"], 0.7) == set()
+
+    def test_reindex_and_remove(self):
+        """Test: re-indexing replaces names, removing drops them."""
+        index = RecipeIndex()
+        recipe_id = uuid4()
+        index.set_recipe(recipe_id, ["butter"])
+        index.set_recipe(recipe_id, ["garlic"])
+
+        assert index.recipes_using(["butter"], 0.7) == set()
+        assert index.recipes_using(["garlic"], 0.7) == {recipe_id}
+
+        index.remove_recipe(recipe_id)
+
+        assert recipe_id not in index
+        assert index.recipes_using(["garlic"], 0.7) == set()
+
+
+class TestPrecomputeStore:
+    """Tests for incremental scoring."""
+
+    def test_first_run_scores_everything(self, store, scorer, catalog):
+        """Test: the first call computes every recipe."""
+        pantry = pantry_of(scorer, [make_pantry_item("butter")])
+
+        scores = store.get_scores(HOUSEHOLD_ID, catalog, pantry, scorer)
+
+        assert store.recomputed == len(catalog)
+        assert as_pairs(scores) == as_pairs(
+            scorer.score_recipes(catalog, [make_pantry_item("butter")])
+        )
+
+    def test_unchanged_pantry_reuses_everything(self, store, scorer, catalog):
+        """Test: a second call with the same pantry recomputes nothing."""
+        items = [make_pantry_item("butter")]
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        assert store.recomputed == len(catalog)
+        assert store.reused == len(catalog)
+
+    def test_pantry_change_recomputes_only_affected(self, store, scorer, catalog):
+        """Test: adding garlic rescores the two garlic recipes only."""
+        items = [make_pantry_item("butter")]
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        items.append(make_pantry_item("garlic"))
+        scores = store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        assert store.recomputed == len(catalog) + 2
+        assert as_pairs(scores) == as_pairs(scorer.score_recipes(catalog, items))
+
+    def test_fuzzy_change_recomputes_fuzzy_users(self, store, scorer, catalog):
+        """Test: buying 'onion' rescores the recipe that needs 'onions'."""
+        items = [make_pantry_item("butter")]
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        items.append(make_pantry_item("onion"))
+        scores = store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        assert store.recomputed == len(catalog) + 1
+        assert as_pairs(scores) == as_pairs(scorer.score_recipes(catalog, items))
+
+    def test_quantity_change_and_removal(self, store, scorer, catalog):
+        """Test: quantity edits and removals are both detected."""
+        butter = make_pantry_item("butter")
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, [butter]), scorer)
+
+        butter.quantity = 0.5
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, [butter]), scorer)
+        assert store.recomputed == len(catalog) + 2
+
+        scores = store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, []), scorer)
+        assert store.recomputed == len(catalog) + 4
+        assert as_pairs(scores) == as_pairs(scorer.score_recipes(catalog, []))
+
+    def test_recipe_change_drops_result(self, store, scorer, catalog):
+        """Test: a re-parsed recipe is rescored and re-indexed."""
+        items = [make_pantry_item("butter")]
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        store.recipe_changed(HOUSEHOLD_ID, catalog[2].id, ["rice", "eggs", "butter"])
+
+        assert store.get_result(HOUSEHOLD_ID, catalog[2].id) is None
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+        assert store.recomputed == len(catalog) + 1
+
+    def test_edited_recipe_detected_without_hook(self, store, scorer, catalog):
+        """Test: changed ingredients are noticed even if nobody reported them."""
+        items = [make_pantry_item("butter")]
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        catalog[2].ingredients[0].item_name = "quinoa"
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        assert store.recomputed == len(catalog) + 1
+
+    def test_removed_recipes_forgotten(self, store, scorer, catalog):
+        """Test: recipes missing from the catalog are dropped."""
+        items = [make_pantry_item("butter")]
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        scores = store.get_scores(HOUSEHOLD_ID, catalog[:2], pantry_of(scorer, items), scorer)
+
+        assert len(scores) == 2
+        assert store.get_result(HOUSEHOLD_ID, catalog[3].id) is None
+
+    def test_results_keep_comparison(self, store, scorer, catalog):
+        """Test: the stored comparison lists what each recipe is missing."""
+        items = [make_pantry_item("butter")]
+        store.get_scores(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer)
+
+        result = store.get_result(HOUSEHOLD_ID, catalog[0].id)
+
+        assert result is not None
+        assert result.comparison is not None
+        assert {item.item_name for item in result.comparison.missing} == {"onions", "beef broth"}
+
+    def test_households_score_independently(self, store, scorer, catalog):
+        """Test: one household's scoring run doesn't block another's."""
+        started, release = threading.Event(), threading.Event()
+
+        class BlockingScorer(RecipeScorer):
+            def evaluate(self, recipe, pantry):
+                started.set()
+                release.wait(timeout=5)
+                return super().evaluate(recipe, pantry)
+
+        items = [make_pantry_item("butter")]
+        slow = threading.Thread(
+            target=store.get_scores,
+            args=(uuid4(), catalog, pantry_of(scorer, items), BlockingScorer()),
+        )
+        fast = threading.Thread(
+            target=store.get_scores,
+            args=(HOUSEHOLD_ID, catalog, pantry_of(scorer, items), scorer),
+        )
+        slow.start()
+        try:
+            assert started.wait(timeout=5)
+            fast.start()
+            fast.join(timeout=2)
+            assert not fast.is_alive()  # Finished while the other household was mid-run
+        finally:
+            release.set()
+            slow.join()
+            fast.join()
+
+        assert store.recomputed == 2 * len(catalog)
@@ -0,0 +1,354 @@
+"""Tests for Recipe Repository batch loading and writes. 🗄️
+
+Planning loads a whole catalog; ingredients must come back in one
+query, not one query per recipe. Replacing ingredients is one RPC
+call per batch of recipes.
+"""
+
+import random
+import re
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.api.app.domain.recipes.models import ParsedIngredient
+from src.api.app.domain.recipes.repository import RecipeRepository
+
+
+class FakeQuery:
+    """Chainable stand-in for a PostgREST query builder."""
+
+    def __init__(self, client: "FakeSupabase", table: str) -> None:
+        self.client = client
+        self.table = table
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name: str):
+        def chain(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return chain
+
+    async def execute(self) -> SimpleNamespace:
+        self.client.executed.append(self)
+        rows = list(self.client.rows[self.table])
+        if self.client.shuffle_ties:
+            random.Random(len(self.client.executed)).shuffle(rows)
+        orders = [
+            (args[0], kwargs.get("desc", False))
+            for name, args, kwargs in self.calls
+            if name == "order"
+        ]
+        for column, descending in reversed(orders):
+            rows.sort(key=lambda row, column=column: row[column], reverse=descending)
+        for name, args, _ in self.calls:
+            if name == "or_":
+                # Keyset cursor: resume after the row whose id is in the filter
+                cursor_id = re.search(r'id\.(?:lt|gt)\."([^"]+)"', args[0]).group(1)
+                position = next(i for i, row in enumerate(rows) if row["id"] == cursor_id)
+                rows = rows[position + 1 :]
+            elif name == "in_":
+                column, values = args
+                rows = [row for row in rows if row[column] in values]
+            elif name == "limit":
+                rows = rows[: args[0]]
+            elif name == "range":
+                start, end = args
+                rows = rows[start : end + 1]
+        return SimpleNamespace(data=rows, count=len(rows))
+
+
+class FakeReplaceRpc:
+    """Stand-in for the replace_recipe_ingredients stored procedure."""
+
+    def __init__(self, client: "FakeSupabase", name: str, params: dict) -> None:
+        self.client = client
+        self.name = name
+        self.params = params
+
+    async def execute(self) -> SimpleNamespace:
+        self.client.executed.append(self)
+        rows = self.client.rows
+        touched = []
+        for entry in self.params["p_recipes"]:
+            recipe_id = entry["recipe_id"]
+            touched.append(recipe_id)
+            existing = [row for row in rows["recipe_ingredients"] if row["recipe_id"] == recipe_id]
+            offset = 0
+            if entry.get("append"):
+                offset = max((row["sort_order"] for row in existing), default=-1) + 1
+            else:
+                rows["recipe_ingredients"] = [
+                    row for row in rows["recipe_ingredients"] if row["recipe_id"] != recipe_id
+                ]
+            for ingredient in entry["ingredients"]:
+                rows["recipe_ingredients"].append(
+                    {
+                        **ingredient,
+                        "recipe_id": recipe_id,
+                        "sort_order": ingredient["sort_order"] + offset,
+                        "created_at": datetime.now(UTC).isoformat(),
+                    }
+                )
+            for recipe in rows["recipes"]:
+                if recipe["id"] == recipe_id:
+                    if "is_parsed" in entry:
+                        recipe["is_parsed"] = entry["is_parsed"]
+                    if "minhash" in entry:
+                        recipe["minhash"] = entry["minhash"]
+        result = [row for row in rows["recipe_ingredients"] if row["recipe_id"] in touched]
+        result.sort(key=lambda row: (row["recipe_id"], row["sort_order"]))
+        # PostgREST cuts responses at the row cap
+        return SimpleNamespace(data=result[: RecipeRepository.INGREDIENT_PAGE_SIZE])
+
+
+class FakeSupabase:
+    """Records every executed query."""
+
+    def __init__(self, rows: dict[str, list[dict]], *, shuffle_ties: bool = False) -> None:
+        self.rows = rows
+        self.shuffle_ties = shuffle_ties  # Like Postgres, ties come back in any order
+        self.executed: list[FakeQuery | FakeReplaceRpc] = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: dict) -> FakeReplaceRpc:
+        return FakeReplaceRpc(self, name, params)
+
+
+def recipe_row(title: str, age_days: int = 0) -> dict:
+    """Helper to create a recipes table row."""
+    now = (datetime.now(UTC) - timedelta(days=age_days)).isoformat()
+    return {
+        "id": str(uuid4()),
+        "household_id": str(uuid4()),
+        "title": title,
+        "source_url": None,
+        "source_domain": None,
+        "servings": 2,
+        "prep_time_minutes": None,
+        "cook_time_minutes": None,
+        "total_time_minutes": None,
+        "description": None,
+        "instructions": None,
+        "tags": None,
+        "is_parsed": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def ingredient_row(recipe_id: str, name: str, sort_order: int) -> dict:
+    """Helper to create a recipe_ingredients table row."""
+    return {
+        "id": str(uuid4()),
+        "recipe_id": recipe_id,
+        "raw_text": name,
+        "quantity": 1.0,
+        "unit": None,
+        "item_name": name,
+        "notes": None,
+        "section": None,
+        "sort_order": sort_order,
+        "confidence": 1.0,
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+
+
+@pytest.fixture
+def catalog() -> dict[str, list[dict]]:
+    """Three recipes, one of them without ingredients."""
+    recipes = [recipe_row("Soup"), recipe_row("Salad", age_days=1), recipe_row("Toast", age_days=2)]
+    ingredients = [
+        ingredient_row(recipes[0]["id"], "onion", 0),
+        ingredient_row(recipes[0]["id"], "broth", 1),
+        ingredient_row(recipes[1]["id"], "lettuce", 0),
+    ]
+    return {"recipes": recipes, "recipe_ingredients": ingredients}
+
+
+class TestGetByIds:
+    """Tests for RecipeRepository.get_by_ids."""
+
+    async def test_two_queries_for_many_recipes(self, catalog):
+        """Test: recipes and their ingredients come from one query each."""
+        supabase = FakeSupabase(catalog)
+        ids = [UUID(row["id"]) for row in catalog["recipes"]]
+
+        recipes = await RecipeRepository(supabase).get_by_ids(ids, uuid4())
+
+        assert len(supabase.executed) == 2
+        recipe_filter = next(call for call in supabase.executed[0].calls if call[0] == "in_")
+        assert recipe_filter[1] == ("id", [str(recipe_id) for recipe_id in ids])
+        assert [i.item_name for i in recipes[ids[0]].ingredients or []] == ["onion", "broth"]
+        assert recipes[ids[2]].ingredients == []
+
+    async def test_no_ids_no_queries(self, catalog):
+        """Test: an empty request doesn't touch the database."""
+        supabase = FakeSupabase(catalog)
+
+        assert await RecipeRepository(supabase).get_by_ids([], uuid4()) == {}
+        assert supabase.executed == []
+
+
+class TestGetIngredientsFor:
+    """Tests for the paged ingredient query."""
+
+    async def test_pages_are_stable_with_duplicate_sort_orders(self, monkeypatch):
+        """Test: repeated sort_order values never repeat or drop rows across pages."""
+        monkeypatch.setattr(RecipeRepository, "INGREDIENT_PAGE_SIZE", 2)
+        recipe_id = str(uuid4())
+        ingredients = [ingredient_row(recipe_id, f"item {n}", 0) for n in range(7)]
+        supabase = FakeSupabase({"recipe_ingredients": ingredients}, shuffle_ties=True)
+
+        grouped = await RecipeRepository(supabase)._get_ingredients_for([UUID(recipe_id)])
+
+        names = [i.item_name for i in grouped[UUID(recipe_id)]]
+        assert sorted(names) == [f"item {n}" for n in range(7)]
+
+
+class TestIterByHousehold:
+    """Tests for keyset-paginated recipe streaming."""
+
+    async def test_streams_every_recipe_in_order(self, catalog):
+        """Test: chunks cover the whole catalog, newest first, with ingredients."""
+        catalog["recipes"] = [recipe_row(f"Recipe {n}", age_days=n) for n in range(7)]
+        catalog["recipe_ingredients"] = [
+            ingredient_row(row["id"], "salt", 0) for row in catalog["recipes"]
+        ]
+        supabase = FakeSupabase(catalog)
+
+        chunks = [
+            chunk
+            async for chunk in RecipeRepository(supabase).iter_by_household(uuid4(), chunk_size=3)
+        ]
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        titles = [recipe.title for chunk in chunks for recipe in chunk]
+        assert titles == [f"Recipe {n}" for n in range(7)]
+        assert all(recipe.ingredients for chunk in chunks for recipe in chunk)
+
+
+def parsed(*names: str) -> list[ParsedIngredient]:
+    """Helper to create parsed ingredients."""
+    return [ParsedIngredient(raw_text=f"1 {name}", item_name=name) for name in names]
+
+
+class TestReplaceIngredients:
+    """Tests for the atomic ingredient replace RPC."""
+
+    async def test_replace_is_one_round_trip(self, catalog):
+        """Test: clear, insert, flag and read back happen in a single call."""
+        soup = catalog["recipes"][0]
+        soup["is_parsed"] = False
+        supabase = FakeSupabase(catalog)
+
+        ingredients = await RecipeRepository(supabase).set_parsed_ingredients(
+            UUID(soup["id"]), parsed("leek", "potato"), minhash=[1, 2, 3]
+        )
+
+        assert len(supabase.executed) == 1
+        (call,) = supabase.executed
+        assert call.name == RecipeRepository.REPLACE_INGREDIENTS_RPC
+        assert [i.item_name for i in ingredients] == ["leek", "potato"]
+        assert [i.sort_order for i in ingredients] == [0, 1]
+        assert soup["is_parsed"] is True
+        assert soup["minhash"] == [1, 2, 3]
+
+    async def test_append_keeps_existing(self, catalog):
+        """Test: appending adds after the current ingredients."""
+        soup_id = UUID(catalog["recipes"][0]["id"])
+        supabase = FakeSupabase(catalog)
+
+        ingredients = await RecipeRepository(supabase).set_parsed_ingredients(
+            soup_id, parsed("salt"), append=True
+        )
+
+        assert [i.item_name for i in ingredients] == ["onion", "broth", "salt"]
+        assert [i.sort_order for i in ingredients] == [0, 1, 2]
+        assert "minhash" not in supabase.executed[0].params["p_recipes"][0]
+
+    async def test_raw_replace_leaves_parsed_flag(self, catalog):
+        """Test: raw text replacement doesn't claim the recipe is parsed."""
+        salad = catalog["recipes"][1]
+        supabase = FakeSupabase(catalog)
+
+        ingredients = await RecipeRepository(supabase).replace_ingredients(
+            UUID(salad["id"]), ["2 tomatoes", "olive oil"]
+        )
+
+        assert [i.item_name for i in ingredients] == ["tomatoes", "oil"]
+        assert "is_parsed" not in supabase.executed[0].params["p_recipes"][0]
+
+    async def test_empty_replace_clears(self, catalog):
+        """Test: replacing with nothing leaves the recipe without ingredients."""
+        soup_id = UUID(catalog["recipes"][0]["id"])
+        supabase = FakeSupabase(catalog)
+
+        assert await RecipeRepository(supabase).set_parsed_ingredients(soup_id, []) == []
+        assert not [
+            row for row in catalog["recipe_ingredients"] if row["recipe_id"] == str(soup_id)
+        ]
+
+    async def test_bulk_keeps_sections(self, catalog):
+        """Test: sections given alongside parsed ingredients are stored."""
+        soup_id = UUID(catalog["recipes"][0]["id"])
+        supabase = FakeSupabase(catalog)
+
+        stored = await RecipeRepository(supabase).set_parsed_ingredients_many(
+            {soup_id: parsed("onion", "broth", "salt")},
+            sections={soup_id: ["For the base", "For the base"]},
+        )
+
+        assert [i.section for i in stored[soup_id]] == ["For the base", "For the base", None]
+
+    @pytest.mark.parametrize("recipes, expected_calls", [(1, 1), (3, 1), (7, 3)])
+    async def test_bulk_batches(self, catalog, monkeypatch, recipes, expected_calls):
+        """Test: recipes are batched by ingredient rows, not one call per recipe."""
+        monkeypatch.setattr(RecipeRepository, "INGREDIENT_PAGE_SIZE", 7)
+        catalog["recipes"] = [recipe_row(f"Recipe {n}") for n in range(recipes)]
+        supabase = FakeSupabase(catalog)
+
+        stored = await RecipeRepository(supabase).set_parsed_ingredients_many(
+            {UUID(row["id"]): parsed("salt", "pepper") for row in catalog["recipes"]}
+        )
+
+        assert len(supabase.executed) == expected_calls
+        assert len(stored) == recipes
+        assert all(len(ingredients) == 2 for ingredients in stored.values())
+        assert all(row["is_parsed"] for row in catalog["recipes"])
+
+    async def test_bulk_batches_large_recipes_alone(self, catalog, monkeypatch):
+        """Test: a batch never sends more rows than one response can return."""
+        monkeypatch.setattr(RecipeRepository, "INGREDIENT_PAGE_SIZE", 4)
+        catalog["recipes"] = [recipe_row(f"Recipe {n}") for n in range(3)]
+        sizes = [3, 3, 1]
+        supabase = FakeSupabase(catalog)
+
+        stored = await RecipeRepository(supabase).set_parsed_ingredients_many(
+            {
+                UUID(row["id"]): parsed(*(f"item {i}" for i in range(size)))
+                for row, size in zip(catalog["recipes"], sizes, strict=True)
+            }
+        )
+
+        assert [len(call.params["p_recipes"]) for call in supabase.executed] == [1, 2]
+        assert [len(ingredients) for ingredients in stored.values()] == sizes
+
+    async def test_capped_response_is_read_back(self, catalog, monkeypatch):
+        """Test: an append whose result hits the row cap is re-read in full."""
+        monkeypatch.setattr(RecipeRepository, "INGREDIENT_PAGE_SIZE", 2)
+        soup_id = UUID(catalog["recipes"][0]["id"])
+        supabase = FakeSupabase(catalog)
+
+        ingredients = await RecipeRepository(supabase).set_parsed_ingredients(
+            soup_id, parsed("salt"), append=True
+        )
+
+        assert [i.item_name for i in ingredients] == ["onion", "broth", "salt"]
+        assert supabase.executed[0].name == RecipeRepository.REPLACE_INGREDIENTS_RPC
+        assert {query.table for query in supabase.executed[1:]} == {"recipe_ingredients"}
@@ -14,6 +14,7 @@ from src.api.app.domain.recipes.models import (
     CreateRecipeDTO,
     ParsedIngredient,
     Recipe,
+    RecipeIngredient,
     UpdateRecipeDTO,
 )
 from src.api.app.domain.recipes.service import (
@@ -21,6 +22,7 @@ from src.api.app.domain.recipes.service import (
     RecipeNotFoundError,
     RecipeService,
 )
+from src.api.app.domain.recipes.similarity import compute_signature
 
 
 @pytest.fixture
@@ -59,6 +61,23 @@ def mock_parser():
     return parser
 
 
+def make_ingredient(recipe_id, item_name: str, sort_order: int = 0) -> RecipeIngredient:
+    """Create a stored ingredient for testing."""
+    return RecipeIngredient(
+        id=uuid4(),
+        recipe_id=recipe_id,
+        raw_text=item_name,
+        quantity=None,
+        unit=None,
+        item_name=item_name,
+        notes=None,
+        section=None,
+        sort_order=sort_order,
+        confidence=None,
+        created_at=datetime.now(UTC),
+    )
+
+
 @pytest.fixture
 def service(mock_repository, mock_parser):
     """Create a RecipeService with mocked dependencies."""
@@ -200,18 +219,24 @@ class TestRecipeServiceWithIngredients:
         """Test creating a recipe with ingredient texts."""
         mock_repository.get_by_url.return_value = None
         mock_repository.create.return_value = sample_recipe
-        mock_repository.add_ingredients.return_value = None
+        mock_repository.set_parsed_ingredients.return_value = []
 
         dto = CreateRecipeDTO(title="Recipe With Ingredients")
         ingredient_texts = ["1 cup flour", "2 eggs"]
         household_id = uuid4()
 
-        await service.create_recipe(household_id, dto, ingredient_texts=ingredient_texts)
+        result = await service.create_recipe(household_id, dto, ingredient_texts=ingredient_texts)
 
         # Parser should be called with ingredient texts
         mock_parser.parse_many.assert_called_once_with(ingredient_texts)
-        # Ingredients should be added to database
-        mock_repository.add_ingredients.assert_called_once()
+        # Ingredients are stored (and the recipe marked parsed) in one call
+        mock_repository.set_parsed_ingredients.assert_called_once_with(
+            sample_recipe.id, mock_parser.parse_many.return_value
+        )
+        mock_repository.add_ingredients.assert_not_called()
+        mock_repository.mark_as_parsed.assert_not_called()
+        mock_repository._get_ingredients.assert_not_called()
+        assert result.is_parsed is True
 
     @pytest.mark.asyncio
     async def test_parse_ingredients_returns_structured_data(
@@ -222,8 +247,7 @@ class TestRecipeServiceWithIngredients:
 
         # Mock repository to return recipe exists
         mock_repository.get_by_id.return_value = sample_recipe
-        mock_repository.clear_ingredients.return_value = None
-        mock_repository.add_ingredients.return_value = None
+        mock_repository.set_parsed_ingredients.return_value = []
 
         mock_parser.parse_many.return_value = [
             ParsedIngredient(
@@ -252,6 +276,53 @@ class TestRecipeServiceWithIngredients:
         assert result[0].quantity == 500
         assert result[1].notes == "large, chopped"
 
+    @pytest.mark.asyncio
+    async def test_parse_ingredients_replaces_atomically(
+        self, service, mock_repository, mock_parser, sample_recipe
+    ):
+        """Test: replacing goes through one atomic call, no separate clear."""
+        mock_repository.get_by_id.return_value = sample_recipe
+        mock_repository.set_parsed_ingredients.return_value = []
+
+        await service.parse_ingredients(
+            sample_recipe.id, sample_recipe.household_id, ["1 cup flour", "2 eggs"]
+        )
+
+        mock_repository.set_parsed_ingredients.assert_called_once_with(
+            sample_recipe.id,
+            mock_parser.parse_many.return_value,
+            minhash=compute_signature(sample_recipe.title, ["flour", "eggs"]),
+        )
+        mock_repository.clear_ingredients.assert_not_called()
+        mock_repository.set_minhash.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_ingredients_appends(
+        self, service, mock_repository, mock_parser, sample_recipe
+    ):
+        """Test: appending keeps existing rows and re-signs from all of them."""
+        stored = [
+            make_ingredient(sample_recipe.id, name, position)
+            for position, name in enumerate(["salt", "flour", "eggs"])
+        ]
+        mock_repository.get_by_id.return_value = sample_recipe
+        mock_repository.set_parsed_ingredients.return_value = stored
+
+        await service.parse_ingredients(
+            sample_recipe.id,
+            sample_recipe.household_id,
+            ["1 cup flour", "2 eggs"],
+            replace_existing=False,
+        )
+
+        mock_repository.set_parsed_ingredients.assert_called_once_with(
+            sample_recipe.id, mock_parser.parse_many.return_value, append=True
+        )
+        mock_repository.set_minhash.assert_called_once_with(
+            sample_recipe.id,
+            compute_signature(sample_recipe.title, ["salt", "flour", "eggs"]),
+        )
+
 
 class TestRecipeServiceUpdateRecipe:
     """Tests for update_recipe method."""
@@ -325,3 +396,162 @@ class TestRecipeServiceIngestUrl:
 
         with pytest.raises(RecipeAlreadyExistsError):
             await service.ingest_from_url(sample_recipe.household_id, sample_recipe.source_url)
+
+
+class TestRecipeServicePrecomputeHooks:
+    """Recipe writes keep the precompute store in sync."""
+
+    @pytest.fixture
+    def store(self):
+        """Create a mock PrecomputeStore."""
+        return MagicMock()
+
+    @pytest.fixture
+    def hooked_service(self, mock_repository, mock_parser, store):
+        """Create a RecipeService with a mocked precompute store."""
+        return RecipeService(mock_repository, mock_parser, precompute_store=store)
+
+    @pytest.mark.asyncio
+    async def test_create_indexes_ingredients(
+        self, hooked_service, mock_repository, store, sample_recipe
+    ):
+        """Test: a created recipe is indexed by its parsed ingredient names."""
+        mock_repository.get_by_url.return_value = None
+        mock_repository.create.return_value = sample_recipe
+        household_id = uuid4()
+
+        await hooked_service.create_recipe(
+            household_id,
+            CreateRecipeDTO(title="Cake"),
+            ingredient_texts=["1 cup flour", "2 eggs"],
+        )
+
+        store.recipe_changed.assert_called_once_with(
+            household_id, sample_recipe.id, ["flour", "eggs"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_marks_changed(
+        self, hooked_service, mock_repository, store, sample_recipe
+    ):
+        """Test: a metadata update drops the stored result."""
+        mock_repository.update.return_value = sample_recipe
+
+        await hooked_service.update_recipe(
+            sample_recipe.id,
+            sample_recipe.household_id,
+            UpdateRecipeDTO(title="Renamed"),
+        )
+
+        store.recipe_changed.assert_called_once_with(
+            sample_recipe.household_id, sample_recipe.id
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_removes(self, hooked_service, mock_repository, store):
+        """Test: a deleted recipe is removed from the store."""
+        mock_repository.delete.return_value = True
+        recipe_id, household_id = uuid4(), uuid4()
+
+        await hooked_service.delete_recipe(recipe_id, household_id)
+
+        store.recipe_removed.assert_called_once_with(household_id, recipe_id)
+
+
+class TestRecipeServiceSignatures:
+    """Recipe writes store the near-duplicate signature."""
+
+    @pytest.mark.asyncio
+    async def test_create_stores_signature(self, service, mock_repository, sample_recipe):
+        """Test: the signature covers the title and parsed ingredient names."""
+        mock_repository.get_by_url.return_value = None
+        mock_repository.create.return_value = sample_recipe
+
+        await service.create_recipe(
+            uuid4(),
+            CreateRecipeDTO(title="Cake"),
+            ingredient_texts=["1 cup flour", "2 eggs"],
+        )
+
+        minhash = mock_repository.create.call_args.kwargs["minhash"]
+        assert minhash == compute_signature("Cake", ["flour", "eggs"])
+
+    @pytest.mark.asyncio
+    async def test_parse_ingredients_updates_signature(
+        self, service, mock_repository, sample_recipe
+    ):
+        """Test: re-parsing stores a signature for the new ingredients."""
+        mock_repository.get_by_id.return_value = sample_recipe
+        mock_repository.set_parsed_ingredients.return_value = []
+
+        await service.parse_ingredients(
+            sample_recipe.id, sample_recipe.household_id, ["1 cup flour"]
+        )
+
+        minhash = mock_repository.set_parsed_ingredients.call_args.kwargs["minhash"]
+        assert minhash == compute_signature(sample_recipe.title, ["flour", "eggs"])
+
+
+class TestRecipeServiceReparse:
+    """Bulk re-parsing of a household's recipes."""
+
+    @staticmethod
+    def chunks(*batches):
+        """Make an iter_by_household stand-in yielding the given chunks."""
+
+        async def iterate(_household_id, **_kwargs):
+            for batch in batches:
+                yield batch
+
+        return iterate
+
+    @pytest.mark.asyncio
+    async def test_reparses_chunk_in_one_bulk_call(
+        self, service, mock_repository, mock_parser, sample_recipe
+    ):
+        """Test: every recipe of a chunk is replaced by a single bulk call."""
+        other = sample_recipe.model_copy(update={"id": uuid4(), "title": "Other"})
+        sample_recipe.ingredients = [make_ingredient(sample_recipe.id, "1 cup flour")]
+        other.ingredients = [make_ingredient(other.id, "2 eggs")]
+        mock_repository.iter_by_household = self.chunks([sample_recipe, other])
+
+        count = await service.reparse_recipes(sample_recipe.household_id)
+
+        assert count == 2
+        mock_repository.set_parsed_ingredients_many.assert_called_once()
+        call = mock_repository.set_parsed_ingredients_many.call_args
+        parsed = mock_parser.parse_many.return_value
+        assert call.args[0] == {sample_recipe.id: parsed, other.id: parsed}
+        assert call.kwargs["minhashes"] == {
+            sample_recipe.id: compute_signature(sample_recipe.title, ["flour", "eggs"]),
+            other.id: compute_signature("Other", ["flour", "eggs"]),
+        }
+
+    @pytest.mark.asyncio
+    async def test_keeps_section_headings(self, service, mock_repository, sample_recipe):
+        """Test: stored sections are passed through, in ingredient order."""
+        sample_recipe.ingredients = [
+            make_ingredient(sample_recipe.id, "1 cup flour"),
+            make_ingredient(sample_recipe.id, "2 tomatoes", sort_order=1).model_copy(
+                update={"section": "For the sauce"}
+            ),
+        ]
+        mock_repository.iter_by_household = self.chunks([sample_recipe])
+
+        await service.reparse_recipes(sample_recipe.household_id)
+
+        call = mock_repository.set_parsed_ingredients_many.call_args
+        assert call.kwargs["sections"] == {sample_recipe.id: [None, "For the sauce"]}
+
+    @pytest.mark.asyncio
+    async def test_skips_recipes_without_ingredients(
+        self, service, mock_repository, sample_recipe
+    ):
+        """Test: nothing is written when no recipe has ingredients."""
+        sample_recipe.ingredients = []
+        mock_repository.iter_by_household = self.chunks([sample_recipe])
+
+        count = await service.reparse_recipes(sample_recipe.household_id)
+
+        assert count == 0
+        mock_repository.set_parsed_ingredients_many.assert_not_called()
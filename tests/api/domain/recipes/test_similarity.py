@@ -0,0 +1,186 @@
+"""Tests for recipe MinHash signatures and the near-duplicate index. 👯
+
+The index may only ever report pairs whose exact Jaccard similarity
+clears the threshold, and should find (almost) all of them.
+"""
+
+from datetime import UTC, datetime
+from itertools import combinations
+from uuid import uuid4
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+from src.api.app.domain.recipes.similarity import (
+    NEAR_DUPLICATE_THRESHOLD,
+    NUM_PERM,
+    NearDuplicateIndex,
+    compute_signature,
+    estimated_similarity,
+    jaccard,
+    recipe_shingles,
+    shingles_for,
+    signature_for,
+)
+
+STEW = ["beef chuck", "potato", "carrot", "onion", "beef broth", "tomato paste", "garlic", "salt"]
+BEAN_STEW = [
+    "beef chuck",
+    "kidney beans",
+    "carrot",
+    "onion",
+    "beef broth",
+    "tomato paste",
+    "garlic",
+    "salt",
+    "celery",
+]
+
+
+def make_recipe(title: str, ingredients: list[str], minhash: list[int] | None = None) -> Recipe:
+    """Create a test recipe."""
+    now = datetime.now(UTC)
+    recipe_id = uuid4()
+    return Recipe(
+        id=recipe_id,
+        household_id=uuid4(),
+        title=title,
+        ingredients=[
+            RecipeIngredient(
+                id=uuid4(),
+                recipe_id=recipe_id,
+                item_name=name,
+                quantity=1,
+                unit="count",
+                raw_text=name,
+                notes=None,
+                section=None,
+                sort_order=position,
+                confidence=1.0,
+                created_at=now,
+            )
+            for position, name in enumerate(ingredients)
+        ],
+        tags=[],
+        prep_time_minutes=30,
+        source_url=None,
+        source_domain=None,
+        servings=4,
+        cook_time_minutes=None,
+        total_time_minutes=None,
+        description=None,
+        instructions=None,
+        is_parsed=True,
+        created_at=now,
+        updated_at=now,
+        minhash=minhash,
+    )
+
+
+class TestSignatures:
+    """Tests for shingles and signatures."""
+
+    def test_shingles_drop_stopwords_and_namespace_features(self):
+        shingles = recipe_shingles("Beef and Bean Stew", ["Beef", " onion "])
+
+        assert shingles == {"t:beef", "t:bean", "t:stew", "i:beef", "i:onion"}
+
+    def test_signature_is_stable_and_fits_bigint(self):
+        first = compute_signature("Beef Stew", STEW)
+        second = compute_signature("beef stew", reversed(STEW))
+
+        assert first == second
+        assert len(first) == NUM_PERM
+        assert all(0 <= value < 2**63 for value in first)
+
+    def test_estimate_tracks_jaccard(self):
+        first, second = recipe_shingles("Beef Stew", STEW), recipe_shingles("Beef Chili", STEW)
+
+        estimate = estimated_similarity(
+            compute_signature("Beef Stew", STEW), compute_signature("Beef Chili", STEW)
+        )
+
+        assert estimate == pytest.approx(jaccard(first, second), abs=0.15)
+
+    def test_stored_signature_is_used(self):
+        stored = [7] * NUM_PERM
+        recipe = make_recipe("Beef Stew", STEW, minhash=stored)
+
+        assert signature_for(recipe) == stored
+
+    def test_stored_signature_of_wrong_length_is_ignored(self):
+        recipe = make_recipe("Beef Stew", STEW, minhash=[7, 7])
+
+        assert signature_for(recipe) == compute_signature("Beef Stew", STEW)
+
+
+class TestNearDuplicateIndex:
+    """Tests for NearDuplicateIndex."""
+
+    def test_finds_reworded_title_with_same_ingredients(self):
+        """'Beef Stew' and 'Hearty Beef and Bean Stew' are near-duplicates."""
+        stew = make_recipe("Beef Stew", STEW)
+        bean_stew = make_recipe("Hearty Beef and Bean Stew", BEAN_STEW)
+        index = NearDuplicateIndex()
+        index.add(stew.id, stew)
+
+        assert index.near_duplicates(bean_stew) == {stew.id}
+
+    def test_different_dishes_are_not_duplicates(self):
+        tacos = make_recipe("Chicken Tacos", ["chicken", "tortillas", "onion", "garlic", "lime"])
+        index = NearDuplicateIndex()
+        index.add("stew", make_recipe("Beef Stew", STEW))
+
+        assert index.near_duplicates(tacos) == set()
+
+    def test_remove(self):
+        stew = make_recipe("Beef Stew", STEW)
+        index = NearDuplicateIndex()
+        index.add(stew.id, stew)
+        index.remove(stew.id)
+
+        assert len(index) == 0
+        assert index.near_duplicates(stew) == set()
+
+    def test_near_duplicates_of_key_excludes_itself(self):
+        index = NearDuplicateIndex()
+        index.add("a", make_recipe("Beef Stew", STEW))
+        index.add("b", make_recipe("Hearty Beef and Bean Stew", BEAN_STEW))
+
+        assert index.near_duplicates_of_key("a") == {"b"}
+
+    def test_bands_must_divide_signature(self):
+        with pytest.raises(ValueError, match="bands"):
+            NearDuplicateIndex(bands=3)
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.lists(st.sampled_from(["beef", "bean", "stew", "quick", "soup"]), max_size=3),
+                st.sets(
+                    st.sampled_from(["onion", "garlic", "carrot", "beef", "rice", "beans"]),
+                    max_size=5,
+                ),
+            ),
+            min_size=2,
+            max_size=8,
+        )
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_only_reports_pairs_over_threshold(self, specs):
+        """Every reported pair clears the threshold exactly."""
+        recipes = [
+            make_recipe(" ".join(words) or "dish", sorted(names)) for words, names in specs
+        ]
+        index = NearDuplicateIndex()
+        for position, recipe in enumerate(recipes):
+            index.add(position, recipe)
+
+        for i, j in combinations(range(len(recipes)), 2):
+            exact = jaccard(shingles_for(recipes[i]), shingles_for(recipes[j]))
+            if j in index.near_duplicates_of_key(i):
+                assert exact >= NEAR_DUPLICATE_THRESHOLD
+            if exact == 1.0:
+                assert j in index.near_duplicates_of_key(i)
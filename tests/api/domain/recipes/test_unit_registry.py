@@ -3,9 +3,13 @@
 Validates unit normalization and conversion logic.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from src.api.app.domain.recipes.unit_registry import UnitRegistry
+from src.api.app.domain.planning.converter import UnitConverter
+from src.api.app.domain.recipes.parser import IngredientParser
+from src.api.app.domain.recipes.unit_registry import UnitRegistry, get_unit_registry
 
 
 @pytest.fixture
@@ -186,3 +190,95 @@ class TestVagueUnits:
     def test_gram_is_not_vague(self, registry: UnitRegistry):
         """Test: 'gram' is not a vague unit."""
         assert not registry.is_vague_unit("gram")
+
+
+class TestFactorTable:
+    """Tests for the precomputed conversion table."""
+
+    def test_table_matches_pint(self, registry: UnitRegistry):
+        """Test: every table pair converts like Pint does."""
+        for from_unit, (from_dim, _) in registry.UNIT_FACTORS.items():
+            for to_unit, (to_dim, _) in registry.UNIT_FACTORS.items():
+                expected = registry._pint_convert(1.0, from_unit, to_unit)
+                actual = registry.convert(1.0, from_unit, to_unit)
+                if from_dim == to_dim:
+                    assert actual == pytest.approx(expected, rel=1e-9), (from_unit, to_unit)
+                else:
+                    assert actual is None
+                    assert expected is None, (from_unit, to_unit)
+
+    def test_custom_units(self, registry: UnitRegistry):
+        """Test: kitchen units from the table convert without Pint."""
+        assert registry.convert(2, "dozen", "count") == pytest.approx(24)
+        assert registry.convert(1, "can", "milliliter") == pytest.approx(400)
+        assert registry.convert(10, "pinch", "dash") == pytest.approx(5)
+
+    def test_unknown_units_fall_back_to_pint(self, registry: UnitRegistry):
+        """Test: units outside the table still convert through Pint."""
+        assert registry.convert(1, "ml", "teaspoon") == pytest.approx(0.2029, abs=1e-4)
+        assert registry.are_compatible("ml", "cup")
+
+    def test_unit_dimension(self, registry: UnitRegistry):
+        """Test: dimensions come from the table."""
+        assert registry.unit_dimension("Tbsp") == "volume"
+        assert registry.unit_dimension("lbs") == "mass"
+        assert registry.unit_dimension("doz") == "count"
+        assert registry.unit_dimension("furlong") is None
+
+
+class TestConvertMany:
+    """Tests for batch conversion."""
+
+    def test_mixed_units(self, registry: UnitRegistry):
+        """Test: each value converts from its own unit."""
+        result = registry.convert_many([1, 8, 100], ["cup", "tbsp", "gram"], "cup")
+
+        assert result[0] == pytest.approx(1.0)
+        assert result[1] == pytest.approx(0.5)
+        assert result[2] is None
+
+    def test_single_source_unit(self, registry: UnitRegistry):
+        """Test: one unit string applies to every value."""
+        assert registry.convert_many([500, 1500], "g", "kg") == pytest.approx([0.5, 1.5])
+
+    def test_length_mismatch(self, registry: UnitRegistry):
+        """Test: values and units must line up."""
+        with pytest.raises(ValueError):
+            registry.convert_many([1, 2], ["cup"], "cup")
+
+
+class TestSharedRegistry:
+    """Tests for the process-wide registry."""
+
+    def test_same_instance(self):
+        """Test: every caller gets the same registry."""
+        assert get_unit_registry() is get_unit_registry()
+
+    def test_same_instance_across_threads(self):
+        """Test: concurrent first use still yields one registry."""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            registries = list(pool.map(lambda _: get_unit_registry(), range(32)))
+
+        assert all(registry is registries[0] for registry in registries)
+
+    def test_services_share_it_by_default(self):
+        """Test: converters and parsers no longer build their own."""
+        assert UnitConverter().unit_registry is get_unit_registry()
+        assert IngredientParser().unit_registry is get_unit_registry()
+
+    def test_concurrent_conversions(self):
+        """Test: table and Pint fallback conversions are safe from threads."""
+        registry = get_unit_registry().warm()
+
+        def convert(index: int) -> tuple[float | None, float | None]:
+            return (
+                registry.convert(index, "cup", "tablespoon"),
+                registry.convert(index, "ml", "teaspoon"),
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(convert, range(64)))
+
+        for index, (tablespoons, teaspoons) in enumerate(results):
+            assert tablespoons == pytest.approx(index * 16)
+            assert teaspoons == pytest.approx(index * 0.2029, abs=1e-2)
@@ -0,0 +1,163 @@
+"""Tests for Shopping Repository list summaries. 🗄️
+
+Listing shopping lists must cost the same number of queries however
+many lists a household has - item counts come from one grouped fetch.
+"""
+
+import re
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.api.app.domain.shopping.repository import ShoppingRepository
+
+
+class FakeQuery:
+    """Chainable stand-in for a PostgREST query builder."""
+
+    def __init__(self, client: "FakeSupabase", table: str) -> None:
+        self.client = client
+        self.table = table
+        self.calls: list[tuple] = []
+
+    def __getattr__(self, name: str):
+        def chain(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+
+        return chain
+
+    async def execute(self) -> SimpleNamespace:
+        self.client.executed.append(self)
+        rows = list(self.client.rows[self.table])
+        for name, args, _ in self.calls:
+            if name == "eq":
+                rows = [row for row in rows if row[args[0]] == args[1]]
+            elif name == "in_":
+                rows = [row for row in rows if row[args[0]] in args[1]]
+        orders = [
+            (args[0], kwargs.get("desc", False))
+            for name, args, kwargs in self.calls
+            if name == "order"
+        ]
+        for column, descending in reversed(orders):
+            rows.sort(key=lambda row, column=column: row[column], reverse=descending)
+        for name, args, _ in self.calls:
+            if name == "or_":
+                # Keyset cursor: resume after the row whose id is in the filter
+                cursor_id = re.search(r'[(,]id\.(?:lt|gt)\."([^"]+)"', args[0]).group(1)
+                position = next(i for i, row in enumerate(rows) if row["id"] == cursor_id)
+                rows = rows[position + 1 :]
+            elif name == "limit":
+                rows = rows[: args[0]]
+        return SimpleNamespace(data=rows, count=len(rows))
+
+
+class FakeSupabase:
+    """Records every executed query."""
+
+    def __init__(self, rows: dict[str, list[dict]]) -> None:
+        self.rows = rows
+        self.executed: list[FakeQuery] = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+
+def list_row(household_id: str, name: str) -> dict:
+    """Helper to create a shopping_lists table row."""
+    return {
+        "id": str(uuid4()),
+        "household_id": household_id,
+        "name": name,
+        "status": "active",
+        "created_at": datetime.now(UTC).isoformat(),
+    }
+
+
+def item_rows(list_id: str, checked: int, pending: int) -> list[dict]:
+    """Helper to create shopping_list_items rows for a list."""
+    return [
+        {
+            "id": str(uuid4()),
+            "shopping_list_id": list_id,
+            "status": "checked" if i < checked else "pending",
+        }
+        for i in range(checked + pending)
+    ]
+
+
+def build_client(num_lists: int) -> tuple[FakeSupabase, str, dict[str, tuple[int, int]]]:
+    """Build a household with lists of varying size.
+
+    Returns:
+        The client, the household ID and (total, checked) by list ID.
+    """
+    household_id = str(uuid4())
+    lists = [list_row(household_id, f"Trip {i}") for i in range(num_lists)]
+    items: list[dict] = []
+    expected: dict[str, tuple[int, int]] = {}
+    for i, shopping_list in enumerate(lists):
+        checked, pending = i % 3, i % 5
+        items.extend(item_rows(shopping_list["id"], checked, pending))
+        expected[shopping_list["id"]] = (checked + pending, checked)
+    # Another household's list must not leak into the counts
+    other = list_row(str(uuid4()), "Not ours")
+    items.extend(item_rows(other["id"], 2, 2))
+    client = FakeSupabase({"shopping_lists": [*lists, other], "shopping_list_items": items})
+    return client, household_id, expected
+
+
+class TestGetAllLists:
+    """Tests for ShoppingRepository.get_all_lists. 🛒"""
+
+    @pytest.mark.parametrize("num_lists", [1, 5, 40])
+    async def test_round_trips_constant(self, num_lists: int) -> None:
+        """Lists and their item counts take two queries, however many lists."""
+        client, household_id, _ = build_client(num_lists)
+        repository = ShoppingRepository(client)
+
+        summaries = await repository.get_all_lists(UUID(household_id))
+
+        assert len(summaries) == num_lists
+        assert [query.table for query in client.executed] == [
+            "shopping_lists",
+            "shopping_list_items",
+        ]
+
+    async def test_counts_grouped_per_list(self) -> None:
+        """Each summary gets its own list's item counts."""
+        client, household_id, expected = build_client(12)
+        repository = ShoppingRepository(client)
+
+        summaries = await repository.get_all_lists(UUID(household_id))
+
+        assert {
+            str(summary.id): (summary.total_items, summary.checked_items)
+            for summary in summaries
+        } == expected
+
+    async def test_no_lists_skips_item_query(self) -> None:
+        """A household without lists costs one query."""
+        client, _, _ = build_client(3)
+        repository = ShoppingRepository(client)
+
+        summaries = await repository.get_all_lists(uuid4())
+
+        assert summaries == []
+        assert len(client.executed) == 1
+
+    async def test_items_page_past_row_cap(self) -> None:
+        """Item counts stay right when the items exceed one page."""
+        client, household_id, expected = build_client(10)
+        repository = ShoppingRepository(client)
+        repository.SUMMARY_PAGE_SIZE = 4
+
+        summaries = await repository.get_all_lists(UUID(household_id))
+
+        assert {
+            str(summary.id): (summary.total_items, summary.checked_items)
+            for summary in summaries
+        } == expected
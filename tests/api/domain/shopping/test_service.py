@@ -3,8 +3,17 @@
 Tests shopping list business logic.
 """
 
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.api.app.core.cache import SHOPPING, HouseholdCache
 from src.api.app.domain.planning.models import DeltaItem
-from src.api.app.domain.shopping.service import ShoppingService
+from src.api.app.domain.shopping.service import (
+    ShoppingItemNotFoundError,
+    ShoppingService,
+)
 
 
 class TestCategoryGuessing:
@@ -198,3 +207,32 @@ class TestItemAggregation:
 
         assert len(aggregated) == 1
         assert aggregated[0].category == "Dairy"
+
+
+class TestReadCacheInvalidation:
+    """List and item writes drop the household's cached shopping reads. 🧊"""
+
+    async def test_check_item_invalidates(self) -> None:
+        """Test that checking an item bumps the shopping namespace."""
+        repository = AsyncMock()
+        repository.check_item.return_value = MagicMock()
+        cache = HouseholdCache()
+        household_id = uuid4()
+        service = ShoppingService(repository=repository, cache=cache)
+
+        await service.check_item(uuid4(), uuid4(), household_id, uuid4())
+
+        assert cache.version(household_id, SHOPPING) == 1
+
+    async def test_missing_item_keeps_cache(self) -> None:
+        """Test that a failed write doesn't invalidate anything."""
+        repository = AsyncMock()
+        repository.delete_item.return_value = False
+        cache = HouseholdCache()
+        household_id = uuid4()
+        service = ShoppingService(repository=repository, cache=cache)
+
+        with pytest.raises(ShoppingItemNotFoundError):
+            await service.delete_item(uuid4(), uuid4(), household_id)
+
+        assert cache.version(household_id, SHOPPING) == 0
@@ -0,0 +1,213 @@
+"""Tests for per-request loaders. 🚚
+
+Within one request, each recipe, ingredient list, catalog and pantry
+snapshot must be read at most once - however many callers ask.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.api.app.domain.loaders import RequestLoaders
+from src.api.app.domain.pantry.models import PantryItem, PantryLocation
+from src.api.app.domain.pantry.repository import PantryRepository
+from src.api.app.domain.recipes.models import Recipe, RecipeIngredient
+from src.api.app.domain.recipes.repository import RecipeRepository
+
+
+def make_recipe(title: str, *ingredient_names: str) -> Recipe:
+    """Create a test recipe with ingredients."""
+    now = datetime.now(UTC)
+    recipe_id = uuid4()
+    return Recipe(
+        id=recipe_id,
+        household_id=uuid4(),
+        title=title,
+        ingredients=[
+            RecipeIngredient(
+                id=uuid4(),
+                recipe_id=recipe_id,
+                raw_text=name,
+                quantity=1,
+                unit="count",
+                item_name=name,
+                notes=None,
+                section=None,
+                sort_order=position,
+                confidence=1.0,
+                created_at=now,
+            )
+            for position, name in enumerate(ingredient_names)
+        ],
+        source_url=None,
+        source_domain=None,
+        servings=2,
+        prep_time_minutes=None,
+        cook_time_minutes=None,
+        total_time_minutes=None,
+        description=None,
+        instructions=None,
+        tags=[],
+        is_parsed=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def make_pantry_item(name: str) -> PantryItem:
+    """Create a test pantry item."""
+    now = datetime.now(UTC)
+    return PantryItem(
+        id=uuid4(),
+        household_id=uuid4(),
+        name=name,
+        quantity=1,
+        unit="count",
+        location=PantryLocation.PANTRY,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def soup() -> Recipe:
+    """A recipe with two ingredients."""
+    return make_recipe("Soup", "onion", "broth")
+
+
+@pytest.fixture
+def salad() -> Recipe:
+    """A recipe with one ingredient."""
+    return make_recipe("Salad", "lettuce")
+
+
+@pytest.fixture
+def recipe_repo(soup, salad):
+    """Mock recipe repository backed by two recipes."""
+    repository = MagicMock()
+    recipes = {soup.id: soup, salad.id: salad}
+
+    async def get_by_ids(recipe_ids, _household_id):
+        return {recipe_id: recipes[recipe_id] for recipe_id in recipe_ids if recipe_id in recipes}
+
+    async def get_ingredients_for(recipe_ids):
+        return {
+            recipe_id: recipes[recipe_id].ingredients
+            for recipe_id in recipe_ids
+            if recipe_id in recipes
+        }
+
+    repository.get_by_ids = AsyncMock(side_effect=get_by_ids)
+    repository._get_ingredients_for = AsyncMock(side_effect=get_ingredients_for)
+    repository.get_catalog = AsyncMock(return_value=[soup, salad])
+    return repository
+
+
+@pytest.fixture
+def pantry_repo():
+    """Mock pantry repository with a two-item pantry."""
+    repository = MagicMock()
+    repository.get_snapshot = AsyncMock(
+        return_value=[make_pantry_item("onion"), make_pantry_item("salt")]
+    )
+    return repository
+
+
+@pytest.fixture
+def loaders(recipe_repo, pantry_repo) -> RequestLoaders:
+    """Loaders for one request."""
+    return RequestLoaders(uuid4(), recipe_repo, pantry_repo)
+
+
+class TestRecipes:
+    """Recipe loads are batched and shared."""
+
+    async def test_concurrent_recipes_one_query(self, loaders, recipe_repo, soup, salad):
+        """Test: recipes requested together are fetched by one get_by_ids call."""
+        missing = uuid4()
+
+        found = await asyncio.gather(
+            loaders.get_recipe(soup.id),
+            loaders.get_recipe(salad.id),
+            loaders.get_recipe(soup.id),
+            loaders.get_recipe(missing),
+        )
+
+        assert found == [soup, salad, soup, None]
+        recipe_repo.get_by_ids.assert_awaited_once()
+        assert recipe_repo.get_by_ids.call_args.args == (
+            [soup.id, salad.id, missing],
+            loaders.household_id,
+        )
+
+    async def test_ingredients_come_with_recipe(self, loaders, recipe_repo, soup):
+        """Test: ingredients of a loaded recipe need no extra query."""
+        recipe = await loaders.get_recipe(soup.id)
+
+        assert await loaders.get_ingredients(soup.id) is recipe.ingredients
+        recipe_repo._get_ingredients_for.assert_not_called()
+
+    async def test_ingredients_batched(self, loaders, recipe_repo, soup, salad):
+        """Test: ingredient lists requested together take one query."""
+        onion_broth, lettuce, nothing = await asyncio.gather(
+            loaders.get_ingredients(soup.id),
+            loaders.get_ingredients(salad.id),
+            loaders.get_ingredients(uuid4()),
+        )
+
+        assert [i.item_name for i in onion_broth] == ["onion", "broth"]
+        assert [i.item_name for i in lettuce] == ["lettuce"]
+        assert nothing == []
+        recipe_repo._get_ingredients_for.assert_awaited_once()
+
+
+class TestSnapshots:
+    """Catalog and pantry snapshots are read once per request."""
+
+    async def test_catalog_read_once(self, loaders, recipe_repo, soup, salad):
+        """Test: concurrent and repeated catalog loads share one read."""
+        first, second = await asyncio.gather(loaders.get_recipes(), loaders.get_recipes())
+
+        assert first == [soup, salad]
+        assert second is first
+        assert await loaders.get_recipes() is first
+        recipe_repo.get_catalog.assert_awaited_once_with(loaders.household_id)
+
+    async def test_catalog_answers_recipe_loads(self, loaders, recipe_repo, salad):
+        """Test: after the catalog, single recipes and ingredients are free."""
+        await loaders.get_recipes()
+
+        assert await loaders.get_recipe(salad.id) is salad
+        assert await loaders.get_ingredients(salad.id) is salad.ingredients
+        recipe_repo.get_by_ids.assert_not_called()
+        recipe_repo._get_ingredients_for.assert_not_called()
+
+    async def test_pantry_read_once(self, loaders, pantry_repo):
+        """Test: every pantry caller shares one full read."""
+        first, second = await asyncio.gather(
+            loaders.get_pantry_items(), loaders.get_pantry_items()
+        )
+
+        assert [item.name for item in first] == ["onion", "salt"]
+        assert second is first
+        assert await loaders.get_pantry_items() is first
+        pantry_repo.get_snapshot.assert_awaited_once_with(loaders.household_id)
+
+
+class TestForClient:
+    """Loaders built straight from a client."""
+
+    def test_uses_configured_repositories(self):
+        """Test: for_client wires the read-backend repositories."""
+        household_id = uuid4()
+        supabase = MagicMock()
+
+        loaders = RequestLoaders.for_client(household_id, supabase)
+
+        assert loaders.household_id == household_id
+        assert isinstance(loaders.recipes, RecipeRepository)
+        assert isinstance(loaders.pantry, PantryRepository)
+        assert loaders.recipes.supabase is supabase
@@ -12,7 +12,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from src.api.app.domain.cooking.service import CookingService
+from src.api.app.domain.loaders import RequestLoaders
 from src.api.app.routes.cooking import get_cooking_service
+from src.api.app.routes.dependencies import get_request_loaders
 from src.api.main import app
 
 
@@ -23,13 +25,23 @@ def mock_cooking_service():
 
 
 @pytest.fixture
-def client(mock_cooking_service):
+def mock_loaders():
+    """Create mock RequestLoaders."""
+    return AsyncMock(spec=RequestLoaders)
+
+
+@pytest.fixture
+def client(mock_cooking_service, mock_loaders):
     """Create a test client with mocked dependencies."""
 
     async def override_get_cooking_service():
         return mock_cooking_service
 
+    async def override_get_request_loaders():
+        yield mock_loaders
+
     app.dependency_overrides[get_cooking_service] = override_get_cooking_service
+    app.dependency_overrides[get_request_loaders] = override_get_request_loaders
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -114,3 +126,27 @@ class TestCookingContext:
         """Test context with invalid UUID."""
         response = client.get("/api/v1/cooking/context/not-a-uuid")
         assert response.status_code == 422
+
+    def test_context_recipe_not_found(self, client, mock_loaders):
+        """Test context for a missing recipe returns 404."""
+        mock_loaders.get_recipe.return_value = None
+        mock_loaders.get_pantry_items.return_value = []
+
+        response = client.get(f"/api/v1/cooking/context/{uuid4()}")
+
+        assert response.status_code == 404
+
+
+class TestRecipeLoading:
+    """Cooking routes read through the request loaders."""
+
+    def test_steps_load_recipe_once(self, client, mock_loaders, mock_cooking_service):
+        """Test the recipe comes from one loader call, ingredients included."""
+        recipe_id = uuid4()
+        mock_cooking_service.get_recipe_steps.return_value = []
+
+        response = client.get(f"/api/v1/cooking/steps/{recipe_id}")
+
+        assert response.status_code == 200
+        mock_loaders.get_recipe.assert_awaited_once_with(recipe_id)
+        mock_loaders.get_ingredients.assert_not_called()
@@ -36,3 +36,19 @@ class TestHealthEndpoint:
         data = response.json()
         assert data["status"] == "ready"
         assert "checks" in data
+
+    def test_background_status(self, client):
+        """Test background runner stats are exposed."""
+        response = client.get("/health/background")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["started"] is True
+        assert {"queue_depth", "running", "cancelled", "last_latency_ms"} <= data.keys()
+
+    def test_cache_status(self, client):
+        """Test household cache stats are exposed."""
+        response = client.get("/health/cache")
+
+        assert response.status_code == 200
+        assert {"hits", "misses", "evictions", "bytes", "max_bytes"} <= response.json().keys()
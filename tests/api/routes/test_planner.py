@@ -11,7 +11,9 @@ from uuid import uuid4
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api.app.domain.loaders import RequestLoaders
 from src.api.app.domain.planner.service import PlannerService
+from src.api.app.routes.dependencies import get_request_loaders
 from src.api.app.routes.planner import get_planner_service
 from src.api.main import app
 
@@ -23,13 +25,23 @@ def mock_planner_service():
 
 
 @pytest.fixture
-def client(mock_planner_service):
+def mock_loaders():
+    """Create mock RequestLoaders."""
+    return AsyncMock(spec=RequestLoaders)
+
+
+@pytest.fixture
+def client(mock_planner_service, mock_loaders):
     """Create a test client with mocked dependencies."""
 
     async def override_get_planner_service():
         yield mock_planner_service
 
+    async def override_get_request_loaders():
+        yield mock_loaders
+
     app.dependency_overrides[get_planner_service] = override_get_planner_service
+    app.dependency_overrides[get_request_loaders] = override_get_request_loaders
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()